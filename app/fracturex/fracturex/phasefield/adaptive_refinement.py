@@ -146,7 +146,7 @@ class AdaptiveRefinement:
         self.mesh.bisect(isMarkedCell, options=option)
         print('2D mesh refine')   
 
-        new_uh = option['data']['uh'].reshape(-1)
+        new_uh = option['data']['uh']
         new_d = option['data']['d'].reshape(-1)
         new_H = option['data']['H']
         self.new_data = {'uh': new_uh, 'd': new_d, 'H': new_H}   
\ No newline at end of file
@@ -491,8 +491,10 @@ class MainSolve:
         #NQ = self.H.shape[-1] if len(self.H) > 1 else 1
         if GD == 2:
             dcell2dof = self.space.cell_to_dof()
-            ucell2dof = self.tspace.cell_to_dof()
-            data = {'uh': self.uh[ucell2dof], 'd': self.d[dcell2dof], 'H': self.H}
+            # the displacement by components at the interpolation points
+            uh = bm.swapaxes(bm.reshape(self.uh[:], (GD, -1)), 0, 1)
+            data = {'uh': (uh, 'node'), 'd': (self.d[dcell2dof], 'local'),
+                    'H': (self.H, 'cell')}
         elif GD == 3:
             data = {'nodedata':[self.uh, self.d], 'celldata':self.H}
         return data
@@ -504,8 +506,7 @@ class MainSolve:
         GD = self.mesh.geo_dimension()
         if GD == 2:
             dcell2dof = self.space.cell_to_dof()
-            ucell2dof = self.tspace.cell_to_dof()
-            self.uh[ucell2dof.reshape(-1)] = data['uh']
+            self.uh[:] = bm.reshape(bm.swapaxes(data['uh'], 0, 1), (-1, ))
             self.d[dcell2dof.reshape(-1)] = data['d']
             H = data['H']
         elif GD == 3:
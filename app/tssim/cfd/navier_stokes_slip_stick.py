@@ -211,7 +211,7 @@ for i in range(5):
     cell2dof = mesh.cell_to_ipoint(2)
     phi0c2f = phi0[cell2dof]
     isMark = np.abs(np.mean(phi0c2f,axis=-1))< epsilon
-    data = {'phi0':phi0c2f} 
+    data = {'phi0':(phi0c2f, 'local')} 
     option = mesh.bisect_options(data=data, disp=False)
     mesh.bisect(isMark,options=option)
 
@@ -432,7 +432,7 @@ for i in range(10):
         isMark = np.abs(np.mean(phi0c2f,axis=-1))<epsilon
         isMark = np.logical_and(np.mean(phi0c2f,axis=-1)>-0.01,isMark)
         isMark = np.logical_and(isMark,cellmeasure>4e-5)
-        data = {'phi0':phi0c2f,'u1x':u1xc2f,'u1y':u1yc2f,'p1':p1c2f,'T1':T1c2f} 
+        data = {'phi0':(phi0c2f, 'local'),'u1x':(u1xc2f, 'local'),'u1y':(u1yc2f, 'local'),'p1':(p1c2f, 'local'),'T1':(T1c2f, 'local')} 
         option = mesh.bisect_options(data=data,disp=False)
         mesh.bisect(isMark,options=option)
 
@@ -463,7 +463,7 @@ for i in range(10):
         cellmeasure = mesh.entity_measure('cell')
         isMark = np.abs(np.mean(phi0c2f,axis=-1))>epsilon
         isMark = np.logical_and(np.mean(phi0c2f,axis=-1)<0.01,isMark)
-        data = {'phi0':phi0c2f,'u1x':u1xc2f,'u1y':u1yc2f,'p1':p1c2f,'T1':T1c2f} 
+        data = {'phi0':(phi0c2f, 'local'),'u1x':(u1xc2f, 'local'),'u1y':(u1yc2f, 'local'),'p1':(p1c2f, 'local'),'T1':(T1c2f, 'local')} 
         option = mesh.bisect_options(data=data,disp=False)
         mesh.coarsen(isMark,options=option)
 
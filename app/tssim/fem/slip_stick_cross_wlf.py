@@ -116,7 +116,7 @@ for i in range(5):
     cell2dof = mesh.cell_to_ipoint(udegree)
     phi0c2f = phi0[cell2dof]
     isMark = np.abs(np.mean(phi0c2f,axis=-1))< 0.05
-    data = {'phi0':phi0c2f} 
+    data = {'phi0':(phi0c2f, 'local')} 
     option = mesh.bisect_options(data=data)
     mesh.bisect(isMark,options=option)
 
@@ -216,7 +216,7 @@ for i in range(0, nt):
         isMark = np.abs(np.mean(phi0c2f,axis=-1))<0.05
         isMark = np.logical_and(np.mean(phi0c2f,axis=-1)>-0.01,isMark)
         isMark = np.logical_and(isMark,cellmeasure>4e-5)
-        data = {'phi0':phi0c2f,'u1x':u1xc2f,'u1y':u1yc2f,'p1':p1c2f} 
+        data = {'phi0':(phi0c2f, 'local'),'u1x':(u1xc2f, 'local'),'u1y':(u1yc2f, 'local'),'p1':(p1c2f, 'local')} 
         option = mesh.bisect_options(data=data,disp=False)
         mesh.bisect(isMark,options=option)
 
@@ -242,7 +242,7 @@ for i in range(0, nt):
         cellmeasure = mesh.entity_measure('cell')
         isMark = np.abs(np.mean(phi0c2f,axis=-1))>0.05
         isMark = np.logical_and(np.mean(phi0c2f,axis=-1)<0.01,isMark)
-        data = {'phi0':phi0c2f,'u1x':u1xc2f,'u1y':u1yc2f,'p1':p1c2f} 
+        data = {'phi0':(phi0c2f, 'local'),'u1x':(u1xc2f, 'local'),'u1y':(u1yc2f, 'local'),'p1':(p1c2f, 'local')} 
         option = mesh.bisect_options(data=data,disp=False)
         mesh.coarsen(isMark,options=option)
 
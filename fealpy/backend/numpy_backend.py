@@ -8,6 +8,7 @@ from itertools import combinations_with_replacement
 import numpy as np
 from numpy.typing import NDArray
 from numpy.linalg import det
+from scipy.sparse import coo_matrix, csr_matrix
 from scipy.sparse._sparsetools import coo_matvec, csr_matvec, csr_matvecs, coo_tocsr
 
 from .base import (
@@ -106,6 +107,15 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
     # non-standard
 
     ### Sorting Functions ###
+    if np.__version__ < '2.0.0':
+        # the `stable` keyword is new in NumPy 2.0
+        @staticmethod
+        def argsort(a, /, axis=-1, kind=None, order=None, *, stable=None):
+            return np.argsort(a, axis=axis, kind='stable' if stable else kind, order=order)
+
+        @staticmethod
+        def sort(a, /, axis=-1, kind=None, order=None, *, stable=None):
+            return np.sort(a, axis=axis, kind='stable' if stable else kind, order=order)
 
     ### Statistical Functions ###
     # python array API standard v2023.12
@@ -173,7 +183,8 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
                     coo_matvec(nnz, row, col, value, acol, rT[i])
                 return result
             else:
-                raise ValueError("`other` must be a 1-D or 2-D array.")
+                raise NotImplementedError("Batch sparse matrix multiplication has "
+                                          "not been supported yet.")
         else:
             raise NotImplementedError("Batch sparse matrix multiplication has "
                                       "not been supported yet.")
@@ -194,7 +205,35 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
                 csr_matvecs(M, N, n_vecs, crow, col, value, other.ravel(), result.ravel())
                 return result
             else:
-                raise ValueError("`other` must be a 1-D or 2-D array.")
+                raise NotImplementedError("Batch sparse matrix multiplication has "
+                                          "not been supported yet.")
+        else:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+
+    @staticmethod
+    def coo_spspmm(indices1, values1, shape1, indices2, values2, shape2):
+        if values1.ndim == 1 and values2.ndim == 1:
+            mat1 = coo_matrix((values1, (indices1[0], indices1[1])), shape=shape1)
+            mat2 = coo_matrix((values2, (indices2[0], indices2[1])), shape=shape2)
+            mat = (mat1 @ mat2).tocsr()
+            mat.sort_indices()
+            mat = mat.tocoo()
+            indices = np.stack([mat.row, mat.col], axis=0).astype(indices1.dtype)
+            return indices, mat.data, mat.shape
+        else:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+
+    @staticmethod
+    def csr_spspmm(crow1, col1, values1, shape1, crow2, col2, values2, shape2):
+        if values1.ndim == 1 and values2.ndim == 1:
+            mat1 = csr_matrix((values1, col1, crow1), shape=shape1)
+            mat2 = csr_matrix((values2, col2, crow2), shape=shape2)
+            mat = mat1 @ mat2
+            mat.sort_indices()
+            itype = crow1.dtype
+            return mat.indptr.astype(itype), mat.indices.astype(itype), mat.data, mat.shape
         else:
             raise NotImplementedError("Batch sparse matrix multiplication has "
                                       "not been supported yet.")
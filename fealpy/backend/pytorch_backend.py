@@ -499,7 +499,7 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
 
     @staticmethod
     def coo_spmm(indices, values, shape, other):
-        if values.ndim == 1:
+        if values.ndim == 1 and other.ndim <= 2:
             mat = torch.sparse_coo_tensor(indices, values, size=shape)
             return PyTorchBackend._spmm(mat, other)
         else:
@@ -508,13 +508,35 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
 
     @staticmethod
     def csr_spmm(crow, col, values, shape, other):
-        if values.ndim == 1:
+        if values.ndim == 1 and other.ndim <= 2:
             mat = torch.sparse_csr_tensor(crow, col, values, size=shape)
             return PyTorchBackend._spmm(mat, other)
         else:
             raise NotImplementedError("Batch sparse matrix multiplication has "
                                       "not been supported yet.")
 
+    @staticmethod
+    def coo_spspmm(indices1, values1, shape1, indices2, values2, shape2):
+        if values1.ndim == 1 and values2.ndim == 1:
+            mat1 = torch.sparse_coo_tensor(indices1, values1, size=shape1)
+            mat2 = torch.sparse_coo_tensor(indices2, values2, size=shape2)
+            mat = torch.sparse.mm(mat1, mat2).coalesce()
+            return mat.indices(), mat.values(), tuple(mat.shape)
+        else:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+
+    @staticmethod
+    def csr_spspmm(crow1, col1, values1, shape1, crow2, col2, values2, shape2):
+        if values1.ndim == 1 and values2.ndim == 1:
+            mat1 = torch.sparse_csr_tensor(crow1, col1, values1, size=shape1)
+            mat2 = torch.sparse_csr_tensor(crow2, col2, values2, size=shape2)
+            mat = torch.sparse.mm(mat1, mat2)
+            return mat.crow_indices(), mat.col_indices(), mat.values(), tuple(mat.shape)
+        else:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+
     @staticmethod
     def _spmm(mat, other):
         if other.ndim == 1:
@@ -1,2 +1,2 @@
 
-from .generator import EITDataGenerator
+from .generator import EITDataGenerator, ChunkedStore
@@ -1,2 +1,3 @@
 
 from .eit_data_generator import EITDataGenerator
+from .chunked_store import ChunkedStore
@@ -0,0 +1,96 @@
+from typing import Dict, Optional, List
+import os
+import json
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class ChunkedStore():
+    """Store samples of named arrays on disk, in chunks of samples.
+
+    The samples are buffered, and every `chunk_size` samples are stacked
+    along a new first axis and written to `{path}/chunk_{i:06d}.npz`, so that
+    a dataset larger than the memory can be streamed to the disk. An index of
+    the chunks is written to `{path}/index.json` when the store is closed.
+
+    Parameters:
+        path (str): The directory of the store, created if not exists.
+        chunk_size (int, optional): Number of samples of a chunk. Defaults to 256.
+        dtype (optional): Type of the floating point arrays on disk. Defaults
+            to None, keeping the types of the samples.
+    """
+    def __init__(self, path: str, chunk_size: int=256, *, dtype=None) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size should be positive, but got {chunk_size}.")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.chunks: List[Dict] = []
+        self._buffer: Dict[str, List[NDArray]] = {}
+        self._nbuffered = 0
+
+    @property
+    def number_of_samples(self) -> int:
+        return sum(c['samples'] for c in self.chunks) + self._nbuffered
+
+    def append(self, **sample: NDArray) -> None:
+        """Append one sample, given as arrays by name. All the samples should
+        have the same names."""
+        if self._nbuffered == 0:
+            self._buffer = {k: [] for k in sample}
+        elif set(sample) != set(self._buffer):
+            raise ValueError(f"Sample of {sorted(sample)}, but the store "
+                             f"holds {sorted(self._buffer)}.")
+        for k, v in sample.items():
+            v = np.asarray(v)
+            if (self.dtype is not None) and np.issubdtype(v.dtype, np.floating):
+                v = v.astype(self.dtype)
+            self._buffer[k].append(v)
+        self._nbuffered += 1
+        if self._nbuffered >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered samples as a chunk."""
+        if self._nbuffered == 0:
+            return
+        name = f"chunk_{len(self.chunks):06d}.npz"
+        np.savez(os.path.join(self.path, name),
+                 **{k: np.stack(v, axis=0) for k, v in self._buffer.items()})
+        self.chunks.append({'file': name, 'samples': self._nbuffered})
+        self._buffer = {}
+        self._nbuffered = 0
+
+    def close(self) -> None:
+        """Write the last chunk and the index."""
+        self.flush()
+        with open(os.path.join(self.path, 'index.json'), 'w') as f:
+            json.dump({'chunk_size': self.chunk_size, 'chunks': self.chunks}, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def load(path: str, names: Optional[List[str]]=None) -> Dict[str, NDArray]:
+        """Load all the samples of a closed store, concatenated along the first axis.
+
+        Parameters:
+            path (str): The directory of the store.
+            names (List[str], optional): Names of the arrays to load. Defaults to all.
+
+        Returns:
+            Dict[str, NDArray]: The arrays by name.
+        """
+        with open(os.path.join(path, 'index.json'), 'r') as f:
+            index = json.load(f)
+        data: Dict[str, List[NDArray]] = {}
+        for chunk in index['chunks']:
+            with np.load(os.path.join(path, chunk['file'])) as npz:
+                for k in (npz.files if names is None else names):
+                    data.setdefault(k, []).append(npz[k])
+        return {k: np.concatenate(v, axis=0) for k, v in data.items()}
@@ -1,5 +1,6 @@
 
-from typing import Tuple, Callable, Union, Optional
+from typing import Tuple, Callable, Union, Optional, Iterable, Dict
+from time import perf_counter
 
 from fealpy.backend import backend_manager as bm
 from fealpy.backend import TensorLike as Tensor
@@ -10,21 +11,31 @@ from fealpy.fem import (
     ScalarDiffusionIntegrator,
     ScalarNeumannBCIntegrator
 )
+from fealpy import logger
 from fealpy.sparse import COOTensor
-from fealpy.solver import cg, spsolve
+from fealpy.solver import factorize
+from .chunked_store import ChunkedStore
 
 
 class EITDataGenerator():
     """Generate boundary voltage and current data for EIT.
     """
-    def __init__(self, mesh: Mesh, p: int=1, q: Optional[int]=None) -> None:
+    def __init__(self, mesh: Mesh, p: int=1, q: Optional[int]=None, *,
+                 solver: str='scipy') -> None:
         """Create a new EIT data generator.
 
+        The sparsity pattern of the stiffness matrix is built once and kept for
+        all the conductivities set on the mesh, and the matrix of each conductivity
+        is factorized once, reusing the symbolic analysis, for all the current
+        patterns solved as one block.
+
         Args:
             mesh (Mesh): _description_
             p (int, optional): Order of the Lagrange finite element space. Defaults to 1.
             q (int | None, optional): Order of the quadrature, use `q = p + 2` if None.
                 Defaults to None.
+            solver (str, optional): The direct solver of `fealpy.solver.factorize`.
+                Defaults to 'scipy'.
         """
         q = p + 2 if q is None else q
 
@@ -42,6 +53,11 @@ class EITDataGenerator():
         # initialize integrators
         self._bsi = ScalarNeumannBCIntegrator(None, q=q)
         self._di = ScalarDiffusionIntegrator(None, q=q)
+        self._bform = BilinearForm(space).keep_pattern()
+        self._bform.add_integrator(self._di)
+        self._solver = solver
+        self._lu = None
+        self._lu_stale = True
 
         # prepare for the unique condition in the neumann case
         self.gdof = space.number_of_global_dofs()
@@ -68,13 +84,10 @@ class EITDataGenerator():
             return sigma
         _coef_func.coordtype = getattr(levelset, 'coordtype', 'cartesian')
 
-        space = self.space
-
-        bform = BilinearForm(space)
         self._di.coef = _coef_func
         self._di.clear() # clear the cached result as the coef has changed
-        bform.add_integrator(self._di)
-        self._A = bform.assembly(format='coo')
+        # NOTE: only the values are assembled when the pattern is kept.
+        self._A = self._bform.assembly(format='coo')
 
         cdata_indices = self.cdata_indices
         cdataT_indices = bm.flip(cdata_indices, axis=0)
@@ -82,6 +95,17 @@ class EITDataGenerator():
         A_n_values = bm.concat([self._A.values(), self.cdata, self.cdata], axis=-1)
         A_n = COOTensor(A_n_indices, A_n_values, spshape=(self.gdof+1, self.gdof+1))
         self.A_n = A_n.tocsr()
+        self._lu_stale = True
+
+    def factor(self):
+        """The factorization of the matrix of the current conductivity,
+        made once for all the current patterns."""
+        if self._lu is None:
+            self._lu = factorize(self.A_n, solver=self._solver)
+        elif self._lu_stale:
+            self._lu.refactorize(self.A_n)
+        self._lu_stale = False
+        return self._lu
 
     def set_boundary(self, gn_source: Union[Callable[[Tensor], Tensor], Tensor],
                      batch_size: int=0, *, zero_integral=False) -> Tensor:
@@ -136,8 +160,8 @@ class EITDataGenerator():
             Tensor: gd Tensor, shaped (Boundary nodes, )\
                 or (Batch, Boundary nodes).
         """
-        # uh = cg(self.A_n, self.b_, batch_first=True, atol=1e-12, rtol=0.)
-        uh = spsolve(self.A_n, self.b_.T, solver='scipy').T
+        # NOTE: the batch of current patterns is solved as one block.
+        uh = self.factor().solve(self.b_.T).T
 
         if return_full:
             return uh[:-1]
@@ -145,3 +169,41 @@ class EITDataGenerator():
         # NOTE: interpolation points on nodes are arranged firstly,
         # therefore the value on the boundary nodes can be fetched like this:
         return uh[..., self._bd_node_index] # voltage
+
+    def generate(self, sigma_vals: Tuple[float, float],
+                 levelsets: Iterable[Callable[[Tensor], Tensor]],
+                 store: Optional[ChunkedStore]=None, *,
+                 return_full=False) -> Dict[str, float]:
+        """Generate the voltage of the current patterns set by `set_boundary`
+        for many conductivities on the mesh, and stream them to a store.
+
+        Args:
+            sigma_vals (Tuple[float, float]): Sigma value of inclusion and background.
+            levelsets (Iterable[Callable]): level-set functions of the samples.
+            store (ChunkedStore | None, optional): Where the voltage of every sample,
+                shaped as the output of `run`, is appended as 'gd'. The store is
+                closed at the end. Defaults to None, dropping the voltage.
+            return_full (bool, optional): Whether store all dofs. Defaults to False.
+
+        Returns:
+            Dict[str, float]: 'samples', 'seconds' and 'samples_per_second'.
+        """
+        if not hasattr(self, 'b_'):
+            raise RuntimeError("set_boundary should be called before generate.")
+        count = 0
+        start = perf_counter()
+
+        for levelset in levelsets:
+            self.set_levelset(sigma_vals, levelset)
+            gd = self.run(return_full=return_full)
+            if store is not None:
+                store.append(gd=bm.to_numpy(gd))
+            count += 1
+
+        if store is not None:
+            store.close()
+        seconds = perf_counter() - start
+        rate = count / seconds if seconds > 0 else float('inf')
+        logger.info(f"EIT data of {count} samples generated in {seconds:.3f} s, "
+                    f"{rate:.2f} samples per second.")
+        return {'samples': count, 'seconds': seconds, 'samples_per_second': rate}
@@ -1,16 +1,16 @@
 
-from typing import Callable, Tuple, Iterable, Generator, Any, Dict, Optional, Union
+from typing import Callable, Tuple, Iterable, Generator, Any, Dict, Optional, Union, List
 import numpy as np
 from numpy import float32
 from numpy.typing import NDArray
-from scipy.sparse.linalg import splu
 from scipy.sparse import spdiags, hstack, vstack, csr_matrix
 
+from fealpy.backend import backend_manager as bm
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.mesh import TriangleMesh, UniformMesh2d
-from fealpy.fem import BilinearForm
-from fealpy.fem import ScalarDiffusionIntegrator
-from fealpy.fem import ScalarNeumannSourceIntegrator
+from fealpy.fem import BilinearForm, LinearForm
+from fealpy.fem import ScalarDiffusionIntegrator, ScalarNeumannBCIntegrator
+from fealpy.solver import factorize
 
 
 ArrayFunction = Callable[..., NDArray]
@@ -23,6 +23,8 @@ class LaplaceFEMSolver():
 
     This solver is designed to efficiently solve the Laplace equation under various boundary conditions,
     utilizing LU decomposition on the same matrix for faster consecutive solutions.
+    The generator methods solve the boundary conditions in blocks of `batch_size`,
+    with one block of right-hand sides for each solve.
 
     Methods:
     1. solve_from_gd(self, gd):
@@ -43,23 +45,25 @@ class LaplaceFEMSolver():
         Returns:
         numpy.ndarray: The solution to the Laplace equation.
     """
-    def __init__(self, space, sigma: Optional[NDArray]=None) -> None:
+    def __init__(self, space, sigma: Optional[NDArray]=None, *, solver: str='scipy') -> None:
         """
         @brief Build a laplace equation solver based on FEM.
 
         @param space: a finite element space object in FEALPy.
         @param sigma: array of sigma values in each cell, with shape (NC, ).
+        @param solver: the direct solver of `fealpy.solver.factorize`.
         """
         self.space = space
         self.ndof = space.number_of_global_dofs()
+        self.solver = solver
 
         bform = BilinearForm(space)
-        bform.add_domain_integrator(ScalarDiffusionIntegrator(c=sigma, q=3))
-        self.A_ = bform.assembly()
+        bform.add_integrator(ScalarDiffusionIntegrator(coef=sigma, q=3))
+        self.A_ = bform.assembly().to_scipy().tocsr()
 
     def _init_gd(self):
         space = self.space
-        isDDof = space.is_boundary_dof()
+        isDDof = bm.to_numpy(space.is_boundary_dof())
         A_ = self.A_
 
         bdIdx = np.zeros(A_.shape[0], dtype=np.int_)
@@ -68,66 +72,96 @@ class LaplaceFEMSolver():
         D1 = spdiags(bdIdx, 0, A_.shape[0], A_.shape[0])
         A_ = D0@A_@D0 + D1
 
-        self.AD_lu = splu(A_.tocsc())
+        self.isDDof = isDDof
+        self.AD_lu = factorize(A_, solver=self.solver)
+
+    def _gd_rhs(self, gds: List[ArrayOrFunc]) -> NDArray:
+        """Right-hand sides of the Dirichlet problems, shaped (ndof, k)."""
+        space = self.space
+        isDDof = self.isDDof
+        U = np.zeros((self.ndof, len(gds)), dtype=np.float64)
+        for i, gd in enumerate(gds):
+            uh, _ = space.boundary_interpolate(gd)
+            U[:, i] = bm.to_numpy(uh[:])
+        B = -(self.A_ @ U)
+        B[isDDof] = U[isDDof]
+        return B
 
     def solve_from_gd(self, gd: ArrayOrFunc) -> NDArray:
         """
         @brief Solve the laplace equation from one dirichlet boundary condition.
         """
-        space = self.space
-
         if not hasattr(self, "AD_lu"):
             self._init_gd()
 
-        uh = np.zeros((self.ndof, ), dtype=space.ftype)
-        isDDof = space.boundary_interpolate(gd, uh)
-        b_ = np.zeros((self.ndof, ), dtype=space.ftype)
-        b_[:] = b_ - self.A_@uh.reshape(-1)
-        b_[isDDof] = uh[isDDof]
-
-        uh[:] = self.AD_lu.solve(b_)
-        return uh
+        B = self._gd_rhs([gd])
+        return bm.to_numpy(self.AD_lu.solve(B))[:, 0]
 
-    def solve_from_gds(self, gd_iterable: Iterable[ArrayOrFunc]) -> Generator[NDArray, Any, None]:
+    def solve_from_gds(self, gd_iterable: Iterable[ArrayOrFunc], batch_size: int=64) -> Generator[NDArray, Any, None]:
         """
-        @brief The generator version of `solve_from_gd`.
+        @brief The generator version of `solve_from_gd`, solving `batch_size`
+        boundary conditions at a time.
         """
-        for gD_ in gd_iterable:
-            yield self.solve_from_gd(gD_)
+        if not hasattr(self, "AD_lu"):
+            self._init_gd()
+
+        for gds in _batched(gd_iterable, batch_size):
+            X = bm.to_numpy(self.AD_lu.solve(self._gd_rhs(gds)))
+            yield from X.T
 
     def _init_gn(self):
         space = self.space
         A_ = self.A_
-        C_ = ScalarNeumannSourceIntegrator(1., q=3).assembly_face_vector(space)
+        lform = LinearForm(space)
+        lform.add_integrator(ScalarNeumannBCIntegrator(1., q=3))
+        C_ = bm.to_numpy(lform.assembly())
 
         A_C = hstack([A_, C_.reshape(-1, 1)])
-        A_C = vstack([A_C, hstack([C_.reshape(1, -1), csr_matrix((1, 1), dtype=space.ftype)])])
+        A_C = vstack([A_C, hstack([C_.reshape(1, -1), csr_matrix((1, 1), dtype=A_.dtype)])])
+
+        self.AC_lu = factorize(A_C.tocsc(), solver=self.solver)
 
-        self.AC_lu = splu(A_C.tocsc())
+    def _gn_rhs(self, gns: List[ArrayOrFunc]) -> NDArray:
+        """Right-hand sides of the Neumann problems, shaped (ndof+1, k)."""
+        F = np.zeros((self.ndof+1, len(gns)), dtype=np.float64)
+        for i, gn in enumerate(gns):
+            lform = LinearForm(self.space)
+            lform.add_integrator(ScalarNeumannBCIntegrator(gn, q=3))
+            F[:-1, i] = bm.to_numpy(lform.assembly())
+        return F
 
     def solve_from_gn(self, gn: ArrayOrFunc) -> NDArray:
         """
         @brief Solve the laplace equation from one neumann boundary condition.
         """
-        space = self.space
-
         if not hasattr(self, "AC_lu"):
             self._init_gn()
 
-        intergrator = ScalarNeumannSourceIntegrator(gn, q=3)
-        F_ = np.zeros((self.ndof+1, ), dtype=space.ftype)
-        intergrator.assembly_face_vector(space, out=F_[:-1])
+        F = self._gn_rhs([gn])
+        return bm.to_numpy(self.AC_lu.solve(F))[:-1, 0]
 
-        uh = np.zeros((self.ndof, ), dtype=space.ftype)
-        uh[:] = self.AC_lu.solve(F_)[:-1]
-        return uh
-
-    def solve_from_gns(self, gn_iterable: Iterable[ArrayOrFunc]) -> Generator[NDArray, Any, None]:
+    def solve_from_gns(self, gn_iterable: Iterable[ArrayOrFunc], batch_size: int=64) -> Generator[NDArray, Any, None]:
         """
-        @brief The generator version of `solve_from_gn`.
+        @brief The generator version of `solve_from_gn`, solving `batch_size`
+        boundary conditions at a time.
         """
-        for gN_ in gn_iterable:
-            yield self.solve_from_gn(gN_)
+        if not hasattr(self, "AC_lu"):
+            self._init_gn()
+
+        for gns in _batched(gn_iterable, batch_size):
+            X = bm.to_numpy(self.AC_lu.solve(self._gn_rhs(gns)))
+            yield from X[:-1].T
+
+
+def _batched(iterable: Iterable, n: int) -> Generator[List, Any, None]:
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 
 def get_gN_func(freq: int, phrase: float=0.):
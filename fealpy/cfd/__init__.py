@@ -1,3 +1,3 @@
 from .ns_mac_solver import NSMacSolver
-from .ns_fem_solver import NSFEMSolver
+from .ns_fem_solver import NSFEMSolver, IPCSStepper
 #from .ns_flip_solver import NSFlipSolver
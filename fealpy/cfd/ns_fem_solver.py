@@ -7,8 +7,13 @@
 	@bref 
 	@ref 
 '''  
+import time
+
+from fealpy import logger
 from fealpy.backend import backend_manager as bm
 from fealpy.decorator import cartesian,barycentric
+from fealpy.sparse import CSRTensor
+from fealpy.solver import factorize, cg, AMGSolver
 from fealpy.fem import BilinearForm, LinearForm, BlockForm, LinearBlockForm
 from fealpy.fem import (ScalarConvectionIntegrator, 
                         ScalarDiffusionIntegrator, 
@@ -124,14 +129,18 @@ class NSFEMSolver():
         Lform.add_integrator(self.ipcs0_lform_BSI)
         return Lform
    
-    def update_ipcs_0(self, u0, p0):
+    def update_ipcs_0(self, u0, p0, convection=True):
+        """Update the sources of the velocity prediction with the velocity u0 and
+        pressure p0 of the last step. The convection is explicit, in the source,
+        unless `convection` is False, leaving it to the matrix."""
         dt = self.dt
         R = self.pde.R
         gd = self.mesh.geo_dimension()
         
         def coef(bcs, index):
             result = R/dt*u0(bcs, index)
-            result -= R * bm.einsum('...j, ...ij -> ...i', u0(bcs, index), u0.grad_value(bcs, index))
+            if convection:
+                result -= R * bm.einsum('...j, ...ij -> ...i', u0(bcs, index), u0.grad_value(bcs, index))
             return result
         
         def G_coef(bcs, index):
@@ -223,3 +232,184 @@ class NSFEMSolver():
             return result
 
         self.ipcs2_lform_SI.source = coef
+
+
+class IPCSStepper():
+    """Time stepping of the incremental pressure correction scheme (IPCS) of
+    `NSFEMSolver`, with the constant operators assembled and factorized once.
+
+    The matrices of the pressure Poisson and velocity correction steps are
+    constant, and so is the one of the velocity prediction when the convection
+    is explicit, as in `NSFEMSolver.update_ipcs_0`. They are assembled once,
+    the Dirichlet conditions are applied on their patterns by `DirichletBCPlan`,
+    and their factorizations, or the AMG hierarchy of the pressure, are kept.
+    A step then assembles the right-hand sides and solves with the kept factors.
+
+    With the semi-implicit convection, R(u0 . grad)us is moved into the matrix
+    of the velocity prediction. Only this term is re-assembled at every step,
+    with the kept pattern of its bilinear form, and added to the constant part.
+    The factorization is then redone numerically, keeping the analysis.
+
+    The times of the assembly and of the solves are logged at every step, and
+    kept in `timings`.
+
+    Parameters:
+        solver (NSFEMSolver): The solver providing the forms.\n
+        BCu (DirichletBC): The Dirichlet condition of the velocity.\n
+        BCp (DirichletBC): The Dirichlet condition of the pressure.\n
+        threshold (optional): The boundary of the friction term, see
+            `NSFEMSolver.IPCS_BForm_0`. Defaults to None.\n
+        convection (str, optional): 'explicit' or 'semi-implicit'. Defaults to 'explicit'.\n
+        linear_solver (str, optional): The solver of the factorizations, see
+            `fealpy.solver.factorize`. Defaults to 'scipy'.\n
+        pressure_solver (str, optional): 'direct' factorizes the pressure Poisson
+            matrix, 'amg' keeps its AMG hierarchy as the preconditioner of `cg`,
+            started from the pressure of the last step. Defaults to 'direct'.
+    """
+    def __init__(self, solver: NSFEMSolver, BCu, BCp, threshold=None, *,
+                 convection='explicit', linear_solver='scipy', pressure_solver='direct'):
+        if convection not in ('explicit', 'semi-implicit'):
+            raise ValueError(f"Unknown convection '{convection}', expected "
+                             "'explicit' or 'semi-implicit'.")
+        if pressure_solver not in ('direct', 'amg'):
+            raise ValueError(f"Unknown pressure solver '{pressure_solver}', "
+                             "expected 'direct' or 'amg'.")
+        self.solver = solver
+        self.convection = convection
+        self.timings = []
+        start = time.perf_counter()
+
+        self.A0 = solver.IPCS_BForm_0(threshold=threshold).assembly()
+        self.A1 = solver.IPCS_BForm_1().assembly()
+        self.A2 = solver.IPCS_BForm_2().assembly()
+        self.lform0 = solver.IPCS_LForm_0()
+        self.lform1 = solver.IPCS_LForm_1()
+        self.lform2 = solver.IPCS_LForm_2()
+        self.plan0 = BCu.plan(self.A0)
+        self.plan1 = BCp.plan(self.A1)
+        A1 = self.plan1.apply_matrix(self.A1)
+
+        self.factor0 = factorize(self.plan0.apply_matrix(self.A0), linear_solver)
+        if pressure_solver == 'direct':
+            self.factor1 = factorize(A1, linear_solver)
+            self.amg1 = None
+        else:
+            self.factor1 = None
+            self.amg1 = AMGSolver(A1)
+            self._A1 = A1
+        self.factor2 = factorize(self.A2, linear_solver)
+
+        if convection == 'semi-implicit':
+            self.u_C = ScalarConvectionIntegrator(q=solver.q)
+            self.u_C.keep_data()
+            self.cform = BilinearForm(solver.uspace).keep_pattern()
+            self.cform.add_integrator(self.u_C)
+            self._cindex = None
+
+        logger.info(f"IPCS operators assembled and factorized in "
+                    f"{time.perf_counter() - start:.3e} s.")
+
+    def _predictor_matrix(self, u0) -> CSRTensor:
+        """The matrix of the velocity prediction with the convection by u0,
+        on the pattern of the constant part."""
+        R = self.solver.pde.R
+
+        def u_C_coef(bcs, index):
+            return R*u0(bcs, index)
+        self.u_C.coef = u_C_coef
+        C = self.cform.assembly()
+
+        A0 = self.A0
+        if self._cindex is None:
+            # positions of the entries of C in the values of A0, found once
+            n = A0.sparse_shape[1]
+            key = A0.row() * n + A0.col()
+            ckey = C.row() * n + C.col()
+            order = bm.argsort(key)
+            pos = bm.clip(bm.searchsorted(key[order], ckey), 0, key.shape[0] - 1)
+            if not bool(bm.all(key[order][pos] == ckey)):
+                raise ValueError("The pattern of the convection matrix is not "
+                                 "in the pattern of the velocity prediction matrix.")
+            self._cindex = order[pos]
+
+        values = bm.index_add(bm.copy(A0.values()), self._cindex, C.values())
+        return CSRTensor(A0.crow(), A0.col(), values, A0.sparse_shape)
+
+    def step(self, u0, p0):
+        """Advance one time step.
+
+        Parameters:
+            u0 (Function): The velocity of the last step.\n
+            p0 (Function): The pressure of the last step.
+
+        Returns:
+            Tuple[Function, Function]: The velocity and pressure of the new step.
+        """
+        solver = self.solver
+        us = solver.uspace.function()
+        u1 = solver.uspace.function()
+        p1 = solver.pspace.function()
+        semi = (self.convection == 'semi-implicit')
+        tassembly = 0.
+        tsolve = 0.
+
+        # velocity prediction
+        start = time.perf_counter()
+        solver.update_ipcs_0(u0, p0, convection=not semi)
+        b0 = self.lform0.assembly()
+        A0 = self._predictor_matrix(u0) if semi else self.A0
+        tassembly += time.perf_counter() - start
+        start = time.perf_counter()
+        b0 = self.plan0.apply_vector(b0, A0, check=False)
+        if semi:
+            self.factor0.refactorize(self.plan0.apply_matrix(A0, inplace=True, check=False))
+        us[:] = self.factor0.solve(b0)
+        tsolve += time.perf_counter() - start
+
+        # pressure correction
+        start = time.perf_counter()
+        solver.update_ipcs_1(us, p0)
+        b1 = self.lform1.assembly()
+        tassembly += time.perf_counter() - start
+        start = time.perf_counter()
+        b1 = self.plan1.apply_vector(b1, self.A1, check=False)
+        if self.amg1 is None:
+            p1[:] = self.factor1.solve(b1)
+        else:
+            p1[:] = cg(self._A1, b1, x0=p0[:], M=self.amg1)
+        tsolve += time.perf_counter() - start
+
+        # velocity correction
+        start = time.perf_counter()
+        solver.update_ipcs_2(us, p0, p1)
+        b2 = self.lform2.assembly()
+        tassembly += time.perf_counter() - start
+        start = time.perf_counter()
+        u1[:] = self.factor2.solve(b2)
+        tsolve += time.perf_counter() - start
+
+        self.timings.append({'assembly': tassembly, 'solve': tsolve})
+        logger.info(f"IPCS step {len(self.timings)}: assembly {tassembly:.3e} s, "
+                    f"solve {tsolve:.3e} s.")
+        return u1, p1
+
+    def run(self, u0, p0, nt: int, callback=None):
+        """Advance `nt` time steps.
+
+        Parameters:
+            u0 (Function): The initial velocity.\n
+            p0 (Function): The initial pressure.\n
+            nt (int): Number of steps.\n
+            callback (callable, optional): Called as callback(i, u, p) after the
+                step i. Defaults to None.
+
+        Returns:
+            Tuple[Function, Function]: The velocity and pressure of the last step.
+        """
+        start = time.perf_counter()
+        for i in range(nt):
+            u0, p0 = self.step(u0, p0)
+            if callback is not None:
+                callback(i, u0, p0)
+        logger.info(f"IPCS: {nt} steps in {time.perf_counter() - start:.3e} s.")
+        return u0, p0
@@ -1,36 +1,248 @@
+from itertools import product
+from typing import Optional, Union, Sequence
+
 from fealpy.backend import backend_manager as bm
-from scipy.spatial import cKDTree
+from fealpy.backend import TensorLike
+from fealpy.sparse._spspmm import _expand
+
+
+class NeighborList():
+    """Neighbor pairs of fixed capacity, in the sparse format of
+    `partition.neighbor_list`: `idx` is shaped (2, capacity), holding the
+    receivers `i_s` and the senders `j_s`, and padded with the number of
+    particles.
+
+    The pairs are those within the cutoff plus the skin radius of the
+    `reference_position`, so the list stays valid until a particle moves more
+    than half of the skin. If there were more pairs than the capacity,
+    `did_buffer_overflow` is True and the list must be allocated again.
+    """
+    def __init__(self, idx: TensorLike, reference_position: TensorLike,
+                 did_buffer_overflow: bool, num_particles: int, builder):
+        self.idx = idx
+        self.reference_position = reference_position
+        self.did_buffer_overflow = did_buffer_overflow
+        self.num_particles = num_particles
+        self.builder = builder
+
+    @property
+    def max_occupancy(self) -> int:
+        return self.idx.shape[1]
+
+    def update(self, position: TensorLike, num_particles: Optional[int]=None):
+        return self.builder.update(position, self, num_particles=num_particles)
+
+
+class CellListNeighbor():
+    """Backend-agnostic neighbor search with a cell-linked list and a Verlet skin.
+
+    The particles are binned into cells of width at least `r_cutoff + skin`,
+    so the neighbors of a particle are in the 3^D cells around its own. The
+    list is rebuilt by `update` only when some particle has moved more than
+    `skin / 2` since the last build.
+
+    Parameters:
+        box_size (float | Tensor): The size of the box, or one for each axis,
+            which is [0, box_size). Only used on the periodic axes.\n
+        r_cutoff (float): The cutoff radius.\n
+        skin (float, optional): The extra radius of the Verlet list. Defaults to 0.0,
+            rebuilding at every update.\n
+        periodic (bool | Sequence[bool], optional): Whether the box is periodic, for all
+            axes or for each one. Defaults to True.\n
+        capacity_multiplier (float, optional): Ratio of the capacity to the number
+            of pairs found by `allocate`. Defaults to 1.25.\n
+        mask_self (bool, optional): Whether to exclude the pairs (i, i). Defaults to True.\n
+        batch_size (int, optional): Number of particles processed at a time, bounding
+            the memory of the candidate pairs. Defaults to 2**16.
+    """
+    def __init__(self, box_size: Union[float, TensorLike, None], r_cutoff: float, *,
+                 skin: float=0.0,
+                 periodic: Union[bool, Sequence[bool]]=True,
+                 capacity_multiplier: float=1.25,
+                 mask_self: bool=True,
+                 batch_size: int=2**16):
+        self.box_size = box_size
+        self.r_cutoff = r_cutoff
+        self.skin = skin
+        self.periodic = periodic
+        self.capacity_multiplier = capacity_multiplier
+        self.mask_self = mask_self
+        self.batch_size = batch_size
+
+    def _setup(self, position: TensorLike):
+        D = position.shape[1]
+        if isinstance(self.periodic, bool):
+            periodic = [self.periodic] * D
+        else:
+            periodic = [bool(p) for p in self.periodic]
+        if len(periodic) != D:
+            raise ValueError(f"periodic has {len(periodic)} axes, but the positions have {D}.")
+        if any(periodic) and self.box_size is None:
+            raise ValueError("box_size is needed for the periodic axes.")
+        box = bm.zeros((D, ), **bm.context(position))
+        if self.box_size is not None:
+            size = self.box_size
+            box = box + (size if bm.is_tensor(size) else bm.tensor(size, **bm.context(position)))
+        return box, bm.tensor(periodic, dtype=bm.bool, device=bm.get_device(position))
+
+    def displacement(self, dr: TensorLike, box: TensorLike, periodic: TensorLike) -> TensorLike:
+        """The minimum image of the displacements dr (..., D)."""
+        if not bool(bm.any(periodic)):
+            return dr
+        safe = bm.where(periodic, box, 1)
+        return bm.where(periodic, dr - safe * bm.round(dr / safe), dr)
+
+    def pairs(self, position: TensorLike, num_particles: Optional[int]=None):
+        """All the pairs of the first `num_particles` particles within `r_cutoff + skin`.
+
+        Returns:
+            Tensor: The receivers i_s, sorted.\n
+            Tensor: The senders j_s.
+        """
+        N = position.shape[0] if num_particles is None else int(num_particles)
+        box, periodic = self._setup(position)
+        pos = position[:N]
+        D = position.shape[1]
+        r = self.r_cutoff + self.skin
+        ikwargs = {'dtype': bm.int64, 'device': bm.get_device(position)}
+
+        # the cell grid: [0, box) on the periodic axes, the bounding box otherwise
+        if N > 0:
+            origin = bm.where(periodic, 0, bm.min(pos, axis=0))
+            length = bm.where(periodic, box, bm.max(pos, axis=0) - origin)
+        else:
+            origin = length = box
+        shape = [max(int(float(length[a]) // r), 1) for a in range(D)]
+        h = length / bm.tensor(shape, **bm.context(position))
+        h = bm.where(h > 0, h, 1)
+        strides = [1] * D
+        for a in range(D - 2, -1, -1):
+            strides[a] = strides[a+1] * shape[a+1]
+        ncell = strides[0] * shape[0]
+        shape_t = bm.tensor(shape, **ikwargs)
+        strides_t = bm.tensor(strides, **ikwargs)
+
+        x = pos - origin
+        x = bm.where(periodic, x - box * bm.floor(x / bm.where(periodic, box, 1)), x)
+        coords = bm.astype(bm.floor(x / h), bm.int64)
+        coords = bm.minimum(bm.maximum(coords, bm.zeros_like(coords)), shape_t - 1)
+        cell = bm.sum(coords * strides_t, axis=-1)
+
+        order = bm.argsort(cell, stable=True)
+        count = bm.bincount(cell, minlength=ncell)
+        ptr = bm.concat([bm.zeros((1, ), **ikwargs), bm.cumsum(count, axis=0)], axis=0)
+
+        # the stencil of neighbor cells, without repetition on short periodic axes
+        offsets = [list(range(shape[a])) if (bool(periodic[a]) and shape[a] < 3)
+                   else [-1, 0, 1] for a in range(D)]
+        stencil = bm.tensor(list(product(*offsets)), **ikwargs) # (S, D)
+        S = stencil.shape[0]
+
+        i_s, j_s = [], []
+        r2 = r**2
+        for start in range(0, N, self.batch_size):
+            pid = bm.arange(start, min(start + self.batch_size, N), **ikwargs)
+            pid = bm.repeat(pid, S)
+            nc = coords[pid] + bm.tile(stencil, (pid.shape[0] // S, 1))
+            nc = bm.where(periodic, nc % shape_t, nc)
+            valid = bm.all((nc >= 0) & (nc < shape_t), axis=-1)
+            nid = bm.sum(bm.where(valid[:, None], nc, 0) * strides_t, axis=-1)
+            cnt = bm.where(valid, ptr[nid + 1] - ptr[nid], 0)
+
+            group, offset = _expand(cnt)
+            i = pid[group]
+            j = order[ptr[nid[group]] + offset]
+            dr = self.displacement(pos[i] - pos[j], box, periodic)
+            keep = bm.sum(dr**2, axis=-1) <= r2
+            if self.mask_self:
+                keep = keep & (i != j)
+            i_s.append(i[keep])
+            j_s.append(j[keep])
+
+        if N == 0:
+            return bm.zeros((0, ), **ikwargs), bm.zeros((0, ), **ikwargs)
+        return bm.concat(i_s, axis=0), bm.concat(j_s, axis=0)
+
+    def _build(self, position: TensorLike, num_particles: Optional[int],
+               capacity: Optional[int]) -> NeighborList:
+        N = position.shape[0] if num_particles is None else int(num_particles)
+        i_s, j_s = self.pairs(position, N)
+        npair = i_s.shape[0]
+        if capacity is None:
+            capacity = int(npair * self.capacity_multiplier)
+        overflow = npair > capacity
+        m = min(npair, capacity)
+        pad = bm.full((2, capacity - m), position.shape[0], dtype=bm.int64,
+                      device=bm.get_device(position))
+        idx = bm.concat([bm.stack([i_s[:m], j_s[:m]], axis=0), pad], axis=1)
+        return NeighborList(idx, position, overflow, N, self)
+
+    def allocate(self, position: TensorLike, num_particles: Optional[int]=None) -> NeighborList:
+        """Build a new neighbor list, whose capacity is `capacity_multiplier`
+        times the number of pairs.
+
+        Parameters:
+            position (Tensor): The positions of the particles, shaped (N, D).\n
+            num_particles (int, optional): Only the first `num_particles` particles
+                are searched, the others are padding. Defaults to all of them.
+
+        Returns:
+            NeighborList: The neighbor list.
+        """
+        return self._build(position, num_particles, None)
+
+    def update(self, position: TensorLike, neighbors: NeighborList,
+               num_particles: Optional[int]=None) -> NeighborList:
+        """Update the neighbor list to the new positions, keeping its capacity.
+
+        The list is returned unchanged if no particle has moved more than
+        `skin / 2` since it was built.
+        """
+        N = neighbors.num_particles if num_particles is None else int(num_particles)
+        reference = neighbors.reference_position
+        if (self.skin > 0) and (N == neighbors.num_particles) and \
+                (position.shape == reference.shape) and not neighbors.did_buffer_overflow:
+            box, periodic = self._setup(position)
+            dr = self.displacement(position[:N] - reference[:N], box, periodic)
+            if N == 0 or float(bm.max(bm.sum(dr**2, axis=-1))) <= (self.skin / 2)**2:
+                return neighbors
+        return self._build(position, N, neighbors.max_occupancy)
 
-import jax.numpy as jnp
-from jax_md import space, partition
-from jax import vmap, lax
 
 class Neighbor:
     def __init__(self, mesh):
-        self.mesh = mesh 
-    
+        self.mesh = mesh
+
     def segmensum(self, ):
         pass
 
 
     def find_neighbors_backend(self, state, h):
-        tree = cKDTree(state["position"])
-        neighbors = tree.query_ball_tree(tree, h)
-        n_long = bm.array([len(sublist) for sublist in neighbors])
-
-        neighbors = bm.array([item for sublist in neighbors for item in sublist])
-
-        indices = bm.arange(len(n_long))
-        indices = bm.repeat(indices, n_long)
-        
+        finder = CellListNeighbor(None, h, periodic=False, mask_self=False)
+        indices, neighbors = finder.pairs(state["position"])
         return neighbors, indices
 
+    def find_neighbors_cell_list(self, box_size, h, *, skin=0.0, periodic=True,
+                                 capacity_multiplier=1.25, mask_self=True):
+        '''
+        @brief Build the backend-agnostic cell list neighbor search, and allocate
+        the neighbor list of the nodes. Use `nbrs.update(position)` at every step.
+        '''
+        neighbor_fn = CellListNeighbor(box_size, h, skin=skin, periodic=periodic,
+                                       capacity_multiplier=capacity_multiplier,
+                                       mask_self=mask_self)
+        return neighbor_fn, neighbor_fn.allocate(self.mesh.node)
+
     def find_neighbors_jax(self, box_size, h):
         '''
         @brief Find neighbor particles within the smoothing radius.
 
         note : Currently using jax's own jax_md, vmap, lax
         '''
+        import jax.numpy as jnp
+        from jax_md import space, partition
+        from jax import vmap, lax
+
         displacement, shift = space.periodic(box_size)
         neighbor_fn = partition.neighbor_list(displacement, box_size, h)
 
@@ -45,4 +257,3 @@ class Neighbor:
         index = index[index != num]
 
         return index, indptr
-
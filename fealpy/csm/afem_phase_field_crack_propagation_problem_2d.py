@@ -170,8 +170,8 @@ class AFEMPhaseFieldCrackPropagationProblem2d():
         """
         @brief 二分法加密策略
         """
-        data = {'uh0':self.uh[:, 0], 'uh1':self.uh[:, 1], 'd':self.d,
-                'H':self.H}
+        data = {'uh0':(self.uh[:, 0], 'node'), 'uh1':(self.uh[:, 1], 'node'),
+                'd':(self.d, 'node'), 'H':(self.H, 'cell')}
         option = self.mesh.bisect_options(data=data, disp=False)
         self.mesh.bisect(isMarkedCell, options=option)
         print('mesh refine')      
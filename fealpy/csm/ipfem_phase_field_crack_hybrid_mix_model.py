@@ -267,8 +267,8 @@ class IPFEMPhaseFieldCrackHybridMixModel():
         @brief 二分法加密策略
         """
         dcell2dof = self.dspace.cell_to_dof()
-        data = {'uh0':self.uh[:, 0], 'uh1':self.uh[:, 1], 'd':self.d[dcell2dof],
-                'H':self.H}
+        data = {'uh0':(self.uh[:, 0], 'node'), 'uh1':(self.uh[:, 1], 'node'),
+                'd':(self.d[dcell2dof], 'local'), 'H':(self.H, 'cell')}
         option = self.mesh.bisect_options(data=data, disp=False)
         self.mesh.bisect(isMarkedCell, options=option)
         print('mesh refine')      
@@ -1,16 +1,22 @@
 
 from typing import Optional, Literal, overload
+from functools import partial
 
 from .. import logger
 from ..typing import TensorLike
 from ..backend import backend_manager as bm
 from ..sparse import COOTensor, CSRTensor
-from .form import Form
-from .integrator import LinearInt
+from ..sparse.utils import csr_pattern
+from .form import Form, AssemblyAccumulator
+from .integrator import LinearInt, GroupIntegrator
 
 
 class BilinearForm(Form[LinearInt]):
     _M = None
+    _keep_pattern = False
+    _pattern = None
+    _keep_local = False
+    _local = None
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -43,36 +49,122 @@ class BilinearForm(Form[LinearInt]):
                 raise ValueError("Spaces should have the same dtype, "
                                 f"but got {s0.ftype} and {s1.ftype}.")
 
-    def _scalar_assembly(self):
+    ### START: Sparsity Pattern ###
+    def keep_pattern(self, status_on=True, /):
+        """Set whether to reuse the sparsity pattern of the global matrix.
+
+        When enabled, the CSR structure and the location of every local entry
+        in the CSR values are built in the first `assembly()` (symbolic assembly).
+        Later calls only scatter-add the local tensors into a new values array
+        (numeric assembly). The pattern is rebuilt automatically if the spaces,
+        the mesh topology or the integrators have been changed.
+        """
+        self._keep_pattern = status_on
+        if not status_on:
+            self._pattern = None
+        return self
+
+    def _pattern_signature(self):
+        # NOTE: Objects are kept alive in the pattern cache, so their ids
+        # can not be reused by other objects while the pattern is valid.
+        objs = []
+        nums = []
+        for space in self._spaces:
+            mesh = space.mesh
+            objs.extend([space, mesh, mesh.entity('cell')])
+            nums.extend([space.number_of_global_dofs(), mesh.number_of_nodes()])
+        for group, int_ in self.integrators.items():
+            sub_ints = tuple(int_) if isinstance(int_, GroupIntegrator) else (int_,)
+            objs.extend([int_, self.splitters[group], *sub_ints])
+            objs.extend(i.get_region() for i in sub_ints)
+            nums.append(len(sub_ints))
+        nums.append(getattr(self, '_transposed', False))
+        return objs, tuple(id(obj) for obj in objs) + tuple(nums)
+
+    def _symbolic_assembly(self):
+        objs, signature = self._pattern_signature()
+        M = self._scalar_assembly(coalesce_chunks=False)
+        if getattr(self, '_transposed', False):
+            M = M.T
+        crow, col, location = csr_pattern(M.indices(), M.sparse_shape)
+        self._pattern = (objs, signature, crow, col, location, M.sparse_shape)
+        logger.info(f"Sparsity pattern of bilinear form built, with {col.shape[0]} "
+                    f"non-zeros from {location.shape[0]} local entries.")
+        values = bm.zeros(M.dense_shape + (col.shape[0],), **M.values_context())
+        values = bm.index_add(values, location, M.values(), axis=-1)
+        return CSRTensor(crow, col, values, M.sparse_shape)
+
+    def _numeric_assembly(self):
+        _, _, crow, col, location, spshape = self._pattern
+        space = self._spaces[0]
+        kwargs = {'dtype': space.ftype, 'device': bm.get_device(space)}
+        values = bm.zeros(self._values_ravel_shape[:-1] + (col.shape[0],), **kwargs)
+        total = location.shape[0]
+        cursor = 0
+
+        for group_tensor, _ in self.assembly_local_iterative():
+            if (self.batch_size > 0) and (group_tensor.ndim == 3):
+                group_tensor = bm.stack([group_tensor]*self.batch_size, axis=0)
+            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+            size = group_tensor.shape[-1]
+            if cursor + size > total:
+                return None
+            values = bm.index_add(values, location[cursor:cursor+size], group_tensor, axis=-1)
+            cursor += size
+
+        if cursor != total:
+            return None
+
+        return CSRTensor(crow, col, values, spshape)
+
+    def _pattern_assembly(self):
+        self.check_space()
+        if self._pattern is not None:
+            if self._pattern[1] == self._pattern_signature()[1]:
+                M = self._numeric_assembly()
+                if M is not None:
+                    return M
+            logger.info("Sparsity pattern of bilinear form is out of date, rebuilding.")
+            self._pattern = None
+        return self._symbolic_assembly()
+    ### END: Sparsity Pattern ###
+
+    def _scalar_assembly(self, *, coalesce_chunks: bool=True):
         self.check_space()
         space = self._spaces
         batch_size = self.batch_size
         ugdof = space[0].number_of_global_dofs()
         vgdof = space[1].number_of_global_dofs() if (len(space) > 1) else ugdof
-        init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
         sparse_shape = (vgdof, ugdof)
 
-        M = COOTensor(
-            indices = bm.empty((2, 0), dtype=space[0].itype, device=bm.get_device(space[0])),
-            values = bm.empty(init_value_shape, dtype=space[0].ftype, device=bm.get_device(space[0])),
-            spshape = sparse_shape
+        # NOTE: The buffers are sized for the groups without splitters only,
+        # and grow as the coalesced chunks of the other groups are appended.
+        acc = AssemblyAccumulator(
+            self.local_capacity(coalesce_chunks=coalesce_chunks), sparse_shape,
+            dense_shape = self._values_ravel_shape[:-1],
+            itype = space[0].itype,
+            ftype = space[0].ftype,
+            device = bm.get_device(space[0])
         )
-        # for group in self.integrators.keys():
-            # group_tensor, e2dofs = self._assembly_group(group, retain_ints)
-        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
-            ue2dof = e2dofs_tuple[0]
-            ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
-            local_shape = group_tensor.shape[-3:] # (NC, vldof, uldof)
-
-            if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
-            I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
-            J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
-            indices = bm.stack([I.ravel(), J.ravel()], axis=0)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
 
-        return M
+        for group in self.integrators.keys():
+            # NOTE: Chunks from splitters are coalesced before being written,
+            # to keep the accumulated entries small.
+            chunked = coalesce_chunks and (self.splitters[group] is not None)
+
+            for group_tensor, e2dofs_tuple in self.assembly_local_group(group):
+                ue2dof = e2dofs_tuple[0]
+                ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+                local_shape = group_tensor.shape[-3:] # (NC, vldof, uldof)
+
+                if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
+                    group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+                I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
+                J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
+                group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+                acc.append((I.ravel(), J.ravel()), group_tensor, coalesce=chunked)
+
+        return acc.tocoo()
 
     @overload
     def assembly(self) -> CSRTensor: ...
@@ -90,6 +182,17 @@ class BilinearForm(Form[LinearInt]):
         Returns:
             global_matrix (CSRTensor | COOTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
         """
+        if self._keep_pattern:
+            M = self._pattern_assembly()
+            if format == 'csr':
+                self._M = M
+            elif format == 'coo':
+                self._M = M.tocoo()
+            else:
+                raise ValueError(f"Unsupported format {format}.")
+            logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)}.")
+            return self._M
+
         M = self._scalar_assembly()
         if getattr(self, '_transposed', False):
             M = M.T
@@ -104,17 +207,111 @@ class BilinearForm(Form[LinearInt]):
 
         return self._M
 
+    ### START: Matrix-free Operator ###
+    def keep_local(self, status_on=True, /):
+        """Set whether to keep the local tensors for the matrix-free `mult`.
+
+        When enabled, the local tensors of all integrator groups are computed
+        in the first `mult()` and reused by later calls, trading the memory of
+        the local tensors for the cost of integrating them in every product.
+        When disabled, they are integrated on the fly chunk by chunk (use
+        `keep_data` of integrators to cache the integral materials).
+        The cache is rebuilt automatically if the spaces, the mesh topology or
+        the integrators have been changed, but not if their coefficients have.
+        Call `keep_local(True)` again to drop the kept local tensors.
+        """
+        self._keep_local = status_on
+        self._local = None
+        return self
+
+    def _local_tensors(self, group: str, /):
+        if not self._keep_local:
+            yield from self.assembly_local_group(group)
+            return
+
+        _, signature = self._pattern_signature()
+        if (self._local is None) or (self._local[0] != signature):
+            self._local = (signature, {})
+        kept = self._local[1]
+        if group not in kept:
+            kept[group] = tuple(self.assembly_local_group(group))
+            logger.info(f"Local tensors of group {group} kept, in {len(kept[group])} chunks.")
+        yield from kept[group]
+
+    def _local_operators(self, group: str, /, transposed: bool=False):
+        """Yield functions applying the local operators of a group to local
+        vectors shaped (..., NC, ldof, n), with the to_global_dof tuples."""
+        int_ = self.integrators[group]
+
+        if getattr(int_, 'matrix_free', False):
+            # NOTE: Matrix-free integrators provide symmetric operators only.
+            space = self.space
+            splitter = self.splitters[group]
+            for indices in ((None,) if splitter is None else splitter(space, int_)):
+                kwargs = {} if (indices is None) else {'indices': indices}
+                etg = int_.to_global_dof(space, **kwargs)
+                if not isinstance(etg, (tuple, list)):
+                    etg = (etg, )
+
+                def apply(gx, kwargs=kwargs):
+                    gx = bm.einsum('...cjk -> ...kcj', gx)
+                    return bm.einsum('...kci -> ...cik', int_.apply(space, gx, **kwargs))
+
+                yield apply, etg
+        else:
+            subs = '...cji' if transposed else '...cij'
+            for group_tensor, etg in self._local_tensors(group):
+                yield partial(bm.einsum, f'{subs}, ...cjk -> ...cik', group_tensor), etg
+
     def mult(self, x: TensorLike, out: Optional[TensorLike]=None) -> TensorLike:
-        """Maxtrix vector multiplication.
+        """Maxtrix vector multiplication, without assembling the global matrix.
+
+        Local tensors are applied to the local DoFs gathered from `x` and the
+        results are scatter-added to the output, chunk by chunk if splitters are set.
+        Integrators with `matrix_free` on (e.g. the 'tensor' assembly method of
+        ScalarDiffusionIntegrator) are applied without their local tensors.
 
         Parameters:
-            x (TensorLike): Vector, accepts batch on the first dimension.\n
-            out (TensorLike, optional): Output vector. Defaults to None.
+            x (TensorLike): Vector shaped (gdof,), or matrix shaped (..., gdof, n)
+                where ... are batch dimensions.\n
+            out (TensorLike, optional): Output tensor. Defaults to None.
 
         Returns:
-            TensorLike: self @ x
+            TensorLike: self @ x, shaped ([batch, ]vgdof) or (..., vgdof, n).
         """
-        raise NotImplementedError
+        self.check_space()
+        transposed = getattr(self, '_transposed', False)
+        nrow = self.sparse_shape[0]
+        ncol = self.sparse_shape[1]
+        vector = (x.ndim == 1)
+        x = x[:, None] if vector else x
+
+        if x.shape[-2] != ncol:
+            raise ValueError(f"Size of x ({x.shape[-2]}) does not match the "
+                             f"shape of the bilinear form {self.sparse_shape}.")
+
+        lead = x.shape[:-2]
+        if (self.batch_size > 0) and (len(lead) == 0):
+            lead = (self.batch_size,)
+        v = bm.zeros(lead + (nrow, x.shape[-1]), **bm.context(x))
+
+        for group in self.integrators.keys():
+            for apply, e2dofs in self._local_operators(group, transposed):
+                ue2dof = e2dofs[0]
+                ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
+                if transposed:
+                    ue2dof, ve2dof = ve2dof, ue2dof
+                gv = apply(x[..., ue2dof, :]) # (..., NC, vldof, n)
+                gv = bm.broadcast_to(gv, lead + gv.shape[-3:])
+                gv = bm.reshape(gv, lead + (-1, gv.shape[-1]))
+                v = bm.index_add(v, ve2dof.reshape(-1), gv, axis=-2)
+
+        v = v[..., 0] if vector else v
+
+        if out is None:
+            return v
+        return bm.set_at(out, ..., v)
+    ### END: Matrix-free Operator ###
 
     @property
     def T(self):
@@ -126,36 +323,4 @@ class BilinearForm(Form[LinearInt]):
     def __matmul__(self, u: TensorLike):
         if self._M is not None:
             return self._M @ u
-
-        nrow = self.shape[-2]
-        kwargs = bm.context(u)
-
-        if self.batch_size > 0:
-            shape = (self.batch_size, nrow)
-            out_subs = 'bci'
-            gv_reshape = (self.batch_size, -1)
-        else:
-            if u.ndim >= 2:
-                shape = (u.shape[0], nrow)
-                out_subs = 'bci'
-                gv_reshape = (u.shape[0], -1)
-            else:
-                shape = (nrow,)
-                out_subs = 'ci'
-                gv_reshape = (-1,)
-
-        v = bm.zeros(shape, **kwargs)
-        gt_subs = 'bcij' if (self.batch_size > 0) else 'cij'
-        gu_subs = 'bcj' if (u.ndim >= 2) else 'cj'
-
-        for group in self.integrators.keys():
-            group_tensor, e2dofs = self._assembly_group(group, True)
-            ue2dof = e2dofs[0]
-            ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
-            gu = u[..., ue2dof] # (..., NC, uldof)
-            gv = bm.einsum(f'{gt_subs}, {gu_subs} -> {out_subs}', group_tensor, gu)
-            v = bm.index_add(v, ve2dof.reshape(-1), gv.reshape(gv_reshape))
-
-        return v
-
-
+        return self.mult(u)
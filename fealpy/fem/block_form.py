@@ -1,11 +1,11 @@
 from typing import List
+from itertools import accumulate
 
 from .. import logger
 from ..typing import Size, TensorLike
 from ..backend import backend_manager as bm
-from ..sparse import COOTensor, CSRTensor
+from ..sparse import COOTensor, CSRTensor, BlockCSRTensor
 from .form import Form
-from ..sparse import COOTensor, CSRTensor
 
 class BlockForm(Form):
     _M = None
@@ -29,63 +29,56 @@ class BlockForm(Form):
     def shape(self) -> Size:
         return self.sparse_shape
 
+    def _block_sizes(self):
+        row_sizes = [int(s) for s in bm.max(self.block_shape[..., 0], axis=1)]
+        col_sizes = [int(s) for s in bm.max(self.block_shape[..., 1], axis=0)]
+        return row_sizes, col_sizes
+
     def assembly(self, format='csr'):
-        a = bm.max(self.block_shape[...,0], axis=1)
-        row_offset = bm.cumsum(bm.max(self.block_shape[...,0],axis = 1), axis=0)
-        col_offset = bm.cumsum(bm.max(self.block_shape[...,1],axis = 0), axis=0)
-        row_offset = bm.concatenate((bm.array([0]),row_offset))
-        col_offset = bm.concatenate((bm.array([0]),col_offset))
-         
-        for j in range(self.ncols):
-            block = self.blocks[0][j]
-            if block is not None:
-                indices = bm.empty((2, 0), dtype=block.space.mesh.itype)
-                values = bm.empty((0,), dtype=block.space.mesh.ftype)
-                break
-        sparse_shape = self.shape
-        
-        for i in range(self.nrows):
-            for j in range(self.ncols):
-                block = self.blocks[i][j]
-                if block is None:
-                    continue
-                block_matrix = block.assembly(format='coo')
-                block_indices = block_matrix.indices() + bm.array([[row_offset[i]], [col_offset[j]]])
-                block_values = block_matrix.values() 
-                indices = bm.concatenate((indices, block_indices), axis=1)
-                values = bm.concatenate((values, block_values))
-        M = COOTensor(indices, values, sparse_shape) 
+        """Assembly the block matrix, block by block.
+
+        Parameters:
+            format (str, optional): Layout of the output. 'block' keeps the CSR
+                matrix of each block in a BlockCSRTensor, without copying them
+                into one matrix, while 'csr' and 'coo' flatten the blocks.
+                Defaults to 'csr'.
+
+        Returns:
+            global_matrix (BlockCSRTensor | CSRTensor | COOTensor): The matrix.
+        """
+        if format not in ('block', 'csr', 'coo'):
+            raise ValueError(f"Unknown format {format}.")
+        row_sizes, col_sizes = self._block_sizes()
+        blocks = [[None if block is None else block.assembly(format='csr')
+                   for block in row] for row in self.blocks]
+        M = BlockCSRTensor(blocks, row_sizes, col_sizes)
+
         if format == 'csr':
-            self._M = M.coalesce().tocsr()
+            self._M = M.tocsr()
         elif format == 'coo':
-            self._M = M.coalesce()
+            self._M = M.tocoo()
         else:
-            raise ValueError(f"Unknown format {format}.")
+            self._M = M
         logger.info(f"Block form matrix constructed, with shape {list(self._M.shape)}.")
         return self._M
-    
-    
+
     def __matmul__(self, u: TensorLike):
         if self._M is not None:
             return self._M @ u
-        
-        # u的不同ndim情况
-        kwargs = bm.context(u)
-        v = bm.zeros_like(u, **kwargs)
 
-        row_offset = bm.cumsum(bm.max(self.block_shape[...,0],axis = 1), axis=0)
-        col_offset = bm.cumsum(bm.max(self.block_shape[...,1],axis = 0), axis=0)
-        row_offset = bm.concatenate((bm.array([0]),row_offset))
-        col_offset = bm.concatenate((bm.array([0]),col_offset))
+        row_sizes, col_sizes = self._block_sizes()
+        row_offset = [0] + list(accumulate(row_sizes))
+        col_offset = [0] + list(accumulate(col_sizes))
+        v = []
         for i in range(self.nrows):
+            vi = bm.zeros((row_sizes[i], ) + tuple(u.shape[1:]), **bm.context(u))
             for j in range(self.ncols):
                 block = self.blocks[i][j]
                 if block is None:
                     continue
-                v = bm.index_add(v, bm.arange(row_offset[i],row_offset[i+1]), 
-                                 block @ u[row_offset[j]:row_offset[j+1]] )
-                #v[row_offset[i]:row_offset[i+1]] += block @ u[row_offset[j]:row_offset[j+1]] 
-        return v
+                vi = vi + block @ u[col_offset[j]:col_offset[j+1]]
+            v.append(vi)
+        return bm.concat(v, axis=0)
 
 
 Form.register(BlockForm)
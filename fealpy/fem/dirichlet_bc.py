@@ -215,12 +215,34 @@ class DirichletBC():
         """
         A = self.check_matrix(matrix) if check else matrix
         f = self.check_vector(vector) if check else vector
+        uh = self.interpolate(f, uh, gd)
+        bd_idx = self.boundary_dof_index
+        f = f - A.matmul(uh[:])
+        f = bm.set_at(f, bd_idx, uh[bd_idx])
+        return f
+
+    def interpolate(self, vector: TensorLike, uh: Optional[TensorLike]=None,
+                    gd: Optional[CoefLike]=None) -> TensorLike:
+        """Interpolate the Dirichlet boundary condition to the boundary DoFs.
+
+        Parameters:
+            vector (TensorLike): The right-hand-size vector, giving the shape of `uh`.
+            uh (TensorLike | None, optional): The solution uh Tensor. Defuault to None.\
+                See `DirichletBC.apply()` for more details.
+            gd (CoefLike | None, optional): The Dirichlet boundary condition.\
+                Use the default gd passed in the __init__ if `None`. Default to None.
+
+        Raises:
+            RuntimeError: If gd is `None` and no default gd exists.
+
+        Returns:
+            TensorLike: uh with the boundary values.
+        """
         gd = self.gd if gd is None else gd
-        
 
         if gd is None:
             raise RuntimeError("The boundary condition is None.")
-        
+
         if isinstance(self.space, tuple):
             if isinstance(gd, tuple):
                 assert len(gd) == len(self.space)
@@ -236,12 +258,146 @@ class DirichletBC():
                 uh = gd
         else:
             if uh is None:
-                uh = bm.zeros_like(f)
+                uh = bm.zeros_like(vector)
             uh, _ = self.space.boundary_interpolate(gd=gd,uh=uh,
                                                 threshold=self.threshold, method=self.method)
-        bd_idx = self.boundary_dof_index
-        f = f - A.matmul(uh[:])
-        f = bm.set_at(f, bd_idx, uh[bd_idx])
+        return uh
+
+    def plan(self, matrix: CSRTensor, /) -> 'DirichletBCPlan':
+        """Make the plan applying the boundary condition to the matrices with
+        the sparsity pattern of `matrix`, see `DirichletBCPlan`."""
+        return DirichletBCPlan(self, matrix)
+
+
+class DirichletBCPlan():
+    """Dirichlet boundary condition applied to CSR matrices of a fixed sparsity
+    pattern, e.g. the matrices of a transient problem assembled with the kept
+    pattern of a `BilinearForm`.
+
+    The positions of the entries in the rows and columns of the boundary DoFs,
+    of their diagonal entries, and of the entries coupling the interior rows to
+    the boundary columns are found once. The matrix is then adjusted by masking
+    the values, keeping the pattern (the removed entries become explicit zeros),
+    and the right-hand side is lifted by the coupling entries only,
+    f_I = f_I - A_IB u_B, instead of the product of the whole matrix.
+
+    Matrix values and vectors can be batched, shaped (..., NNZ) and (..., gdof).
+
+    Parameters:
+        bc (DirichletBC): The boundary condition.\n
+        matrix (CSRTensor): A matrix of the sparsity pattern. Every boundary row
+            must have its diagonal entry in the pattern.
+    """
+    def __init__(self, bc: DirichletBC, matrix: CSRTensor):
+        if not isinstance(matrix, CSRTensor):
+            raise ValueError('The type of matrix must be CSRTensor.')
+        bc.check_matrix(matrix)
+        self.bc = bc
+        self.crow = matrix.crow()
+        self.col = matrix.col()
+        self.sparse_shape = matrix.sparse_shape
+
+        crow, col = self.crow, self.col
+        isDDof = bc.is_boundary_dof
+        N = crow.shape[0] - 1
+        row = bm.repeat(bm.arange(N, **bm.context(crow)), crow[1:] - crow[:-1])
+        brow = isDDof[row]
+        bcol = isDDof[col]
+        diag = brow & (row == col)
+
+        NBD = bc.boundary_dof_index.shape[0]
+        if int(bm.sum(bm.astype(diag, bm.int64))) != NBD:
+            raise ValueError("Every boundary row must have one diagonal entry in "
+                             "the sparsity pattern.")
+
+        # entries set to zero, or to one on the diagonal
+        self.mask_index = bm.nonzero(brow | bcol)[0]
+        self.mask_value = bm.astype(diag[self.mask_index], matrix.values().dtype)
+        # entries coupling the interior rows to the boundary columns
+        lift = bm.nonzero(bm.logical_not(brow) & bcol)[0]
+        self.lift_index = lift
+        self.lift_row = row[lift]
+        self.lift_col = col[lift]
+
+    def check_matrix(self, matrix: CSRTensor, /) -> CSRTensor:
+        """Check if the matrix has the sparsity pattern of the plan."""
+        if not isinstance(matrix, CSRTensor):
+            raise ValueError('The type of matrix must be CSRTensor.')
+        crow, col = matrix.crow(), matrix.col()
+        if (crow is self.crow) and (col is self.col):
+            return matrix
+        if (matrix.sparse_shape != self.sparse_shape) or (col.shape != self.col.shape) \
+                or not (bm.all(crow == self.crow) and bm.all(col == self.col)):
+            raise ValueError('The sparsity pattern of the matrix differs from the plan.')
+        return matrix
+
+    def apply(self, A: CSRTensor, f: TensorLike, uh: Optional[TensorLike]=None,
+              gd: Optional[CoefLike]=None, *,
+              inplace=False, check=True) -> Tuple[CSRTensor, TensorLike]:
+        """Apply Dirichlet boundary conditions, see `DirichletBC.apply`.
+
+        Parameters:
+            A (CSRTensor): Left-hand-size sparse matrix of the pattern.
+            f (Tensor): Right-hand-size vector.
+            uh (Tensor | None, optional): The solution uh Tensor, where the boundary
+                values are interpolated. Only the boundary values are used. Defaults to None.
+            gd (CoefLike | None, optional): The Dirichlet boundary condition.\
+                Use the default gd of the boundary condition if `None`. Default to None.
+            inplace (bool, optional): Whether to mask the values of `A` without a copy,
+                see `apply_matrix`. Defaults to False.
+            check (bool, optional): Whether to check the pattern of `A`. Defaults to True.
+
+        Returns:
+            out (CSRTensor, Tensor): Adjusted `A` and `f`.
+        """
+        f = self.apply_vector(f, A, uh, gd, check=check)
+        A = self.apply_matrix(A, inplace=inplace, check=False)
+        return A, f
+
+    def apply_matrix(self, matrix: CSRTensor, *, inplace=False, check=True) -> CSRTensor:
+        """Apply Dirichlet boundary condition to left-hand-size matrix only,
+        by masking the values.
+
+        Parameters:
+            matrix (CSRTensor): The left-hand-size sparse matrix of the pattern.
+            inplace (bool, optional): Whether to mask the values of the input without
+                a copy. The input is modified on the backends mutating tensors in
+                place only, so use the returned matrix. Defaults to False.
+            check (bool, optional): Whether to check the pattern. Defaults to True.
+
+        Returns:
+            CSRTensor: The adjusted matrix, sharing the pattern of the input.
+        """
+        A = self.check_matrix(matrix) if check else matrix
+        values = A.values() if inplace else bm.copy(A.values())
+        values = bm.set_at(values, (..., self.mask_index), self.mask_value)
+        return CSRTensor(self.crow, self.col, values, self.sparse_shape)
+
+    def apply_vector(self, vector: TensorLike, matrix: CSRTensor,
+                     uh: Optional[TensorLike]=None,
+                     gd: Optional[CoefLike]=None, *, check=True) -> TensorLike:
+        """Apply Dirichlet boundary condition to right-hand-size vector only, by
+        lifting with the entries coupling the interior and boundary DoFs of the
+        original matrix.
+
+        Parameters:
+            vector (TensorLike): The right-hand-size vector, shaped (..., gdof).
+            matrix (CSRTensor): The original sparse matrix of the pattern.
+            uh (TensorLike | None, optional): See `apply`.
+            gd (CoefLike | None, optional): See `apply`.
+            check (bool, optional): Whether to check the pattern. Defaults to True.
+
+        Returns:
+            TensorLike: The adjusted vector.
+        """
+        A = self.check_matrix(matrix) if check else matrix
+        if vector.shape[-1] != self.sparse_shape[0]:
+            raise ValueError('The vector size must match the gdof of the space.')
+        uh = self.bc.interpolate(vector, uh, gd)[:]
+        bd_idx = self.bc.boundary_dof_index
+        contrib = A.values()[..., self.lift_index] * uh[..., self.lift_col]
+        f = bm.index_add(bm.copy(vector), self.lift_row, contrib, axis=-1, alpha=-1)
+        f = bm.set_at(f, (..., bd_idx), uh[..., bd_idx])
         return f
 
 
@@ -6,8 +6,10 @@ from typing import (
 
 from ..typing import TensorLike, Size, Index
 from ..backend import backend_manager as bm
+from ..sparse import COOTensor
 from ..functionspace import FunctionSpace as _FS
 from .integrator import Integrator, GroupIntegrator
+from .form_executor import EXECUTORS, map_chunks
 
 from .. import logger
 from abc import ABC
@@ -29,6 +31,7 @@ class Form(Generic[_I], ABC):
     splitters: Dict[str, _Splitter]
     batch_size: int
     sparse_shape: Tuple[int, ...]
+    _executor: Optional[Tuple[str, Optional[int]]] = None
 
     @overload
     def __init__(self, space: _FS, /, *, batch_size: int=0): ...
@@ -56,6 +59,7 @@ class Form(Generic[_I], ABC):
         new_obj.integrators.update(self.integrators)
         # new_obj.chunk_sizes.update(self.chunk_sizes)
         new_obj.splitters.update(self.splitters)
+        new_obj._executor = self._executor
         new_obj._values_ravel_shape = self._values_ravel_shape
         new_obj.sparse_shape = tuple(reversed(self.sparse_shape))
         return new_obj
@@ -143,6 +147,28 @@ class Form(Generic[_I], ABC):
 
         return self
 
+    def parallel(self, executor: Optional[str]='thread', /, *, max_workers: Optional[int]=None):
+        """Set the executor integrating the chunks of the integrator groups with splitters.
+
+        The first chunk of a group is integrated in the calling thread, building
+        the lazy mesh topology and the caches shared by the chunks, and the others
+        are distributed to a pool of workers, see `fem.form_executor`. Both executors
+        work with the numpy backend only, and for the 'process' executor the
+        integrators and their coefficients must be picklable. The local tensors
+        are merged in the order of the chunks, so the result is the same as the
+        sequential assembly.
+
+        Parameters:
+            executor (str | None, optional): 'thread', 'process', or None for the
+                sequential assembly. Defaults to 'thread'.\n
+            max_workers (int, optional): Number of workers. Defaults to the default
+                of the pool.
+        """
+        if (executor is not None) and (executor not in EXECUTORS):
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS} or None.")
+        self._executor = None if executor is None else (executor, max_workers)
+        return self
+
     def _assembly_kernel(self, group: str, /, indices=None):
         integrator = self.integrators[group]
         if indices is None:
@@ -155,18 +181,131 @@ class Form(Generic[_I], ABC):
             etg = (etg, )
         return value, etg
 
+    def assembly_local_group(self, group: str, /):
+        """Assembly local matrix of a group considering chunk size.
+        Yields local matrix and to_global_dof tuple."""
+        int_ = self.integrators[group]
+        splitter = self.splitters[group]
+        if splitter is None:
+            logger.debug(f"(ASSEMBLY LOCAL FULL) {group}")
+            yield self._assembly_kernel(group)
+        else:
+            logger.debug(f"(ASSEMBLY LOCAL ITER) {group}")
+            chunks = iter(splitter(self.space, int_))
+            for indices in chunks:
+                yield self._assembly_kernel(group, indices)
+                # NOTE: The pool consumes the rest of the chunks after the first one.
+                if self._executor is not None:
+                    yield from map_chunks(self, group, chunks, *self._executor)
+
     def assembly_local_iterative(self):
         """Assembly local matrix considering chunk size.
         Yields local matrix and to_global_dof tuple."""
-        for key, int_ in self.integrators.items():
-            splitter = self.splitters[key]
-            if splitter is None:
-                logger.debug(f"(ASSEMBLY LOCAL FULL) {key}")
-                yield self._assembly_kernel(key)
-            else:
-                logger.debug(f"(ASSEMBLY LOCAL ITER) {key}")
-                for indices in splitter(self.space, int_):
-                    yield self._assembly_kernel(key, indices)
+        for key in self.integrators.keys():
+            yield from self.assembly_local_group(key)
+
+    def local_capacity(self, *, coalesce_chunks: bool=False) -> int:
+        """Number of local entries produced by the integrators, counted from
+        the shapes of their to_global_dof outputs.
+
+        Parameters:
+            coalesce_chunks (bool, optional): Leave out the groups with splitters,
+                whose chunks are coalesced before they are accumulated, so their
+                to_global_dof are not evaluated on the whole mesh. Defaults to False.
+        """
+        total = 0
+        for group, int_ in self.integrators.items():
+            if coalesce_chunks and (self.splitters[group] is not None):
+                continue
+            etg = int_.to_global_dof(self.space)
+            if not isinstance(etg, (tuple, list)):
+                etg = (etg, )
+            total += self._local_size(etg)
+        return total
+
+    def _local_size(self, entity_to_global: Tuple[TensorLike, ...], /) -> int:
+        """Number of local entries of one integrator, with a local dof axis for
+        each axis of the sparse shape. The last to_global_dof is shared by the
+        remaining axes, as the test space of a bilinear form defaults to the
+        trial space."""
+        size = entity_to_global[0].shape[0]
+        for i in range(len(self.sparse_shape)):
+            size *= entity_to_global[min(i, len(entity_to_global) - 1)].shape[-1]
+        return size
+
+
+class AssemblyAccumulator():
+    """Accumulate local entries of a form into preallocated COO buffers.
+
+    The index and value buffers are allocated once with the given capacity and
+    filled in place, instead of concatenating the whole COO tensor for every
+    integrator group. Chunks can be coalesced before they are written, which
+    keeps the written part of the buffers small when a splitter is used.
+
+    Parameters:
+        capacity (int): Initial number of entries of the buffers. The buffers
+            grow automatically if more entries are appended.\n
+        sparse_shape (Size): Shape of the sparse dimensions.\n
+        dense_shape (Size, optional): Shape of the dense (batch) dimensions of values.\n
+        itype, ftype: Data types of indices and values.\n
+        device (optional): Device of the buffers.
+    """
+    def __init__(self, capacity: int, sparse_shape: Size, *,
+                 dense_shape: Size = (), itype=None, ftype=None, device=None):
+        self.sparse_shape = tuple(sparse_shape)
+        self.dense_shape = tuple(dense_shape)
+        self._indices = bm.empty((len(self.sparse_shape), capacity), dtype=itype, device=device)
+        self._values = bm.empty(self.dense_shape + (capacity,), dtype=ftype, device=device)
+        self._cursor = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._indices.shape[-1]
+
+    @property
+    def nnz(self) -> int:
+        return self._cursor
+
+    def _reserve(self, size: int, /):
+        capacity = max(size, 2 * self.capacity)
+        logger.debug(f"(ASSEMBLY ACCUMULATOR) growing from {self.capacity} to {capacity}.")
+        indices = bm.empty((self._indices.shape[0], capacity), **bm.context(self._indices))
+        values = bm.empty(self.dense_shape + (capacity,), **bm.context(self._values))
+        stop = self._cursor
+        self._indices = bm.set_at(indices, (slice(None), slice(0, stop)), self._indices[:, :stop])
+        self._values = bm.set_at(values, (..., slice(0, stop)), self._values[..., :stop])
+
+    def append(self, indices: Union[TensorLike, Sequence[TensorLike]], values: TensorLike, /, *,
+               coalesce: bool = False):
+        """Write local entries into the buffers.
+
+        Parameters:
+            indices (Tensor | Sequence[Tensor]): Indices shaped (sparse_ndim, n),
+                or a sequence of 1-D index tensors for each sparse dimension.\n
+            values (Tensor): Values shaped (*dense_shape, n).\n
+            coalesce (bool, optional): Sum the duplicated entries before writing.
+                Defaults to False.
+        """
+        if coalesce:
+            if not isinstance(indices, TensorLike):
+                indices = bm.stack(indices, axis=0)
+            chunk = COOTensor(indices, values, self.sparse_shape).coalesce()
+            indices, values = chunk.indices(), chunk.values()
+
+        size = values.shape[-1]
+        start, stop = self._cursor, self._cursor + size
+        if stop > self.capacity:
+            self._reserve(stop)
+
+        for d in range(len(self.sparse_shape)):
+            self._indices = bm.set_at(self._indices, (d, slice(start, stop)), indices[d])
+        self._values = bm.set_at(self._values, (..., slice(start, stop)), values)
+        self._cursor = stop
+
+    def tocoo(self) -> COOTensor:
+        """Return the accumulated entries as a (not coalesced) COO tensor."""
+        stop = self._cursor
+        return COOTensor(self._indices[:, :stop], self._values[..., :stop], self.sparse_shape)
 
 
 class UniformSplitter():
@@ -188,6 +327,51 @@ class UniformSplitter():
             start = stop
 
 
+class PartitionSplitter():
+    """Split the cells of integration by the parts of a mesh partition, so that
+    the chunks are compact pieces of the mesh.
+
+    Parameters:
+        nparts (int | MeshPartition): Number of parts, or the partition of the mesh.\\n
+        method (str, optional): Method of the partitions made for the meshes, see
+            `MeshPartition.from_mesh`. Defaults to 'rcb'.
+    """
+    def __init__(self, nparts, /, *, method: str='rcb'):
+        if isinstance(nparts, int):
+            self.nparts = nparts
+            self.partition = None
+        else:
+            self.nparts = nparts.nparts
+            self.partition = nparts
+        self.method = method
+
+    def get_partition(self, mesh):
+        """The partition of the mesh, made once for each mesh."""
+        partition = self.partition
+        if (partition is None) or (partition.mesh is not mesh) or \
+                (partition.part.shape[0] != mesh.number_of_cells()):
+            partition = mesh.partition(self.nparts, method=self.method)
+            self.partition = partition
+        return partition
+
+    def __call__(self, space, integrator: Integrator):
+        if isinstance(space, (list, tuple)):
+            space = space[0]
+        mesh = space.mesh
+        etype = getattr(integrator, 'etype', 'cell')
+        if etype != 'cell':
+            raise ValueError(f"PartitionSplitter splits cells, but the integrator "
+                             f"integrates on {etype}.")
+        part = self.get_partition(mesh).part
+        region = integrator.entity_selection(mesh=mesh)
+        if not isinstance(region, slice):
+            part = part[region]
+
+        for i in range(self.nparts):
+            logger.debug(f"(FORM ITER) part {i+1}/{self.nparts}")
+            yield bm.nonzero(part == i)[0]
+
+
 # NOTE: deprecated.
 # An iteration util for the `_assembly_kernel` method.
 class IntegralIter():
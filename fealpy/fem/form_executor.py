@@ -0,0 +1,151 @@
+"""Parallel execution of the assembly chunks of a form.
+
+The chunks yielded by the splitter of an integrator group are independent,
+so their local tensors can be integrated by a pool of workers:
+- 'thread', a thread pool sharing everything with the calling thread, which
+  scales as far as NumPy releases the GIL in its kernels;
+- 'process', a process pool. The form is pickled once for each worker, with
+  the large arrays, the mesh arrays above all, placed in shared memory
+  instead of the pickle.
+
+Both work with the numpy backend only: the operators of PyTorch are
+multithreaded already, and its functional transforms, used by the shape
+functions, are not thread-safe.
+
+The local tensors are returned in the order of the chunks, and merged into
+the global matrix by the form as in the sequential assembly.
+"""
+from typing import Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+import io
+import pickle
+
+from .. import logger
+from ..backend import backend_manager as bm
+
+__all__ = ['EXECUTORS', 'map_chunks']
+
+EXECUTORS = ('thread', 'process')
+# Arrays smaller than this are cheaper to pickle than to share.
+_SHARE_NBYTES = 1024
+
+
+class _SharedPickler(pickle.Pickler):
+    """Pickle NumPy arrays of at least `_SHARE_NBYTES` bytes as references
+    to shared memory blocks, each array copied once."""
+    def __init__(self, file, blocks: dict):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.blocks = blocks
+
+    def persistent_id(self, obj):
+        import numpy as np
+        if (type(obj) is not np.ndarray) or obj.dtype.hasobject or (obj.nbytes < _SHARE_NBYTES):
+            return None
+        key = id(obj)
+        if key not in self.blocks:
+            from multiprocessing.shared_memory import SharedMemory
+            shm = SharedMemory(create=True, size=obj.nbytes)
+            np.ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)[...] = obj
+            # NOTE: The array is kept to pin its id while pickling.
+            self.blocks[key] = (shm, obj)
+        shm = self.blocks[key][0]
+        return (shm.name, obj.shape, obj.dtype.str)
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    """Load the arrays pickled by `_SharedPickler` as read-only views of the
+    shared memory blocks."""
+    def __init__(self, file, attached: list):
+        super().__init__(file)
+        self.attached = attached
+
+    def persistent_load(self, pid):
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory
+        name, shape, dtype = pid
+        shm = SharedMemory(name=name)
+        self.attached.append(shm)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        array.flags.writeable = False
+        return array
+
+
+class _SharedBlocks():
+    """The shared memory blocks of one pickled object, released on exit."""
+    def __init__(self):
+        self.blocks = {}
+
+    def dumps(self, obj) -> bytes:
+        file = io.BytesIO()
+        _SharedPickler(file, self.blocks).dump(obj)
+        return file.getvalue()
+
+    def nbytes(self) -> int:
+        return sum(obj.nbytes for _, obj in self.blocks.values())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        for shm, _ in self.blocks.values():
+            shm.close()
+            shm.unlink()
+        self.blocks.clear()
+
+
+# State of the process workers
+_WORKER_FORM = None
+_WORKER_SHM = []
+
+
+def _init_process(payload: bytes, backend: str):
+    global _WORKER_FORM
+    bm.set_backend(backend)
+    _WORKER_FORM = _SharedUnpickler(io.BytesIO(payload), _WORKER_SHM).load()
+
+
+def _process_kernel(group: str, indices):
+    return _WORKER_FORM._assembly_kernel(group, indices)
+
+
+def map_chunks(form, group: str, chunks: Iterable, executor: str,
+               max_workers: Optional[int]=None):
+    """Integrate the chunks of an integrator group in a pool of workers.
+
+    Parameters:
+        form (Form): The form.\n
+        group (str): Name of the integrator group.\n
+        chunks (Iterable): Indices of the chunks from the splitter.\n
+        executor (str): 'thread' or 'process'.\n
+        max_workers (int, optional): Number of workers. Defaults to the
+            default of the pool.
+
+    Yields:
+        Tuple[Tensor, Tuple[Tensor, ...]]: The local tensor and the to_global_dof
+            tuple of every chunk, in the order of the chunks.
+    """
+    backend = bm.backend_name
+    if backend != 'numpy':
+        raise RuntimeError("The parallel executors support the numpy backend only, "
+                           f"but the current backend is {backend}.")
+
+    if executor == 'thread':
+        # NOTE: The backend is set for each thread.
+        with ThreadPoolExecutor(max_workers, initializer=bm.set_backend,
+                                initargs=(backend,)) as pool:
+            yield from pool.map(partial(form._assembly_kernel, group), chunks)
+
+    elif executor == 'process':
+        with _SharedBlocks() as shared:
+            # NOTE: The copy drops the matrices and patterns kept by the form.
+            payload = shared.dumps(form.copy())
+            logger.info(f"Form of group {group} sent to the process pool, with "
+                        f"{shared.nbytes()} bytes in shared memory and "
+                        f"{len(payload)} bytes pickled.")
+            with ProcessPoolExecutor(max_workers, initializer=_init_process,
+                                     initargs=(payload, backend)) as pool:
+                yield from pool.map(partial(_process_kernel, group), chunks)
+
+    else:
+        raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}.")
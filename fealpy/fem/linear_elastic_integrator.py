@@ -12,6 +12,7 @@ from .integrator import (
     assemblymethod
 )
 from fealpy.fem.utils import SymbolicIntegration
+from .reference_tensor import simplex_elasticity_assembly
 
 class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
     """
@@ -437,6 +438,27 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
         
         return KK
     
+    @assemblymethod('reference')
+    def reference_assembly(self, space: _TS) -> TensorLike:
+        """Assembly on simplex meshes with the reference tensors cached process-wide,
+        for piecewise-constant elastic matrices."""
+        scalar_space = space.scalar_space
+        mesh = getattr(scalar_space, 'mesh', None)
+        GD = mesh.geo_dimension()
+        q = scalar_space.p+3 if self.q is None else self.q
+
+        D = self.material.elastic_matrix()
+        if D.shape[1] != 1:
+            raise ValueError("reference_assembly currently only supports elastic matrices "
+                             "with shape (NC, 1, NS, NS) or (1, 1, NS, NS).")
+        # Strain of the gradients of unit vectors, giving the strain operator.
+        I = bm.eye(GD, dtype=mesh.ftype, device=mesh.device)
+        strain = self.material.strain_matrix(True, I[:, None, None, :])[:, 0] # (GD, NS, GD)
+        strain = bm.einsum('asb -> sba', strain)
+
+        return simplex_elasticity_assembly(mesh, scalar_space.p, q, D[:, 0], strain,
+                                           dof_priority=space.dof_priority, index=self.index)
+
     @assemblymethod('fast_stress')
     def fast_assembly_stress(self, space: _TS) -> TensorLike:
         scalar_space = space.scalar_space
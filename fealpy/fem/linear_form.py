@@ -5,7 +5,7 @@ from .. import logger
 from ..typing import TensorLike
 from ..backend import backend_manager as bm 
 from ..sparse import COOTensor
-from .form import Form
+from .form import Form, AssemblyAccumulator
 from .integrator import LinearInt
 
 
@@ -33,29 +33,35 @@ class LinearForm(Form[LinearInt]):
         if len(self._spaces) != 1:
             raise ValueError("LinearForm should have only one space.")
 
-    def _scalar_assembly(self):
+    def _scalar_assembly(self, *, coalesce_chunks: bool=True):
         self.check_space()
         space = self._spaces[0]
         batch_size = self.batch_size
         gdof = space.number_of_global_dofs()
-        init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
         sparse_shape = (gdof, )
 
-        M = COOTensor(
-            indices = bm.empty((1, 0), dtype=space.itype, device=bm.get_device(space)),
-            values = bm.empty(init_value_shape, dtype=space.ftype, device=bm.get_device(space)),
-            spshape = sparse_shape
+        # NOTE: The buffers are sized for the groups without splitters only,
+        # and grow as the coalesced chunks of the other groups are appended.
+        acc = AssemblyAccumulator(
+            self.local_capacity(coalesce_chunks=coalesce_chunks), sparse_shape,
+            dense_shape = self._values_ravel_shape[:-1],
+            itype = space.itype,
+            ftype = space.ftype,
+            device = bm.get_device(space)
         )
 
-        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
-            if (batch_size > 0) and (group_tensor.ndim == 2):
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+        for group in self.integrators.keys():
+            chunked = coalesce_chunks and (self.splitters[group] is not None)
 
-            indices = e2dofs_tuple[0].reshape(1, -1)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+            for group_tensor, e2dofs_tuple in self.assembly_local_group(group):
+                if (batch_size > 0) and (group_tensor.ndim == 2):
+                    group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
 
-        return M
+                indices = e2dofs_tuple[0].reshape(1, -1)
+                group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+                acc.append(indices, group_tensor, coalesce=chunked)
+
+        return acc.tocoo()
 
     @overload
     def assembly(self) -> TensorLike: ...
@@ -0,0 +1,175 @@
+"""Reference-element tensors for the assembly on simplex meshes.
+
+On a simplex cell, the gradient of a Lagrange basis is an affine combination
+of the (cell-wise constant) gradients of barycentric coordinates:
+
+    grad phi_i = sum_k (d phi_i / d lambda_k) grad lambda_k.
+
+So for piecewise-constant coefficients, integrals of basis products only
+depend on the cell through its measure and `grad_lambda`. The integrals on
+the reference element are computed once for each (p, q) and cached
+process-wide, and the local matrices are small contractions of them.
+"""
+from typing import Dict, Tuple, Optional, Literal
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike, Index, _S, CoefLike
+from ..mesh.mesh_base import SimplexMesh
+from ..utils import is_scalar, is_tensor
+from .. import logger
+
+__all__ = [
+    'reference_tensor',
+    'clear_reference_tensors',
+    'simplex_mass_assembly',
+    'simplex_diffusion_assembly',
+    'simplex_convection_assembly',
+    'simplex_elasticity_assembly'
+]
+
+_RefName = Literal['mass', 'convection', 'stiffness']
+_REFERENCE_TENSORS: Dict[Tuple, TensorLike] = {}
+
+
+def reference_tensor(name: _RefName, mesh: SimplexMesh, p: int, q: int) -> TensorLike:
+    """Integrals of products of the basis and its derivatives in barycentric
+    coordinates on the reference simplex, with weights summing up to 1.
+
+    Parameters:
+        name (str): 'mass' for phi_i phi_j, shaped (ldof, ldof);\n
+            'convection' for phi_i d_l phi_j, shaped (ldof, ldof, TD+1);\n
+            'stiffness' for d_k phi_i d_l phi_j, shaped (ldof, ldof, TD+1, TD+1).\n
+        mesh (SimplexMesh): Mesh providing the quadrature formula.\n
+        p (int): Degree of the Lagrange basis.\n
+        q (int): Index of the quadrature formula.
+
+    Returns:
+        TensorLike: The reference tensor, cached for the same arguments and backend.
+    """
+    if not isinstance(mesh, SimplexMesh):
+        raise TypeError("Reference tensors are only available on simplex meshes, "
+                        f"but got {type(mesh).__name__}.")
+
+    key = (name, type(mesh).__name__, mesh.top_dimension(), p, q,
+           bm.backend_name, str(mesh.ftype), str(mesh.device))
+
+    if key not in _REFERENCE_TENSORS:
+        qf = mesh.quadrature_formula(q, 'cell')
+        bcs, ws = qf.get_quadrature_points_and_weights()
+        phi = mesh.shape_function(bcs, p) # (NQ, ldof)
+        gphi = mesh.grad_shape_function(bcs, p, variables='u') # (NQ, ldof, TD+1)
+
+        if name == 'mass':
+            data = bm.einsum('q, qi, qj -> ij', ws, phi, phi)
+        elif name == 'convection':
+            data = bm.einsum('q, qi, qjl -> ijl', ws, phi, gphi)
+        elif name == 'stiffness':
+            data = bm.einsum('q, qik, qjl -> ijkl', ws, gphi, gphi)
+        else:
+            raise ValueError(f"Unknown reference tensor '{name}'.")
+
+        logger.debug(f"(REFERENCE TENSOR) {key}")
+        _REFERENCE_TENSORS[key] = data
+
+    return _REFERENCE_TENSORS[key]
+
+
+def clear_reference_tensors() -> None:
+    """Clear the process-wide cache of reference tensors."""
+    _REFERENCE_TENSORS.clear()
+
+
+def _cell_coef(coef: Optional[CoefLike], NC: int, ndim: int) -> Optional[TensorLike]:
+    """Check a piecewise-constant coefficient, returned as None, a scalar
+    or a tensor shaped (NC, ...) with `ndim` dimensions."""
+    if (coef is None) or is_scalar(coef):
+        return coef
+    if not is_tensor(coef):
+        raise TypeError("Only piecewise-constant coefficients given as tensors "
+                        f"are supported, but got {type(coef).__name__}.")
+    if coef.ndim == ndim - 1:
+        coef = coef[None, ...]
+    if (coef.ndim != ndim) or (coef.shape[0] not in (1, NC)):
+        raise ValueError(f"Piecewise-constant coefficient should be shaped ({NC}, ...) "
+                         f"with {ndim} dimensions, but got {tuple(coef.shape)}.")
+    return coef
+
+
+def simplex_mass_assembly(mesh: SimplexMesh, p: int, q: int,
+                          coef: Optional[CoefLike]=None, *,
+                          index: Index=_S) -> TensorLike:
+    """Local mass matrices shaped (NC, ldof, ldof), with a piecewise-constant
+    coefficient given as a scalar or shaped (NC,)."""
+    M = reference_tensor('mass', mesh, p, q)
+    cm = mesh.entity_measure('cell', index=index)
+    coef = _cell_coef(coef, cm.shape[0], 1)
+    if is_tensor(coef):
+        cm = cm * coef
+    result = bm.einsum('ij, c -> cij', M, cm)
+    return result if (coef is None) or is_tensor(coef) else result * coef
+
+
+def simplex_diffusion_assembly(mesh: SimplexMesh, p: int, q: int,
+                               coef: Optional[CoefLike]=None, *,
+                               index: Index=_S) -> TensorLike:
+    """Local diffusion matrices shaped (NC, ldof, ldof), with a piecewise-constant
+    coefficient given as a scalar, shaped (NC,), or shaped (NC, GD, GD)."""
+    S = reference_tensor('stiffness', mesh, p, q)
+    cm = mesh.entity_measure('cell', index=index)
+    glambda = mesh.grad_lambda(index=index) # (NC, TD+1, GD)
+
+    if is_tensor(coef) and (coef.ndim >= 2):
+        coef = _cell_coef(coef, cm.shape[0], 3)
+        G = bm.einsum('ckm, cmn, cln -> ckl', glambda, coef, glambda)
+        return bm.einsum('ijkl, ckl, c -> cij', S, G, cm)
+
+    coef = _cell_coef(coef, cm.shape[0], 1)
+    if is_tensor(coef):
+        cm = cm * coef
+    G = bm.einsum('ckm, clm -> ckl', glambda, glambda)
+    result = bm.einsum('ijkl, ckl, c -> cij', S, G, cm)
+    return result if (coef is None) or is_tensor(coef) else result * coef
+
+
+def simplex_convection_assembly(mesh: SimplexMesh, p: int, q: int,
+                                coef: TensorLike, *,
+                                index: Index=_S) -> TensorLike:
+    """Local convection matrices (phi_i, b.grad phi_j) shaped (NC, ldof, ldof),
+    with a piecewise-constant velocity b shaped (GD,) or (NC, GD)."""
+    C = reference_tensor('convection', mesh, p, q)
+    cm = mesh.entity_measure('cell', index=index)
+    glambda = mesh.grad_lambda(index=index) # (NC, TD+1, GD)
+    coef = _cell_coef(coef, cm.shape[0], 2)
+    bl = bm.einsum('clm, cm -> cl', glambda, coef)
+    return bm.einsum('ijl, cl, c -> cij', C, bl, cm)
+
+
+def simplex_elasticity_assembly(mesh: SimplexMesh, p: int, q: int,
+                                D: TensorLike, strain: TensorLike, *,
+                                dof_priority: bool=True,
+                                index: Index=_S) -> TensorLike:
+    """Local linear elastic stiffness matrices shaped (NC, GD*ldof, GD*ldof).
+
+    Parameters:
+        D (TensorLike): Piecewise-constant elastic matrix in the Voigt notation,
+            shaped (NC, NS, NS), (1, NS, NS) or (NS, NS).\n
+        strain (TensorLike): The strain-displacement operator shaped (NS, GD, GD),
+            where strain[s, b, a] is the factor of the a-th derivative of the
+            b-th displacement component in the s-th strain component.\n
+        dof_priority (bool, optional): Whether the local DoFs are ordered by
+            components first. Defaults to True.
+    """
+    S = reference_tensor('stiffness', mesh, p, q)
+    cm = mesh.entity_measure('cell', index=index)
+    glambda = mesh.grad_lambda(index=index) # (NC, TD+1, GD)
+    D = _cell_coef(D, cm.shape[0], 3)
+    # B[c, s, b, k]: factor of d phi/d lambda_k for the b-th component
+    B = bm.einsum('sba, cka -> csbk', strain, glambda)
+    G = bm.einsum('csbk, cst, ctdl -> cbdkl', B, D, B)
+    A = bm.einsum('ijkl, cbdkl, c -> cbidj', S, G, cm) # (NC, GD, ldof, GD, ldof)
+
+    if not dof_priority:
+        A = bm.einsum('cbidj -> cibjd', A)
+
+    NC, n = A.shape[0], A.shape[1] * A.shape[2]
+    return bm.reshape(A, (NC, n, n))
@@ -8,6 +8,7 @@ from ..mesh import HomogeneousMesh
 from ..functionspace.space import FunctionSpace as _FS
 from ..utils import process_coef_func
 from ..functional import bilinear_integral
+from .reference_tensor import simplex_convection_assembly
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -61,3 +62,12 @@ class ScalarConvectionIntegrator(LinearInt, OpInt, CellInt):
         else:
             raise TypeError(f"coef should be Tensor, but got {type(coef)}.")
         return result
+
+    @assemblymethod('fast')
+    def fast_assembly(self, space: _FS) -> TensorLike:
+        """Assembly on simplex meshes with the reference tensors cached process-wide,
+        for piecewise-constant coef shaped (GD,) or (NC, GD)."""
+        if self.batched:
+            raise NotImplementedError("fast assembly does not support batched coef.")
+        q = space.p+3 if self.q is None else self.q
+        return simplex_convection_assembly(space.mesh, space.p, q, self.coef, index=self.index)
@@ -8,6 +8,8 @@ from ..mesh import HomogeneousMesh
 from ..functionspace.space import FunctionSpace as _FS
 from ..utils import process_coef_func
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from ..functional import sum_factorized_integral, sum_factorized_apply
+from .reference_tensor import simplex_diffusion_assembly
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -21,7 +23,7 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
     def __init__(self, coef: Optional[CoefLike] = None, q: Optional[int] = None, *,
                  region: Optional[TensorLike] = None,
                  batched: bool = False,
-                 method: Literal['fast', 'nonlinear', 'isopara', None] = None) -> None:
+                 method: Literal['fast', 'nonlinear', 'isopara', 'tensor', None] = None) -> None:
         super().__init__(method=method if method else 'assembly')
         self.coef = coef
         self.q = q
@@ -70,16 +72,17 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
         """
         限制：常系数、单纯形网格
         TODO: 加入 assert
+
+        On simplex meshes, the reference tensors are cached process-wide and
+        piecewise-constant coef shaped (NC,) or (NC, GD, GD) is supported.
         """
         mesh = space.mesh
         if isinstance(mesh, SimplexMesh):
-
-            _, ws = self.fetch_qf(space)
-            gphi = self.fetch_gphiu(space, indices)
-            M = bm.einsum('q, qik, qjl -> ijkl', ws, gphi, gphi)
-            cm = self.fetch_measure(space, indices)
-            glambda = mesh.grad_lambda(index=self.entity_selection(indices))
-            result = bm.einsum('ijkl, ckm, clm, c -> cij', M, glambda, glambda, cm)
+            if self.batched:
+                raise NotImplementedError("fast assembly does not support batched coef.")
+            q = space.p+3 if self.q is None else self.q
+            index = self.entity_selection(indices)
+            result = simplex_diffusion_assembly(mesh, space.p, q, self.coef, index=index)
         else:
             coef = self.coef
             mesh = space.mesh    
@@ -97,6 +100,61 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
             result = bm.einsum('cqkn, qijmn, cqkm, c -> cij', JG, M, JG, cm) # (NC, NQ, ldof, GD)
         return result
 
+    @enable_cache
+    def fetch_tensor_factors(self, space: _FS):
+        bcs = self.fetch_qf(space)[0]
+        if not isinstance(bcs, tuple):
+            raise ValueError("Sum factorization requires a tensor-product quadrature, "
+                             f"which is not provided by {type(space.mesh).__name__}.")
+        p = space.p
+        TD = len(bcs)
+        Dlambda = bm.array([-1, 1], dtype=space.ftype, device=bm.get_device(bcs[0]))
+        phi = [bm.simplex_shape_function(bc, p=p) for bc in bcs]
+        dphi = [bm.einsum('...ij, j -> ...i', bm.simplex_grad_shape_function(bc, p=p), Dlambda)
+                for bc in bcs]
+        # the m-th reference derivative of the tensor-product basis
+        return tuple(
+            tuple(dphi[k] if k == m else phi[k] for k in range(TD)) for m in range(TD)
+        )
+
+    @enable_cache
+    def fetch_tensor_metric(self, space: _FS, /, indices=None):
+        mesh = space.mesh
+        bcs, ws = self.fetch_qf(space)
+        cm = self.fetch_measure(space, indices)
+        J = mesh.jacobi_matrix(bcs, index=self.entity_selection(indices))
+        G = bm.einsum('cqkm, cqkn -> cqmn', J, J)
+        return bm.einsum('q, c, cqmn -> cqmn', ws, cm, bm.linalg.inv(G))
+
+    def _tensor_coef(self, space: _FS, /, indices=None):
+        if self.batched:
+            raise NotImplementedError("Sum factorization does not support batched coef.")
+        bcs = self.fetch_qf(space)[0]
+        index = self.entity_selection(indices)
+        return process_coef_func(self.coef, bcs=bcs, mesh=space.mesh, etype='cell', index=index)
+
+    @assemblymethod('tensor')
+    def tensor_assembly(self, space: _FS, /, indices=None) -> TensorLike:
+        """Sum-factorized assembly on tensor-product cells (quadrangle, hexahedron
+        and uniform meshes), for scalar coefficients."""
+        factors = self.fetch_tensor_factors(space)
+        metric = self.fetch_tensor_metric(space, indices)
+        coef = self._tensor_coef(space, indices)
+        return sum_factorized_integral(factors, factors, metric, coef)
+
+    @property
+    def matrix_free(self) -> bool:
+        """Whether the integrator can be applied by `apply` without local matrices."""
+        return self._method == 'tensor'
+
+    def apply(self, space: _FS, x: TensorLike, /, indices=None) -> TensorLike:
+        """Apply the local matrices of the 'tensor' assembly method to the local
+        vectors `x` shaped (..., NC, ldof), using sum factorization."""
+        factors = self.fetch_tensor_factors(space)
+        metric = self.fetch_tensor_metric(space, indices)
+        coef = self._tensor_coef(space, indices)
+        return sum_factorized_apply(factors, factors, metric, x, coef)
+
     @assemblymethod('nonlinear')
     def nonlinear_assembly(self, space: _FS, /, indices=None) -> TensorLike:
         uh = self.uh
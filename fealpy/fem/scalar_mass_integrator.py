@@ -7,6 +7,8 @@ from ..mesh import HomogeneousMesh
 from ..functionspace.space import FunctionSpace as _FS
 from ..utils import process_coef_func
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from ..functional import sum_factorized_integral, sum_factorized_apply
+from .reference_tensor import simplex_mass_assembly
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -57,6 +59,56 @@ class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
 
         return bilinear_integral(phi, phi, ws, cm, val, batched=self.batched)
 
+    @enable_cache
+    def fetch_tensor(self, space: _FS):
+        index = self.index
+        mesh = getattr(space, 'mesh', None)
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q, 'cell')
+        bcs, ws = qf.get_quadrature_points_and_weights()
+        if not isinstance(bcs, tuple):
+            raise ValueError("Sum factorization requires a tensor-product quadrature, "
+                             f"which is not provided by {type(mesh).__name__}.")
+        factors = (tuple(bm.simplex_shape_function(bc, p=space.p) for bc in bcs), )
+        cm = mesh.entity_measure('cell', index=index)
+        metric = bm.einsum('q, c -> cq', ws, cm)[..., None, None]
+        return bcs, factors, metric, index
+
+    def _tensor_coef(self, space: _FS, bcs, index):
+        if self.batched:
+            raise NotImplementedError("Sum factorization does not support batched coef.")
+        mesh = getattr(space, 'mesh', None)
+        return process_coef_func(self.coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+
+    @assemblymethod('fast')
+    def fast_assembly(self, space: _FS) -> TensorLike:
+        """Assembly on simplex meshes with the reference tensors cached process-wide,
+        for piecewise-constant coef shaped (NC,)."""
+        if self.batched:
+            raise NotImplementedError("fast assembly does not support batched coef.")
+        q = space.p+3 if self.q is None else self.q
+        return simplex_mass_assembly(space.mesh, space.p, q, self.coef, index=self.index)
+
+    @assemblymethod('tensor')
+    def tensor_assembly(self, space: _FS) -> TensorLike:
+        """Sum-factorized assembly on tensor-product cells (quadrangle, hexahedron
+        and uniform meshes), for scalar coefficients."""
+        bcs, factors, metric, index = self.fetch_tensor(space)
+        coef = self._tensor_coef(space, bcs, index)
+        return sum_factorized_integral(factors, factors, metric, coef)
+
+    @property
+    def matrix_free(self) -> bool:
+        """Whether the integrator can be applied by `apply` without local matrices."""
+        return self._method == 'tensor'
+
+    def apply(self, space: _FS, x: TensorLike, /) -> TensorLike:
+        """Apply the local matrices of the 'tensor' assembly method to the local
+        vectors `x` shaped (..., NC, ldof), using sum factorization."""
+        bcs, factors, metric, index = self.fetch_tensor(space)
+        coef = self._tensor_coef(space, bcs, index)
+        return sum_factorized_apply(factors, factors, metric, x, coef)
+
     @assemblymethod('semilinear')
     def semilinear_assembly(self, space: _FS) -> TensorLike:
         uh = self.uh
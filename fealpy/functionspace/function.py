@@ -18,6 +18,11 @@ class Function(Generic[_FS]):
     def __call__(self, bcs: TensorLike, index: Index=_S):
         return self.space.value(self.array, bcs, index=index)
 
+    def eval_points(self, points: TensorLike, *, matrix=None) -> TensorLike:
+        """Evaluate the function at physical points, shaped (NP, GD).
+        See the `eval_points` of the space."""
+        return self.space.eval_points(self.array, points, matrix=matrix)
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.space}, {self.array})'
 
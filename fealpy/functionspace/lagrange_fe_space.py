@@ -8,6 +8,7 @@ from ..mesh.mesh_base import Mesh
 from .space import FunctionSpace
 from .dofs import LinearMeshCFEDof, LinearMeshDFEDof
 from .function import Function
+from .utils import real_matmul
 from fealpy.decorator import barycentric, cartesian
 
 
@@ -177,6 +178,62 @@ class LagrangeFESpace(FunctionSpace, Generic[_MT]):
             result[tag] = gphi[tag]
         return result
     
+    def point_basis(self, points: TensorLike):
+        """Locate the points in the mesh and evaluate the basis functions at them.
+
+        Parameters:
+            points (Tensor): The points, shaped (NP, GD).
+
+        Returns:
+            Tensor: The cell index of each point, shaped (NP,), -1 for points outside.\n
+            Tensor: The basis values of the cell at each point, shaped (NP, LDOF).
+        """
+        cell, bc = self.mesh.point_locator().locate(points)
+        if isinstance(bc, tuple):
+            NP = cell.shape[0]
+            phi = bm.simplex_shape_function(bc[0], self.p)
+            for b in bc[1:]:
+                phi1 = bm.simplex_shape_function(b, self.p)
+                phi = bm.reshape(phi[:, :, None] * phi1[:, None, :], (NP, -1))
+        else:
+            phi = bm.simplex_shape_function(bc, self.p)
+        return cell, phi
+
+    def point_interpolation_matrix(self, points: TensorLike):
+        """The sparse matrix mapping the DoF values to the function values at the
+        points, shaped (NP, GDOF). The rows of the points outside the mesh are empty.
+
+        The matrix is built on every call. Keep it and pass it to `eval_points`
+        to evaluate at the same points again.
+        """
+        from ..sparse import CSRTensor
+        cell, phi = self.point_basis(points)
+        found = cell >= 0
+        ldof = phi.shape[-1]
+        count = bm.where(found, ldof, 0)
+        crow = bm.concat([bm.zeros((1, ), **bm.context(count)), bm.cumsum(count, axis=0)], axis=0)
+        col = bm.reshape(self.cell_to_dof()[cell[found]], (-1, ))
+        values = bm.reshape(phi[found], (-1, ))
+        return CSRTensor(crow, col, values, (points.shape[0], self.number_of_global_dofs()))
+
+    def eval_points(self, uh: TensorLike, points: TensorLike, *, matrix=None) -> TensorLike:
+        """Evaluate the finite element function at physical points.
+
+        Parameters:
+            uh (Tensor): The DoF values, shaped (..., GDOF).\n
+            points (Tensor): The points, shaped (NP, GD).\n
+            matrix (CSRTensor, optional): The `point_interpolation_matrix` of the
+                points, reused instead of locating the points again. Defaults to None.
+
+        Returns:
+            Tensor: The function values, shaped (..., NP). Zero at the points
+            outside the mesh, see `Mesh.location`.
+        """
+        M = self.point_interpolation_matrix(points) if matrix is None else matrix
+        gdof = uh.shape[-1]
+        val = real_matmul(M, bm.swapaxes(bm.reshape(uh, (-1, gdof)), 0, 1)) # (NP, batch)
+        return bm.reshape(bm.swapaxes(val, 0, 1), uh.shape[:-1] + (points.shape[0], ))
+
     @barycentric
     def value(self, uh: TensorLike, bc: TensorLike, index: Index=_S) -> TensorLike: 
         if isinstance(bc, tuple):
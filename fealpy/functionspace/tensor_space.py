@@ -6,7 +6,7 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Size, _S
 from .functional import generate_tensor_basis, generate_tensor_grad_basis
 from .space import FunctionSpace, _S, Index, Function
-from .utils import to_tensor_dof
+from .utils import to_tensor_dof, real_matmul
 from fealpy.decorator import barycentric, cartesian
 
 
@@ -397,6 +397,29 @@ class TensorFunctionSpace(FunctionSpace):
         return uh, isTensorBDof
 
     
+    def eval_points(self, uh: TensorLike, points: TensorLike, *, matrix=None) -> TensorLike:
+        """Evaluate the finite element function at physical points, through the
+        point interpolation matrix of the scalar space.
+
+        Parameters:
+            uh (Tensor): The DoF values, shaped (GDOF, ).\n
+            points (Tensor): The points, shaped (NP, GD).\n
+            matrix (CSRTensor, optional): The `point_interpolation_matrix` of the
+                scalar space at the points, reused if given. Defaults to None.
+
+        Returns:
+            Tensor: The function values, shaped (NP, *dof_shape).
+        """
+        if matrix is None:
+            matrix = self.scalar_space.point_interpolation_matrix(points)
+        M = matrix
+        sgdof = self.scalar_space.number_of_global_dofs()
+        if self.dof_priority:
+            val = real_matmul(M, bm.swapaxes(bm.reshape(uh, (self.dof_numel, sgdof)), 0, 1))
+        else:
+            val = real_matmul(M, bm.reshape(uh, (sgdof, self.dof_numel)))
+        return bm.reshape(val, (points.shape[0], ) + self.dof_shape)
+
     @barycentric
     def value(self, uh: TensorLike, bc: TensorLike, index: Index=_S) -> TensorLike:
         if isinstance(bc, tuple):
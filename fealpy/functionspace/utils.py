@@ -41,6 +41,13 @@ def flatten_indices(shape: Size, permute: Size) -> TensorLike:
     return bm.permute_dims(permuted_indices, inv_permute)
 
 
+def real_matmul(M, x: TensorLike) -> TensorLike:
+    """Multiply a real sparse matrix and a real or complex dense tensor."""
+    if x.dtype in (bm.complex64, bm.complex128):
+        return (M @ bm.real(x)) + 1j * (M @ bm.imag(x))
+    return M @ x
+
+
 def to_tensor_dof(to_dof: TensorLike, dof_numel: int, gdof: int, dof_priority: bool=True) -> TensorLike:
     """Expand the relationship between entity and scalar dof to the tensor dof.
 
@@ -1,6 +1,10 @@
 
 from .mesh_data_structure import MeshDS
 from .mesh_base import Mesh, HomogeneousMesh, SimplexMesh, TensorMesh, StructuredMesh
+from .point_locator import PointLocator
+from .kd_tree import KDTree
+from .mesh_transfer import MeshTransfer
+from .mesh_partition import MeshPartition
 
 from .interval_mesh import IntervalMesh
 from .triangle_mesh import TriangleMesh
@@ -0,0 +1,151 @@
+"""An array-backed KD-tree for batched radius queries.
+
+The tree is a complete binary tree stored level by level: the points are
+reordered by a permutation so that every node covers a contiguous range,
+split at the median along the axes in turn, down to leaves of at most
+`leafsize` points. The bounding boxes of the nodes are stored as one array
+per level. A query descends the tree breadth-first for all query points at
+once, so both building and querying are vectorized backend operations.
+"""
+from typing import Union, Tuple
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse._spspmm import _expand
+
+__all__ = ['KDTree']
+
+
+class KDTree():
+    """KD-tree of a point set for batched radius queries.
+
+    Parameters:
+        points (Tensor): The points, shaped (N, D).\n
+        leafsize (int, optional): Maximum number of points in a leaf. Defaults to 8.
+    """
+    def __init__(self, points: TensorLike, leafsize: int=8):
+        if points.ndim != 2:
+            raise ValueError("points must be a 2D tensor shaped (N, D).")
+        self.points = points
+        self.leafsize = leafsize
+        N, D = points.shape
+        kwargs = bm.context(points)
+        ikwargs = {'dtype': bm.int64, 'device': bm.get_device(points)}
+
+        depth = 0
+        while (N >> depth) >= leafsize and (1 << depth) < N:
+            depth += 1
+        self.depth = depth
+
+        perm = bm.arange(N, **ikwargs)
+        position = bm.arange(N, **ikwargs)
+        for level in range(depth):
+            # node of each position at this level, then sort by the node and
+            # the coordinate to split every node at its median
+            node = bm.searchsorted(self._starts(level, ikwargs), position, side='right') - 1
+            order = bm.lexsort((points[perm, level % D], node))
+            perm = perm[order]
+        self.perm = perm
+
+        # bounding boxes of the leaves, then of the upper levels
+        starts = self._starts(depth, ikwargs)
+        ends = bm.concat([starts[1:], bm.tensor([N], **ikwargs)], axis=0)
+        width = int(bm.max(ends - starts)) if N > 0 else 0
+        index = starts[:, None] + bm.arange(width, **ikwargs)
+        valid = (index < ends[:, None])[..., None]
+        pts = points[perm[bm.minimum(index, bm.full_like(index, max(N - 1, 0)))]]
+        inf = bm.finfo(points.dtype).max
+        lo = bm.min(bm.where(valid, pts, inf), axis=1)
+        hi = bm.max(bm.where(valid, pts, -inf), axis=1)
+        count = ends - starts
+        self.lo, self.hi, self.count = [lo], [hi], [count]
+        for _ in range(depth):
+            lo = bm.minimum(lo[0::2], lo[1::2])
+            hi = bm.maximum(hi[0::2], hi[1::2])
+            count = count[0::2] + count[1::2]
+            self.lo.insert(0, lo)
+            self.hi.insert(0, hi)
+            self.count.insert(0, count)
+        self.leaf_start = starts
+        self.leaf_count = self.count[-1]
+
+    def _starts(self, level: int, ikwargs):
+        """The first positions of the nodes at a level."""
+        N = self.points.shape[0]
+        return (bm.arange(1 << level, **ikwargs) * N) >> level
+
+    def query_radius(self, query_points: TensorLike, radius: Union[float, TensorLike],
+                     *, include_self: bool=True,
+                     batch_size: int=2**16) -> Tuple[TensorLike, TensorLike]:
+        """Find the points within the radius of every query point.
+
+        Parameters:
+            query_points (Tensor): The query points, shaped (M, D).\n
+            radius (float | Tensor): The radius, or one for each query point shaped (M,).\n
+            include_self (bool, optional): Whether a tree point identical to the query
+                point counts as a neighbor. Defaults to True.\n
+            batch_size (int, optional): Number of query points processed at a time,
+                bounding the memory of the traversal. Defaults to 2**16.
+
+        Returns:
+            Tensor: The indices of the neighbors, grouped by the query points.\n
+            Tensor: The pointers shaped (M+1,), so that the neighbors of query point
+            `i` are `indices[indptr[i]:indptr[i+1]]`.
+        """
+        M = query_points.shape[0]
+        if not bm.is_tensor(radius):
+            radius = bm.full((M, ), radius, **bm.context(query_points))
+        qids, nids = [], []
+        for start in range(0, M, batch_size):
+            qid, nid = self._query(query_points[start:start+batch_size],
+                                   radius[start:start+batch_size], include_self)
+            qids.append(qid + start)
+            nids.append(nid)
+
+        ikwargs = {'dtype': bm.int64, 'device': bm.get_device(query_points)}
+        qid = bm.concat(qids, axis=0) if M > 0 else bm.zeros((0, ), **ikwargs)
+        nid = bm.concat(nids, axis=0) if M > 0 else bm.zeros((0, ), **ikwargs)
+        indptr = bm.concat([bm.zeros((1, ), **ikwargs),
+                            bm.cumsum(bm.bincount(qid, minlength=M), axis=0)], axis=0)
+        return nid, indptr
+
+    def _query(self, query_points: TensorLike, radius: TensorLike, include_self: bool):
+        ikwargs = {'dtype': bm.int64, 'device': bm.get_device(query_points)}
+        r2 = radius**2
+        qid = bm.arange(query_points.shape[0], **ikwargs)
+        node = bm.zeros_like(qid)
+
+        for level in range(self.depth + 1):
+            # the boxes of the empty nodes are not finite
+            nonempty = self.count[level][node] > 0
+            qid, node = qid[nonempty], node[nonempty]
+            q = query_points[qid]
+            gap = bm.maximum(self.lo[level][node] - q, q - self.hi[level][node])
+            gap = bm.maximum(gap, bm.zeros_like(gap))
+            keep = bm.sum(gap**2, axis=-1) <= r2[qid]
+            qid, node = qid[keep], node[keep]
+            if level < self.depth:
+                qid = bm.repeat(qid, 2)
+                node = bm.stack([2 * node, 2 * node + 1], axis=-1).reshape(-1)
+
+        group, offset = _expand(self.leaf_count[node])
+        qid = qid[group]
+        nid = self.perm[self.leaf_start[node[group]] + offset]
+        d2 = bm.sum((self.points[nid] - query_points[qid])**2, axis=-1)
+        keep = d2 <= r2[qid]
+        if not include_self:
+            keep = keep & (d2 > 0)
+        return qid[keep], nid[keep]
+
+    def range_query(self, query_points: TensorLike, radius: float,
+                    include_self: bool=False) -> Tuple[TensorLike, TensorLike]:
+        """Find the pairs of neighbors within the radius.
+
+        Returns:
+            Tensor: The indices of the neighbor points.\n
+            Tensor: The indices of the query points, one for each neighbor.
+        """
+        nid, indptr = self.query_radius(query_points, radius, include_self=include_self)
+        qid = bm.repeat(bm.arange(indptr.shape[0] - 1, **bm.context(indptr)),
+                        indptr[1:] - indptr[:-1])
+        return nid, qid
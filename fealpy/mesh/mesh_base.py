@@ -6,6 +6,8 @@ from ..typing import TensorLike, Index, _S
 from .. import logger
 from ..quadrature import Quadrature
 from .mesh_data_structure import MeshDS
+from .point_locator import PointLocator
+from .mesh_reorder import reorder_permutation
 from .utils import (
     estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof
 )
@@ -373,6 +375,74 @@ class HomogeneousMesh(Mesh):
     def face_to_ipoint(self, p: int, index: Index=_S) -> TensorLike:
         raise NotImplementedError
 
+    # point location
+    def point_locator(self, **kwargs) -> PointLocator:
+        """Build a point locator of the mesh. Keep it for many queries while the
+        mesh is unchanged, and build a new one after the nodes are moved or
+        the mesh is refined. See `PointLocator` for the keyword arguments."""
+        return PointLocator(self, **kwargs)
+
+    def location(self, points: TensorLike) -> TensorLike:
+        """Find the cells containing the points, shaped (NP,), with -1 for
+        the points outside the mesh. A new locator is built on every call,
+        see `point_locator` to keep one."""
+        return self.point_locator().locate(points)[0]
+
+    def point_to_bc(self, points: TensorLike):
+        """Find the cells containing the points and the barycentric coordinates
+        of the points in them. See `PointLocator.locate`."""
+        return self.point_locator().locate(points)
+
+    # partition
+    def partition(self, nparts: int, method: str='metis'):
+        """Partition the cells into `nparts` parts, see `MeshPartition.from_mesh`.
+        The subdomains with their ghost layers are extracted as standalone meshes
+        by `MeshPartition.subdomain`.
+
+        Returns:
+            MeshPartition: The partition.
+        """
+        from .mesh_partition import MeshPartition
+        return MeshPartition.from_mesh(self, nparts, method)
+
+    # ordering
+    def reorder(self, method: str='rcm') -> Tuple[TensorLike, TensorLike]:
+        """Renumber the nodes and cells in place for the locality of memory
+        accesses, see `mesh_reorder.reorder_permutation`. The topology is
+        constructed again, and the arrays in `nodedata` and `celldata` are
+        permuted, while other data attached to the mesh must follow the
+        returned permutations, e.g. `uh_new = uh[nperm]`.
+
+        Parameters:
+            method (str, optional): 'rcm', 'hilbert' or 'morton'. Defaults to 'rcm'.
+
+        Returns:
+            Tensor: The permutation of the nodes, the new node `i` is the old
+            node `nperm[i]`.\n
+            Tensor: The permutation of the cells.
+        """
+        if self.TD in self._entity_factory:
+            raise TypeError(f"{type(self).__name__} generates its cells, "
+                            "which can not be reordered.")
+        node = self.entity('node')
+        cell = self.entity('cell')
+        nperm, cperm = reorder_permutation(node, cell, method)
+        NN = node.shape[0]
+        kwargs = bm.context(cell)
+        inv = bm.zeros((NN, ), **kwargs)
+        inv = bm.set_at(inv, nperm, bm.arange(NN, **kwargs))
+
+        self.node = node[nperm]
+        self.cell = inv[cell[cperm]]
+        for name, perm in (('nodedata', nperm), ('celldata', cperm)):
+            data = self.__dict__.get(name, None)
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    if bm.is_tensor(value) and (value.ndim > 0) and (value.shape[0] == perm.shape[0]):
+                        data[key] = value[perm]
+        self.construct()
+        return nperm, cperm
+
     # tools
     def integral(self, f, q=3, celltype=False) -> TensorLike:
         """
@@ -14,6 +14,9 @@ from .utils import estr2dim, edim2entity, MeshMeta, flocc
 
 class MeshDS(metaclass=MeshMeta):
     _STORAGE_ATTR = ['cell', 'face', 'edge', 'node']
+    # NOTE: built by `construct()` on the first access, together with the
+    # faces and edges.
+    _TOPOLOGY_ATTR = ['face2cell', 'cell2face', 'edge2cell', 'cell2edge']
     cell: TensorLike
     face: TensorLike
     edge: TensorLike
@@ -27,6 +30,8 @@ class MeshDS(metaclass=MeshMeta):
     def __init__(self, *, TD: int, itype, ftype) -> None:
         assert hasattr(self, '_entity_dim_method_name_map')
         self._entity_storage: Dict[int, TensorLike] = {}
+        self._relation_cache: Dict[tuple, TensorLike] = {}
+        self._topology_pending = False
         self._entity_factory: Dict[int, Callable] = {
             k: getattr(self, self._entity_dim_method_name_map[k])
             for k in self._entity_dim_method_name_map
@@ -40,7 +45,11 @@ class MeshDS(metaclass=MeshMeta):
     def __getattr__(self, name: str):
         if name in self._STORAGE_ATTR:
             etype_dim = estr2dim(self, name)
+            self._check_topology(etype_dim)
             return edim2entity(self._entity_storage, self._entity_factory, etype_dim)
+        elif name in self._TOPOLOGY_ATTR and self.__dict__.get('_topology_pending', False):
+            self._build_topology()
+            return object.__getattribute__(self, name)
         else:
             return object.__getattribute__(self, name)
 
@@ -50,18 +59,22 @@ class MeshDS(metaclass=MeshMeta):
                 raise RuntimeError('please call super().__init__() before setting attributes.')
             etype_dim = estr2dim(self, name)
             self._entity_storage[etype_dim] = value
+            self._relation_cache.clear()
         else:
             super().__setattr__(name, value)
 
     def __delattr__(self, name: str) -> None:
         if name in self._STORAGE_ATTR:
             del self._entity_storage[estr2dim(self, name)]
+            self._relation_cache.clear()
         else:
             super().__delattr__(name)
 
     def clear(self) -> None:
-        """Remove all entities from the storage."""
+        """Remove all entities and cached relations from the storage."""
         self._entity_storage.clear()
+        self._relation_cache.clear()
+        self._topology_pending = False
 
     ### properties
     def top_dimension(self) -> int: return self.TD
@@ -70,6 +83,35 @@ class MeshDS(metaclass=MeshMeta):
     def storage(self) -> Dict[int, TensorLike]:
         return self._entity_storage
 
+    def memory_report(self) -> Dict[str, int]:
+        """Return the memory in bytes of every stored entity, topological
+        relation and cached relation, without building anything.
+
+        Returns:
+            Dict[str, int]: Bytes of the tensors, by their names. The cached
+            relations are named like 'cell_to_ipoint(p=2)'.
+        """
+        def nbytes(t) -> int:
+            if isinstance(t, tuple):
+                return sum(nbytes(v) for v in t)
+            return int(getattr(t, 'nbytes', 0))
+
+        report = {}
+        dims = set()
+        for name in ['node', 'edge', 'face', 'cell']:
+            edim = estr2dim(self, name)
+            if (edim in self._entity_storage) and (edim not in dims):
+                report[name] = nbytes(self._entity_storage[edim])
+                dims.add(edim)
+        for name in self._TOPOLOGY_ATTR:
+            if name in self.__dict__:
+                report[name] = nbytes(self.__dict__[name])
+        for key, value in self._relation_cache.items():
+            meth = key[0].rsplit('.', 1)[-1]
+            args = ', '.join(f'{k}={v}' for k, v in key[1:])
+            report[f'{meth}({args})'] = nbytes(value)
+        return report
+
     ### counters
     def count(self, etype: Union[int, str]) -> int:
         """Return the number of entities of the given type."""
@@ -118,6 +160,7 @@ class MeshDS(metaclass=MeshMeta):
         """
         if isinstance(etype, str):
             etype = estr2dim(self, etype)
+        self._check_topology(etype)
         return edim2entity(self.storage(), self._entity_factory, etype, index)
 
     ### topology
@@ -259,12 +302,38 @@ class MeshDS(metaclass=MeshMeta):
         total_edge = cell[..., local_edge].reshape(-1, NVE)
         return total_edge
 
-    def construct(self):
+    def construct(self, method: str='auto'):
+        """Reset the topological relations of the mesh after the cells are
+        changed. The faces, edges and their relations to the cells are built
+        on the first access, so a mesh only used for its nodes and cells never
+        pays for them.
+
+        Parameters:
+            method (str, optional): The method of `flocc` finding the unique faces
+                and edges, 'auto', 'lexsort' or 'packed'. Defaults to 'auto'.
+        """
         if not self.is_homogeneous():
             raise RuntimeError('Can not construct for a non-homogeneous mesh.')
-
+        if method not in ('auto', 'lexsort', 'packed'):
+            raise ValueError(f"Unknown method '{method}', expected 'auto', 'lexsort' or 'packed'.")
+        self._flocc_method = method
+
+        for edim in range(1, self.TD):
+            self._entity_storage.pop(edim, None)
+        for name in self._TOPOLOGY_ATTR:
+            self.__dict__.pop(name, None)
+        self._relation_cache.clear()
+        self._topology_pending = True
+
+    def _check_topology(self, edim: int) -> None:
+        if (0 < edim < self.TD) and (edim not in self._entity_storage) \
+                and self.__dict__.get('_topology_pending', False):
+            self._build_topology()
+
+    def _build_topology(self) -> None:
+        self._topology_pending = False
         totalFace = self.total_face()
-        i0, i1, j = flocc(bm.sort(totalFace, axis=1))
+        i0, i1, j = flocc(bm.sort(totalFace, axis=1), method=self._flocc_method)
 
         if self.TD > 1: # Do not add faces for interval mesh
             self.face = totalFace[i0, :] # this also adds the edge in 2-d meshes
@@ -282,7 +351,7 @@ class MeshDS(metaclass=MeshMeta):
             NEC = self.number_of_edges_of_cells()
 
             totalEdge = self.total_edge()
-            i2, _, j = flocc(bm.sort(totalEdge, axis=1))
+            i2, _, j = flocc(bm.sort(totalEdge, axis=1), method=self._flocc_method)
             self.edge = totalEdge[i2, :]
             self.cell2edge = bm.astype(j.reshape(NC, NEC), self.itype)
 
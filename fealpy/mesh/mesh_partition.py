@@ -0,0 +1,237 @@
+"""Partitioning of a mesh into subdomains of cells.
+
+A partition assigns every cell to one part. The subdomain of a part is made
+of its own cells and the ghost cells around them, layer by layer, where a
+ghost layer is the set of the cells sharing a node with the previous ones.
+Each subdomain can be extracted as a standalone mesh of the same type, with
+the maps from its local cells, nodes and DOFs to the global ones, so the
+local problems can be assembled and solved independently.
+"""
+from typing import Optional, List
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from .mesh_reorder import morton_key
+
+__all__ = ['MeshPartition', 'Subdomain']
+
+
+def _metis(mesh, nparts: int) -> TensorLike:
+    """Partition the dual graph of the mesh, the cells connected by the
+    faces, with METIS."""
+    import numpy as np
+    try:
+        from ..graph import metis
+    except (ImportError, RuntimeError) as e:
+        raise RuntimeError("The METIS library is not available, use the 'rcb' "
+                           "or 'morton' method instead.") from e
+
+    NC = mesh.number_of_cells()
+    face2cell = bm.to_numpy(mesh.face_to_cell())
+    face2cell = face2cell[face2cell[:, 0] != face2cell[:, 1]]
+    row = np.concatenate([face2cell[:, 0], face2cell[:, 1]])
+    col = np.concatenate([face2cell[:, 1], face2cell[:, 0]])
+    order = np.argsort(row, kind='stable')
+    adjncy = col[order].astype(np.int32)
+    xadj = np.zeros(NC + 1, dtype=np.int32)
+    xadj[1:] = np.cumsum(np.bincount(row, minlength=NC))
+    graph = metis.array_to_metis(adjncy, xadj)
+    _, part = metis.part_graph(graph, nparts)
+    return bm.tensor(np.asarray(part, dtype=np.int64), device=mesh.device)
+
+
+def _rcb(points: TensorLike, nparts: int) -> TensorLike:
+    """Recursive coordinate bisection: split the points along the longest
+    axis of their bounding box, in proportion to the numbers of parts on
+    the two sides."""
+    ikwargs = {'dtype': bm.int64, 'device': bm.get_device(points)}
+    part = bm.zeros((points.shape[0], ), **ikwargs)
+    stack = [(bm.arange(points.shape[0], **ikwargs), 0, nparts)]
+    while stack:
+        index, first, k = stack.pop()
+        if k == 1:
+            part = bm.set_at(part, index, first)
+            continue
+        x = points[index]
+        axis = int(bm.argmax(bm.max(x, axis=0) - bm.min(x, axis=0)))
+        order = index[bm.argsort(x[:, axis], stable=True)]
+        k0 = k // 2
+        m = (index.shape[0] * k0) // k
+        stack.append((order[:m], first, k0))
+        stack.append((order[m:], first + k0, k - k0))
+    return part
+
+
+class Subdomain():
+    """A subdomain of a partitioned mesh, as a standalone mesh.
+
+    The local cells are ordered as the owned cells first, then the ghost
+    cells layer by layer. The local nodes are ordered as the global ones.
+
+    Attributes:
+        mesh (HomogeneousMesh): The mesh of the subdomain, of the same type as the global one.\n
+        cell (Tensor): The global index of each local cell.\n
+        node (Tensor): The global index of each local node.\n
+        nowned (int): Number of the owned cells, the first ones.
+    """
+    def __init__(self, mesh, cell: TensorLike, node: TensorLike, nowned: int):
+        self.mesh = mesh
+        self.cell = cell
+        self.node = node
+        self.nowned = nowned
+
+    def owned_cell_flag(self) -> TensorLike:
+        """Return a boolean tensor indicating the owned local cells."""
+        NC = self.cell.shape[0]
+        return bm.arange(NC, device=bm.get_device(self.cell)) < self.nowned
+
+    def ipoint_map(self, gmesh, p: int) -> TensorLike:
+        """The global index of each local interpolation point of degree p.
+
+        Parameters:
+            gmesh (HomogeneousMesh): The global mesh.\n
+            p (int): The degree.
+
+        Returns:
+            Tensor: The map, shaped (local number of ipoints,).
+        """
+        return self._map(gmesh.cell_to_ipoint(p, index=self.cell),
+                         self.mesh.cell_to_ipoint(p),
+                         self.mesh.number_of_global_ipoints(p))
+
+    def dof_map(self, space, subspace) -> TensorLike:
+        """The global index of each local DOF. The spaces must number the DOFs
+        of each cell in the same local order, like Lagrange spaces of the same
+        degree on the global and local meshes.
+
+        Parameters:
+            space (FunctionSpace): The space on the global mesh.\n
+            subspace (FunctionSpace): The same space on the mesh of the subdomain.
+
+        Returns:
+            Tensor: The map, shaped (local number of DOFs,).
+        """
+        return self._map(space.cell_to_dof()[self.cell], subspace.cell_to_dof(),
+                         subspace.number_of_global_dofs())
+
+    @staticmethod
+    def _map(gcell2dof: TensorLike, lcell2dof: TensorLike, ldof: int) -> TensorLike:
+        l2g = bm.zeros((ldof, ), **bm.context(gcell2dof))
+        return bm.set_at(l2g, bm.reshape(lcell2dof, (-1, )), bm.reshape(gcell2dof, (-1, )))
+
+
+class MeshPartition():
+    """The partition of the cells of a homogeneous mesh, see `HomogeneousMesh.partition`.
+
+    Parameters:
+        mesh (HomogeneousMesh): The mesh.\n
+        part (Tensor): The part owning each cell, shaped (NC,).\n
+        nparts (int, optional): Number of parts. Defaults to max(part) + 1.
+    """
+    def __init__(self, mesh, part: TensorLike, nparts: Optional[int]=None):
+        self.mesh = mesh
+        self.part = part
+        self.nparts = int(bm.max(part)) + 1 if nparts is None else nparts
+
+    @classmethod
+    def from_mesh(cls, mesh, nparts: int, method: str='metis'):
+        """Partition the cells of the mesh.
+
+        Parameters:
+            mesh (HomogeneousMesh): The mesh.\n
+            nparts (int): Number of parts.\n
+            method (str, optional): 'metis' partitions the dual graph of the cells
+                with METIS, minimizing the faces cut. 'rcb' bisects the barycenters
+                of the cells recursively along the longest axis. 'morton' cuts the
+                cells sorted along the Morton curve into equal chunks. Defaults to 'metis'.
+
+        Returns:
+            MeshPartition: The partition.
+        """
+        if nparts < 1:
+            raise ValueError(f"nparts must be positive, but got {nparts}.")
+        if method == 'metis':
+            part = _metis(mesh, nparts) if nparts > 1 else None
+        elif method == 'rcb':
+            part = _rcb(mesh.entity_barycenter('cell'), nparts)
+        elif method == 'morton':
+            NC = mesh.number_of_cells()
+            ikwargs = {'dtype': bm.int64, 'device': mesh.device}
+            order = bm.argsort(morton_key(mesh.entity_barycenter('cell')), stable=True)
+            part = bm.zeros((NC, ), **ikwargs)
+            part = bm.set_at(part, order, (bm.arange(NC, **ikwargs) * nparts) // NC)
+        else:
+            raise ValueError(f"Unknown method '{method}', expected 'metis', 'rcb' or 'morton'.")
+        if part is None:
+            part = bm.zeros((mesh.number_of_cells(), ), dtype=bm.int64, device=mesh.device)
+        return cls(mesh, part, nparts)
+
+    def number_of_cells_of_parts(self) -> TensorLike:
+        """Number of the cells owned by each part, shaped (nparts,)."""
+        return bm.bincount(self.part, minlength=self.nparts)
+
+    def node_owner(self) -> TensorLike:
+        """The owner of each node, the smallest part among the cells around it,
+        so that every node is owned by exactly one part."""
+        mesh = self.mesh
+        cell = mesh.entity('cell')
+        NN = mesh.number_of_nodes()
+        owner = bm.full((NN, ), self.nparts, **bm.context(self.part))
+        node = bm.reshape(cell, (-1, ))
+        part = bm.reshape(bm.broadcast_to(self.part[:, None], cell.shape), (-1, ))
+        order = bm.lexsort((part, node))
+        node, part = node[order], part[order]
+        first = bm.concat([bm.ones((1, ), dtype=bm.bool, device=mesh.device),
+                           node[1:] != node[:-1]], axis=0)
+        return bm.set_at(owner, node[first], part[first])
+
+    def cells(self, i: int, ghost: int=1) -> List[TensorLike]:
+        """The global indices of the cells of part `i`, and of its ghost layers.
+
+        Parameters:
+            i (int): The part.\n
+            ghost (int, optional): Number of ghost layers. Defaults to 1.
+
+        Returns:
+            List[Tensor]: The owned cells, followed by one tensor for each ghost layer.
+        """
+        cell = self.mesh.entity('cell')
+        NN = self.mesh.number_of_nodes()
+        inside = (self.part == i)
+        layers = [bm.nonzero(inside)[0]]
+        for _ in range(ghost):
+            flag = bm.zeros((NN, ), dtype=bm.bool, device=self.mesh.device)
+            flag = bm.set_at(flag, bm.reshape(cell[inside], (-1, )), True)
+            new = bm.any(flag[cell], axis=1) & ~inside
+            layers.append(bm.nonzero(new)[0])
+            inside = inside | new
+        return layers
+
+    def subdomain(self, i: int, ghost: int=1) -> Subdomain:
+        """Extract the subdomain of part `i` with its ghost layers as a standalone mesh.
+
+        Parameters:
+            i (int): The part.\n
+            ghost (int, optional): Number of ghost layers. Defaults to 1.
+
+        Returns:
+            Subdomain: The subdomain.
+        """
+        mesh = self.mesh
+        layers = self.cells(i, ghost)
+        cid = bm.concat(layers, axis=0)
+        cell = mesh.entity('cell')[cid]
+        NN = mesh.number_of_nodes()
+        kwargs = bm.context(cell)
+
+        flag = bm.zeros((NN, ), dtype=bm.bool, device=mesh.device)
+        flag = bm.set_at(flag, bm.reshape(cell, (-1, )), True)
+        nid = bm.astype(bm.nonzero(flag)[0], cell.dtype)
+        idx = bm.zeros((NN, ), **kwargs)
+        idx = bm.set_at(idx, nid, bm.arange(nid.shape[0], **kwargs))
+        submesh = type(mesh)(mesh.entity('node')[nid], idx[cell])
+        return Subdomain(submesh, cid, nid, layers[0].shape[0])
+
+    def subdomains(self, ghost: int=1) -> List[Subdomain]:
+        """Extract all the subdomains, see `subdomain`."""
+        return [self.subdomain(i, ghost) for i in range(self.nparts)]
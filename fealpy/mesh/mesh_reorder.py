@@ -0,0 +1,171 @@
+"""Cache-friendly orderings of the nodes and cells of a mesh.
+
+Three orderings are provided:
+- 'rcm', the reverse Cuthill-McKee ordering of the node graph, which
+  minimizes the bandwidth of the matrices of the linear elements;
+- 'hilbert' and 'morton', the orderings along the Hilbert and Morton (Z)
+  space-filling curves, which keep the nodes and cells close in space close
+  in memory.
+
+The curve keys are computed for all points at once with integer bitwise
+operations of the backend, on a 2^b grid over the bounding box of the nodes.
+"""
+from typing import Tuple, List
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+__all__ = ['morton_key', 'hilbert_key', 'reorder_permutation']
+
+
+def _quantize(points: TensorLike, lo: TensorLike, size: TensorLike, bits: int) -> List[TensorLike]:
+    """The integer grid coordinates of the points, one tensor for each axis."""
+    scale = (1 << bits) - 1
+    size = bm.where(size > 0, size, 1)
+    q = bm.floor((points - lo) / size * scale)
+    q = bm.astype(bm.clip(q, 0, scale), bm.int64)
+    return [q[:, i] for i in range(points.shape[1])]
+
+
+def _interleave(X: List[TensorLike], bits: int) -> TensorLike:
+    """Interleave the bits of the coordinates, the most significant first."""
+    key = bm.zeros_like(X[0])
+    for b in range(bits - 1, -1, -1):
+        for x in X:
+            key = (key << 1) | ((x >> b) & 1)
+    return key
+
+
+def _bits(points: TensorLike, bits: int=None) -> int:
+    if bits is None:
+        bits = min(63 // points.shape[1], 31)
+    if bits * points.shape[1] > 63:
+        raise ValueError(f"{bits} bits for {points.shape[1]} axes do not fit in a 64-bit key.")
+    return bits
+
+
+def _box(points: TensorLike):
+    lo = bm.min(points, axis=0)
+    return lo, bm.max(points, axis=0) - lo
+
+
+def morton_key(points: TensorLike, bits: int=None, *, box=None) -> TensorLike:
+    """The keys of the points along the Morton (Z-order) curve.
+
+    Parameters:
+        points (Tensor): The points, shaped (N, GD).\n
+        bits (int, optional): Number of bits of the grid on each axis.
+            Defaults to min(63 // GD, 31).\n
+        box (Tuple[Tensor, Tensor], optional): The lower corner and the size of the
+            box of the grid. Defaults to the bounding box of the points.
+
+    Returns:
+        Tensor: The int64 keys, shaped (N,).
+    """
+    bits = _bits(points, bits)
+    lo, size = _box(points) if box is None else box
+    return _interleave(_quantize(points, lo, size, bits), bits)
+
+
+def hilbert_key(points: TensorLike, bits: int=None, *, box=None) -> TensorLike:
+    """The keys of the points along the Hilbert curve, by the algorithm of
+    J. Skilling, Programming the Hilbert curve, AIP Conf. Proc. 707, 2004.
+
+    Parameters:
+        points (Tensor): The points, shaped (N, GD).\n
+        bits (int, optional): Number of bits of the grid on each axis.
+            Defaults to min(63 // GD, 31).\n
+        box (Tuple[Tensor, Tensor], optional): The lower corner and the size of the
+            box of the grid. Defaults to the bounding box of the points.
+
+    Returns:
+        Tensor: The int64 keys, shaped (N,).
+    """
+    bits = _bits(points, bits)
+    lo, size = _box(points) if box is None else box
+    X = _quantize(points, lo, size, bits)
+    n = len(X)
+
+    # inverse undo
+    Q = 1 << (bits - 1)
+    while Q > 1:
+        P = Q - 1
+        for i in range(n):
+            flag = (X[i] & Q) != 0
+            t = (X[0] ^ X[i]) & P
+            X0 = bm.where(flag, X[0] ^ P, X[0] ^ t)
+            if i > 0:
+                X[i] = bm.where(flag, X[i], X[i] ^ t)
+            X[0] = X0
+        Q >>= 1
+
+    # Gray encode
+    for i in range(1, n):
+        X[i] = X[i] ^ X[i-1]
+    t = bm.zeros_like(X[0])
+    Q = 1 << (bits - 1)
+    while Q > 1:
+        t = bm.where((X[n-1] & Q) != 0, t ^ (Q - 1), t)
+        Q >>= 1
+    X = [x ^ t for x in X]
+    return _interleave(X, bits)
+
+
+def _rcm(cell: TensorLike, NN: int) -> TensorLike:
+    """The reverse Cuthill-McKee ordering of the graph of the nodes connected
+    by the cells."""
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+    c = bm.to_numpy(cell)
+    NV = c.shape[1]
+    i, j = np.triu_indices(NV, k=1)
+    row = c[:, i].reshape(-1)
+    col = c[:, j].reshape(-1)
+    data = np.ones(2 * row.shape[0], dtype=np.int8)
+    graph = csr_matrix((data, (np.concatenate([row, col]), np.concatenate([col, row]))),
+                       shape=(NN, NN))
+    perm = reverse_cuthill_mckee(graph, symmetric_mode=True)
+    return bm.tensor(perm.astype(np.int64), device=bm.get_device(cell))
+
+
+def reorder_permutation(node: TensorLike, cell: TensorLike,
+                        method: str='rcm') -> Tuple[TensorLike, TensorLike]:
+    """The permutations of the nodes and cells of a mesh for a cache-friendly
+    ordering. The new node `i` is the old node `nperm[i]`, and likewise for
+    the cells.
+
+    For 'rcm', the cells are sorted by their smallest and largest new node
+    indices. For 'hilbert' and 'morton', the nodes and the barycenters of the
+    cells are sorted along the curve.
+
+    Parameters:
+        node (Tensor): The nodes, shaped (NN, GD).\n
+        cell (Tensor): The cells, shaped (NC, NV).\n
+        method (str, optional): 'rcm', 'hilbert' or 'morton'. Defaults to 'rcm'.
+
+    Returns:
+        Tensor: The permutation of the nodes, shaped (NN,).\n
+        Tensor: The permutation of the cells, shaped (NC,).
+    """
+    NN = node.shape[0]
+    ikwargs = {'dtype': bm.int64, 'device': bm.get_device(cell)}
+
+    if method == 'rcm':
+        nperm = _rcm(cell, NN)
+        inv = bm.zeros((NN, ), **ikwargs)
+        inv = bm.set_at(inv, nperm, bm.arange(NN, **ikwargs))
+        c = inv[cell]
+        key = bm.min(c, axis=1) * NN + bm.max(c, axis=1)
+        cperm = bm.argsort(key, stable=True)
+    elif method in ('hilbert', 'morton'):
+        keyfunc = hilbert_key if method == 'hilbert' else morton_key
+        box = _box(node)
+        nperm = bm.argsort(keyfunc(node, box=box), stable=True)
+        barycenter = bm.mean(node[cell], axis=1)
+        cperm = bm.argsort(keyfunc(barycenter, box=box), stable=True)
+    else:
+        raise ValueError(f"Unknown method '{method}', expected 'rcm', 'hilbert' or 'morton'.")
+
+    return nperm, cperm
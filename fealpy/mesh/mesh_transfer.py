@@ -0,0 +1,250 @@
+"""Transfer of the data on a simplex mesh to the mesh after a local
+refinement or coarsening.
+
+The old mesh is recorded before it changes. Every cell of the new mesh lies
+in one cell of the old mesh, its parent, after a bisection, or in the union
+of the old cells merged into it after a coarsening. The interpolation points
+of the new mesh are located in these cells by their barycentric coordinates,
+so the Lagrange interpolation of any degree is one sparse matrix, built once
+and applied to any number of vectors.
+"""
+from typing import Optional, Dict, Sequence, Tuple, Callable, Union
+from warnings import warn
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from .point_locator import _small_inv
+
+__all__ = ['MeshTransfer']
+
+KINDS = ('cell', 'node', 'local')
+
+
+def _degree(count: Callable[[int], int], n: int, maxp: int=20) -> Optional[int]:
+    """The degree p >= 1 with count(p) == n, or None."""
+    for p in range(1, maxp + 1):
+        m = count(p)
+        if m == n:
+            return p
+        if m > n:
+            break
+    return None
+
+
+class MeshTransfer():
+    """Record a simplex mesh before a refinement or coarsening, and transfer
+    the Lagrange finite element data to the new mesh.
+
+    The kind of every data is declared with its value as a pair (value, kind):
+    - 'cell': (NC, ...) cell data, piecewise constant on the cells,
+    - 'local': (NC, ldof) values at the local interpolation points of degree p
+      of every cell,
+    - 'node': (gdof, ...) values at the global interpolation points of degree p.
+
+    The degree p is found from the shape. The kinds of bare values are guessed
+    from their shapes, in which case the (NC, ldof) data are taken as local
+    values rather than cell data. This is done silently only if `infer` is
+    True, and is deprecated otherwise.
+
+    Parameters:
+        mesh (SimplexMesh): The mesh before it changes. Its node and cell
+            tensors must not be modified in place afterwards.\n
+        data (Dict, optional): The data to be transferred by `transfer`, as
+            (value, kind) pairs. Defaults to None.\n
+        p (Sequence[int], optional): Other degrees of the interpolation matrices
+            needed. Defaults to ().\n
+        infer (bool, optional): Guess the kinds of the bare values in data
+            from their shapes. Defaults to False.
+    """
+    def __init__(self, mesh,
+                 data: Optional[Dict[str, Union[Tuple[TensorLike, str], TensorLike]]]=None,
+                 p: Sequence[int]=(), *, infer: bool=False):
+        self.node = mesh.entity('node')
+        self.cell = mesh.entity('cell')
+        self.NC = self.cell.shape[0]
+        self.TD = mesh.top_dimension()
+        self.ipoint: Dict[int, Tuple[TensorLike, int]] = {}
+        self.kind: Dict[str, Tuple[str, Optional[int]]] = {}
+        self._Jinv = None
+        self._matrices = {}
+
+        for q in p:
+            self._record(mesh, q)
+        if data is not None:
+            for key, value in data.items():
+                if isinstance(value, tuple):
+                    self.kind[key] = self._declare(mesh, *value)
+                else:
+                    if not infer:
+                        warn(f"The kind of the data '{key}' is guessed from its shape. "
+                             f"Give it as a (value, kind) pair with kind in {KINDS}, "
+                             "or pass infer=True.", DeprecationWarning, stacklevel=2)
+                    self.kind[key] = self._classify(mesh, value)
+
+    def _record(self, mesh, p: int):
+        if (p > 1) and (p not in self.ipoint):
+            self.ipoint[p] = (mesh.cell_to_ipoint(p), mesh.number_of_global_ipoints(p))
+
+    def _declare(self, mesh, value: TensorLike, kind: str):
+        shape = tuple(value.shape)
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind '{kind}' of data, expected one of {KINDS}.")
+        if kind == 'node':
+            p = _degree(mesh.number_of_global_ipoints, shape[0])
+            if p is None:
+                raise ValueError(f"The node data shaped {shape} are not the values at "
+                                 "the global interpolation points of any degree.")
+            self._record(mesh, p)
+            return ('node', p)
+        if shape[0] != self.NC:
+            raise ValueError(f"The {kind} data shaped {shape} should have "
+                             f"{self.NC} rows, one for each cell.")
+        if kind == 'cell':
+            return ('cell', None)
+        p = _degree(mesh.number_of_local_ipoints, shape[1]) if len(shape) == 2 else None
+        if p is None:
+            raise ValueError(f"The local data shaped {shape} are not the values at "
+                             "the local interpolation points of any degree.")
+        return ('local', p)
+
+    def _classify(self, mesh, value: TensorLike):
+        n = value.shape[0]
+        if n == self.NC:
+            if value.ndim == 2:
+                p = _degree(mesh.number_of_local_ipoints, value.shape[1])
+                if p is not None:
+                    return ('local', p)
+            return ('cell', None)
+        p = _degree(mesh.number_of_global_ipoints, n)
+        if p is None:
+            raise ValueError(f"Can not transfer data shaped {tuple(value.shape)}, which is "
+                             "neither cell data nor Lagrange interpolation values.")
+        self._record(mesh, p)
+        return ('node', p)
+
+    def _barycentric(self, points: TensorLike, cid: TensorLike) -> TensorLike:
+        if self._Jinv is None:
+            # the pseudo inverse J^T (J J^T)^{-1}, also for surface meshes
+            v0 = self.node[self.cell[:, 0]]
+            J = self.node[self.cell[:, 1:]] - v0[:, None, :] # (NC, TD, GD)
+            G = bm.einsum('cig, cjg -> cij', J, J)
+            self._Jinv = bm.einsum('cig, cij -> cgj', J, _small_inv(G))
+        lam = bm.einsum('ig, igj -> ij', points - self.node[self.cell[cid, 0]], self._Jinv[cid])
+        return bm.concat([1 - bm.sum(lam, axis=-1, keepdims=True), lam], axis=-1)
+
+    def locate(self, points: TensorLike, source: TensorLike):
+        """The old cells containing the points, chosen among the candidates,
+        and the barycentric coordinates in them.
+
+        Parameters:
+            points (Tensor): The points, shaped (M, GD).\n
+            source (Tensor): The old cell containing each point shaped (M,), or
+                the candidates shaped (M, k).
+
+        Returns:
+            Tensor: The old cells, shaped (M,).\n
+            Tensor: The barycentric coordinates, shaped (M, TD+1).
+        """
+        if source.ndim == 1:
+            return source, self._barycentric(points, source)
+        cid = source[:, 0]
+        bc = self._barycentric(points, cid)
+        for i in range(1, source.shape[1]):
+            bci = self._barycentric(points, source[:, i])
+            flag = bm.min(bci, axis=-1) > bm.min(bc, axis=-1)
+            cid = bm.where(flag, source[:, i], cid)
+            bc = bm.where(flag[:, None], bci, bc)
+        return cid, bc
+
+    def interpolation_matrix(self, mesh, source: TensorLike, p: int=1):
+        """The matrix of the Lagrange interpolation of degree p from the old
+        mesh to the new one, shaped (new gdof, old gdof). It is built once for
+        each degree, as a MeshTransfer records one change of the mesh.
+
+        Parameters:
+            mesh (SimplexMesh): The new mesh.\n
+            source (Tensor): The old cell containing each new cell shaped (NC,),
+                or the candidates shaped (NC, k).\n
+            p (int, optional): The degree. Defaults to 1.
+
+        Returns:
+            CSRTensor: The interpolation matrix.
+        """
+        from ..sparse import CSRTensor
+
+        if p in self._matrices:
+            return self._matrices[p]
+        if p == 1:
+            cell2ipoint, ogdof = self.cell, self.node.shape[0]
+        elif p in self.ipoint:
+            cell2ipoint, ogdof = self.ipoint[p]
+        else:
+            raise ValueError(f"The interpolation points of degree {p} were not "
+                             "recorded on the old mesh.")
+        fcell2ipoint = mesh.cell_to_ipoint(p)
+        gdof = mesh.number_of_global_ipoints(p)
+        kwargs = bm.context(fcell2ipoint)
+
+        # one new cell containing each new interpolation point
+        owner = bm.zeros((gdof, ), **kwargs)
+        fcell = bm.broadcast_to(bm.arange(fcell2ipoint.shape[0], **kwargs)[:, None],
+                                fcell2ipoint.shape)
+        owner = bm.set_at(owner, bm.reshape(fcell2ipoint, (-1, )), bm.reshape(fcell, (-1, )))
+        cid, bc = self.locate(mesh.interpolation_points(p), source[owner])
+
+        phi = bm.simplex_shape_function(bc, p) # (gdof, ldof)
+        row = bm.broadcast_to(bm.arange(gdof, **kwargs)[:, None], phi.shape)
+        flag = bm.abs(phi) > 1e3 * bm.finfo(phi.dtype).eps
+        row, col, values = row[flag], cell2ipoint[cid][flag], phi[flag]
+        crow = bm.concat([bm.zeros((1, ), dtype=bm.int64, device=bm.get_device(row)),
+                          bm.cumsum(bm.bincount(row, minlength=gdof), axis=0)], axis=0)
+        self._matrices[p] = CSRTensor(crow, bm.astype(col, bm.int64), values, (gdof, ogdof))
+        return self._matrices[p]
+
+    def transfer(self, mesh, source: TensorLike,
+                 data: Dict[str, TensorLike]) -> Dict[str, TensorLike]:
+        """Transfer the data declared in the constructor to the new mesh.
+        The interpolation matrix of each degree is shared by all data.
+
+        Parameters:
+            mesh (SimplexMesh): The new mesh.\n
+            source (Tensor): The old cell containing each new cell shaped (NC,),
+                or the candidates shaped (NC, k).\n
+            data (Dict): The data on the old mesh, bare or as (value, kind) pairs.
+
+        Returns:
+            Dict: The values of the data on the new mesh.
+        """
+        out = {}
+        for key, value in data.items():
+            kind, p = self.kind[key]
+            if isinstance(value, tuple):
+                value = value[0]
+            if not bm.is_tensor(value): # e.g. a finite element Function
+                value = value[:]
+            if kind == 'cell':
+                if source.ndim == 1:
+                    out[key] = value[source]
+                else:
+                    out[key] = bm.mean(bm.stack([value[source[:, i]] for i in
+                                                 range(source.shape[1])], axis=0), axis=0)
+            elif kind == 'local':
+                out[key] = self._local(mesh, source, value, p)
+            else:
+                out[key] = self.interpolation_matrix(mesh, source, p) @ value
+        return out
+
+    def _local(self, mesh, source: TensorLike, value: TensorLike, p: int) -> TensorLike:
+        cell = mesh.entity('cell')
+        NC = cell.shape[0]
+        bcs = mesh.multi_index_matrix(p, self.TD, dtype=mesh.ftype) / p # (ldof, TD+1)
+        ldof = bcs.shape[0]
+        points = bm.einsum('lk, ckg -> clg', bcs, mesh.entity('node')[cell])
+        points = bm.reshape(points, (NC * ldof, -1))
+        if source.ndim == 1:
+            source = bm.repeat(source, ldof)
+        else:
+            source = bm.repeat(source, ldof, axis=0)
+        cid, bc = self.locate(points, source)
+        phi = bm.simplex_shape_function(bc, p) # (NC*ldof, ldof)
+        return bm.reshape(bm.sum(value[cid] * phi, axis=-1), (NC, ldof))
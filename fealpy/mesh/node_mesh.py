@@ -5,6 +5,7 @@ from ..typing import TensorLike, Index, _S
 from .. import logger
 
 from .mesh_base import MeshDS 
+from .kd_tree import KDTree
 
 import jax.numpy as jnp
 import jax
@@ -325,192 +326,3 @@ class NodeMesh(MeshDS):
         node = jnp.vstack((pp, boundaryp))
 
         return cls(node)
-'''
-class KDTree:
-    def __init__(self, points):
-        """
-        初始化KDTree,输入为一个N x D的NumPy数组,表示N个D维的点集。
-        """
-        self.points = points
-        self.tree = self._build_tree(points, depth=0)
-
-    def _build_tree(self, points, depth):
-        """
-        递归构建KD-Tree。points是当前节点的点集,depth是当前树的深度。
-        """
-        if len(points) == 0:
-            return None
-        
-        # 选择当前维度
-        k = points.shape[1]  # 点的维度
-        axis = depth % k  # 循环选择维度
-        
-        # 排序并选择中位点作为根节点
-        points = points[points[:, axis].argsort()]
-        median_idx = len(points) // 2
-        median_point = points[median_idx]
-
-        # 递归构建左子树和右子树
-        left_tree = self._build_tree(points[:median_idx], depth + 1)
-        right_tree = self._build_tree(points[median_idx + 1:], depth + 1)
-
-        return {
-            'point': median_point,
-            'left': left_tree,
-            'right': right_tree,
-            'axis': axis
-        }
-
-    def range_query(self, query_points, radius, include_self=False):
-        """
-        查找每个查询点距离为radius以内的所有邻居点,并返回邻居粒子的索引和自身粒子的索引。
-        query_points: (M, D) 形状的 NumPy 数组,表示M个查询点。
-        radius: 查找邻居的半径
-        include_self: 是否将查询点本身的索引加入到邻居结果中
-        """
-        neighbors_within_range = []
-        self_indices = []  # 存储查询点的索引
-        for i, query_point in enumerate(query_points):
-            neighbors = self._range_query(self.tree, query_point, radius, depth=0, query_idx=i, include_self=include_self)
-            neighbors_within_range.append(neighbors)
-            self_indices.append([i] * len(neighbors))  # 每个查询点的索引重复以匹配邻居数量
-        
-        # 将查询点索引和邻居粒子的索引拆开，按索引顺序整理
-        neighbors = [item for sublist in neighbors_within_range for item in sublist]
-        indices = [item for sublist in self_indices for item in sublist]
-        
-        return bm.array(neighbors), bm.array(indices)
-
-    def _range_query(self, node, query_point, radius, depth, query_idx, include_self):
-        """
-        递归查找范围查询，返回邻居粒子的索引。
-        """
-        if node is None:
-            return []
-
-        axis = node['axis']
-        neighbors = []
-
-        # 计算当前点和查询点的距离
-        point = node['point']
-        dist = bm.linalg.norm(point - query_point)
-
-        # 如果当前点在查询范围内，加入结果
-        if dist <= radius:
-            # 如果include_self为True，允许加入查询点本身
-            if include_self or not (point==query_point).all():  
-                # 获取该点的索引
-                neighbor_idx = bm.where(bm.all(self.points == point, axis=1))[0][0]
-                neighbors.append(neighbor_idx)  # 添加邻居粒子的索引
-
-        # 判断是否需要继续递归查找子树
-        next_branch = None
-        opposite_branch = None
-
-        if query_point[axis] < point[axis]:
-            next_branch = node['left']
-            opposite_branch = node['right']
-        else:
-            next_branch = node['right']
-            opposite_branch = node['left']
-
-        # 递归查询邻居
-        neighbors.extend(self._range_query(next_branch, query_point, radius, depth + 1, query_idx, include_self))
-
-        # 如果对面子树有可能有点在范围内，继续查询
-        if abs(query_point[axis] - point[axis]) < radius:
-            neighbors.extend(self._range_query(opposite_branch, query_point, radius, depth + 1, query_idx, include_self))
-
-        return neighbors
-'''
-class KDTree:
-    def __init__(self, points):
-        """
-        初始化KDTree,输入为一个N x D的NumPy数组,表示N个D维的点集。
-        """
-        self.points = points
-        self.tree = self._build_tree(points, depth=0)
-
-    def _build_tree(self, points, depth):
-        """
-        递归构建KD-Tree。points是当前节点的点集,depth是当前树的深度。
-        """
-        if len(points) == 0:
-            return None
-        
-        # 选择当前维度
-        k = points.shape[1]  # 点的维度
-        axis = depth % k  # 循环选择维度
-        
-        # 排序并选择中位点作为根节点
-        points = points[points[:, axis].argsort()]
-        median_idx = len(points) // 2
-        median_point = points[median_idx]
-
-        # 递归构建左子树和右子树
-        left_tree = self._build_tree(points[:median_idx], depth + 1)
-        right_tree = self._build_tree(points[median_idx + 1:], depth + 1)
-
-        return {
-            'point': median_point,
-            'left': left_tree,
-            'right': right_tree,
-            'axis': axis
-        }
-        
-    @staticmethod
-    @bm.compile
-    def range_query(self, query_points, radius, include_self=False):
-        """
-        查找每个查询点距离为radius以内的所有邻居点,并返回邻居粒子的索引和自身粒子的索引。
-        query_points: (M, D) 形状的 NumPy 数组,表示M个查询点。
-        radius: 查找邻居的半径
-        include_self: 是否将查询点本身的索引加入到邻居结果中
-        """
-        neighbors_within_range = []
-        self_indices = []  # 存储查询点的索引
-        for i, query_point in enumerate(query_points):
-            neighbors = self._range_query(self.tree, query_point, radius, depth=0, query_idx=i, include_self=include_self)
-            neighbors_within_range.append(neighbors)
-            self_indices.append([i] * len(neighbors))  # 每个查询点的索引重复以匹配邻居数量
-        
-        # 将查询点索引和邻居粒子的索引拆开，按索引顺序整理
-        neighbors = [item for sublist in neighbors_within_range for item in sublist]
-        indices = [item for sublist in self_indices for item in sublist]
-        
-        return bm.array(neighbors), bm.array(indices)
-
-    @staticmethod
-    @bm.compile
-    def _range_query(self, node, query_point, radius, depth, query_idx, include_self):
-        if node is None:
-            return []
-
-        axis = node['axis']
-        neighbors = []
-        point = node['point']
-        dist = bm.linalg.norm(point - query_point)
-
-        # 剪枝策略：距离超过半径时，停止搜索
-        if dist <= radius:
-            if include_self or not (point==query_point).all():
-                neighbor_idx = bm.where(bm.all(self.points == point, axis=1))[0][0]
-                neighbors.append(neighbor_idx)
-
-        next_branch = None
-        opposite_branch = None
-        if query_point[axis] < point[axis]:
-            next_branch = node['left']
-            opposite_branch = node['right']
-        else:
-            next_branch = node['right']
-            opposite_branch = node['left']
-
-        # 递归查询
-        neighbors.extend(self._range_query(next_branch, query_point, radius, depth + 1, query_idx, include_self))
-
-        # 剪枝：如果查询点和当前节点的差异已经大于半径，停止递归查询对面子树
-        if abs(query_point[axis] - point[axis]) < radius:
-            neighbors.extend(self._range_query(opposite_branch, query_point, radius, depth + 1, query_idx, include_self))
-
-        return neighbors
@@ -0,0 +1,250 @@
+"""Batch point location on unstructured meshes.
+
+The bounding boxes of the cells are registered once in a uniform grid of
+buckets, with about one cell per bucket. A query looks up the bucket of each
+point, computes the local coordinates of the point in every candidate cell
+of that bucket, and keeps the first cell containing it. All steps are
+vectorized over the points, and no assumption on the convexity of the
+domain is made.
+"""
+from typing import Tuple, Union
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse._spspmm import _expand
+
+__all__ = ['PointLocator']
+
+def _small_inv(J: TensorLike):
+    """Inverse of a batch of 1x1, 2x2 or 3x3 matrices by cofactors.
+    Singular matrices give the zero matrix."""
+    n = J.shape[-1]
+    if n == 1:
+        det = J[..., 0, 0]
+        adj = bm.ones_like(J)
+    elif n == 2:
+        det = J[..., 0, 0] * J[..., 1, 1] - J[..., 0, 1] * J[..., 1, 0]
+        adj = bm.stack([
+            bm.stack([J[..., 1, 1], -J[..., 0, 1]], axis=-1),
+            bm.stack([-J[..., 1, 0], J[..., 0, 0]], axis=-1)
+        ], axis=-2)
+    else:
+        a = [[J[..., i, j] for j in range(3)] for i in range(3)]
+        cof = [[a[(j+1)%3][(i+1)%3] * a[(j+2)%3][(i+2)%3]
+                - a[(j+1)%3][(i+2)%3] * a[(j+2)%3][(i+1)%3] for j in range(3)]
+               for i in range(3)]
+        adj = bm.stack([bm.stack(row, axis=-1) for row in cof], axis=-2)
+        det = sum(a[0][k] * cof[k][0] for k in range(3))
+    nonzero = (det != 0)
+    inv = adj / bm.where(nonzero, det, 1)[..., None, None]
+    return bm.where(nonzero[..., None, None], inv, 0)
+
+
+class PointLocator():
+    """Locate points in the cells of a simplex or tensor product mesh, in which
+    the geometric dimension equals the topological one.
+
+    The bucket index is built in the constructor, so the locator should be
+    reused for many queries on the same mesh. It is not updated when the mesh
+    changes, so a new one is needed after the nodes are moved, also in place.
+
+    Parameters:
+        mesh (SimplexMesh | TensorMesh): The mesh.\n
+        density (float, optional): Average number of cells per bucket. Defaults to 1.0.\n
+        tol (float, optional): Tolerance of the local coordinates, so that points on
+            the boundary of a cell are inside it. Defaults to 1e-10.\n
+        newton_steps (int, optional): Number of Newton steps inverting the
+            multilinear map of the tensor product cells. Defaults to 8.
+    """
+    def __init__(self, mesh, *, density: float=1.0, tol: float=1e-10,
+                 newton_steps: int=8):
+        from .mesh_base import SimplexMesh, TensorMesh
+
+        TD = mesh.top_dimension()
+        GD = mesh.geo_dimension()
+        if TD != GD:
+            raise ValueError("PointLocator needs a mesh whose geometric dimension "
+                             f"equals the topological one, but got GD={GD}, TD={TD}.")
+        if isinstance(mesh, SimplexMesh):
+            self.simplex = True
+        elif isinstance(mesh, TensorMesh):
+            self.simplex = False
+        else:
+            raise TypeError(f"PointLocator does not support {type(mesh).__name__}.")
+
+        self.node = node = mesh.entity('node')
+        self.cell = cell = mesh.entity('cell')
+        self.TD = TD
+        self.tol = tol
+        self.newton_steps = newton_steps
+        NC = cell.shape[0]
+        ikwargs = bm.context(cell)
+
+        # the grid of buckets over the bounding box of the mesh
+        vertex = node[cell] # (NC, NV, GD)
+        clo = bm.min(vertex, axis=1)
+        chi = bm.max(vertex, axis=1)
+        self.origin = bm.min(clo, axis=0)
+        size = bm.max(chi, axis=0) - self.origin
+        self.margin = float(bm.max(size)) * tol
+        size = bm.maximum(size, bm.full_like(size, self.margin + bm.finfo(size.dtype).tiny))
+        scale = (NC / density / float(bm.prod(size)))**(1 / GD)
+        shape = bm.astype(bm.ceil(size * scale), cell.dtype)
+        self.shape = bm.maximum(shape, bm.ones_like(shape))
+        self.h = size / bm.astype(self.shape, size.dtype)
+        strides = [1] * GD
+        for i in range(GD - 2, -1, -1):
+            strides[i] = strides[i+1] * int(self.shape[i+1])
+        self.strides = bm.tensor(strides, **ikwargs)
+        nbucket = strides[0] * int(self.shape[0])
+
+        # register every cell in all buckets overlapping its bounding box
+        self.clo = clo = clo - self.margin
+        self.chi = chi = chi + self.margin
+        lo = self._bucket_coords(clo)
+        hi = self._bucket_coords(chi)
+        extent = hi - lo + 1
+        cid, offset = _expand(bm.prod(extent, axis=-1))
+        index = bm.zeros_like(cid)
+        for i in range(GD - 1, -1, -1):
+            e = extent[cid, i]
+            index = index + (lo[cid, i] + offset % e) * self.strides[i]
+            offset = offset // e
+        order = bm.argsort(index, stable=True)
+        self.bucket_cell = bm.astype(cid[order], cell.dtype)
+        count = bm.bincount(index, minlength=nbucket)
+        self.bucket_ptr = bm.concat([bm.zeros((1, ), **ikwargs),
+                                     bm.cumsum(count, axis=0)], axis=0)
+
+        if self.simplex:
+            v0 = vertex[:, 0]
+            self.v0 = v0
+            self.Jinv = bm.linalg.inv(vertex[:, 1:] - v0[:, None, :])
+        else:
+            # The vertices in the lexicographic order of the multilinear basis,
+            # as mapped by the mesh itself, since the local order of the cell
+            # nodes differs between the tensor product meshes.
+            corner = bm.eye(2, **bm.context(node))
+            vertex = mesh.bc_to_point((corner, ) * TD)
+            if tuple(vertex.shape) != (NC, 2**TD, GD):
+                raise TypeError(f"PointLocator does not support {type(mesh).__name__}, "
+                                "whose bc_to_point does not map the corners of the "
+                                "reference cell to the cell vertices.")
+            self.vertex = vertex
+            k = bm.arange(2**TD, **ikwargs)
+            self.bits = bm.stack([(k >> (TD - 1 - a)) & 1 for a in range(TD)],
+                                 axis=-1) == 1 # (NV, TD)
+            self.sign = bm.astype(2 * self.bits - 1, node.dtype)
+
+    def _bucket_coords(self, points: TensorLike) -> TensorLike:
+        c = bm.floor((points - self.origin) / self.h)
+        c = bm.astype(c, self.shape.dtype)
+        return bm.minimum(bm.maximum(c, bm.zeros_like(c)), self.shape - 1)
+
+    def _simplex_coords(self, points: TensorLike, cid: TensorLike):
+        lam = bm.einsum('mg, mgj -> mj', points - self.v0[cid], self.Jinv[cid])
+        bc = bm.concat([1 - bm.sum(lam, axis=-1, keepdims=True), lam], axis=-1)
+        return bc, bm.all(bc >= -self.tol, axis=-1)
+
+    def _tensor_basis(self, xi: TensorLike):
+        """The multilinear basis at the local coordinates xi (M, TD), shaped
+        (M, NV), and its derivatives, shaped (M, NV, TD)."""
+        val = bm.where(self.bits, xi[:, None, :], 1 - xi[:, None, :]) # (M, NV, TD)
+        phi = val[..., 0]
+        for a in range(1, self.TD):
+            phi = phi * val[..., a]
+        dphi = []
+        for a in range(self.TD):
+            d = self.sign[:, a]
+            for b in range(self.TD):
+                if b != a:
+                    d = d * val[..., b]
+            dphi.append(d)
+        return phi, bm.stack(dphi, axis=-1)
+
+    def _tensor_coords(self, points: TensorLike, cid: TensorLike):
+        vertex = self.vertex[cid] # (M, NV, GD)
+        xi = bm.full(points.shape, 0.5, **bm.context(points))
+        if xi.shape[0] == 0:
+            return xi, bm.zeros((0, ), dtype=bm.bool, device=bm.get_device(xi))
+
+        for _ in range(self.newton_steps):
+            phi, dphi = self._tensor_basis(xi)
+            r = bm.einsum('mk, mkg -> mg', phi, vertex) - points
+            J = bm.einsum('mka, mkg -> mga', dphi, vertex)
+            delta = bm.einsum('mag, mg -> ma', _small_inv(J), r)
+            xi = bm.clip(xi - delta, -1.0, 2.0)
+            if float(bm.max(bm.abs(delta))) <= self.tol:
+                break
+
+        phi, _ = self._tensor_basis(xi)
+        x = bm.einsum('mk, mkg -> mg', phi, vertex)
+        converged = bm.all(bm.abs(x - points) <= self.margin + self.tol, axis=-1)
+        inside = bm.all((xi >= -self.tol) & (xi <= 1 + self.tol), axis=-1) & converged
+        return xi, inside
+
+    def locate(self, points: TensorLike, batch_size: int=2**18
+               ) -> Tuple[TensorLike, Union[TensorLike, Tuple[TensorLike, ...]]]:
+        """Find the cells containing the points, and the local coordinates.
+
+        Parameters:
+            points (Tensor): The points, shaped (NP, GD).\n
+            batch_size (int, optional): Number of points processed at a time,
+                bounding the memory of the candidate pairs. Defaults to 2**18.
+
+        Returns:
+            Tensor: The cell index of each point, shaped (NP,), and -1 for the
+            points outside the mesh.\n
+            Tensor | Tuple[Tensor, ...]: The barycentric coordinates of the points
+            in their cells, shaped (NP, TD+1) for simplex meshes, or a tuple of TD
+            tensors shaped (NP, 2) for tensor product meshes, one for each direction
+            like the quadrature points of `TensorMesh`. Zero for points outside.
+        """
+        NP = points.shape[0]
+        cells, coords = [], []
+        for start in range(0, NP, batch_size):
+            c, x = self._locate(points[start:start+batch_size])
+            cells.append(c)
+            coords.append(x)
+        cell = bm.concat(cells, axis=0) if NP > 0 else \
+            bm.zeros((0, ), **bm.context(self.cell))
+        coord = bm.concat(coords, axis=0) if NP > 0 else \
+            bm.zeros((0, self.TD + int(self.simplex)), **bm.context(self.node))
+
+        if self.simplex:
+            return cell, coord
+        return cell, tuple(bm.stack([1 - coord[:, a], coord[:, a]], axis=-1)
+                           for a in range(self.TD))
+
+    def _locate(self, points: TensorLike):
+        NP = points.shape[0]
+        ikwargs = bm.context(self.cell)
+        inbox = bm.all((points >= self.origin - self.margin) &
+                       (points <= self.origin + self.h * bm.astype(self.shape, self.h.dtype) + self.margin),
+                       axis=-1)
+        bucket = bm.sum(self._bucket_coords(points) * self.strides, axis=-1)
+        count = self.bucket_ptr[bucket + 1] - self.bucket_ptr[bucket]
+        count = bm.where(inbox, count, 0)
+        pid, offset = _expand(count)
+        cid = self.bucket_cell[self.bucket_ptr[bucket[pid]] + offset]
+        # drop the candidates whose bounding boxes do not contain the points
+        flag = bm.all((points[pid] >= self.clo[cid]) & (points[pid] <= self.chi[cid]), axis=-1)
+        pid, cid = pid[flag], cid[flag]
+
+        if self.simplex:
+            local, inside = self._simplex_coords(points[pid], cid)
+        else:
+            local, inside = self._tensor_coords(points[pid], cid)
+
+        # the first candidate containing each point
+        pid, cid, local = pid[inside], cid[inside], local[inside]
+        first = bm.concat([bm.ones((min(1, pid.shape[0]), ), dtype=bm.bool,
+                                   device=bm.get_device(pid)),
+                           pid[1:] != pid[:-1]], axis=0)
+        pid, cid, local = pid[first], cid[first], local[first]
+
+        cell = bm.full((NP, ), -1, **ikwargs)
+        cell = bm.set_at(cell, pid, cid)
+        coord = bm.zeros((NP, local.shape[-1]), **bm.context(points))
+        coord = bm.set_at(coord, pid, local)
+        return cell, coord
@@ -2,6 +2,7 @@ from typing import Union, Optional
 from math import sqrt
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
+from .. import logger
 from .mesh_base import SimplexMesh
 from .plot import Plotable
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
@@ -611,232 +612,159 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         cellEdgeLength = length.reshape(NC, 6)
         lidx = bm.argmax(cellEdgeLength, axis=-1)
 
-        flag = (lidx == 1)
-        if  sum(flag) > 0:
-            cell = bm.set_at(cell, cellidx[flag], cell[cellidx[flag]][:, [2, 0, 1, 3]])
-
-        flag = (lidx == 2)
-        if sum(flag) > 0:
-            cell = bm.set_at(cell, cellidx[flag], cell[cellidx[flag]][:, [0, 3, 1, 2]])
-
-        flag = (lidx == 3)
-        if sum(flag) > 0:
-            cell = bm.set_at(cell, cellidx[flag], cell[cellidx[flag]][:, [1, 2, 0, 3]])
-
-        flag = (lidx == 4)
-        if sum(flag) > 0:
-            cell = bm.set_at(cell, cellidx[flag], cell[cellidx[flag]][:, [1, 3, 2, 0]])
-
-        flag = (lidx == 5)
-        if sum(flag) > 0:
-            cell = bm.set_at(cell, cellidx[flag], cell[cellidx[flag]][:, [3, 2, 1, 0]])
+        perms = {1: [2, 0, 1, 3], 2: [0, 3, 1, 2], 3: [1, 2, 0, 3],
+                 4: [1, 3, 2, 0], 5: [3, 2, 1, 0]}
+        for k, perm in perms.items():
+            flag = (lidx == k)
+            if bool(bm.any(flag)):
+                cell = bm.set_at(cell, cellidx[flag], cell[cellidx[flag]][:, perm])
 
         if rflag == True:
             self.construct()
 
+        return cell
+
     def uniform_bisect(self, n=1):
         for i in range(n):
             self.bisect()
 
-    def bisect_options(self, HB=None, data=None, disp=None):
-        options = {'HB': HB, 'data': data, 'disp': disp}
+    def bisect_options(self, HB=None, data=None, disp=None, p=1):
+        options = {'HB': HB, 'data': data, 'disp': disp, 'p': p}
         return options
-           
-    def bisect(self, isMarkedCell=None, data=None, returnim=False, options={'disp': True}):
 
-        if options['disp']:
-            print('Bisection begining.......')
+    def bisect(self, isMarkedCell=None, data=None, returnim=False, options={'disp': True}):
+        """Refine the marked cells by the longest edge bisection, and the cells
+        needed for a conforming mesh.
+
+        Every round bisects the marked cells at their longest edges, reusing
+        the midpoints of the edges already cut, and marks the cells which
+        contain a cut edge for the next round. Each round is vectorized over
+        the cells.
+
+        Parameters:
+            isMarkedCell (Tensor, optional): The flags of the cells to refine.
+                Defaults to all cells.\n
+            data: Not used.\n
+            returnim (bool, optional): Whether to return the CSRTensor of the
+                Lagrange interpolation of degree options['p'] from the old mesh
+                to the new one, reusable for any vector of that degree. Defaults to False.\n
+            options (dict, optional): See `bisect_options`. The keys present are
+                filled in place:\n
+                'HB': shaped (NC, 2), the new cells and their parents in the old mesh.\n
+                'data': a dict with the lists 'celldata' and 'nodedata', transferred
+                to the new mesh. The cell data are piecewise constant, and the
+                node data are the interpolation values of any degree, see `MeshTransfer`.
+        """
+        from .mesh_transfer import MeshTransfer
 
+        disp = options.get('disp', False)
+        p = options.get('p', 1) or 1
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
-        NE = self.number_of_edges()
-
-        if options['disp']:
-            print('Current number of nodes:', NN)
-            print('Current number of edges:', NE)
-            print('Current number of cells:', NC)
+        if disp:
+            logger.info(f"Bisection of a mesh with {NN} nodes, "
+                        f"{self.number_of_edges()} edges and {NC} cells.")
+
+        data = options.get('data', None)
+        values = {}
+        if data is not None:
+            for name, kind in (('celldata', 'cell'), ('nodedata', 'node')):
+                for i, value in enumerate(data.get(name, [])):
+                    values[(name, i)] = (value, kind)
+        if (data is not None) or returnim:
+            transfer = MeshTransfer(self, values, p=(p, ))
 
-        if ('data' in options) and (options['data'] is not None):
-            oldnode = self.entity('node')
-            oldcell = self.entity('cell')
-        
-        if ('HB' in options) and (options['HB'] is not None):
-            HB = bm.tile(bm.arange(NC*4)[:, None], (1, 2))
-            options["HB"] = HB
-   
         if isMarkedCell is None: # 加密所有的单元
-            markedCell = bm.arange(NC, dtype=self.itype)
+            markedCell = bm.arange(NC, dtype=self.itype, device=self.device)
         else:
             markedCell, = bm.nonzero(isMarkedCell)
 
-        # allocate new memory for node and cell
-        node = bm.zeros((9*NN, 3), dtype=self.ftype)
-        cell = bm.zeros((4*NC, 4), dtype=self.itype)
-
-        node = bm.set_at(node, slice(NN), self.entity('node'))
-        cell = bm.set_at(cell, slice(NC), self.entity('cell'))
-
-        for key in self.celldata:
-            data = bm.zeros(4*NC, dtype=self.ftype)
-            data = bm.set_at(data, slice(NC), self.celldata[key])
-            data = bm.set_at(self.celldata , key, data.copy())
-
-        # 用于存储网格节点的代数，初始所有节点都为第 0 代
-        generation = bm.zeros(NN + 6*NC, dtype=bm.uint8)
-
-        # 用于记录被二分的边及其中点编号
-        cutEdge = bm.zeros((8*NN, 3), dtype=self.itype)
-
-        # 当前的二分边的数目
-        nCut = 0
+        node = self.entity('node')
+        cell = bm.copy(self.entity('cell'))
+        parent = bm.arange(NC, dtype=self.itype, device=self.device)
+        localEdge = self.localEdge
+        ikwargs = {'dtype': bm.int64, 'device': self.device}
+
+        # the cut edges, with sorted end nodes and their midpoints
+        cutEdge = bm.zeros((0, 3), **ikwargs)
+        nonConforming = bm.zeros((0, ), dtype=bm.bool, device=self.device)
+
+        def lookup(key, ckey):
+            """Positions of the edge keys in the cut edges, and if found."""
+            order = bm.argsort(ckey)
+            pos = bm.searchsorted(ckey[order], key)
+            pos = bm.minimum(pos, bm.full_like(pos, max(ckey.shape[0] - 1, 0)))
+            if ckey.shape[0] == 0:
+                return pos, bm.zeros(key.shape, dtype=bm.bool, device=self.device)
+            pos = order[pos]
+            return pos, ckey[pos] == key
 
-        # 非协调边的标记数组
-        nonConforming = bm.ones(8*NN, dtype=bm.bool)
-        IM = eye(NN)
         while len(markedCell) != 0:
             # 标记最长边
-            self.label(node, cell, markedCell)
-
-            # 获取标记单元的四个顶点编号
+            cell = self.label(node, cell, markedCell)
             p0 = cell[markedCell, 0]
             p1 = cell[markedCell, 1]
             p2 = cell[markedCell, 2]
             p3 = cell[markedCell, 3]
 
-            # 找到新的二分边和新的中点
-            nMarked = len(markedCell)
-            p4 = bm.zeros(nMarked, dtype=self.itype)
-
-            if nCut == 0: # 如果是第一次循环
-                idx = bm.arange(nMarked) # cells introduce new cut edges
-            else:
-                # all non-conforming edges
-                ncEdge = bm.nonzero(nonConforming[:nCut])
-                NE = len(ncEdge)
-                I = cutEdge[ncEdge][:, [2, 2]].reshape(-1)
-                J = cutEdge[ncEdge][:, [0, 1]].reshape(-1)
-                val = bm.ones(len(I), dtype=bm.bool)
-                nv2v = csr_matrix(
-                        (val, (I, J)),
-                        shape=(NN, NN))
-                i, j =  (nv2v[:, p0].multiply(nv2v[:, p1])).nonzero()
-                p4 = bm.set_at(p4, bm.array(j,dtype=self.itype), bm.array(i,dtype=self.itype))
-                idx, = bm.nonzero(p4 == 0)
-
-            if len(idx) != 0:
-                # 把需要二分的边唯一化
-                NE = len(idx)
-                cellCutEdge = bm.stack([p0[idx], p1[idx]])
-                cellCutEdge = bm.sort(cellCutEdge,axis=0)
-                s = csr_matrix(
-                    (
-                        bm.ones(NE, dtype=bm.bool),
-                        (
-                            cellCutEdge[0, ...],
-                            cellCutEdge[1, ...]
-                        )
-                    ), shape=(NN, NN))
-                # 获得唯一的边
-                i, j = s.nonzero()
-                i = bm.tensor(i,dtype=self.itype)
-                j = bm.tensor(j,dtype=self.itype)
-                nNew = len(i)
-                newCutEdge = bm.arange(nCut, nCut+nNew)
-                cutEdge = bm.set_at(cutEdge, (newCutEdge,0), i)
-                cutEdge = bm.set_at(cutEdge, (newCutEdge,1), j)
-                cutEdge = bm.set_at(cutEdge, (newCutEdge,2), bm.arange(NN, NN+nNew,dtype=self.itype))
-                node = bm.set_at(node, slice(NN, NN+nNew), (node[i, :] + node[j, :])/2.0)
-
-                if returnim is True:
-                    val = bm.full(nNew, 0.5)
-                    I = coo_matrix(
-                            (val, (range(nNew), i)), shape=(nNew, NN),
-                            dtype=self.ftype)
-                    I += coo_matrix(
-                            (val, (range(nNew), j)), shape=(nNew, NN),
-                            dtype=self.ftype)
-                    I = bmat([[eye(NN)], [I]], format='csr')
-                    IM = I@IM
-
-                nCut += nNew
+            # the midpoints of the longest edges, cutting the new ones
+            a = bm.astype(bm.minimum(p0, p1), bm.int64)
+            b = bm.astype(bm.maximum(p0, p1), bm.int64)
+            key = a * NN + b
+            pos, found = lookup(key, cutEdge[:, 0] * NN + cutEdge[:, 1])
+            p4 = bm.where(found, cutEdge[pos, 2] if cutEdge.shape[0] > 0 else 0, 0)
+            if not bool(bm.all(found)):
+                newKey = bm.unique(key[~found])
+                nNew = newKey.shape[0]
+                i, j = newKey // NN, newKey % NN
+                mid = bm.arange(NN, NN + nNew, **ikwargs)
+                cutEdge = bm.concatenate((cutEdge, bm.stack([i, j, mid], axis=1)), axis=0)
+                nonConforming = bm.concatenate(
+                    (nonConforming, bm.ones((nNew, ), dtype=bm.bool, device=self.device)), axis=0)
+                node = bm.concatenate((node, (node[i, :] + node[j, :])/2.0), axis=0)
+                k = bm.searchsorted(newKey, key)
+                p4 = bm.where(found, p4, mid[bm.minimum(k, bm.full_like(k, nNew - 1))])
                 NN += nNew
-
-                # 新点和旧点的邻接矩阵
-                I = cutEdge[newCutEdge][:, [2, 2]].reshape(-1)
-                J = cutEdge[newCutEdge][:, [0, 1]].reshape(-1)
-                val = bm.ones(len(I), dtype=bm.bool)
-                nv2v = csr_matrix(
-                        (val, (I, J)),
-                        shape=(NN, NN))
-                i, j =  (nv2v[:, p0].multiply(nv2v[:, p1])).nonzero()
-                p4 = bm.set_at(p4, bm.array(j,dtype=self.itype), bm.array(i,dtype=self.itype))
-
-            # 如果新点的代数仍然为 0
-            idx = (generation[p4] == 0)
-            cellGeneration = bm.max(
-                    generation[cell[markedCell[idx]]],
-                    axis=-1)
-            # 第几代点
-            generation = bm.set_at(generation, p4[idx], cellGeneration + 1)
-            cell = bm.set_at(cell, (markedCell,0), p3)
-            cell = bm.set_at(cell, (markedCell,1), p0)
-            cell = bm.set_at(cell, (markedCell,2), p2)
-            cell = bm.set_at(cell, (markedCell,3), p4)
-            cell = bm.set_at(cell, (slice(NC, NC+nMarked),0), p2)
-            cell = bm.set_at(cell, (slice(NC, NC+nMarked),1), p1)
-            cell = bm.set_at(cell, (slice(NC, NC+nMarked),2), p3)
-            cell = bm.set_at(cell, (slice(NC, NC+nMarked),3), p4)
-
-            for key in self.celldata:
-                data = self.celldata[key]
-                data = bm.set_at(data, slice(NC, NC+nMarked), data[markedCell])
-
-            if("HB" in options) and (options["HB"] is not None):
-                HB = options['HB']
-                HB = bm.set_at(HB, (slice(NC, NC+nMarked),1), HB[markedCell,1])
-            
-            NC = NC + nMarked
-            del cellGeneration, p0, p1, p2, p3, p4
-
-            # 找到非协调的单元
-            checkEdge, = bm.nonzero(nonConforming[:nCut])
-            isCheckNode = bm.zeros(NN, dtype=bm.bool)
-            isCheckNode = bm.set_at(isCheckNode, cutEdge[checkEdge], True)
-            isCheckCell = bm.sum(
-                    isCheckNode[cell[:NC]],
-                    axis= -1) > 0
-            # 找到所有包含检查节点的单元编号
-            checkCell, = bm.nonzero(isCheckCell)
-            I = bm.repeat(checkCell, 4)
-            J = cell[checkCell].reshape(-1)
-            val = bm.ones(len(I), dtype=bm.bool)
-            cell2node = csr_matrix((val, (I, J)), shape=(NC, NN))
-            i, j =  (cell2node[:, cutEdge[checkEdge, 0]].multiply(
-                        cell2node[:, cutEdge[checkEdge, 1]]
-                        )).nonzero()
-            markedCell = bm.unique(bm.array(i))
+            p4 = bm.astype(p4, cell.dtype)
+
+            cell = bm.concatenate((cell, bm.stack([p2, p1, p3, p4], axis=1)), axis=0)
+            cell = bm.set_at(cell, markedCell, bm.stack([p3, p0, p2, p4], axis=1))
+            parent = bm.concatenate((parent, parent[markedCell]), axis=0)
+            NC = NC + len(markedCell)
+
+            # 找到非协调的单元: the cells containing a cut edge
+            checkEdge, = bm.nonzero(nonConforming)
+            isCheckNode = bm.zeros((NN, ), dtype=bm.bool, device=self.device)
+            isCheckNode = bm.set_at(isCheckNode, cutEdge[checkEdge, :2], True)
+            checkCell, = bm.nonzero(bm.any(isCheckNode[cell], axis=-1))
+            ce = bm.astype(cell[checkCell][:, localEdge], bm.int64) # (M, 6, 2)
+            key = bm.min(ce, axis=-1) * NN + bm.max(ce, axis=-1)
+            ckey = cutEdge[checkEdge, 0] * NN + cutEdge[checkEdge, 1]
+            pos, found = lookup(key, ckey)
+            markedCell = checkCell[bm.any(found, axis=-1)]
             nonConforming = bm.set_at(nonConforming, checkEdge, False)
-            nonConforming = bm.set_at(nonConforming, checkEdge[j], True)
-
+            nonConforming = bm.set_at(nonConforming, checkEdge[pos[found]], True)
 
-        self.node = node[:NN]
-        self.cell = cell[:NC]
+        self.node = node
+        self.cell = cell
         self.construct()
-        
+        if disp:
+            logger.info(f"Bisection cut {cutEdge.shape[0]} edges, and gives {NC} cells.")
 
         for key in self.celldata:
-            self.celldata = bm.set_at(self.celldata, key, self.celldata[key][:NC])
-            
+            self.celldata[key] = self.celldata[key][parent]
 
-        if("HB" in options) and (options["HB"] is not None):
-            options['HB'] = options['HB'][:NC]
+        if ("HB" in options) and (options["HB"] is not None):
+            options['HB'] = bm.stack([bm.arange(NC, dtype=self.itype, device=self.device),
+                                      parent], axis=1)
 
-        if ('data' in options) and (options['data'] is not None):
-            options['data'] = self.interpolation_with_HB(oldnode, oldcell, options['HB'], options['data'])
-            
+        if data is not None:
+            out = transfer.transfer(self, parent, values)
+            options['data'] = {name: [out[(name, i)] for i in range(len(data.get(name, [])))]
+                               for name in ('celldata', 'nodedata')}
 
         if returnim is True:
-            return IM
+            return transfer.interpolation_matrix(self, parent, p)
 
     def interpolation_with_HB(self, oldnode, oldcell, HB, data={}):
 
@@ -352,17 +352,6 @@ class TriangleMesh(SimplexMesh, Plotable):
         """
         pass
     
-    def location(self, points):
-        """
-        @breif  给定一组点 p , 找到这些点所在的单元
-
-        这里假设：
-
-        1. 所有点在网格内部，
-        2. 网格中没有洞
-        3. 区域还要是凸的
-        """
-        pass
 
     def circumcenter(self, index: Index=_S, returnradius=False):
         """
@@ -446,186 +435,144 @@ class TriangleMesh(SimplexMesh, Plotable):
             IM=None,
             data=None,
             disp=True,
+            p=1,
+            infer=False,
     ):
 
         options = {
             'HB': HB,
             'IM': IM,
             'data': data,
-            'disp': disp
+            'disp': disp,
+            'p': p,
+            'infer': infer
         }
         return options
 
-    def bisect(self, isMarkedCell=None, options={'disp': True}): #TODO
-        if options['disp']:
-            print('Bisection begining......')
+    def bisect(self, isMarkedCell=None, options={}):
+        """Refine the marked cells by the newest vertex bisection, and the
+        cells needed for a conforming mesh.
 
+        The refinement edge of a cell is the edge opposite to `cell[:, 0]`.
+        Every cell is bisected at most twice, so all the new nodes are the
+        midpoints of the old edges.
+
+        Parameters:
+            isMarkedCell (Tensor, optional): The flags of the cells to refine.
+                Defaults to all cells.\n
+            options (dict, optional): See `bisect_options`. The keys present are
+                filled in place:\n
+                'HB': the parent (old cell) of every new cell, shaped (NC,).\n
+                'IM': the CSRTensor of the Lagrange interpolation of degree
+                options['p'] from the old mesh to the new one, reusable for any
+                vector of that degree.\n
+                'data': a dict of (value, kind) pairs transferred to the new
+                mesh, replaced by the dict of the new values. The kind is 'cell'
+                for the cell data shaped (NC, ...), 'local' for the local
+                interpolation values shaped (NC, ldof), or 'node' for the global
+                interpolation values shaped (gdof, ...) of any degree, see
+                `MeshTransfer`. The kinds of bare values are guessed from their
+                shapes, with a DeprecationWarning unless options['infer'] is True.
+        """
+        from .mesh_transfer import MeshTransfer
+
+        disp = options.get('disp', False)
+        data = options.get('data', None)
+        p = options.get('p', 1) or 1
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
         NE = self.number_of_edges()
-
-        if options['disp']:
-            print('Current number of nodes:', NN)
-            print('Current number of edges:', NE)
-            print('Current number of cells:', NC)
+        if disp:
+            logger.info(f"Bisection of a mesh with {NN} nodes, {NE} edges and {NC} cells.")
 
         if isMarkedCell is None:
-            isMarkedCell = bm.ones(NC, dtype=bm.bool)
+            isMarkedCell = bm.ones(NC, dtype=bm.bool, device=self.device)
+
+        if (data is not None) or ('IM' in options):
+            transfer = MeshTransfer(self, data, p=(p, ), infer=options.get('infer', False))
 
         cell = self.entity('cell')
         edge = self.entity('edge')
-
         cell2edge = self.cell_to_edge()
         cell2cell = self.cell_to_cell()
-        #cell2ipoint = self.cell_to_ipoint(self.p)
-        isCutEdge = bm.zeros((NE,), dtype=bm.bool, device=self.device)
-
-        if options['disp']:
-            print('The initial number of marked elements:', isMarkedCell.sum())
 
+        # the refinement closure: the refinement edges of the marked cells and,
+        # recursively, of the neighbors whose edges are cut
+        isCutEdge = bm.zeros((NE,), dtype=bm.bool, device=self.device)
         markedCell, = bm.nonzero(isMarkedCell)
         while len(markedCell) > 0:
             isCutEdge = bm.set_at(isCutEdge, cell2edge[markedCell, 0], True)
             refineNeighbor = cell2cell[markedCell, 0]
             markedCell = refineNeighbor[~isCutEdge[cell2edge[refineNeighbor, 0]]]
 
-        if options['disp']:
-            print('The number of markedg edges: ', isCutEdge.sum())
-
+        nn = int(bm.sum(isCutEdge))
         edge2newNode = bm.zeros((NE,), dtype=self.itype, device=self.device)
-        edge2newNode = bm.set_at(edge2newNode, isCutEdge, bm.arange(NN, NN + isCutEdge.sum(), dtype=self.itype, device=self.device))
-
-        node = self.node
+        edge2newNode = bm.set_at(edge2newNode, isCutEdge,
+                                 bm.arange(NN, NN + nn, dtype=self.itype, device=self.device))
+        node = self.entity('node')
         newNode = 0.5 * (node[edge[isCutEdge, 0], :] + node[edge[isCutEdge, 1], :])
-        self.node = bm.concatenate((node, newNode), axis=0)
-        cell2edge0 = cell2edge[:, 0]
-
-        if 'data' in options:
-            pass
-
-        if 'IM' in options:
-            nn = len(newNode)
-            IM = COOTensor( indices=bm.stack((bm.arange(NN), bm.arange(NN)), axis=0),
-                            values=bm.ones(NN), 
-                            shape=(NN + nn, NN))
-            # IM = coo_matrix((bm.ones(NN), (bm.arange(NN), bm.arange(NN))),
-            #                 shape=(NN + nn, NN))
-            val = bm.full((nn,), 0.5)
-            IM += COOTensor(indices=bm.stack((NN + bm.arange(nn), edge[isCutEdge, 0]), axis=0),
-                            values=val,
-                            shape=(NN + nn, NN))
-            # IM += coo_matrix(
-            #     (
-            #         val,
-            #         (
-            #             NN + bm.arange(nn),
-            #             edge[isCutEdge, 0]
-            #         )
-            #     ), shape=(NN + nn, NN))
-            IM += COOTensor(indices=bm.stack((NN + bm.arange(nn), edge[isCutEdge, 1]), axis=0),
-                            values=val,
-                            shape=(NN + nn, NN))
-            # IM += coo_matrix(
-            #     (
-            #         val,
-            #         (
-            #             NN + bm.arange(nn),
-            #             edge[isCutEdge, 1]
-            #         )
-            #     ), shape=(NN + nn, NN))
-            options['IM'] = IM.tocsr()
-
-        if 'HB' in options:
-            options['HB'] = bm.arange(NC)
 
+        parent = bm.arange(NC, dtype=self.itype, device=self.device)
+        cell2edge0 = cell2edge[:, 0]
         for k in range(2):
             idx, = bm.nonzero(edge2newNode[cell2edge0] > 0)
             nc = len(idx)
             if nc == 0:
                 break
-
-            if 'HB' in options:
-                HB = options['HB']
-                options['HB'] = bm.concatenate((HB, HB[idx]), axis=0)
-
-            L = idx
-            R = bm.arange(NC, NC + nc)
-            if ('data' in options) and (options['data'] is not None):
-                for key, value in options['data'].items():
-                    if value.shape == (NC,):  # 分片常数
-                        value = bm.concatenate((value[:], value[idx]))
-                        options['data'][key] = value
-                    #elif value.ndim == 2 and value.shape[0] == NC:  # 处理(NC, NQ)的情况
-                    #    value = bm.concatenate((value, value[idx, :])) 
-                    #    options['data'][key] = value
-                    elif value.shape == (NN + k * nn,):
-                        if k == 0:
-                            value = bm.concatenate((value, bm.zeros((nn,),  dtype=self.ftype, device=self.device)))
-                            value = bm.set_at(value , slice(NN, None), 0.5 * (value[edge[isCutEdge, 0]] + value[edge[isCutEdge, 1]]))
-                            options['data'][key] = value
-                    else:
-                        ldof = value.shape[-1]
-                        p = int((bm.sqrt(1 + 8 * bm.array(ldof)) - 3) // 2)
-                        bc = self.multi_index_matrix(p, etype=2) / p
-
-                        bcl = bm.zeros_like(bc, dtype=self.ftype, device=self.device)
-                        bcl = bm.set_at(bcl , (slice(None), 0), bc[:, 1])
-                        bcl = bm.set_at(bcl , (slice(None), 1), 0.5 * bc[:, 0] + bc[:, 2])
-                        bcl = bm.set_at(bcl , (slice(None), 2), 0.5 * bc[:, 0])
-
-                        bcr = bm.zeros_like(bc,dtype=self.ftype, device=self.device)
-                        bcr = bm.set_at(bcr , (slice(None), 0), bc[:, 2])
-                        bcr = bm.set_at(bcr , (slice(None), 1), 0.5 * bc[:, 0])
-                        bcr = bm.set_at(bcr , (slice(None), 2), 0.5 * bc[:, 0] + bc[:, 1])
-
-                        value = bm.concatenate((value, bm.zeros((nc, ldof), dtype=self.ftype, device=self.device)))
-
-                        phi = self.shape_function(bcr, p=p)
-                        value = bm.set_at(value , slice(NC , None), bm.einsum('cj,kj->ck', value[idx], phi))
-
-                        phi = self.shape_function(bcl, p=p)
-                        value = bm.set_at(value , (idx, slice(None)), bm.einsum('cj,kj->ck', value[idx], phi))
-
-                        options['data'][key] = value
-
             p0 = cell[idx, 0]
             p1 = cell[idx, 1]
             p2 = cell[idx, 2]
             p3 = edge2newNode[cell2edge0[idx]]
-            cell = bm.concatenate((cell, bm.zeros((nc, 3), dtype=self.itype, device=self.device)), axis=0)
-            
-            cell = bm.set_at(cell , (L, 0), p3)
-            cell = bm.set_at(cell , (L, 1), p0)
-            cell = bm.set_at(cell , (L, 2), p1)
-            cell = bm.set_at(cell , (R, 0), p3)
-            cell = bm.set_at(cell , (R, 1), p2)
-            cell = bm.set_at(cell , (R, 2), p0)
+            # the left child replaces the cell, and the right one is appended
+            cell = bm.concatenate((cell, bm.stack([p3, p2, p0], axis=1)), axis=0)
+            cell = bm.set_at(cell, idx, bm.stack([p3, p0, p1], axis=1))
+            parent = bm.concatenate((parent, parent[idx]), axis=0)
             if k == 0:
-                cell2edge0 = bm.zeros((NC + nc,), dtype=self.itype, device=self.device)
-                cell2edge0 = bm.set_at(cell2edge0 , slice(NC) , cell2edge[:, 0])
-                cell2edge0 = bm.set_at(cell2edge0 , L , cell2edge[idx, 2])
-                cell2edge0 = bm.set_at(cell2edge0 , R , cell2edge[idx, 1])
-            NC = NC + nc
+                cell2edge0 = bm.concatenate((cell2edge0, cell2edge[idx, 1]), axis=0)
+                cell2edge0 = bm.set_at(cell2edge0, idx, cell2edge[idx, 2])
 
-        self.NN = self.node.shape[0]
+        self.node = bm.concatenate((node, newNode), axis=0)
         self.cell = cell
         self.construct()
+        if disp:
+            logger.info(f"Bisection cut {nn} edges, and gives {cell.shape[0]} cells.")
 
-    def coarsen(self, isMarkedCell=None, options={}):
-        """
-        @brief
+        if 'HB' in options:
+            options['HB'] = parent
+        if 'IM' in options:
+            options['IM'] = transfer.interpolation_matrix(self, parent, p)
+        if data is not None:
+            options['data'] = transfer.transfer(self, parent, data)
 
+    def coarsen(self, isMarkedCell=None, options={}):
+        """Coarsen the marked cells, merging the pairs of cells bisected from a
+        common parent around the good nodes, see
         https://lyc102.github.io/ifem/afem/coarsen/
+
+        Parameters:
+            isMarkedCell (Tensor, optional): The flags of the cells to coarsen.
+                Nothing is done if None.\n
+            options (dict, optional): The keys present are filled in place:\n
+                'IM': the CSRTensor of the Lagrange interpolation of degree
+                options['p'] from the old mesh to the new one.\n
+                'data': a dict of (value, kind) pairs transferred to the new
+                mesh like in `bisect`, the cell data of a merged cell are the
+                mean of its two halves.
         """
         from .utils import inverse_relation
+        from .mesh_transfer import MeshTransfer
 
         if isMarkedCell is None:
             return
 
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
+        data = options.get('data', None)
+        p = options.get('p', 1) or 1
+        if (data is not None) or ('IM' in options):
+            transfer = MeshTransfer(self, data, p=(p, ), infer=options.get('infer', False))
 
-        cell = self.entity('cell')
+        cell = bm.copy(self.entity('cell'))
         node = self.entity('node')
 
         valence = bm.zeros(NN, dtype=self.itype, device=self.device)
@@ -642,11 +589,25 @@ class TriangleMesh(SimplexMesh, Plotable):
         # I, J = bm.nonzero(node2cell[isIGoodNode, :])
         _, J, _ = inverse_relation(cell, NN, isIGoodNode)
         nodeStar = J.reshape(-1, 4)
-
-        ix = (cell[nodeStar[:, 0], 2] == cell[nodeStar[:, 3], 1])
-        iy = (cell[nodeStar[:, 1], 1] == cell[nodeStar[:, 2], 2])
-        nodeStar = bm.set_at(nodeStar , ix & (~iy) ,nodeStar[ix & (~iy), :][:, [0, 2, 1, 3]])
-        nodeStar = bm.set_at(nodeStar , (~ix) & iy ,nodeStar[(~ix) & iy, :][:, [0, 3, 1, 2]])
+        # the stars of the boundary nodes are disjoint from the interior ones,
+        # and are found before the merged cells are marked by -1
+        _, J, _ = inverse_relation(cell, NN, isBGoodNode)
+        bnodeStar = J.reshape(-1, 2)
+
+        # sort the four cells around each node counterclockwise: the successor
+        # of a cell [x, a, b] is the cell [x, b, c]
+        star = cell[nodeStar]
+        succ = bm.argmax(bm.astype(star[:, :, None, 2] == star[:, None, :, 1], bm.int32), axis=-1)
+        rows = bm.arange(succ.shape[0], device=self.device)
+        order = [bm.zeros_like(succ[:, 0])]
+        for _ in range(3):
+            order.append(succ[rows, order[-1]])
+        cyc = bm.stack([nodeStar[rows, o] for o in order], axis=1)
+        # the children [x, a, b] and [x, c, a] of a parent [a, b, c] are
+        # consecutive, and the left one [x, a, b] keeps the index of the parent
+        # while the right one is appended by `bisect`
+        flag = cyc[:, 0] < cyc[:, 3]
+        nodeStar = bm.where(flag[:, None], cyc[:, [0, 3, 2, 1]], cyc[:, [1, 0, 3, 2]])
 
         t0 = nodeStar[:, 0]
         t1 = nodeStar[:, 1]
@@ -668,11 +629,9 @@ class TriangleMesh(SimplexMesh, Plotable):
         cell = bm.set_at(cell , (t2, 2) , p1)
         cell = bm.set_at(cell , (t3, 0) , -1)
 
-        # I, J = bm.nonzero(node2cell[isBGoodNode, :])
-        _, J, _ = inverse_relation(cell, NN, isBGoodNode)
-        nodeStar = J.reshape(-1, 2)
+        nodeStar = bnodeStar
         idx = (cell[nodeStar[:, 0], 2] == cell[nodeStar[:, 1], 1])
-        nodeStar = bm.set_at(nodeStar , idx , nodeStar[idx, :][:, [0, 1]])
+        nodeStar = bm.where(idx[:, None], nodeStar[:, [1, 0]], nodeStar)
 
         t4 = nodeStar[:, 0]
         t5 = nodeStar[:, 1]
@@ -686,32 +645,12 @@ class TriangleMesh(SimplexMesh, Plotable):
         cell = bm.set_at(cell , (t5, 0) , -1)
 
         isKeepCell = cell[:, 0] > -1
-        if ('data' in options) and (options['data'] is not None):
-            # value.shape == (NC, (p+1)*(p+2)//2)
-            lidx = bm.concatenate((t0, t2, t4))
-            ridx = bm.concatenate((t1, t3, t5))
-            for key, value in options['data'].items():
-                ldof = value.shape[1]
-                p = int((bm.sqrt(8 * ldof + 1) - 3) / 2)
-                bc = self.multi_index_matrix(p=p, etype=2) / p
-                bcl = bm.zeros_like(bc)
-                bcl = bm.set_at(bcl , (slice(None), 0) , 2 * bc[:, 2])
-                bcl = bm.set_at(bcl , (slice(None), 1) , bc[:, 0])
-                bcl = bm.set_at(bcl , (slice(None), 2) , bc[:, 1] - bc[:, 2])
- 
-                bcr = bm.zeros_like(bc)
-                bar = bm.set_at(bcr , (slice(None), 0) , 2 * bc[:, 1])
-                bar = bm.set_at(bcr , (slice(None), 1) , bc[:, 2] - bc[:, 1])
-                bar = bm.set_at(bcr , (slice(None), 2) , bc[:, 0])
-
-                phi = self.shape_function(bcl, p=p)  # (NQ, ldof)
-                value = bm.set_at(value , lidx , bm.einsum('ci, qi->cq', value[lidx, :], phi))
-
-                phi = self.shape_function(bcr, p=p)  # (NQ, ldof)
-
-                value = bm.add_at(value , lidx , bm.einsum('ci, qi->cq', value[ridx, :], phi))
-                value = bm.set_at(value , lidx , 0.5 * value[lidx])
-                options['data'] = bm.set_at(options['data'],key , value[isKeepCell])
+        # the old cells merged into each new cell
+        partner = bm.arange(NC, dtype=t0.dtype, device=self.device)
+        partner = bm.set_at(partner, bm.concatenate((t0, t2, t4)), bm.concatenate((t1, t3, t5)))
+        keep, = bm.nonzero(isKeepCell)
+        keep = bm.astype(keep, t0.dtype)
+        source = bm.stack([keep, partner[keep]], axis=1)
 
         cell = cell[isKeepCell]
         isGoodNode = (isIGoodNode | isBGoodNode)
@@ -726,6 +665,11 @@ class TriangleMesh(SimplexMesh, Plotable):
         self.cell = cell
         self.construct()
 
+        if 'IM' in options:
+            options['IM'] = transfer.interpolation_matrix(self, source, p)
+        if data is not None:
+            options['data'] = transfer.transfer(self, source, data)
+
     def label(self, node=None, cell=None, cellidx=None):
         """
         单元顶点的重新排列，使得cell[:, [1, 2]] 存储了单元的最长边
@@ -1066,12 +1010,6 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         return J
 
-    def point_to_bc(self, point):
-        """
-        @brief 找到定点 point 所在的单元，并计算其重心坐标 
-        """
-        pass
-
     def mark_interface_cell(self, phi):
         """
         @brief 标记穿过界面的单元
@@ -1,6 +1,8 @@
 
 from typing import Dict, Callable, TypeVar, Tuple, Any
 from math import comb
+from functools import wraps
+import inspect
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
@@ -78,9 +80,37 @@ def inverse_relation(entity: TensorLike, size: int, index=None, *, sorted=True):
     return row, col, (size, entity.shape[0])
 
 
-def flocc(array: TensorLike, /):
+def _pack_rows(array: TensorLike):
+    """Pack the rows of non-negative integers into int64 keys ordered like
+    the rows, or None if they do not fit in 63 bits."""
+    N, k = array.shape
+    if (N == 0) or (k == 0) or (not bm.is_tensor(array)) or \
+            array.dtype not in (bm.int8, bm.int16, bm.int32, bm.int64, bm.uint8):
+        return None
+    if int(bm.min(array)) < 0:
+        return None
+    bits = max(int(bm.max(array)).bit_length(), 1)
+    if k * bits > 63:
+        return None
+    array = bm.astype(array, bm.int64)
+    key = array[:, 0]
+    for i in range(1, k):
+        key = key * (1 << bits) + array[:, i]
+    return key
+
+
+def flocc(array: TensorLike, /, *, method: str='auto'):
     """Find the first and last occurrence of each unique row in a 2D array.
 
+    Parameters:
+        array (TensorLike): The rows, shaped (N, k), usually sorted in each row.\n
+        method (str, optional): 'lexsort' sorts the rows by all columns.
+            'packed' packs every row of non-negative integers into one int64
+            key and sorts the keys, which is several times faster and never
+            gathers the sorted rows; it requires k * bits(max) <= 63. 'auto' uses 'packed'
+            when possible, otherwise 'lexsort'. The outputs are identical.
+            Defaults to 'auto'.
+
     Returns:
         out (TensorLike, TensorLike, TensorLike):
         - The first occurrence index of each unique row.
@@ -89,13 +119,28 @@ def flocc(array: TensorLike, /):
     """
     if array.ndim != 2:
         raise ValueError("total_face must be a 2D array.")
+    if method not in ('auto', 'lexsort', 'packed'):
+        raise ValueError(f"Unknown method '{method}', expected 'auto', 'lexsort' or 'packed'.")
+
+    key = None
+    if method != 'lexsort':
+        key = _pack_rows(array)
+        if (key is None) and (method == 'packed'):
+            raise ValueError("The rows can not be packed into 64-bit keys.")
+
+    if key is None:
+        indices = bm.lexsort(tuple(reversed(array.T)), axis=0)
+        sorted_array = array[indices]
+        diff_flag = bm.any(
+            sorted_array[1:] != sorted_array[:-1],
+            axis=1,
+        )
+    else:
+        indices = bm.argsort(key, stable=True)
+        sorted_key = key[indices]
+        diff_flag = sorted_key[1:] != sorted_key[:-1]
+        del key, sorted_key
 
-    indices = bm.lexsort(tuple(reversed(array.T)), axis=0)
-    sorted_array = array[indices]
-    diff_flag = bm.any(
-        sorted_array[1:] != sorted_array[:-1],
-        axis=1,
-    )
     TRUE = bm.ones((1,), dtype=bm.bool, device=bm.get_device(diff_flag))
     diff_flag = bm.concat([TRUE, diff_flag, TRUE])
     group_index = bm.cumsum(diff_flag[:-1], axis=0) - 1
@@ -122,6 +167,23 @@ def flocc(array: TensorLike, /):
 # TODO: This feature does not hinder the unstructured mesh, but wee still need
 # to see if it is an over-design or if there is a better way to do this.
 
+# NOTE: The relations below are derived from the entities only, so they are
+# memoized by the meta class for every mesh class defining them. The cache is
+# dropped when `node`, `cell` or any other entity is assigned, and by
+# `construct()` and `clear()`. The boolean flags are returned as copies, as
+# they are often modified in place by the callers.
+CACHED_RELATIONS: Dict[str, bool] = {
+    'cell_to_ipoint': False,
+    'face_to_ipoint': False,
+    'edge_to_ipoint': False,
+    'cell_to_cell': False,
+    'boundary_node_flag': True,
+    'boundary_edge_flag': True,
+    'boundary_face_flag': True,
+    'boundary_cell_flag': True,
+}
+
+
 class MeshMeta(type):
     def __init__(self, name: str, bases: Tuple[type, ...], dict: Dict[str, Any], /, **kwds: Any):
         if '_entity_dim_method_name_map' in dict:
@@ -137,6 +199,9 @@ class MeshMeta(type):
                     dim = getattr(item, '__entity__')
                     assert isinstance(dim, int)
                     self._entity_dim_method_name_map[dim] = item.__name__
+                if (name in CACHED_RELATIONS) and inspect.isfunction(item) \
+                        and not hasattr(item, '__relation__'):
+                    setattr(self, name, cachedrelation(CACHED_RELATIONS[name])(item))
 
         return type.__init__(self, name, bases, dict, **kwds)
 
@@ -155,6 +220,48 @@ def entitymethod(top_dim: int):
     return decorator
 
 
+def cachedrelation(copy: bool=False):
+    """A decorator memoizing a topological relation of a mesh, keyed by the
+    arguments other than `index`. The whole relation is computed once and
+    indexed afterwards.
+
+    Parameters:
+        copy (bool, optional): Whether to return a copy of the cached relation,
+            for the results modified in place by the callers. Defaults to False.
+    """
+    def decorator(meth: _Meth) -> _Meth:
+        sig = inspect.signature(meth)
+        has_index = 'index' in sig.parameters
+        variadic = any(v.kind in (v.VAR_POSITIONAL, v.VAR_KEYWORD)
+                       for v in sig.parameters.values())
+
+        @wraps(meth)
+        def wrapper(self, *args, **kwargs):
+            if variadic:
+                return meth(self, *args, **kwargs)
+            bound = sig.bind(self, *args, **kwargs)
+            arguments = dict(bound.arguments)
+            arguments.pop('self', None)
+            index = arguments.pop('index', None) if has_index else None
+            key = (meth.__qualname__, ) + tuple(arguments.items())
+            try:
+                hash(key)
+            except TypeError:
+                return meth(self, *args, **kwargs)
+
+            cache = self.__dict__.setdefault('_relation_cache', {})
+            if key not in cache:
+                cache[key] = meth(self, **arguments)
+            out = cache[key]
+            if (index is None) or (isinstance(index, slice) and index == slice(None)):
+                return bm.copy(out) if copy else out
+            return out[index]
+
+        wrapper.__relation__ = meth
+        return wrapper
+    return decorator
+
+
 def simplex_ldof(p: int, iptype: int) -> int:
     """Number of local dofs in a simplex entity."""
     if iptype == 0:
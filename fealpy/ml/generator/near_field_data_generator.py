@@ -117,35 +117,6 @@ class NearFieldDataFEMGenerator2d:
         uh[:] = spsolve(A, F, solver='scipy')
         return uh
 
-    def points_location_and_bc(self, p: NDArray, domain: Sequence[float], nx: int, ny: int):
-        """
-        计算接收点的位置和重心坐标。
-
-        参数:
-        - p: 接收点坐标
-        - domain: 计算域
-        - nx: x方向的网格数
-        - ny: y方向的网格数
-
-        返回:
-        - location: 接收点所在单元的索引
-        - bc: 重心坐标
-        """
-        x = p[..., 0]
-        y = p[..., 1]
-        cell_length_x = (domain[1] - domain[0]) / nx
-        cell_length_y = (domain[3] - domain[2]) / ny
-        index_x = (x - domain[0]) // cell_length_x
-        index_y = (y - domain[2]) // cell_length_y
-        location = int(index_x * ny + index_y)
-
-        bc_x_ = ((x - domain[0]) / cell_length_x) % 1
-        bc_y_ = ((y - domain[2]) / cell_length_y) % 1
-        bc_x = bm.array([[bc_x_, 1 - bc_x_]], dtype=bm.float64)
-        bc_y = bm.array([[bc_y_, 1 - bc_y_]], dtype=bm.float64)
-        bc = (bc_x, bc_y)
-        return location, bc
-
     def data_for_dsm(self, k: float, d: Sequence[float]):
         """
         获取用于DSM的数据。
@@ -162,16 +133,8 @@ class NearFieldDataFEMGenerator2d:
         data = bm.zeros((data_length,), dtype=bm.complex128)
         uh = self.get_nearfield_data(k=k, d=d)
 
-        if self.meshtype == 'InterfaceMesh':
-            b = self.mesh.point_to_bc(reciever_points)
-            location = self.mesh.location(reciever_points)
-            for i in range(data_length):
-                data[i] = uh(b[i])[location[i]]
-        elif self.meshtype == 'QuadrangleMesh':
-            for i in range(data_length):
-                location, b = self.points_location_and_bc(reciever_points[i], self.domain, self.nx, self.ny)
-                u = uh(b).reshape(-1)
-                data[i] = u[location]
+        if self.meshtype in ('InterfaceMesh', 'QuadrangleMesh'):
+            data = uh.eval_points(bm.astype(bm.tensor(reciever_points), bm.float64))
         else:
             for i in range(data_length):
                 cell_location = self.mesh.cell_location(reciever_points[i])
@@ -1,4 +1,13 @@
 
 from .conjugate_gradient import cg
-from .direct_solver import spsolve
+from .minimal_residual import minres
+from .bicgstab import bicgstab
+from .direct_solver import spsolve, factorize
 from .gmres_solver import gmres
+from .preconditioner import (
+    JacobiPreconditioner, BlockJacobiPreconditioner,
+    SSORPreconditioner, ILU0Preconditioner, IC0Preconditioner,
+    BlockDiagonalPreconditioner, BlockTriangularPreconditioner
+)
+from .amg_solver import AMGSolver
+from .gmg_solver import GMGSolver
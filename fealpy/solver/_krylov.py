@@ -0,0 +1,118 @@
+from typing import Optional, Protocol, Callable, Tuple, Dict, Any
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .. import logger
+
+
+class SupportsMatmul(Protocol):
+    def __matmul__(self, other: TensorLike) -> TensorLike: ...
+
+
+Preconditioner = Callable[[TensorLike], TensorLike]
+
+
+def prepare_system(b: TensorLike, x0: Optional[TensorLike], batch_first: bool):
+    """Check the right-hand side and the initial guess, and move the batch
+    dimension to the last one.
+
+    Returns:
+        out (Tensor, Tensor, bool): The right-hand side and the initial guess
+        shaped (dof,) or (dof, batch), and whether they are transposed.
+    """
+    assert isinstance(b, TensorLike), "b must be a Tensor"
+    if x0 is not None:
+        assert isinstance(x0, TensorLike), "x0 must be a Tensor if not None"
+
+    if b.ndim not in {1, 2}:
+        raise ValueError("b must be a 1D or 2D dense tensor")
+
+    if x0 is None:
+        x0 = bm.zeros_like(b)
+    else:
+        if x0.shape != b.shape:
+            raise ValueError("x0 and b must have the same shape")
+
+    transposed = (b.ndim == 2) and batch_first
+    if transposed:
+        b = bm.swapaxes(b, 0, 1)
+        x0 = bm.swapaxes(x0, 0, 1)
+
+    return b, x0, transposed
+
+
+def inner(a: TensorLike, b: TensorLike) -> TensorLike:
+    """Column-wise inner products, shaped () or (batch,)."""
+    return bm.sum(a * b, axis=0)
+
+
+def norm(a: TensorLike) -> TensorLike:
+    """Column-wise 2-norms, shaped () or (batch,)."""
+    return bm.sqrt(bm.sum(a * a, axis=0))
+
+
+def safe_divide(a: TensorLike, b: TensorLike) -> TensorLike:
+    """Divide `a` by `b`, giving 0 where `b` is 0 (a converged or broken-down column)."""
+    nonzero = (b != 0)
+    return bm.where(nonzero, a / bm.where(nonzero, b, 1), 0)
+
+
+class ConvergenceMonitor():
+    """Record the residual norms of a Krylov iteration and check the stopping
+    criteria column by column.
+
+    Each column `j` is converged once its residual norm is at most
+    max(atol, rtol * b_norm[j]), and the iteration stops when all of them are.
+    """
+    def __init__(self, name: str, b_norm: TensorLike, r_norm: TensorLike,
+                 atol: float, rtol: float, maxiter: Optional[int]):
+        self.name = name
+        self.tol = bm.maximum(rtol * b_norm, bm.full_like(b_norm, atol))
+        self.maxiter = maxiter
+        self.niter = 0
+        self.history = [r_norm]
+        self.active = r_norm > self.tol
+        self.success = not bool(bm.any(self.active))
+
+    def __call__(self, r_norm: TensorLike) -> bool:
+        """Record the residual norms after an iteration, and return True
+        if the iteration should stop."""
+        r_norm = bm.where(self.active, r_norm, self.history[-1])
+        self.niter += 1
+        self.history.append(r_norm)
+        self.active = r_norm > self.tol
+
+        if not bool(bm.any(self.active)):
+            self.success = True
+            logger.info(f"{self.name}: converged in {self.niter} iterations.")
+            return True
+
+        if (self.maxiter is not None) and (self.niter >= self.maxiter):
+            logger.info(f"{self.name}: failed, stopped by maxiter ({self.maxiter}).")
+            return True
+
+        return False
+
+    def info(self) -> Dict[str, Any]:
+        """Summary of the iteration.
+
+        Returns:
+            Dict: 'success' (bool) for whether all columns converged, 'niter' (int)
+            for the number of iterations, and 'residual' (Tensor) for the residual
+            norms of each iteration, shaped (niter + 1,) or (niter + 1, batch).
+        """
+        return {
+            'success': self.success,
+            'niter': self.niter,
+            'residual': bm.stack(self.history, axis=0)
+        }
+
+
+def finalize(x: TensorLike, transposed: bool, monitor: ConvergenceMonitor,
+             returninfo: bool):
+    if transposed:
+        x = bm.swapaxes(x, 0, 1)
+    if returninfo:
+        return x, monitor.info()
+    return x
@@ -0,0 +1,174 @@
+"""Smoothed aggregation algebraic multigrid (AMG).
+
+The hierarchy is built with backend operations on the coalesced entries of
+the matrix:
+
+1. Strength of connection |a_ij| >= theta * sqrt(|a_ii a_jj|).
+2. Aggregation around the roots of a distance-2 maximal independent set,
+   computed in parallel rounds (Bell, Dalton and Olson, 2012) instead of the
+   sequential greedy pass.
+3. Tentative prolongation interpolating the near-null space candidate (the
+   constant vector for each component on the finest level) on each aggregate,
+   smoothed by one damped Jacobi step.
+4. Galerkin coarse operators P^T A P.
+"""
+from typing import Union, Literal
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+from .. import logger
+from .preconditioner import _sorted_entries, _diagonal
+from .multigrid import MultigridSolver, _csr, _entries, _spectral_radius
+
+__all__ = ['AMGSolver']
+
+
+def _segment_max(index: TensorLike, values: TensorLike, n: int, fill: int):
+    """Maximum of values grouped by index, or `fill` for empty groups."""
+    out = bm.full((n, ), fill, **bm.context(values))
+    if index.shape[0] == 0:
+        return out
+    order = bm.lexsort((values, index))
+    index, values = index[order], values[order]
+    last = bm.concat([index[1:] != index[:-1],
+                      bm.ones((1, ), dtype=bm.bool, device=bm.get_device(index))], axis=0)
+    return bm.set_at(out, index[last], values[last])
+
+
+def _aggregate(row: TensorLike, col: TensorLike, n: int) -> TensorLike:
+    """Aggregate the nodes of a graph with edges (row, col), including self
+    loops, around the roots of a distance-2 maximal independent set.
+
+    Returns:
+        Tensor: The aggregate index of each node, shaped (n,).
+    """
+    kwargs = bm.context(row)
+    # distinct pseudo-random weights breaking the ties of the independent set
+    w = bm.argsort((bm.arange(n, **kwargs) * 2654435761) % 4294967296)
+    state = bm.zeros((n, ), **kwargs) # 0: undecided, 1: root, -1: not a root
+
+    while bool(bm.any(state == 0)):
+        key = bm.where(state == -1, -1, (state + 1) * n + w)
+        m = key
+        for _ in range(2):
+            m = _segment_max(row, m[col], n, -1)
+        undecided = (state == 0)
+        state = bm.where(undecided & (m == key), 1, state)
+        state = bm.where(undecided & (m >= 2 * n), -1, state)
+
+    is_root = (state == 1)
+    NA = int(bm.sum(is_root))
+    agg = bm.full((n, ), -1, **kwargs)
+    agg = bm.set_at(agg, is_root, bm.arange(NA, **kwargs))
+
+    # every node is within distance 2 from a root, so two passes suffice
+    while bool(bm.any(agg < 0)):
+        neighbor = agg[col]
+        m = _segment_max(row, bm.where(neighbor >= 0, w[col] * NA + neighbor, -1), n, -1)
+        agg = bm.where((agg < 0) & (m >= 0), m % NA, agg)
+
+    return agg
+
+
+class AMGSolver(MultigridSolver):
+    """Smoothed aggregation algebraic multigrid solver and preconditioner.
+
+    The hierarchy is built once in the constructor and kept in the object, so
+    the solver can be reused for many right-hand sides, e.g. across time
+    steps, and passed as the preconditioner `M` of `cg`. If only the values of
+    the matrix change, `update` rebuilds the coarse operators with the same
+    prolongations.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The symmetric positive-definite matrix.\n
+        theta (float, optional): Threshold of the strength of connection. Defaults to 0.08.\n
+        block_size (int, optional): Number of DoFs of each node, stored consecutively,
+            e.g. GD for linear elasticity. Nodes are aggregated with all their DoFs,
+            and each component is interpolated separately. Defaults to 1.\n
+        csize (int, optional): Maximum size of the coarsest problem, which is solved
+            directly. Defaults to 50.\n
+        maxlevel (int, optional): Maximum number of levels. Defaults to 10.\n
+        smoother (str, optional): 'jacobi' for the damped Jacobi, or 'gs' for the
+            forward Gauss-Seidel in the pre-smoothing and backward in the post-smoothing.
+            Gauss-Seidel needs fewer cycles, but each sweep has as many sequential
+            steps as the levels of the triangular solve. Defaults to 'jacobi'.\n
+        sstep (int, optional): Number of smoothing steps. Defaults to 1.\n
+        cycle (str, optional): 'V' or 'W'. Defaults to 'V'.
+    """
+    _name = 'AMG'
+
+    def __init__(self, A: Union[COOTensor, CSRTensor], *,
+                 theta: float=0.08, block_size: int=1,
+                 csize: int=50, maxlevel: int=10,
+                 smoother: Literal['gs', 'jacobi']='jacobi', sstep: int=1,
+                 cycle: Literal['V', 'W']='V'):
+        super().__init__(smoother=smoother, sstep=sstep, cycle=cycle)
+        self.theta = theta
+        self.block_size = block_size
+        self.csize = csize
+        self.maxlevel = maxlevel
+        self.setup(A)
+
+    def setup(self, A: Union[COOTensor, CSRTensor]) -> None:
+        """Build the multigrid hierarchy of A."""
+        row, col, values, n = _sorted_entries(A)
+        A = _csr(row, col, values, (n, n))
+        self.A = [A]
+        self.P = []
+        self.R = []
+
+        B = bm.ones((n, ), **bm.context(values))
+
+        while (n > self.csize) and (len(self.A) < self.maxlevel):
+            T, B = self._tentative(self.A[-1], B)
+            if T.shape[1] >= n:
+                logger.warning(f"AMG: coarsening stagnates at {n} DoFs.")
+                break
+            P = self._smooth(self.A[-1], T)
+            row, col, values = _entries(P)
+            self.P.append(P)
+            self.R.append(_csr(col, row, values, (P.shape[1], P.shape[0])))
+            self.A.append(self.R[-1] @ (self.A[-1] @ P))
+            n = P.shape[1]
+
+        logger.info(f"AMG: {len(self.A)} levels with "
+                    f"{[a.shape[0] for a in self.A]} DoFs.")
+        self._setup_levels()
+
+    def _tentative(self, A: CSRTensor, B: TensorLike):
+        """The tentative prolongation interpolating the near-null space
+        candidate B (one value per DoF) on each aggregate, and the coarse candidate."""
+        k = self.block_size
+        row, col, values = _entries(A)
+        n = A.shape[0]
+        NN = n // k
+        kwargs = bm.context(row)
+
+        # strength of connection between nodes
+        node = _csr(row // k, col // k, values**2, (NN, NN))
+        nrow, ncol, nval = _entries(node)
+        diag = _diagonal(nrow, ncol, nval, NN)
+        strong = (nval >= self.theta**2 * bm.sqrt(diag[nrow] * diag[ncol])) | (nrow == ncol)
+        agg = _aggregate(nrow[strong], ncol[strong], NN)
+
+        NA = int(bm.max(agg)) + 1
+        dof = bm.arange(n, **kwargs)
+        tcol = agg[dof // k] * k + dof % k
+        # the QR factorization of B on each aggregate, for each component
+        Bc = bm.zeros((NA * k, ), **bm.context(B))
+        Bc = bm.sqrt(bm.index_add(Bc, tcol, B**2))
+        return _csr(dof, tcol, B / Bc[tcol], (n, NA * k)), Bc
+
+    @staticmethod
+    def _smooth(A: CSRTensor, T: CSRTensor) -> CSRTensor:
+        """P = (I - w D^{-1} A) T with w = 4 / (3 rho(D^{-1} A))."""
+        row, col, values = _entries(A)
+        dinv = 1 / _diagonal(row, col, values, A.shape[0])
+        omega = 4 / (3 * _spectral_radius(A, dinv))
+        AT = A @ T
+        arow, acol, avals = _entries(AT)
+        trow, tcol, tvals = _entries(T)
+        return _csr(bm.concat([trow, arow], axis=0), bm.concat([tcol, acol], axis=0),
+                    bm.concat([tvals, -omega * dinv[arow] * avals], axis=0), T.shape)
@@ -0,0 +1,73 @@
+from typing import Optional
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from ._krylov import (
+    SupportsMatmul, Preconditioner, ConvergenceMonitor,
+    prepare_system, inner, safe_divide, finalize
+)
+
+
+def bicgstab(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+             M: Optional[Preconditioner]=None,
+             batch_first: bool=False,
+             atol: float=1e-12, rtol: float=1e-8,
+             maxiter: Optional[int]=10000,
+             returninfo: bool=False):
+    """Solve a linear system Ax = b using the (right-preconditioned) Biconjugate Gradient
+    Stabilized (BiCGStab) method.
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
+        Must have the same shape as b when reshaped appropriately.
+        M (Preconditioner, optional): A callable applying the inverse of the preconditioner\
+        to a tensor shaped like b. Default is None.
+        batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
+        is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        returninfo (bool, optional): Whether to return the convergence information. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        Dict: The convergence information, only returned if `returninfo` is True,\
+        including 'success', 'niter' and the 'residual' norms of each iteration.
+    """
+    b, x0, transposed = prepare_system(b, x0, batch_first)
+    x, monitor = _bicgstab_impl(A, b, x0, M, atol, rtol, maxiter)
+    return finalize(x, transposed, monitor, returninfo)
+
+
+def _bicgstab_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter):
+    x = x0
+    r = b - A @ x
+    rhat = r
+    p = r
+    rho = inner(rhat, r)
+    monitor = ConvergenceMonitor("BiCGStab", bm.sqrt(inner(b, b)), bm.sqrt(rho),
+                                 atol, rtol, maxiter)
+
+    while not monitor.success:
+        phat = p if M is None else M(p)
+        v = A @ phat
+        alpha = safe_divide(rho, inner(rhat, v))
+        s = r - alpha * v
+        shat = s if M is None else M(s)
+        t = A @ shat
+        omega = safe_divide(inner(t, s), inner(t, t))
+        x = bm.where(monitor.active, x + alpha * phat + omega * shat, x)
+        r = s - omega * t
+
+        if monitor(bm.sqrt(inner(r, r))):
+            break
+
+        rho_new = inner(rhat, r)
+        beta = safe_divide(rho_new, rho) * safe_divide(alpha, omega)
+        p = r + beta * (p - omega * v)
+        rho = rho_new
+
+    return x, monitor
@@ -1,111 +1,85 @@
 
-from typing import Optional, Protocol
+from typing import Optional
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
 
-from .. import logger
-
-
-class SupportsMatmul(Protocol):
-    def __matmul__(self, other: TensorLike) -> TensorLike: ...
+from ._krylov import (
+    SupportsMatmul, Preconditioner, ConvergenceMonitor,
+    prepare_system, inner, safe_divide, finalize
+)
 
 
 def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+       M: Optional[Preconditioner]=None,
        batch_first: bool=False,
        atol: float=1e-12, rtol: float=1e-8,
-       maxiter: Optional[int]=10000) -> TensorLike:
-    """Solve a linear system Ax = b using the Conjugate Gradient (CG) method.
+       maxiter: Optional[int]=10000,
+       returninfo: bool=False):
+    """Solve a linear system Ax = b using the (preconditioned) Conjugate Gradient (CG) method.
 
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
         b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
         x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
         Must have the same shape as b when reshaped appropriately.
+        M (Preconditioner, optional): A callable applying the inverse of the preconditioner\
+        to a tensor shaped like b, see `fealpy.solver.preconditioner`. Default is None.
         batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
         is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
         atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
         rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
         maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.\
         If not provided, the method will continue until convergence based on the given tolerances.
+        returninfo (bool, optional): Whether to return the convergence information. Default is False.
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
+        Dict: The convergence information, only returned if `returninfo` is True,\
+        including 'success', 'niter' and the 'residual' norms of each iteration.
 
     Raises:
         ValueError: If inputs do not meet the specified conditions (e.g., A is not sparse, dimensions mismatch).
 
     Note:
-        This implementation assumes that A is a symmetric positive-definite matrix,
+        This implementation assumes that A and M are symmetric positive-definite matrices,
         which is a common requirement for the Conjugate Gradient method to work correctly.
+        Columns of a 2D `b` are solved simultaneously, and each of them stops updating
+        once its residual satisfies the tolerances.
     """
-    assert isinstance(b, TensorLike), "b must be a Tensor"
-    if x0 is not None:
-        assert isinstance(x0, TensorLike), "x0 must be a Tensor if not None"
-    single_vector = b.ndim == 1
-
-    if b.ndim not in {1, 2}:
-        raise ValueError("b must be a 1D or 2D dense tensor")
-
-    if x0 is None:
-        x0 = bm.zeros_like(b)
-    else:
-        if x0.shape != b.shape:
-            raise ValueError("x0 and b must have the same shape")
-
-    if (not single_vector) and batch_first:
-        b = bm.swapaxes(b, 0, 1)
-        x0 = bm.swapaxes(x0, 0, 1)
-
-    sol = _cg_impl(A, b, x0, atol, rtol, maxiter)
+    b, x0, transposed = prepare_system(b, x0, batch_first)
+    x, monitor = _cg_impl(A, b, x0, M, atol, rtol, maxiter)
+    return finalize(x, transposed, monitor, returninfo)
 
-    if (not single_vector) and batch_first:
-        sol = bm.swapaxes(sol, 0, 1)
 
-    return sol
-
-
-def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, atol, rtol, maxiter):
+def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter):
     # initialize
     x = x0              # (dof, batch)
     r = b - A @ x       # (dof, batch)
-    p = r               # (dof, batch)
-    n_iter = 0
-    b_norm = bm.linalg.norm(b)
-    sum_func = bm.sum
-    sqrt_func = bm.sqrt
+    z = r if M is None else M(r)
+    p = z               # (dof, batch)
+    rTz = inner(r, z)   # (batch,)
+    monitor = ConvergenceMonitor("CG", bm.sqrt(inner(b, b)), bm.sqrt(inner(r, r)),
+                                 atol, rtol, maxiter)
 
     # iterate
-    while True:
+    while not monitor.success:
         Ap = A @ p      # (dof, batch)
-        rTr = sum_func(r**2, axis=0)
-        alpha = rTr / sum_func(p*Ap, axis=0)  # r @ r / (p @ Ap) # (batch,)
-        x = x + alpha[None, ...] * p  # (dof, batch)
-        r_new = r - alpha[None, ...] * Ap
-        rTr_new = sum_func(r_new**2, axis=0)  # (batch,)
-        r_norm_new = sqrt_func(sum_func(rTr_new))
-
-        n_iter += 1
-
-        if r_norm_new < atol:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by absolute tolerance.")
-            break
-
-        if r_norm_new < rtol * b_norm:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by relative tolerance.")
-            break
+        alpha = safe_divide(rTz, inner(p, Ap))  # r @ z / (p @ Ap) # (batch,)
+        alpha = bm.where(monitor.active, alpha, 0)
+        x = x + alpha * p  # (dof, batch)
+        r = r - alpha * Ap
 
-        if (maxiter is not None) and (n_iter >= maxiter):
-            logger.info(f"CG: failed, stopped by maxiter ({maxiter}).")
+        if monitor(bm.sqrt(inner(r, r))):
             break
 
-        beta = rTr_new / rTr # (batch,)
-        p = r_new + beta[None, ...] * p
-        r = r_new
+        z = r if M is None else M(r)
+        rTz_new = inner(r, z)  # (batch,)
+        beta = safe_divide(rTz_new, rTz) # (batch,)
+        p = z + beta * p
+        rTz = rTz_new
 
-    return x
+    return x, monitor
 
     # @staticmethod
     # def setup_context(ctx, inputs, output):
@@ -104,6 +104,225 @@ def _cupy_solve(A, b):
         x = cp.asnumpy(x)
     return x
 
+def _to_scipy_csc(A):
+    """Convert the matrix to a scipy CSC matrix with sorted indices. The
+    explicit zeros are kept, so that the pattern only depends on the pattern
+    of the input."""
+    if hasattr(A, 'to_scipy'):
+        A = A.to_scipy()
+    A = A.tocsc(copy=True)
+    A.sum_duplicates()
+    A.sort_indices()
+    return A
+
+
+class DirectFactor():
+    """A sparse LU factorization of a matrix, kept for many right-hand sides.
+    Create it by `factorize`.
+
+    The symbolic analysis (the fill-reducing ordering) is done once for a
+    sparsity pattern. `refactorize` with a matrix of the same pattern only
+    redoes the numerical factorization, and `solve` only the triangular solves.
+
+    Parameters:
+        A(COOTensor | CSRTensor | scipy.sparse matrix): The square matrix.
+    """
+    def __init__(self, A):
+        self._pattern = None
+        self._nanalyses = 0
+        self._nfactorizations = 0
+        self.refactorize(A)
+
+    @property
+    def shape(self):
+        return self._pattern[2]
+
+    def number_of_analyses(self) -> int:
+        """Number of the symbolic analyses done, one for each new pattern."""
+        return self._nanalyses
+
+    def number_of_factorizations(self) -> int:
+        """Number of the numerical factorizations done."""
+        return self._nfactorizations
+
+    def refactorize(self, A):
+        """Factorize a new matrix, reusing the symbolic analysis if the pattern
+        of the matrix is unchanged.
+
+        Parameters:
+            A(COOTensor | CSRTensor | scipy.sparse matrix): The square matrix.
+
+        Returns:
+            DirectFactor: self.
+        """
+        A = _to_scipy_csc(A)
+        if A.shape[0] != A.shape[1]:
+            raise ValueError(f"The matrix should be square, but got shape {A.shape}.")
+        pattern = (A.indptr, A.indices, A.shape)
+        analyse = not self._same_pattern(pattern)
+        if analyse:
+            self._pattern = pattern
+            self._nanalyses += 1
+        self._factorize(A, analyse)
+        self._nfactorizations += 1
+        return self
+
+    def _same_pattern(self, pattern):
+        if self._pattern is None:
+            return False
+        indptr, indices, shape = self._pattern
+        return (shape == pattern[2]) and np.array_equal(indptr, pattern[0]) \
+            and np.array_equal(indices, pattern[1])
+
+    def _factorize(self, A, analyse: bool):
+        raise NotImplementedError
+
+    def _solve(self, b):
+        raise NotImplementedError
+
+    def _check_rhs(self, b):
+        if b.shape[0] != self.shape[0]:
+            raise ValueError(f"The right-hand side has {b.shape[0]} rows, but the "
+                             f"matrix has shape {self.shape}.")
+
+    def solve(self, b):
+        """Solve the linear system with the factorized matrix.
+
+        Parameters:
+            b(Tensor): The right-hand side shaped (n,), or a block of
+                right-hand sides shaped (n, k).
+
+        Returns:
+            Tensor: The solution, shaped as b.
+        """
+        self._check_rhs(b)
+        return bm.tensor(self._solve(bm.to_numpy(b)))
+
+    def __call__(self, b):
+        return self.solve(b)
+
+
+class _ScipyFactor(DirectFactor):
+    """SuperLU of scipy. The analysis is the COLAMD column ordering, which is
+    reused by factorizing the matrix with permuted columns in natural order."""
+    def _factorize(self, A, analyse):
+        from scipy.sparse.linalg import splu
+        if analyse:
+            self._lu = splu(A)
+            # NOTE: SuperLU factorizes A Pc, whose column perm_c[j] is the
+            # column j of A, so the columns are taken in the inverse order.
+            self._order = np.argsort(self._lu.perm_c)
+            self._permuted = False
+        else:
+            self._lu = splu(A[:, self._order], permc_spec='NATURAL')
+            self._permuted = True
+
+    def _solve(self, b):
+        y = self._lu.solve(b)
+        if not self._permuted:
+            return y
+        x = np.empty_like(y)
+        x[self._order] = y
+        return x
+
+
+class _CupyFactor(_ScipyFactor):
+    """SuperLU of scipy on the CPU, with the triangular solves on the GPU."""
+    def _factorize(self, A, analyse):
+        from cupyx.scipy.sparse.linalg import SuperLU
+        super()._factorize(A, analyse)
+        self._gpu_lu = SuperLU(self._lu)
+
+    def solve(self, b):
+        import cupy as cp
+        self._check_rhs(b)
+        iscpu = isinstance(b, np.ndarray) or b.device.type == "cpu"
+        b = cp.array(bm.to_numpy(b)) if iscpu else cp.from_dlpack(b)
+        y = self._gpu_lu.solve(b)
+        if self._permuted:
+            x = cp.empty_like(y)
+            x[cp.asarray(self._order)] = y
+        else:
+            x = y
+        return bm.tensor(cp.asnumpy(x)) if iscpu else bm.tensor(x)
+
+
+class _MumpsFactor(DirectFactor):
+    """A persistent MUMPS context: job 1 analyses, job 2 factorizes and job 3
+    solves. A block of right-hand sides is solved in one job 3."""
+    _ctx = None
+
+    def _factorize(self, A, analyse):
+        from mumps import DMumpsContext
+        A = A.tocoo()
+        if analyse:
+            self.close()
+            self._ctx = DMumpsContext()
+            self._ctx.set_silent()
+            self._ctx.set_centralized_sparse(A)
+            self._ctx.run(job=1)
+        else:
+            self._ctx.set_centralized_assembled_values(A.data)
+        self._ctx.run(job=2)
+
+    def _solve(self, b):
+        ctx = self._ctx
+        if b.ndim == 1:
+            x = np.array(b, dtype=np.float64)
+            ctx.set_rhs(x)
+            ctx.run(job=3)
+            return x
+        # NOTE: MUMPS reads the right-hand sides column by column. The block is
+        # set on the MUMPS structure directly, as `set_rhs` accepts one vector
+        # only, and referenced until the solve is done.
+        x = np.array(b.T, dtype=np.float64, order='C')
+        self._rhs = x
+        ctx.id.rhs = ctx.cast_array(x)
+        ctx.id.nrhs = x.shape[0]
+        ctx.id.lrhs = x.shape[1]
+        ctx.run(job=3)
+        self._rhs = None
+        return x.T
+
+    def close(self):
+        """Release the MUMPS context."""
+        if self._ctx is not None:
+            self._ctx.destroy()
+            self._ctx = None
+
+    def __del__(self):
+        self.close()
+
+
+def factorize(A, solver: str="mumps") -> DirectFactor:
+    """Factorize a sparse matrix for repeated solves.
+
+    Parameters:
+        A(COOTensor | CSRTensor | scipy.sparse matrix): The square matrix.
+        solver(str): The solver to use. It can be "mumps", "scipy", or "cupy".
+
+    Returns:
+        DirectFactor: The factorization, with `solve(b)` for a right-hand side
+            shaped (n,) or a block shaped (n, k), and `refactorize(A)` for a
+            matrix with new values.
+
+    Example:
+        ```
+        lu = factorize(A, solver="scipy")
+        X = lu.solve(B) # B shaped (n, k)
+        lu.refactorize(A2) # same pattern, new values
+        ```
+    """
+    if solver == "mumps":
+        return _MumpsFactor(A)
+    elif solver == "scipy":
+        return _ScipyFactor(A)
+    elif solver == "cupy":
+        return _CupyFactor(A)
+    else:
+        raise ValueError(f"Unknown solver: {solver}")
+
+
 def spsolve(A:[COOTensor, CSRTensor], b, solver:str="mumps"):
     """Solve a linear system using a direct solver.
 
@@ -0,0 +1,133 @@
+"""Geometric multigrid (GMG) on a hierarchy of uniformly refined simplex meshes.
+
+The prolongation of the Lagrange space of degree p from a coarse mesh to
+its uniform refinement evaluates the coarse basis functions at the
+interpolation points of the fine space. The uniform refinement of the
+interval, triangle and tetrahedron meshes stacks the children of the cells
+block by block, so the parent of the fine cell `i` is `i % NC`.
+"""
+from typing import Optional, Union, Literal, Callable, List
+
+from ..backend import backend_manager as bm
+from ..sparse import COOTensor, CSRTensor
+
+from .. import logger
+from .preconditioner import _sorted_entries
+from .multigrid import MultigridSolver, _csr, _entries
+
+__all__ = ['GMGSolver']
+
+
+def _prolongation(coarse, fine, p: int) -> CSRTensor:
+    """The prolongation from the Lagrange space of degree p on the coarse
+    mesh to that on its uniform refinement."""
+    cmesh = coarse.mesh
+    NC = cmesh.number_of_cells()
+    node = cmesh.entity('node')
+    cell = cmesh.entity('cell')
+    fcell2dof = fine.cell_to_dof()
+    ccell2dof = coarse.cell_to_dof()
+    fgdof = fine.number_of_global_dofs()
+    cgdof = coarse.number_of_global_dofs()
+    kwargs = bm.context(fcell2dof)
+
+    # one fine cell containing each fine dof, and its parent
+    owner = bm.zeros((fgdof, ), **kwargs)
+    fcell = bm.broadcast_to(bm.arange(fcell2dof.shape[0], **kwargs)[:, None], fcell2dof.shape)
+    owner = bm.set_at(owner, bm.reshape(fcell2dof, (-1, )), bm.reshape(fcell, (-1, )))
+    parent = owner % NC
+
+    # barycentric coordinates of the fine interpolation points in the parents
+    v0 = node[cell[:, 0]]
+    J = node[cell[:, 1:]] - v0[:, None, :]
+    lam = bm.einsum('ig, igj -> ij', fine.interpolation_points() - v0[parent],
+                    bm.linalg.pinv(J)[parent])
+    bc = bm.concat([1 - bm.sum(lam, axis=-1, keepdims=True), lam], axis=-1)
+    eps = 1e3 * bm.finfo(bc.dtype).eps
+    if bool(bm.any(bc < -eps)):
+        raise ValueError("The fine mesh is not the uniform refinement of the coarse mesh.")
+
+    phi = bm.simplex_shape_function(bc, p) # (fgdof, ldof)
+    row = bm.broadcast_to(bm.arange(fgdof, **kwargs)[:, None], phi.shape)
+    col = ccell2dof[parent]
+    flag = bm.abs(phi) > eps
+    return _csr(row[flag], col[flag], phi[flag], (fgdof, cgdof))
+
+
+class GMGSolver(MultigridSolver):
+    """Geometric multigrid solver and preconditioner for the Lagrange finite
+    elements on a hierarchy of uniformly refined simplex meshes.
+
+    The mesh is refined in place `nrefine` times, so it is the finest level
+    afterwards, and `spaces[0]` is the Lagrange space on it. The operators of
+    the coarse levels are either assembled by `assembler` on every level, or
+    the Galerkin projections of the finest matrix given to `setup`.
+
+    Parameters:
+        mesh (SimplexMesh): The coarsest mesh, an interval, triangle or tetrahedron mesh.\n
+        nrefine (int): Number of uniform refinements.\n
+        A (COOTensor | CSRTensor, optional): The matrix on the finest level, whose
+            Galerkin projections are the coarse operators. If neither `A` nor
+            `assembler` is given, call `setup` before solving. Defaults to None.\n
+        p (int, optional): Degree of the Lagrange space. Defaults to 1.\n
+        assembler (Callable, optional): A function assembling the matrix on a
+            given `LagrangeFESpace`, used to rediscretize every level. Defaults to None.\n
+        smoother (str, optional): 'jacobi' or 'gs'. Defaults to 'jacobi'.\n
+        sstep (int, optional): Number of smoothing steps. Defaults to 1.\n
+        cycle (str, optional): 'V' or 'W'. Defaults to 'V'.
+    """
+    _name = 'GMG'
+
+    def __init__(self, mesh, nrefine: int,
+                 A: Optional[Union[COOTensor, CSRTensor]]=None, *,
+                 p: int=1,
+                 assembler: Optional[Callable]=None,
+                 smoother: Literal['gs', 'jacobi']='jacobi', sstep: int=1,
+                 cycle: Literal['V', 'W']='V'):
+        from ..mesh.mesh_base import SimplexMesh
+        from ..functionspace import LagrangeFESpace
+
+        if not isinstance(mesh, SimplexMesh):
+            raise TypeError("GMGSolver only supports simplex meshes, "
+                            f"but got {type(mesh).__name__}.")
+        super().__init__(smoother=smoother, sstep=sstep, cycle=cycle)
+        self.p = p
+
+        spaces = []
+        for _ in range(nrefine):
+            level = type(mesh)(mesh.entity('node'), mesh.entity('cell'))
+            spaces.append(LagrangeFESpace(level, p=p))
+            mesh.uniform_refine()
+        spaces.append(LagrangeFESpace(mesh, p=p))
+        self.spaces: List = spaces[::-1]
+
+        for fine, coarse in zip(self.spaces[:-1], self.spaces[1:]):
+            P = _prolongation(coarse, fine, p)
+            row, col, values = _entries(P)
+            self.P.append(P)
+            self.R.append(_csr(col, row, values, (P.shape[1], P.shape[0])))
+
+        if assembler is not None:
+            self.A = []
+            for space in self.spaces:
+                row, col, values, n = _sorted_entries(assembler(space))
+                self.A.append(_csr(row, col, values, (n, n)))
+            self._setup_levels()
+        elif A is not None:
+            self.setup(A)
+
+        logger.info(f"GMG: {len(self.spaces)} levels with "
+                    f"{[s.number_of_global_dofs() for s in self.spaces]} DoFs.")
+
+    def setup(self, A: Union[COOTensor, CSRTensor]) -> None:
+        """Set the matrix on the finest level, and build the coarse operators
+        by Galerkin projections."""
+        row, col, values, n = _sorted_entries(A)
+        gdof = self.spaces[0].number_of_global_dofs()
+        if n != gdof:
+            raise ValueError(f"The size of A ({n}) does not match the "
+                             f"finest space ({gdof}).")
+        self.A = [_csr(row, col, values, (n, n))]
+        for P, R in zip(self.P, self.R):
+            self.A.append(R @ (self.A[-1] @ P))
+        self._setup_levels()
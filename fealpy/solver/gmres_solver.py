@@ -1,6 +1,15 @@
+from typing import Optional
+
 from ..backend import backend_manager as bm
+from ..backend import TensorLike
 from ..sparse import COOTensor, CSRTensor
 import numpy as np
+
+from ._krylov import (
+    SupportsMatmul, Preconditioner, ConvergenceMonitor,
+    prepare_system, inner, norm, safe_divide, finalize
+)
+
 def _to_cupy_data(A, b, x0):
     """Convert the input tensors to cupy tensors.
 
@@ -68,18 +77,95 @@ def _scipy_solve(A, b, tol, x0, maxiter, atol):
     return gmres(A, b, x0=x0, maxiter=maxiter, atol=atol, rtol=tol)[0]
 
 
+def _fealpy_solve(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M,
+                  restart: int, atol, rtol, maxiter):
+    # Restarted GMRES with right preconditioning, so that the residual norms
+    # from the Givens rotations are those of the original system.
+    # Every scalar is a tensor of shape (batch,).
+    x = x0
+    r = b - A @ x
+    beta = norm(r)
+    monitor = ConvergenceMonitor("GMRES", norm(b), beta, atol, rtol, maxiter)
+    stop = monitor.success
+
+    while not stop:
+        V = [safe_divide(1, beta) * r]
+        g = [beta]
+        R = [] # columns of the triangular factor
+        cs, sn = [], []
+
+        for j in range(restart):
+            w = A @ (V[j] if M is None else M(V[j]))
+            h = []
+            for i in range(j + 1): # modified Gram-Schmidt
+                h.append(inner(w, V[i]))
+                w = w - h[i] * V[i]
+            h.append(norm(w))
+            V.append(safe_divide(1, h[j+1]) * w)
+
+            for i in range(j):
+                h[i], h[i+1] = cs[i] * h[i] + sn[i] * h[i+1], -sn[i] * h[i] + cs[i] * h[i+1]
+            d = bm.sqrt(h[j]**2 + h[j+1]**2)
+            cs.append(safe_divide(h[j], d))
+            sn.append(safe_divide(h[j+1], d))
+            h[j] = d
+            R.append(h[:j+1])
+            g.append(-sn[j] * g[j])
+            g[j] = cs[j] * g[j]
+
+            stop = monitor(bm.abs(g[j+1]))
+            if stop:
+                break
+
+        k = len(R)
+        y = [None] * k
+        for i in range(k-1, -1, -1): # back substitution
+            s = g[i]
+            for l in range(i+1, k):
+                s = s - R[l][i] * y[l]
+            y[i] = safe_divide(s, R[i][i])
+
+        dx = sum(y[i] * V[i] for i in range(k))
+        x = x + (dx if M is None else M(dx))
+
+        if not stop:
+            r = b - A @ x
+            beta = norm(r)
+
+    return x, monitor
+
+
 def gmres(A:[COOTensor, CSRTensor], b, solver:str="scipy", 
-          tol=1e-5, x0=None, maxiter=None, atol=0.0):
+          tol=1e-5, x0=None, maxiter=None, atol=0.0, *,
+          M: Optional[Preconditioner]=None, restart: int=20,
+          batch_first: bool=False, returninfo: bool=False):
     """Solve a linear system using a gmres solver.
 
     Parameters:
         A(COOTensor | CSRTensor): The matrix of the linear system.
         b(Tensor): The right-hand side.
-        solver(str): The solver to use. It can be "mumps", "scipy", or "cupy".
+        solver(str): The solver to use. It can be "scipy", "cupy", or "fealpy"\
+        for the backend-native restarted GMRES. The following arguments are\
+        only supported by "fealpy".
+        M(Preconditioner, optional): A callable applying the inverse of the right preconditioner.
+        restart(int, optional): Number of iterations between restarts. Defaults to 20.\
+        Note that `maxiter` counts all iterations for "fealpy", defaulting to 10000.
+        batch_first(bool, optional): Whether the batch dimension of a 2D `b` is the first one.
+        returninfo(bool, optional): Whether to return the convergence information,\
+        including 'success', 'niter' and the 'residual' norms of each iteration.
 
     Returns:
         Tensor: The solution of the linear system.
     """
+    if solver == "fealpy":
+        b, x0, transposed = prepare_system(b, x0, batch_first)
+        maxiter = 10000 if maxiter is None else maxiter
+        x, monitor = _fealpy_solve(A, b, x0, M, restart, atol, tol, maxiter)
+        return finalize(x, transposed, monitor, returninfo)
+
+    if (M is not None) or batch_first or returninfo:
+        raise ValueError(f"M, batch_first and returninfo are not supported by the {solver} solver.")
+
     if solver == "scipy":
         return bm.tensor(_scipy_solve(A, b, tol=tol, x0=x0, maxiter=maxiter, atol=atol))
     elif solver == "cupy":
@@ -87,6 +173,3 @@ def gmres(A:[COOTensor, CSRTensor], b, solver:str="scipy",
         return bm.tensor(_cupy_solve(A, b, tol=tol, x0=x0, maxiter=maxiter, atol=atol))
     else:
         raise ValueError(f"Unknown solver: {solver}")
-
-
-
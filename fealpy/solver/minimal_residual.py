@@ -0,0 +1,97 @@
+from typing import Optional
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from ._krylov import (
+    SupportsMatmul, Preconditioner, ConvergenceMonitor,
+    prepare_system, inner, safe_divide, finalize
+)
+
+
+def minres(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+           M: Optional[Preconditioner]=None,
+           batch_first: bool=False,
+           atol: float=1e-12, rtol: float=1e-8,
+           maxiter: Optional[int]=10000,
+           returninfo: bool=False):
+    """Solve a linear system Ax = b using the (preconditioned) Minimal Residual (MINRES) method.
+
+    Parameters:
+        A (SupportsMatmul): The symmetric coefficient matrix of the linear system, may be indefinite.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
+        Must have the same shape as b when reshaped appropriately.
+        M (Preconditioner, optional): A callable applying the inverse of a symmetric positive-definite\
+        preconditioner to a tensor shaped like b. Default is None.
+        batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
+        is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        returninfo (bool, optional): Whether to return the convergence information. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        Dict: The convergence information, only returned if `returninfo` is True,\
+        including 'success', 'niter' and the 'residual' norms of each iteration.
+
+    Note:
+        The residual norms are the estimates maintained by the Lanczos process,\
+        measured in the norm induced by M if a preconditioner is given. So is the norm of b\
+        in the relative tolerance.
+    """
+    b, x0, transposed = prepare_system(b, x0, batch_first)
+    x, monitor = _minres_impl(A, b, x0, M, atol, rtol, maxiter)
+    return finalize(x, transposed, monitor, returninfo)
+
+
+def _minres_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter):
+    # The Lanczos process with Givens rotations (Paige and Saunders, 1975),
+    # with every scalar turned into a tensor of shape (batch,).
+    x = x0
+    r1 = b - A @ x
+    y = r1 if M is None else M(r1)
+    beta1 = bm.sqrt(inner(r1, y))
+    b_norm = bm.sqrt(inner(b, b if M is None else M(b)))
+    monitor = ConvergenceMonitor("MINRES", b_norm, beta1, atol, rtol, maxiter)
+
+    eps = bm.finfo(b.dtype).eps
+    zero = bm.zeros_like(beta1)
+    oldb, beta, dbar, epsln, phibar = zero, beta1, zero, zero, beta1
+    cs, sn = zero - 1, zero
+    r2 = r1
+    w = w2 = bm.zeros_like(b)
+
+    while not monitor.success:
+        v = safe_divide(1, beta) * y
+        y = A @ v
+        if monitor.niter > 0:
+            y = y - safe_divide(beta, oldb) * r1
+        alfa = inner(v, y)
+        y = y - safe_divide(alfa, beta) * r2
+        r1, r2 = r2, y
+        y = r2 if M is None else M(r2)
+        oldb = beta
+        beta = bm.sqrt(inner(r2, y))
+
+        oldeps = epsln
+        delta = cs * dbar + sn * alfa
+        gbar = sn * dbar - cs * alfa
+        epsln = sn * beta
+        dbar = -cs * beta
+        gamma = bm.sqrt(gbar**2 + beta**2)
+        gamma = bm.where(gamma > eps, gamma, eps)
+        cs = gbar / gamma
+        sn = beta / gamma
+        phi = cs * phibar
+        phibar = sn * phibar
+
+        w1, w2 = w2, w
+        w = (v - oldeps * w1 - delta * w2) / gamma
+        x = bm.where(monitor.active, x + phi * w, x)
+
+        if monitor(bm.abs(phibar)):
+            break
+
+    return x, monitor
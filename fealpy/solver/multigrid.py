@@ -0,0 +1,174 @@
+"""Common parts of the multigrid solvers: the smoothers, cycles and the
+Galerkin coarse operators, given the prolongations of a level hierarchy."""
+from typing import Optional, Union, Literal, List
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from ..sparse.utils import csr_pattern
+
+from ._krylov import ConvergenceMonitor, prepare_system, norm, finalize
+from .preconditioner import _sorted_entries, _diagonal, _columnwise, _TriangularSolver
+
+__all__ = ['MultigridSolver']
+
+
+def _csr(row: TensorLike, col: TensorLike, values: TensorLike, shape) -> CSRTensor:
+    """Build a CSRTensor from COO entries, summing duplicates."""
+    crow, new_col, location = csr_pattern(bm.stack([row, col], axis=0), shape)
+    new_values = bm.zeros((new_col.shape[0], ), dtype=values.dtype, device=bm.get_device(values))
+    new_values = bm.index_add(new_values, location, values)
+    return CSRTensor(crow, new_col, new_values, shape)
+
+
+def _entries(A: CSRTensor):
+    return A.row(), A.col(), A.values()
+
+
+def _spectral_radius(A: CSRTensor, dinv: TensorLike, steps: int=15) -> float:
+    """Estimate the spectral radius of D^{-1}A by power iterations on the
+    similar symmetric matrix D^{-1/2} A D^{-1/2}."""
+    s = bm.sqrt(dinv)
+    n = dinv.shape[0]
+    x = bm.sin(bm.arange(n, dtype=dinv.dtype, device=bm.get_device(dinv)) * 1.2345 + 0.1)
+    rho = 0.0
+
+    for _ in range(steps):
+        x = x / norm(x)
+        y = s * (A @ (s * x))
+        rho = float(bm.sum(x * y))
+        x = y
+
+    return abs(rho)
+
+
+class MultigridSolver():
+    """Base class of the multigrid solvers.
+
+    Level 0 is the finest. Subclasses fill the prolongations `P` and
+    restrictions `R` between the levels, and the operators `A` of all levels,
+    then call `_setup_levels`.
+
+    Parameters:
+        smoother (str, optional): 'jacobi' for the damped Jacobi, or 'gs' for the
+            forward Gauss-Seidel in the pre-smoothing and backward in the post-smoothing.
+            Gauss-Seidel needs fewer cycles, but each sweep has as many sequential
+            steps as the levels of the triangular solve. Defaults to 'jacobi'.\n
+        sstep (int, optional): Number of smoothing steps. Defaults to 1.\n
+        cycle (str, optional): 'V' or 'W'. Defaults to 'V'.
+    """
+    _name = 'MG'
+
+    def __init__(self, *, smoother: Literal['gs', 'jacobi']='jacobi', sstep: int=1,
+                 cycle: Literal['V', 'W']='V'):
+        if smoother not in ('gs', 'jacobi'):
+            raise ValueError(f"Unknown smoother '{smoother}'.")
+        if cycle not in ('V', 'W'):
+            raise ValueError(f"Unknown cycle type '{cycle}'.")
+        self.smoother = smoother
+        self.sstep = sstep
+        self.gamma = 1 if cycle == 'V' else 2
+        self.A: List[CSRTensor] = []
+        self.P: List[CSRTensor] = []
+        self.R: List[CSRTensor] = []
+
+    def update(self, A: Union[COOTensor, CSRTensor]) -> None:
+        """Update the matrix values, reusing the prolongations of the hierarchy."""
+        row, col, values, n = _sorted_entries(A)
+        if n != self.A[0].shape[0]:
+            raise ValueError(f"The size of A ({n}) does not match the hierarchy "
+                             f"({self.A[0].shape[0]}).")
+        self.A = [_csr(row, col, values, (n, n))]
+        for P, R in zip(self.P, self.R):
+            self.A.append(R @ (self.A[-1] @ P))
+        self._setup_levels()
+
+    def _setup_levels(self):
+        self.diag = []
+        self.lower = []
+        self.upper = []
+        self.omega = []
+
+        for A in self.A[:-1]:
+            row, col, values = _entries(A)
+            diag = _diagonal(row, col, values, A.shape[0])
+            self.diag.append(diag)
+            if self.smoother == 'gs':
+                lower, upper = row > col, row < col
+                self.lower.append(_TriangularSolver(row[lower], col[lower], values[lower], diag))
+                self.upper.append(_TriangularSolver(row[upper], col[upper], values[upper], diag))
+            else:
+                self.omega.append(4 / (3 * _spectral_radius(A, 1 / diag)))
+
+        self.coarse = bm.linalg.pinv(self.A[-1].to_dense())
+
+    @property
+    def number_of_levels(self) -> int:
+        return len(self.A)
+
+    def operator_complexity(self) -> float:
+        """Total number of non-zeros in all levels relative to the finest one."""
+        return sum(A.nnz for A in self.A) / self.A[0].nnz
+
+    def _smoothing(self, level: int, b: TensorLike, x: TensorLike, post: bool):
+        A = self.A[level]
+        for _ in range(self.sstep):
+            r = b - A @ x
+            if self.smoother == 'gs':
+                x = x + (self.upper[level](r) if post else self.lower[level](r))
+            else:
+                x = x + self.omega[level] * _columnwise(1 / self.diag[level], r) * r
+        return x
+
+    def _cycle(self, level: int, b: TensorLike, x: Optional[TensorLike]=None):
+        if level == len(self.A) - 1:
+            return self.coarse @ b
+
+        if x is None:
+            x = bm.zeros_like(b)
+        x = self._smoothing(level, b, x, post=False)
+        rc = self.R[level] @ (b - self.A[level] @ x)
+        ec = None
+        for _ in range(self.gamma):
+            ec = self._cycle(level + 1, rc, ec)
+        x = x + self.P[level] @ ec
+        return self._smoothing(level, b, x, post=True)
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        """Apply one multigrid cycle to Ae = r from zero, as a preconditioner."""
+        return self._cycle(0, r)
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return self(r)
+
+    def solve(self, b: TensorLike, x0: Optional[TensorLike]=None, *,
+              batch_first: bool=False,
+              atol: float=1e-12, rtol: float=1e-8,
+              maxiter: Optional[int]=200,
+              returninfo: bool=False):
+        """Solve Ax = b by multigrid cycles.
+
+        Parameters:
+            b (TensorLike): The right-hand side, shaped (dof,) or (dof, batch).\n
+            x0 (TensorLike, optional): Initial guess. Defaults to zeros.\n
+            batch_first (bool, optional): Whether the batch dimension of a 2D `b`
+                is the first one. Defaults to False.\n
+            atol, rtol (float, optional): Tolerances of the residual norm.\n
+            maxiter (int, optional): Maximum number of cycles. Defaults to 200.\n
+            returninfo (bool, optional): Whether to return the convergence information.
+
+        Returns:
+            Tensor: The solution, and the convergence information if `returninfo` is True.
+        """
+        b, x, transposed = prepare_system(b, x0, batch_first)
+        A = self.A[0]
+        r = b - A @ x
+        monitor = ConvergenceMonitor(self._name, norm(b), norm(r), atol, rtol, maxiter)
+
+        while not monitor.success:
+            x = x + self._cycle(0, r)
+            r = b - A @ x
+            if monitor(norm(r)):
+                break
+
+        return finalize(x, transposed, monitor, returninfo)
@@ -0,0 +1,453 @@
+"""Preconditioners for the Krylov solvers in `fealpy.solver`.
+
+A preconditioner is any callable applying the inverse of the preconditioning
+matrix to a tensor shaped (dof,) or (dof, batch). The classes here are built
+from a square COOTensor or CSRTensor, set up once and applied many times with
+backend operations only. The block preconditioners are built from a
+BlockCSRTensor and the preconditioners of its diagonal blocks.
+"""
+from typing import Union, Optional, Sequence
+from abc import ABC, abstractmethod
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor, BlockCSRTensor
+from ..sparse._spspmm import _expand_products
+from ._krylov import Preconditioner
+
+__all__ = [
+    'JacobiPreconditioner',
+    'BlockJacobiPreconditioner',
+    'SSORPreconditioner',
+    'ILU0Preconditioner',
+    'IC0Preconditioner',
+    'BlockDiagonalPreconditioner',
+    'BlockTriangularPreconditioner'
+]
+
+_PRODUCT_CHUNK = 2**24
+_SYMMETRY_RTOL = 1e-12
+
+
+def _sorted_entries(A: Union[COOTensor, CSRTensor]):
+    """Row, column and value of the coalesced non-zeros of A in the row-major order."""
+    if not isinstance(A, (COOTensor, CSRTensor)):
+        raise TypeError(f"A should be a COOTensor or CSRTensor, but got {type(A).__name__}.")
+    if (A.sparse_ndim != 2) or (A.sparse_shape[0] != A.sparse_shape[1]):
+        raise ValueError(f"A should be a square matrix, but got shape {A.sparse_shape}.")
+    A = A.tocoo().coalesce()
+    values = A.values()
+    if (values is None) or (values.ndim != 1):
+        raise ValueError("Preconditioners require a matrix with 1-d values.")
+    row, col = A.indices()[0], A.indices()[1]
+    return row, col, values, A.sparse_shape[0]
+
+
+def _diagonal(row: TensorLike, col: TensorLike, values: TensorLike, n: int):
+    flag = (row == col)
+    diag = bm.zeros((n, ), dtype=values.dtype, device=bm.get_device(values))
+    return bm.index_add(diag, row[flag], values[flag])
+
+
+def _columnwise(vec: TensorLike, x: TensorLike):
+    """Reshape a vector shaped (dof,) to broadcast with x shaped (dof, ...)."""
+    return bm.reshape(vec, vec.shape + (1, ) * (x.ndim - 1))
+
+
+def _product_pairs(keys: TensorLike, n: int,
+                   left: TensorLike, lrow: TensorLike, lcol: TensorLike,
+                   right: TensorLike, rrow: TensorLike, rcol: TensorLike):
+    """Positions of the left entry (i, k), the right entry (k, j) and the
+    target (i, j) for all products with the target in the pattern.
+
+    Parameters:
+        keys (TensorLike): Sorted keys row * n + col of the pattern.\n
+        n (int): Number of rows.\n
+        left, lrow, lcol (TensorLike): Positions, rows and columns of the left entries.\n
+        right, rrow, rcol (TensorLike): Positions, rows and columns of the right entries.
+
+    Returns:
+        Tuple[TensorLike, TensorLike, TensorLike]: The left, right and target positions.
+    """
+    kwargs = bm.context(keys)
+    order = bm.argsort(rrow, stable=True)
+    right, rcol = right[order], rcol[order]
+    rcount = bm.bincount(rrow, minlength=n)
+    rcrow = bm.concat([bm.zeros((1, ), **kwargs), bm.cumsum(rcount, axis=0)], axis=0)
+
+    # expand in chunks of left entries to bound the memory of the products
+    work = bm.to_numpy(bm.cumsum(rcount[lcol], axis=0))
+    pairs = []
+    s = 0
+    while s < left.shape[0]:
+        base = work[s-1] if s > 0 else 0
+        e = max(int(work.searchsorted(base + _PRODUCT_CHUNK, side='right')), s + 1)
+        l, r = _expand_products(lcol[s:e], rcrow)
+        l = l + s
+        tkey = lrow[l] * n + rcol[r]
+        loc = bm.searchsorted(keys, tkey)
+        loc = bm.where(loc < keys.shape[0], loc, 0)
+        found = keys[loc] == tkey
+        pairs.append((left[l][found], right[r][found], loc[found]))
+        s = e
+
+    if len(pairs) == 0:
+        empty = bm.zeros((0, ), **kwargs)
+        return empty, empty, empty
+
+    return tuple(bm.concat(p, axis=0) for p in zip(*pairs))
+
+
+class _TriangularSolver():
+    """Level-scheduled solver for (D + T)x = b, where D is diagonal and T is
+    strictly lower or strictly upper triangular.
+
+    Rows are grouped into levels such that every row only depends on rows in
+    the previous levels. So each level is solved in one vectorized step, and
+    the number of sequential steps is the depth of the dependency graph instead
+    of the number of rows.
+    """
+    def __init__(self, row: TensorLike, col: TensorLike, values: TensorLike,
+                 diag: TensorLike):
+        n = diag.shape[0]
+        kwargs = bm.context(row)
+        done = bm.zeros((n, ), dtype=bm.bool, device=bm.get_device(row))
+        level = bm.zeros((n, ), **kwargs)
+        nlevel = 0
+
+        while not bool(bm.all(done)):
+            pending = bm.index_add(bm.zeros((n, ), **kwargs), row,
+                                   bm.astype(~done[col], row.dtype))
+            ready = (~done) & (pending == 0)
+            level = bm.where(ready, nlevel, level)
+            done = done | ready
+            nlevel += 1
+
+        order = bm.argsort(level, stable=True)
+        count = bm.bincount(level, minlength=nlevel)
+        start = bm.cumsum(count, axis=0) - count
+        local = bm.empty((n, ), **kwargs)
+        local = bm.set_at(local, order, bm.arange(n, **kwargs) - start[level[order]])
+
+        entry_level = level[row]
+        entry_order = bm.argsort(entry_level, stable=True)
+        entry_count = bm.bincount(entry_level, minlength=nlevel)
+
+        count = bm.to_numpy(count).tolist()
+        entry_count = bm.to_numpy(entry_count).tolist()
+        dinv = 1 / diag
+        self.levels = []
+        s, es = 0, 0
+
+        for c, ec in zip(count, entry_count):
+            rows = order[s:s+c]
+            ent = entry_order[es:es+ec]
+            self.levels.append((rows, dinv[rows], local[row[ent]], col[ent], values[ent]))
+            s, es = s + c, es + ec
+
+    def __call__(self, b: TensorLike) -> TensorLike:
+        x = bm.zeros_like(b)
+
+        for rows, dinv, erow, ecol, evals in self.levels:
+            s = b[rows]
+            if ecol.shape[0] > 0:
+                s = bm.index_add(s, erow, -_columnwise(evals, b) * x[ecol])
+            x = bm.set_at(x, rows, _columnwise(dinv, b) * s)
+
+        return x
+
+
+class _Preconditioner(ABC):
+    @abstractmethod
+    def __call__(self, r: TensorLike) -> TensorLike:
+        pass
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return self(r)
+
+
+class JacobiPreconditioner(_Preconditioner):
+    """Jacobi preconditioner, scaling by the inverse of the diagonal of A."""
+    def __init__(self, A: Union[COOTensor, CSRTensor]):
+        row, col, values, n = _sorted_entries(A)
+        self.dinv = 1 / _diagonal(row, col, values, n)
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        return _columnwise(self.dinv, r) * r
+
+
+class BlockJacobiPreconditioner(_Preconditioner):
+    """Block-Jacobi preconditioner, applying the inverses of the diagonal blocks of A.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The matrix.\n
+        blocks (int | Tensor): Size of the blocks formed by consecutive DoFs,
+            e.g. GD for vector fields with the components of each node stored
+            together, or the DoF indices of each block shaped (NB, k),
+            partitioning all DoFs.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], blocks: Union[int, TensorLike]):
+        row, col, values, n = _sorted_entries(A)
+        kwargs = bm.context(row)
+
+        if isinstance(blocks, int):
+            if n % blocks != 0:
+                raise ValueError(f"The number of DoFs {n} is not divisible "
+                                 f"by the block size {blocks}.")
+            blocks = bm.reshape(bm.arange(n, **kwargs), (-1, blocks))
+
+        NB, k = blocks.shape
+        flat = bm.reshape(blocks, (-1, ))
+        bid = bm.full((n, ), -1, **kwargs)
+        bid = bm.set_at(bid, flat, bm.repeat(bm.arange(NB, **kwargs), k))
+        loc = bm.zeros((n, ), **kwargs)
+        loc = bm.set_at(loc, flat, bm.reshape(bm.broadcast_to(bm.arange(k, **kwargs), (NB, k)), (-1, )))
+
+        flag = (bid[row] == bid[col])
+        index = bid[row[flag]] * k * k + loc[row[flag]] * k + loc[col[flag]]
+        D = bm.zeros((NB * k * k, ), dtype=values.dtype, device=bm.get_device(values))
+        D = bm.index_add(D, index, values[flag])
+
+        self.blocks = blocks
+        self.inv = bm.linalg.inv(bm.reshape(D, (NB, k, k)))
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        z = bm.einsum('bij, bj... -> bi...', self.inv, r[self.blocks])
+        return bm.set_at(bm.zeros_like(r), self.blocks, z)
+
+
+class SSORPreconditioner(_Preconditioner):
+    """Symmetric successive over-relaxation (SSOR) preconditioner
+
+        M = (D + wL) D^{-1} (D + wU) / (w(2 - w)),
+
+    where D, L and U are the diagonal, strictly lower and strictly upper parts of A.
+    For symmetric positive-definite A and 0 < w < 2, M is symmetric positive-definite.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The matrix.\n
+        omega (float, optional): The relaxation factor w. Defaults to 1.0.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], omega: float=1.0):
+        if not (0 < omega < 2):
+            raise ValueError(f"omega should be in (0, 2), but got {omega}.")
+        row, col, values, n = _sorted_entries(A)
+        self.diag = _diagonal(row, col, values, n)
+        lower = row > col
+        upper = row < col
+        self.lower = _TriangularSolver(row[lower], col[lower], omega * values[lower], self.diag)
+        self.upper = _TriangularSolver(row[upper], col[upper], omega * values[upper], self.diag)
+        self.scale = omega * (2 - omega)
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        y = self.lower(r)
+        return self.scale * self.upper(_columnwise(self.diag, r) * y)
+
+
+class ILU0Preconditioner(_Preconditioner):
+    """Incomplete LU factorization with zero fill-in, ILU(0).
+
+    The factors L (unit lower triangular) and U keep the sparsity pattern of A.
+    They are computed by the fixed-point sweeps of Chow and Patel (2015): every
+    sweep updates all entries at once from
+
+        u_ij = a_ij - sum_{k<i} l_ik u_kj,  (i <= j)
+        l_ij = (a_ij - sum_{k<j} l_ik u_kj) / u_jj,  (i > j)
+
+    which converge to the exact ILU(0) factors after at most as many sweeps as
+    the depth of the dependency graph, and usually give a good preconditioner
+    after a few. The triangular solves are level-scheduled.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The matrix, with all diagonal entries in its pattern.\n
+        sweeps (int, optional): Number of fixed-point sweeps. Defaults to 5.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], sweeps: int=5):
+        row, col, values, n = _sorted_entries(A)
+        kwargs = bm.context(row)
+        nnz = row.shape[0]
+
+        is_diag = (row == col)
+        dpos = bm.full((n, ), -1, **kwargs)
+        dpos = bm.set_at(dpos, row[is_diag], bm.nonzero(is_diag)[0])
+        if bool(bm.any(dpos < 0)):
+            raise ValueError("ILU(0) requires all diagonal entries in the pattern of A.")
+
+        lower = row > col
+        upper = row < col
+        lidx, uidx = bm.nonzero(lower)[0], bm.nonzero(upper)[0]
+        left, right, target = _product_pairs(row * n + col, n,
+                                             lidx, row[lidx], col[lidx],
+                                             uidx, row[uidx], col[uidx])
+
+        # initial guess: L = tril(A) D^{-1}, U = triu(A)
+        F = bm.where(lower, values / values[dpos][col], values)
+        is_upper = ~lower
+
+        for _ in range(sweeps):
+            s = bm.zeros((nnz, ), dtype=values.dtype, device=bm.get_device(values))
+            s = bm.index_add(s, target, F[left] * F[right])
+            F = bm.where(is_upper, values - s, F)
+            # l_ij uses the new u_jj, keeping U = D L^T for symmetric A.
+            F = bm.where(is_upper, F, (values - s) / F[dpos][col])
+
+        self.diag = F[dpos]
+        ones = bm.ones((n, ), dtype=values.dtype, device=bm.get_device(values))
+        self.lower = _TriangularSolver(row[lower], col[lower], F[lower], ones)
+        self.upper = _TriangularSolver(row[upper], col[upper], F[upper], self.diag)
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        return self.upper(self.lower(r))
+
+
+class IC0Preconditioner(_Preconditioner):
+    """Incomplete Cholesky factorization with zero fill-in, IC(0).
+
+    The symmetric preconditioner M = L D L^T, suitable for `cg` and `minres`,
+    where L is unit lower triangular with the pattern of tril(A). Only the
+    lower triangle of A is used, and L and D are computed by the symmetric
+    form of the ILU(0) sweeps
+
+        d_i = a_ii - sum_{k<i} l_ik d_k l_ik,
+        l_ij = (a_ij - sum_{k<j} l_ik d_k l_jk) / d_j,  (i > j)
+
+    so the result equals the ILU(0) of A with U = D L^T. Use
+    `ILU0Preconditioner` for nonsymmetric matrices.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The symmetric matrix, with all diagonal entries in its pattern.\n
+        sweeps (int, optional): Number of fixed-point sweeps. Defaults to 5.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], sweeps: int=5):
+        row, col, values, n = _sorted_entries(A)
+        kwargs = bm.context(row)
+        keys = row * n + col
+        tkeys = col * n + row
+        loc = bm.searchsorted(keys, tkeys)
+        loc = bm.where(loc < keys.shape[0], loc, 0)
+        if not bool(bm.all(keys[loc] == tkeys)):
+            raise ValueError("IC(0) requires a symmetric matrix, "
+                             "but the pattern of A is not symmetric.")
+        scale = bm.max(bm.abs(values)) if values.shape[0] > 0 else 0.
+        if bool(bm.any(bm.abs(values - values[loc]) > _SYMMETRY_RTOL * scale)):
+            raise ValueError("IC(0) requires a symmetric matrix, "
+                             "but the values of A are not symmetric.")
+
+        # the row-major order of the lower triangle keeps its keys sorted
+        tril = row >= col
+        row, col, values = row[tril], col[tril], values[tril]
+        nnz = row.shape[0]
+
+        is_diag = (row == col)
+        dpos = bm.full((n, ), -1, **kwargs)
+        dpos = bm.set_at(dpos, row[is_diag], bm.nonzero(is_diag)[0])
+        if bool(bm.any(dpos < 0)):
+            raise ValueError("IC(0) requires all diagonal entries in the pattern of A.")
+
+        # l_ik d_k l_jk is the product of l_ik and the transposed l_jk
+        lower = row > col
+        lidx = bm.nonzero(lower)[0]
+        left, right, target = _product_pairs(row * n + col, n,
+                                             lidx, row[lidx], col[lidx],
+                                             lidx, col[lidx], row[lidx])
+
+        # initial guess: L = tril(A) D^{-1}, D = diag(A)
+        F = bm.where(lower, values / values[dpos][col], values)
+
+        for _ in range(sweeps):
+            s = bm.zeros((nnz, ), dtype=values.dtype, device=bm.get_device(values))
+            s = bm.index_add(s, target, F[left] * F[dpos][col[left]] * F[right])
+            F = bm.where(lower, F, values - s)
+            F = bm.where(lower, (values - s) / F[dpos][col], F)
+
+        self.diag = F[dpos]
+        ones = bm.ones((n, ), dtype=values.dtype, device=bm.get_device(values))
+        self.lower = _TriangularSolver(row[lower], col[lower], F[lower], ones)
+        self.upper = _TriangularSolver(col[lower], row[lower], F[lower], ones)
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        return self.upper(self.lower(r) / _columnwise(self.diag, r))
+
+
+def _block_inverses(A: BlockCSRTensor, inverses: Sequence[Optional[Preconditioner]]):
+    if not isinstance(A, BlockCSRTensor):
+        raise TypeError(f"A should be a BlockCSRTensor, but got {type(A).__name__}.")
+    if A.row_sizes != A.col_sizes:
+        raise ValueError("A should have square diagonal blocks, but got block rows "
+                         f"sized {A.row_sizes} and block columns sized {A.col_sizes}.")
+    n = A.block_shape[0]
+    if len(inverses) != n:
+        raise ValueError(f"Expected {n} inverses, one for each diagonal block, "
+                         f"but got {len(inverses)}.")
+    result = []
+    for i, inv in enumerate(inverses):
+        if inv is None:
+            if A.block(i, i) is None:
+                raise ValueError(f"The diagonal block {i} is empty, its inverse should be given.")
+            inv = JacobiPreconditioner(A.block(i, i))
+        result.append(inv)
+    return result
+
+
+class BlockDiagonalPreconditioner(_Preconditioner):
+    """Block-diagonal preconditioner of a block matrix, P = diag(P_0, P_1, ...).
+
+    Parameters:
+        A (BlockCSRTensor): The matrix, with square diagonal blocks.\n
+        inverses (Sequence[Callable | None]): Callables applying the inverse of
+            each P_i to a tensor shaped (n_i,) or (n_i, batch), such as the
+            preconditioners here, a factorization from `factorize`, or the inverse
+            of an approximate Schur complement. None uses the Jacobi
+            preconditioner of the diagonal block A_ii.
+    """
+    def __init__(self, A: BlockCSRTensor, inverses: Sequence[Optional[Preconditioner]]):
+        self.A = A
+        self.inverses = _block_inverses(A, inverses)
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        rs = self.A.split(r, 'row')
+        return bm.concat([inv(ri) for inv, ri in zip(self.inverses, rs)], axis=0)
+
+
+class BlockTriangularPreconditioner(_Preconditioner):
+    """Block-triangular preconditioner of a block matrix, made of the blocks of
+    A above (upper) or below (lower) the diagonal and P_i on the diagonal, and
+    applied by block substitution
+
+        z_i = P_i^{-1} (r_i - sum_{j > i} A_ij z_j)  (upper),
+
+    from the last block to the first one.
+
+    For a saddle point matrix [[F, B^T], [B, 0]], the upper one with P_0 = F and
+    P_1 = -S, where S approximates the Schur complement B F^{-1} B^T, makes the
+    iterations of GMRES with right preconditioning independent of the mesh.
+
+    Parameters:
+        A (BlockCSRTensor): The matrix, with square diagonal blocks.\n
+        inverses (Sequence[Callable | None]): Callables applying the inverse of
+            each P_i, see `BlockDiagonalPreconditioner`.\n
+        lower (bool, optional): Whether to use the blocks below the diagonal
+            instead. Defaults to False.
+    """
+    def __init__(self, A: BlockCSRTensor, inverses: Sequence[Optional[Preconditioner]],
+                 lower: bool=False):
+        self.A = A
+        self.inverses = _block_inverses(A, inverses)
+        self.lower = lower
+
+    def __call__(self, r: TensorLike) -> TensorLike:
+        A = self.A
+        rs = A.split(r, 'row')
+        n = len(rs)
+        order = range(n) if self.lower else range(n-1, -1, -1)
+        z = [None] * n
+
+        for i in order:
+            s = rs[i]
+            for j in (range(i) if self.lower else range(i+1, n)):
+                block = A.block(i, j)
+                if block is not None:
+                    s = s - block @ z[j]
+            z[i] = self.inverses[i](s)
+
+        return bm.concat(z, axis=0)
@@ -50,22 +50,18 @@ def spmm_coo(indices: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
 def spmm_csr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
     _shape_check(spshape, x.shape)
     nrow = spshape[0]
-    unsqueezed = False
+    kwargs = bm.context(crow)
+    # NOTE: Expand the compressed rows to the row index of each non-zero,
+    # then the products are reduced into rows segment by segment.
+    row = bm.repeat(bm.arange(nrow, **kwargs), crow[1:] - crow[:-1])
 
     if x.ndim == 1:
-        x = x[:, None]
-        unsqueezed = True
+        new_vals = values * x[col] # (*batch, nnz)
+        result = bm.zeros(new_vals.shape[:-1] + (nrow, ), **bm.context(new_vals))
+        return bm.index_add(result, row, new_vals, axis=-1)
 
-    shape = x.shape[:-2] + (nrow, x.shape[-1])
-    result = bm.zeros(shape, dtype=x.dtype)
-
-    for i in range(nrow):
-        start = crow[i]
-        end = crow[i + 1]
-        r = bm.einsum('...i, ...ij -> ...j', values[..., start:end], x[..., col[start:end], :])
-        result[..., i, :] = r
-
-    if unsqueezed:
-        result = result[..., 0]
-
-    return result
+    else: # x.ndim >= 2
+        new_vals = values[..., None] * x[..., col, :] # (*batch, nnz, x_col)
+        shape = new_vals.shape[:-2] + (nrow, x.shape[-1])
+        result = bm.zeros(shape, **bm.context(new_vals))
+        return bm.index_add(result, row, new_vals, axis=-2)
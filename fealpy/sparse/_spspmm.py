@@ -3,6 +3,7 @@ from typing import Tuple
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike as _DT
+from .utils import csr_pattern
 
 _Size = Tuple[int, ...]
 
@@ -17,97 +18,134 @@ def _shape_check(spshape1: _Size, spshape2: _Size):
                         f"got shape {spshape1} and {spshape2}.")
 
 
-def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
-               indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
-    _shape_check(spshape1, spshape2)
-
+def _check_dense_shape(values1: _DT, values2: _DT):
     structure = values1.shape[:-1]
     if values2.shape[:-1] != structure:
         raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
                          f"must match that of matrix1 {structure}")
-
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
-
-    for i in range(size):
-        left_col_flag = (indices1[1, :] == i)
-
-        if not bm.any(left_col_flag, axis=0):
-            continue
-
-        right_row_flag = (indices2[0, :] == i)
-
-        if not bm.any(right_row_flag, axis=0):
-            continue
-
-        row = indices1[0, left_col_flag]
-        col = indices2[1, right_row_flag]
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.meshgrid(row, col, indexing='ij')
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., right_row_flag]
-
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
-        indices_list.append(idx)
-        values_list.append(val)
-
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
-    return indices, values, (spshape1[0], spshape2[1])
-
-
-def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
-               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
+    return structure
+
+
+def _expand(count: _DT) -> Tuple[_DT, _DT]:
+    """For groups of the given sizes, the group index and the offset in the
+    group of every member."""
+    kwargs = bm.context(count)
+    total = int(bm.sum(count))
+    group = bm.repeat(bm.arange(count.shape[0], **kwargs), count)
+    start = bm.cumsum(count, axis=0) - count
+    offset = bm.arange(total, **kwargs) - start[group]
+    return group, offset
+
+
+def _expand_products(col1: _DT, crow2: _DT) -> Tuple[_DT, _DT]:
+    """Pair every non-zero (i, k) of the left matrix with each non-zero in the
+    k-th row of the right matrix (the expansion step of the Gustavson product).
+
+    Parameters:
+        col1 (Tensor): Column indices of the left matrix, shaped (nnz1,).\n
+        crow2 (Tensor): Compressed row pointers of the right matrix.
+
+    Returns:
+        out (Tensor, Tensor): Positions of the left and right factors in their
+        value arrays for every scalar product, both shaped (nprod,).
+    """
+    left, offset = _expand(crow2[col1 + 1] - crow2[col1])
+    return left, offset + crow2[col1[left]]
+
+
+def spspmm_csr_symbolic(crow1: _DT, col1: _DT, spshape1: _Size,
+                        crow2: _DT, col2: _DT, spshape2: _Size):
+    """Symbolic pass of the CSR sparse-sparse product.
+
+    The result depends on the sparsity structures only, and can be reused by
+    `spspmm_csr_numeric` for any values sharing the same structures.
+
+    Parameters:
+        crow1, col1 (Tensor): CSR structure of the left matrix.\n
+        spshape1 (Size): Sparse shape of the left matrix.\n
+        crow2, col2 (Tensor): CSR structure of the right matrix.\n
+        spshape2 (Size): Sparse shape of the right matrix.
+
+    Returns:
+        out (Tensor, Tensor, Tensor, Tensor, Tensor):
+        - Compressed row pointers of the product, shaped (nrow + 1,).
+        - Column indices of the product, shaped (nnz,).
+        - Positions of the left factors in `values1`, shaped (nprod,).
+        - Positions of the right factors in `values2`, shaped (nprod,).
+        - Location of each scalar product in the values of the product, shaped (nprod,).
+    """
     _shape_check(spshape1, spshape2)
+    kwargs = bm.context(col1)
+    nrow = spshape1[0]
+    row1 = bm.repeat(bm.arange(nrow, **kwargs), crow1[1:] - crow1[:-1])
+    left, right = _expand_products(col1, crow2)
+    indices = bm.stack([row1[left], col2[right]], axis=0)
+    crow, col, location = csr_pattern(indices, (nrow, spshape2[1]))
 
-    structure = values1.shape[:-1]
-    if values2.shape[:-1] != structure:
-        raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
-                         f"must match that of matrix1 {structure}")
-
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
-    new_crow = bm.zeros(size+1,dtype=bm.int64)
+    return crow, col, left, right, location
 
-    for i in range(size):
-        row = bm.array([],dtype=bm.int64)
-        left_col_flag = (col1 == i)
 
-        for x in bm.where(left_col_flag == True)[0]+1:
-            flag = ~(x>crow1[:-1])^(x<=crow1[1:])
-            row = bm.concat((row,(bm.where(flag == True))[0]))
+def spspmm_csr_numeric(left: _DT, right: _DT, location: _DT, nnz: int,
+                       values1: _DT, values2: _DT) -> _DT:
+    """Numeric pass of the CSR sparse-sparse product, see `spspmm_csr_symbolic`.
 
-        col = col2[crow2[i]:crow2[i+1]]
+    Parameters:
+        left, right, location (Tensor): Outputs of the symbolic pass.\n
+        nnz (int): Number of non-zero elements of the product.\n
+        values1 (Tensor): Values of the left matrix, shaped (..., nnz1).\n
+        values2 (Tensor): Values of the right matrix, shaped (..., nnz2).
 
-        if not bm.any(row, axis=0):
-            continue
+    Returns:
+        Tensor: Values of the product, shaped (..., nnz).
+    """
+    structure = _check_dense_shape(values1, values2)
+    product = values1[..., left] * values2[..., right]
+    new_values = bm.zeros(structure + (nnz,), dtype=product.dtype,
+                          device=bm.get_device(product))
 
-        if not bm.any(col, axis=0):
-            continue
+    return bm.index_add(new_values, location, product, axis=-1)
 
-        idx = bm.meshgrid(row, col, indexing='ij')
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., crow2[i]:crow2[i+1]]
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
 
-        indices_list.append(idx)
-        values_list.append(val)
-
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
-
-    unique_indices, inverse_indices = bm.unique(indices, return_inverse=True, axis=1)
-    new_values = bm.zeros(unique_indices.shape[1])
-    new_values = bm.index_add(new_values, inverse_indices, values, axis=-1)
+def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
+               indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
+    """Sparse-sparse product of two COO matrices.
 
-    for x in unique_indices[0,:]:
-        new_crow[x+1]+=1
+    Returns:
+        out (Tensor, Tensor, Size): Indices and values of the product, and its
+        sparse shape. Duplicated indices are not summed.
+    """
+    _shape_check(spshape1, spshape2)
+    _check_dense_shape(values1, values2)
+
+    # sort the right matrix by rows to locate the rows in the expansion
+    kwargs = bm.context(indices2)
+    row2 = indices2[0]
+    order2 = bm.lexsort((row2,))
+    counts = bm.bincount(row2, minlength=spshape2[0])
+    crow2 = bm.concat([
+        bm.zeros((1,), **kwargs),
+        bm.astype(bm.cumsum(counts, axis=0), indices2.dtype)
+    ], axis=0)
+    left, right = _expand_products(indices1[1], crow2)
+    right = order2[right]
+
+    indices = bm.stack([indices1[0, left], indices2[1, right]], axis=0)
+    values = values1[..., left] * values2[..., right]
+    return indices, values, (spshape1[0], spshape2[1])
 
-    new_crow=bm.cumsum(new_crow, axis =-1)
 
-    return new_crow, unique_indices[1,:], new_values,(spshape1[0], spshape2[1])
+def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
+               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _DT, _Size]:
+    """Sparse-sparse product of two CSR matrices.
+
+    Returns:
+        out (Tensor, Tensor, Tensor, Size): Compressed row pointers, column indices
+        and values of the product, and its sparse shape.
+    """
+    _check_dense_shape(values1, values2)
+    crow, col, left, right, location = spspmm_csr_symbolic(
+        crow1, col1, spshape1, crow2, col2, spshape2
+    )
+    values = spspmm_csr_numeric(left, right, location, col.shape[0], values1, values2)
+
+    return crow, col, values, (spshape1[0], spshape2[1])
@@ -0,0 +1,202 @@
+from typing import Optional, Union, List, Tuple, Sequence
+
+from ..backend import TensorLike, Size
+from ..backend import backend_manager as bm
+from .coo_tensor import COOTensor
+from .csr_tensor import CSRTensor
+
+
+class BlockCSRTensor():
+    """A block matrix of CSR blocks.
+
+    Each block is kept as its own CSRTensor, and empty blocks are None, so the
+    memory, the assembly and the products cost only the non-empty blocks.
+    The block structure is left for the block preconditioners, and the matrix
+    is flattened to one CSRTensor on demand only, see `tocsr`.
+
+    Parameters:
+        blocks (List[List[CSRTensor | COOTensor | None]]): The blocks by block rows,
+            COOTensor blocks converted to CSR.\n
+        row_sizes (Sequence[int], optional): Number of rows of each block row,
+            required for the block rows without any block. Defaults to None.\n
+        col_sizes (Sequence[int], optional): Number of columns of each block column,
+            required for the block columns without any block. Defaults to None.
+    """
+    def __init__(self, blocks: List[List[Union[CSRTensor, COOTensor, None]]],
+                 row_sizes: Optional[Sequence[int]]=None,
+                 col_sizes: Optional[Sequence[int]]=None) -> None:
+        nrows = len(blocks)
+        ncols = len(blocks[0]) if nrows > 0 else 0
+        if any(len(row) != ncols for row in blocks):
+            raise ValueError("All block rows should have the same number of blocks.")
+
+        rsize = [None] * nrows if row_sizes is None else [int(s) for s in row_sizes]
+        csize = [None] * ncols if col_sizes is None else [int(s) for s in col_sizes]
+        if (len(rsize) != nrows) or (len(csize) != ncols):
+            raise ValueError(f"Expected {nrows} row sizes and {ncols} column sizes, "
+                             f"but got {len(rsize)} and {len(csize)}.")
+
+        self._blocks: List[List[Optional[CSRTensor]]] = []
+        for i, row in enumerate(blocks):
+            new_row = []
+            for j, block in enumerate(row):
+                if block is not None:
+                    if isinstance(block, COOTensor):
+                        block = block.tocsr()
+                    if not isinstance(block, CSRTensor):
+                        raise TypeError(f"Block ({i}, {j}) should be a CSRTensor, COOTensor "
+                                        f"or None, but got {type(block).__name__}.")
+                    if block.values() is None:
+                        raise ValueError(f"Block ({i}, {j}) has no values.")
+                    m, n = block.sparse_shape
+                    if rsize[i] is None:
+                        rsize[i] = m
+                    if csize[j] is None:
+                        csize[j] = n
+                    if (rsize[i], csize[j]) != (m, n):
+                        raise ValueError(f"Block ({i}, {j}) is shaped {(m, n)}, but the block "
+                                         f"row and column are sized {rsize[i]} and {csize[j]}.")
+                new_row.append(block)
+            self._blocks.append(new_row)
+
+        if (None in rsize) or (None in csize):
+            raise ValueError("The sizes of the empty block rows and columns should be "
+                             "given by row_sizes and col_sizes.")
+        self.row_sizes: Tuple[int, ...] = tuple(rsize)
+        self.col_sizes: Tuple[int, ...] = tuple(csize)
+
+    def __repr__(self) -> str:
+        nnz = [[0 if b is None else b.nnz for b in row] for row in self._blocks]
+        return (f"BlockCSRTensor(row_sizes={self.row_sizes}, col_sizes={self.col_sizes}, "
+                f"nnz={nnz})")
+
+    ### 1. Data Fetching ###
+    @property
+    def block_shape(self) -> Tuple[int, int]:
+        """Number of the block rows and block columns."""
+        return (len(self.row_sizes), len(self.col_sizes))
+
+    @property
+    def shape(self) -> Size:
+        return (sum(self.row_sizes), sum(self.col_sizes))
+
+    @property
+    def sparse_shape(self) -> Size:
+        return self.shape
+
+    @property
+    def nnz(self) -> int:
+        return sum(b.nnz for row in self._blocks for b in row if b is not None)
+
+    @property
+    def row_offsets(self) -> Tuple[int, ...]:
+        """The first row of each block row, followed by the number of rows."""
+        return _offsets(self.row_sizes)
+
+    @property
+    def col_offsets(self) -> Tuple[int, ...]:
+        """The first column of each block column, followed by the number of columns."""
+        return _offsets(self.col_sizes)
+
+    def block(self, i: int, j: int) -> Optional[CSRTensor]:
+        """Return the block (i, j), or None if it is empty."""
+        return self._blocks[i][j]
+
+    def __getitem__(self, index: Tuple[int, int]) -> Optional[CSRTensor]:
+        i, j = index
+        return self._blocks[i][j]
+
+    def blocks(self) -> List[List[Optional[CSRTensor]]]:
+        """Return the blocks by block rows."""
+        return [list(row) for row in self._blocks]
+
+    def split(self, x: TensorLike, axis: str='col') -> List[TensorLike]:
+        """Split a tensor shaped (N, ...) along the block columns ('col') or
+        the block rows ('row')."""
+        offsets = self.col_offsets if axis == 'col' else self.row_offsets
+        if x.shape[0] != offsets[-1]:
+            raise ValueError(f"Expected a tensor with {offsets[-1]} rows, but got {x.shape[0]}.")
+        return [x[offsets[k]:offsets[k+1]] for k in range(len(offsets) - 1)]
+
+    def _context(self):
+        for row in self._blocks:
+            for b in row:
+                if b is not None:
+                    return b.col(), b.values()
+        raise ValueError("The block matrix has no non-empty block.")
+
+    ### 3. Format Conversion ###
+    def tocsr(self) -> CSRTensor:
+        """Flatten to one CSRTensor. The entries of each row are ordered by
+        the block columns, then as in the blocks."""
+        col0, values0 = self._context()
+        ikwargs = bm.context(col0)
+        NNZ = self.nnz
+        roff, coff = self.row_offsets, self.col_offsets
+        new_col = bm.empty((NNZ, ), **ikwargs)
+        new_values = bm.empty(values0.shape[:-1] + (NNZ, ), **bm.context(values0))
+        crows = [bm.zeros((1, ), **ikwargs)]
+        base = 0
+
+        for i, m in enumerate(self.row_sizes):
+            row_blocks = [(j, b) for j, b in enumerate(self._blocks[i]) if b is not None]
+            count = bm.zeros((m, ), **ikwargs)
+            for _, b in row_blocks:
+                count = count + bm.astype(b.crow()[1:] - b.crow()[:-1], col0.dtype)
+            start = bm.cumsum(count, axis=0) - count # the first entry of each row
+            # the entries of each row are placed block by block
+            for j, b in row_blocks:
+                crow = bm.astype(b.crow(), col0.dtype)
+                row = b.row()
+                pos = base + start[row] + bm.arange(b.nnz, **ikwargs) - crow[row]
+                new_col = bm.set_at(new_col, pos, bm.astype(b.col(), col0.dtype) + coff[j])
+                new_values = bm.set_at(new_values, (..., pos), b.values())
+                start = start + (crow[1:] - crow[:-1])
+            crows.append(base + bm.cumsum(count, axis=0))
+            base += int(bm.sum(count))
+
+        return CSRTensor(bm.concat(crows, axis=0), new_col, new_values, self.shape)
+
+    def tocoo(self) -> COOTensor:
+        """Flatten to one COOTensor, see `tocsr`."""
+        return self.tocsr().tocoo()
+
+    def to_dense(self) -> TensorLike:
+        return self.tocsr().to_dense()
+
+    toarray = to_dense
+
+    def to_scipy(self):
+        return self.tocsr().to_scipy()
+
+    ### 6. Arithmetic Operations ###
+    def matmul(self, other: TensorLike) -> TensorLike:
+        """Multiply by a dense tensor shaped (N,) or (N, K), block by block.
+
+        Returns:
+            Tensor: The product shaped (M,) or (M, K).
+        """
+        if not isinstance(other, TensorLike):
+            raise TypeError(f"Only dense tensors are supported, but got {type(other).__name__}.")
+        xs = self.split(other, 'col')
+        ys = []
+        for i, m in enumerate(self.row_sizes):
+            y = None
+            for j, b in enumerate(self._blocks[i]):
+                if b is None:
+                    continue
+                y = b @ xs[j] if y is None else y + b @ xs[j]
+            if y is None:
+                y = bm.zeros((m, ) + tuple(other.shape[1:]), **bm.context(other))
+            ys.append(y)
+        return bm.concat(ys, axis=0)
+
+    def __matmul__(self, other: TensorLike) -> TensorLike:
+        return self.matmul(other)
+
+
+def _offsets(sizes: Sequence[int]) -> Tuple[int, ...]:
+    offsets = [0]
+    for s in sizes:
+        offsets.append(offsets[-1] + s)
+    return tuple(offsets)
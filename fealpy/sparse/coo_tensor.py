@@ -9,7 +9,7 @@ from .utils import (
     flatten_indices, tril_coo,
     check_shape_match, check_spshape_match
 )
-from ._spspmm import spspmm_coo
+from ._spspmm import spspmm_coo, _shape_check
 from ._spmm import spmm_coo
 
 
@@ -444,10 +444,16 @@ class COOTensor(SparseTensor):
             if (self.values() is None) or (other.values() is None):
                 raise ValueError("Matrix multiplication between COOTensor without "
                                  "value is not implemented now")
-            indices, values, spshape = spspmm_coo(
-                self.indices(), self.values(), self.sparse_shape,
-                other.indices(), other.values(), other.sparse_shape,
-            )
+            _shape_check(self.sparse_shape, other.sparse_shape)
+            args = (self.indices(), self.values(), self.sparse_shape,
+                    other.indices(), other.values(), other.sparse_shape)
+            try:
+                indices, values, spshape = bm.coo_spspmm(*args)
+                return COOTensor(indices, values, spshape, is_coalesced=True)
+            except (AttributeError, NotImplementedError):
+                pass
+
+            indices, values, spshape = spspmm_coo(*args)
             return COOTensor(indices, values, spshape).coalesce()
 
         elif isinstance(other, TensorLike):
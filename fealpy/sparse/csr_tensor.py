@@ -9,7 +9,7 @@ from .utils import (
     flatten_indices,
     check_shape_match, check_spshape_match
 )
-from ._spspmm import spspmm_csr
+from ._spspmm import spspmm_csr, _shape_check
 from ._spmm import spmm_csr
 
 
@@ -420,11 +420,14 @@ class CSRTensor(SparseTensor):
             if (self.values() is None) or (other.values() is None):
                 raise ValueError("Matrix multiplication between CSRTensor without "
                                  "value is not implemented now")
-            crow, col,values, spshape = spspmm_csr(
-                self._crow,self._col ,self._values, self.sparse_shape,
-                other._crow, other._col,other._values, other.sparse_shape,
-            )
-            return CSRTensor(crow, col,values, spshape)
+            _shape_check(self.sparse_shape, other.sparse_shape)
+            args = (self._crow, self._col, self._values, self.sparse_shape,
+                    other._crow, other._col, other._values, other.sparse_shape)
+            try:
+                crow, col, values, spshape = bm.csr_spspmm(*args)
+            except (AttributeError, NotImplementedError):
+                crow, col, values, spshape = spspmm_csr(*args)
+            return CSRTensor(crow, col, values, spshape)
 
         elif isinstance(other, TensorLike):
             if self.values() is None:
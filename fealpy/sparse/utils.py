@@ -57,3 +57,44 @@ def tril_coo(indices: TensorLike, values: TensorLike, k: int=0):
     new_values = bm.copy(values[..., tril_pos])
 
     return new_indices, new_values
+
+
+def csr_pattern(indices: TensorLike, spshape: Size):
+    """Build the CSR structure of a 2-D COO index set, summing duplicates.
+
+    Parameters:
+        indices (TensorLike): Row and column indices shaped (2, nnz), may contain duplicates.\n
+        spshape (Size): Shape of the sparse matrix (nrow, ncol).
+
+    Returns:
+        out (TensorLike, TensorLike, TensorLike):
+        - Compressed row pointers, shaped (nrow + 1,).
+        - Column indices of the unique entries, shaped (nnz_unique,).
+        - Location of each input entry in the CSR values, shaped (nnz,).
+    """
+    kwargs = bm.context(indices)
+    nnz = indices.shape[-1]
+
+    if nnz == 0:
+        crow = bm.zeros((spshape[0] + 1,), **kwargs)
+        return crow, bm.empty((0,), **kwargs), bm.empty((0,), **kwargs)
+
+    row, col = indices[0], indices[1]
+    order = bm.lexsort((col, row))
+    sorted_row = row[order]
+    sorted_col = col[order]
+    unique_mask = bm.concat([
+        bm.ones((1,), dtype=bm.bool, device=bm.get_device(indices)),
+        (sorted_row[1:] != sorted_row[:-1]) | (sorted_col[1:] != sorted_col[:-1])
+    ], axis=0)
+    location = bm.empty((nnz,), **kwargs)
+    location = bm.set_at(location, order, bm.astype(bm.cumsum(unique_mask, axis=0) - 1, indices.dtype))
+
+    new_col = bm.copy(sorted_col[unique_mask])
+    counts = bm.bincount(sorted_row[unique_mask], minlength=spshape[0])
+    crow = bm.concat([
+        bm.zeros((1,), **kwargs),
+        bm.astype(bm.cumsum(counts, axis=0), indices.dtype)
+    ], axis=0)
+
+    return crow, new_col, location
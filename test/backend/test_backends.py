@@ -2649,6 +2649,15 @@ class TestBackendInterfaces:
         np.testing.assert_almost_equal(result, bm.to_numpy(test_result),decimal=7, 
                                      err_msg=f" `bm.tetrahedron_grad_lambda_3d` function is not equal to real result in backend {backend}")
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_argsort_stable(self, backend):
+        bm.set_backend(backend)
+        key = bm.tensor([2, 0, 1, 0, 2, 1, 0] * 50)
+        order = bm.to_numpy(bm.argsort(key, stable=True))
+        np.testing.assert_array_equal(order, np.argsort(bm.to_numpy(key), kind='stable'))
+        np.testing.assert_array_equal(bm.to_numpy(bm.sort(key, stable=True)),
+                                      np.sort(bm.to_numpy(key)))
+
 
 
 
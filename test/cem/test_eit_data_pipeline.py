@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.solver import spsolve
+from fealpy.cem import EITDataGenerator, ChunkedStore
+
+
+def circle(cx, cy, r):
+    def levelset(p):
+        return (p[..., 0] - cx)**2 + (p[..., 1] - cy)**2 - r**2
+    levelset.coordtype = 'cartesian'
+    return levelset
+
+
+def current_density(p, *args):
+    angle = bm.atan2(p[..., 1], p[..., 0])
+    freq = bm.tensor([1., 2., 3.], dtype=p.dtype)
+    return bm.sin(bm.tensordot(freq, angle, axes=0))
+current_density.coordtype = 'cartesian'
+
+
+class TestEITDataPipeline:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_generate(self, backend, tmp_path):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([-1, 1, -1, 1], nx=12, ny=12)
+        gen = EITDataGenerator(mesh, p=1)
+        gen.set_boundary(current_density, batch_size=3)
+        levelsets = [circle(0.1*i, -0.1*i, 0.3 + 0.05*i) for i in range(5)]
+
+        store = ChunkedStore(str(tmp_path / 'gd'), chunk_size=2)
+        stats = gen.generate((10., 1.), levelsets, store)
+        assert stats['samples'] == 5
+        assert stats['samples_per_second'] > 0
+
+        data = ChunkedStore.load(str(tmp_path / 'gd'))
+        NBN = int(bm.sum(mesh.boundary_node_flag()))
+        assert data['gd'].shape == (5, 3, NBN)
+        assert len(store.chunks) == 3
+
+        # the pattern and the symbolic analysis are reused
+        assert gen._bform._pattern is not None
+        nanalyses = gen.factor().number_of_analyses()
+        gen.set_levelset((10., 1.), levelsets[2])
+        gd = bm.to_numpy(gen.run())
+        assert gen.factor().number_of_analyses() == nanalyses
+
+        uh = spsolve(gen.A_n, gen.b_.T, solver='scipy').T
+        expected = bm.to_numpy(uh[..., gen._bd_node_index])
+        np.testing.assert_allclose(gd, expected, atol=1e-10)
+        np.testing.assert_allclose(data['gd'][2], expected, atol=1e-10)
+
+
+class TestChunkedStore:
+
+    def test_chunks(self, tmp_path):
+        path = str(tmp_path / 'store')
+        with ChunkedStore(path, chunk_size=4, dtype=np.float32) as store:
+            for i in range(10):
+                store.append(x=np.full((2, ), i, dtype=np.float64), label=np.array(i))
+            assert store.number_of_samples == 10
+            with pytest.raises(ValueError):
+                store.append(y=np.zeros(2))
+        assert [c['samples'] for c in store.chunks] == [4, 4, 2]
+
+        data = ChunkedStore.load(path)
+        assert data['x'].dtype == np.float32
+        np.testing.assert_array_equal(data['x'][:, 0], np.arange(10))
+        np.testing.assert_array_equal(ChunkedStore.load(path, ['label'])['label'], np.arange(10))
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.cem.generator.laplace_data_generator import LaplaceFEMSolver
+
+
+def harmonic(a):
+    """The harmonic function a(x^2 - y^2 + x), in the quadratic space."""
+    def u(p):
+        return a * (p[..., 0]**2 - p[..., 1]**2 + p[..., 0])
+    u.coordtype = 'cartesian'
+    return u
+
+
+def harmonic_flux(a):
+    def gn(p, n):
+        n = n[:, None, :]
+        return a * ((2*p[..., 0] + 1) * n[..., 0] - 2*p[..., 1] * n[..., 1])
+    gn.coordtype = 'cartesian'
+    return gn
+
+
+class TestLaplaceFEMSolver:
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 64])
+    def test_batched_solves(self, batch_size):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box([-1, 1, -1, 1], nx=6, ny=6)
+        space = LagrangeFESpace(mesh, p=2)
+        solver = LaplaceFEMSolver(space)
+        ip = bm.to_numpy(space.interpolation_points())
+        exact = [harmonic(a)(ip) for a in range(1, 6)]
+
+        # the quadratic solution is reproduced by the Dirichlet problems
+        uh = solver.solve_from_gd(harmonic(1.))
+        np.testing.assert_allclose(uh, exact[0], atol=1e-12)
+        uhs = list(solver.solve_from_gds([harmonic(a) for a in range(1, 6)], batch_size))
+        assert len(uhs) == 5
+        for u, e in zip(uhs, exact):
+            np.testing.assert_allclose(u, e, atol=1e-12)
+
+        # and up to the constant by the Neumann problems, which have zero mean
+        # on the boundary like the solution
+        vh = solver.solve_from_gn(harmonic_flux(1.))
+        np.testing.assert_allclose(vh, exact[0], atol=1e-12)
+        vhs = list(solver.solve_from_gns([harmonic_flux(a) for a in range(1, 6)], batch_size))
+        assert len(vhs) == 5
+        for v, e in zip(vhs, exact):
+            np.testing.assert_allclose(v, e, atol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(["-q", __file__])
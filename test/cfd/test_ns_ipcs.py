@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.pde.navier_stokes_equation_2d import ChannelFlow
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.cfd import NSFEMSolver, IPCSStepper
+from fealpy.fem import DirichletBC, ScalarConvectionIntegrator
+from fealpy.solver import spsolve
+
+
+def setup(n=8, dt=0.01):
+    pde = ChannelFlow()
+    mesh = pde.mesh(n)
+    pspace = LagrangeFESpace(mesh, p=1)
+    uspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (2, -1))
+    solver = NSFEMSolver(pde, mesh, pspace, uspace, dt, q=4)
+    BCu = DirichletBC(space=uspace, gd=pde.velocity, threshold=pde.is_u_boundary, method='interp')
+    BCp = DirichletBC(space=pspace, gd=pde.pressure, threshold=pde.is_p_boundary, method='interp')
+    return solver, BCu, BCp
+
+
+def reference(solver, BCu, BCp, nt, semi=False):
+    """The time loop applying the boundary conditions and solving from scratch."""
+    R = solver.pde.R
+    BForm0 = solver.IPCS_BForm_0()
+    if semi:
+        u_C = ScalarConvectionIntegrator(q=solver.q)
+        BForm0.add_integrator(u_C)
+    LForm0 = solver.IPCS_LForm_0()
+    A1 = solver.IPCS_BForm_1().assembly()
+    LForm1 = solver.IPCS_LForm_1()
+    A2 = solver.IPCS_BForm_2().assembly()
+    LForm2 = solver.IPCS_LForm_2()
+    u0, p0 = solver.uspace.function(), solver.pspace.function()
+
+    for _ in range(nt):
+        us, u1, p1 = solver.uspace.function(), solver.uspace.function(), solver.pspace.function()
+        solver.update_ipcs_0(u0, p0, convection=not semi)
+        if semi:
+            u_C.coef = lambda bcs, index, u0=u0: R*u0(bcs, index)
+        A, b = BCu.apply(BForm0.assembly(), LForm0.assembly())
+        us[:] = spsolve(A, b, 'scipy')
+        solver.update_ipcs_1(us, p0)
+        A, b = BCp.apply(A1, LForm1.assembly())
+        p1[:] = spsolve(A, b, 'scipy')
+        solver.update_ipcs_2(us, p0, p1)
+        u1[:] = spsolve(A2, LForm2.assembly(), 'scipy')
+        u0, p0 = u1, p1
+
+    return u0, p0
+
+
+class TestIPCSStepper:
+
+    @pytest.mark.parametrize("convection", ['explicit', 'semi-implicit'])
+    def test_step(self, convection):
+        bm.set_backend('numpy')
+        solver, BCu, BCp = setup()
+        u, p = reference(solver, BCu, BCp, 3, semi=(convection == 'semi-implicit'))
+
+        stepper = IPCSStepper(solver, BCu, BCp, convection=convection)
+        u0, p0 = solver.uspace.function(), solver.pspace.function()
+        u1, p1 = stepper.run(u0, p0, 3)
+        np.testing.assert_allclose(u1[:], u[:], atol=1e-10)
+        np.testing.assert_allclose(p1[:], p[:], atol=1e-8)
+        assert len(stepper.timings) == 3
+        assert set(stepper.timings[0]) == {'assembly', 'solve'}
+
+    def test_amg(self):
+        bm.set_backend('numpy')
+        solver, BCu, BCp = setup()
+        u, p = reference(solver, BCu, BCp, 3)
+
+        stepper = IPCSStepper(solver, BCu, BCp, pressure_solver='amg')
+        u1, p1 = stepper.run(solver.uspace.function(), solver.pspace.function(), 3)
+        np.testing.assert_allclose(u1[:], u[:], atol=1e-6)
+        np.testing.assert_allclose(p1[:], p[:], atol=1e-5)
+
+        with pytest.raises(ValueError):
+            IPCSStepper(solver, BCu, BCp, convection='implicit')
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_ns_ipcs.py', '-q'])
@@ -0,0 +1,62 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.pde.navier_stokes_equation_2d import ChannelFlow
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.cfd import NSFEMSolver, IPCSStepper
+from fealpy.fem import DirichletBC
+from fealpy.solver import spsolve
+
+SIZES = [32, 64]
+
+
+def setup(n):
+    pde = ChannelFlow()
+    mesh = pde.mesh(n)
+    pspace = LagrangeFESpace(mesh, p=1)
+    uspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (2, -1))
+    solver = NSFEMSolver(pde, mesh, pspace, uspace, 0.002, q=4)
+    BCu = DirichletBC(space=uspace, gd=pde.velocity, threshold=pde.is_u_boundary, method='interp')
+    BCp = DirichletBC(space=pspace, gd=pde.pressure, threshold=pde.is_p_boundary, method='interp')
+    return solver, BCu, BCp
+
+
+@pytest.mark.benchmark(group="ns_ipcs_step")
+@pytest.mark.parametrize("n", SIZES)
+def test_reference_step_benchmark(benchmark, n):
+    """One step of the loop of the examples: the matrices are assembled once,
+    the boundary conditions applied and the systems factorized every step."""
+    bm.set_backend('numpy')
+    solver, BCu, BCp = setup(n)
+    A0 = solver.IPCS_BForm_0().assembly()
+    A1 = solver.IPCS_BForm_1().assembly()
+    A2 = solver.IPCS_BForm_2().assembly()
+    L0, L1, L2 = solver.IPCS_LForm_0(), solver.IPCS_LForm_1(), solver.IPCS_LForm_2()
+    u0, p0 = solver.uspace.function(), solver.pspace.function()
+    us, u1, p1 = solver.uspace.function(), solver.uspace.function(), solver.pspace.function()
+
+    def step():
+        solver.update_ipcs_0(u0, p0)
+        A, b = BCu.apply(A0, L0.assembly())
+        us[:] = spsolve(A, b, 'scipy')
+        solver.update_ipcs_1(us, p0)
+        A, b = BCp.apply(A1, L1.assembly())
+        p1[:] = spsolve(A, b, 'scipy')
+        solver.update_ipcs_2(us, p0, p1)
+        u1[:] = spsolve(A2, L2.assembly(), 'scipy')
+
+    benchmark(step)
+
+
+@pytest.mark.benchmark(group="ns_ipcs_step")
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("convection, pressure_solver", [
+    ('explicit', 'direct'), ('explicit', 'amg'), ('semi-implicit', 'direct')])
+def test_stepper_benchmark(benchmark, n, convection, pressure_solver):
+    bm.set_backend('numpy')
+    solver, BCu, BCp = setup(n)
+    stepper = IPCSStepper(solver, BCu, BCp, convection=convection,
+                          pressure_solver=pressure_solver)
+    u0, p0 = solver.uspace.function(), solver.pspace.function()
+    stepper.step(u0, p0)
+    benchmark(stepper.step, u0, p0)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+
+# the fealpy.cfd.sph package imports jax_md for the particle solver
+pytest.importorskip("jax")
+from fealpy.cfd.sph.neighbor import CellListNeighbor
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def brute_force(x, box, periodic, radius, mask_self=True):
+    d = x[:, None, :] - x[None, :, :]
+    d = np.where(periodic, d - box * np.round(d / box), d)
+    flag = np.sum(d**2, axis=-1) <= radius**2
+    if mask_self:
+        flag &= ~np.eye(x.shape[0], dtype=bool)
+    return set(zip(*np.nonzero(flag)))
+
+
+def pairs_of(nbrs, N):
+    idx = bm.to_numpy(nbrs.idx)
+    pairs = [(i, j) for i, j in idx.T if i != N]
+    assert np.all(idx[:, len(pairs):] == N)
+    return pairs
+
+
+class TestCellListNeighbor:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("D, periodic", [(2, True), (3, True), (2, False), (3, [False, True, False])])
+    @pytest.mark.parametrize("skin", [0.0, 0.03])
+    def test_allocate(self, backend, D, periodic, skin):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(D)
+        box = np.array([1.0, 0.7, 0.4])[:D]
+        x = rng.random((400, D)) * box
+        neighbor_fn = CellListNeighbor(bm.tensor(box), 0.12, skin=skin, periodic=periodic)
+        nbrs = neighbor_fn.allocate(bm.tensor(x), num_particles=350)
+
+        mask = np.broadcast_to(periodic, (D, ))
+        expected = brute_force(x[:350], box, mask, 0.12 + skin)
+        pairs = pairs_of(nbrs, 400)
+        assert len(pairs) == len(set(pairs))
+        assert set(pairs) == expected
+        assert nbrs.max_occupancy == int(len(expected) * 1.25)
+        assert not nbrs.did_buffer_overflow
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_small_periodic_box(self, backend):
+        bm.set_backend(backend)
+        x = np.random.default_rng(0).random((50, 2)) * [0.25, 1.0]
+        nbrs = CellListNeighbor([0.25, 1.0], 0.1, mask_self=False).allocate(bm.tensor(x))
+        pairs = pairs_of(nbrs, 50)
+        assert len(pairs) == len(set(pairs))
+        assert set(pairs) == brute_force(x, np.array([0.25, 1.0]), True, 0.1, mask_self=False)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_update(self, backend):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(1)
+        x = rng.random((300, 2))
+        neighbor_fn = CellListNeighbor(1.0, 0.1, skin=0.04)
+        nbrs = neighbor_fn.allocate(bm.tensor(x))
+
+        # moves within half of the skin reuse the list
+        x = (x + [0.0, 0.015]) % 1.0
+        assert nbrs.update(bm.tensor(x)) is nbrs
+
+        x = (x + [0.02, 0.0]) % 1.0
+        new = nbrs.update(bm.tensor(x))
+        assert new is not nbrs
+        assert new.max_occupancy == nbrs.max_occupancy
+        assert set(pairs_of(new, 300)) == brute_force(x, 1.0, True, 0.14)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_overflow(self, backend):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(2)
+        neighbor_fn = CellListNeighbor(1.0, 0.1, capacity_multiplier=1.0)
+        nbrs = neighbor_fn.allocate(bm.tensor(rng.random((200, 2))))
+        nbrs = nbrs.update(bm.tensor(0.3 * rng.random((200, 2))))
+        assert nbrs.did_buffer_overflow
+        assert len(pairs_of(nbrs, 200)) == nbrs.max_occupancy
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_sph_neighbor.py", "-k", "TestCellListNeighbor"])
@@ -2,11 +2,12 @@ import numpy as np
 import pytest
 from fealpy.backend import backend_manager as bm
 
-from fealpy.mesh import TriangleMesh
+from fealpy.mesh import TriangleMesh, QuadrangleMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
     )
+from fealpy.solver import cg
 
 from bilinear_form_data import *
 
@@ -43,6 +44,133 @@ class TestBilinearFormInterface:
         z = bm.to_numpy(bform @ x)
         assert np.linalg.norm(y-z) < 1e-12 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_keep_pattern(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=1)
+        A = bm.to_numpy(bform.assembly().to_dense())
+
+        bform.keep_pattern(True)
+        B0 = bm.to_numpy(bform.assembly().to_dense()) # symbolic assembly
+        pattern = bform._pattern
+        B1 = bm.to_numpy(bform.assembly().to_dense()) # numeric assembly
+        assert bform._pattern is pattern
+        np.testing.assert_allclose(B0, A, atol=1e-12)
+        np.testing.assert_allclose(B1, A, atol=1e-12)
+
+        # a new integrator rebuilds the pattern, which is then reused
+        bform.add_integrator(ScalarMassIntegrator())
+        B2 = bm.to_numpy(bform.assembly().to_dense())
+        assert bform._pattern is not pattern
+        pattern = bform._pattern
+        B3 = bm.to_numpy(bform.assembly().to_dense())
+        assert bform._pattern is pattern
+
+        expected = BilinearForm(space)
+        expected.add_integrator(ScalarDiffusionIntegrator())
+        expected.add_integrator(ScalarMassIntegrator())
+        C = bm.to_numpy(expected.assembly().to_dense())
+        np.testing.assert_allclose(B2, C, atol=1e-12)
+        np.testing.assert_allclose(B3, C, atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_splitter_assembly(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        mesh.uniform_refine()
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        A = bm.to_numpy(bform.assembly().to_dense())
+        assert bform.local_capacity() == bform._scalar_assembly().nnz
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=3)
+        B = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(B, A, atol=1e-12)
+        # the coalesced chunks are not counted in advance
+        assert bform.local_capacity(coalesce_chunks=True) == 0
+        C = bm.to_numpy(bform._scalar_assembly(coalesce_chunks=False).to_dense())
+        np.testing.assert_allclose(C, A, atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_mult(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        mesh.uniform_refine()
+        space = LagrangeFESpace(mesh, p)
+        gdof = space.number_of_global_dofs()
+        kwargs = bm.context(mesh.node)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=3)
+        bform.add_integrator(ScalarMassIntegrator())
+        x = bm.tensor(np.random.rand(gdof), **kwargs)
+        X = bm.tensor(np.random.rand(2, gdof, 3), **kwargs)
+        y = bm.to_numpy(bform.mult(x))
+        Y = bm.to_numpy(bform.mult(X))
+        assert bform._M is None
+
+        A = bform.assembly().to_scipy()
+        np.testing.assert_allclose(y, A @ bm.to_numpy(x), atol=1e-12)
+        np.testing.assert_allclose(Y[1], A @ bm.to_numpy(X[1]), atol=1e-12)
+
+        bform.keep_local(True)
+        bform.mult(x)
+        local = bform._local
+        out = bm.zeros((gdof, ), **kwargs)
+        bform.mult(x, out=out)
+        assert bform._local is local
+        np.testing.assert_allclose(bm.to_numpy(out), y, atol=1e-12)
+
+        b = bm.tensor(A @ bm.to_numpy(x), **kwargs)
+        bform._M = None
+        sol = bm.to_numpy(cg(bform, b, atol=1e-14, rtol=1e-14))
+        np.testing.assert_allclose(sol, bm.to_numpy(x), atol=1e-8)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_mult_matrix_free(self, backend, p):
+        bm.set_backend(backend)
+
+        mesh = QuadrangleMesh.from_box(nx=3, ny=3)
+        space = LagrangeFESpace(mesh, p)
+        gdof = space.number_of_global_dofs()
+        x = bm.tensor(np.random.rand(gdof), dtype=bm.float64)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(), ScalarMassIntegrator())
+        A = bform.assembly().to_scipy()
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(method='tensor'), splitter=4)
+        bform.add_integrator(ScalarMassIntegrator(method='tensor'))
+        y = bm.to_numpy(bform.mult(x))
+        np.testing.assert_allclose(y, A @ bm.to_numpy(x), atol=1e-12)
+
 
 if __name__ == "__main__":
     pytest.main(['./test_bilinear_form.py', '-k', 'test_matmul'])
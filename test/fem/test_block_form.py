@@ -6,10 +6,11 @@ from fealpy.fem import BlockForm
 from fealpy.fem import BilinearForm
 from fealpy.mesh import TriangleMesh
 from fealpy.functionspace import LagrangeFESpace
-from fealpy.fem import ScalarDiffusionIntegrator
+from fealpy.fem import ScalarDiffusionIntegrator, PressWorkIntegrator
+from fealpy.functionspace import TensorFunctionSpace
 from fealpy.backend import backend_manager as bm
 
-from fealpy.sparse import COOTensor, CSRTensor
+from fealpy.sparse import COOTensor, CSRTensor, BlockCSRTensor
 from block_form_data import *
 
 class TestBlockForm:
@@ -41,6 +42,37 @@ class TestBlockForm:
                                      err_msg=f" `blockform` function is not equal to real result in backend {backend}")
         np.testing.assert_array_almost_equal(vector, true_vector, 
                                      err_msg=f" `blockform __mult__` function is not equal to real result in backend {backend}")
+    @pytest.mark.parametrize("backend", ['numpy','pytorch'])
+    def test_block_format(self, backend):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], 4, 4)
+        pspace = LagrangeFESpace(mesh, p=1)
+        uspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (2, -1))
+
+        A = BilinearForm(uspace)
+        A.add_integrator(ScalarDiffusionIntegrator(q=4))
+        B = BilinearForm((pspace, uspace))
+        B.add_integrator(PressWorkIntegrator(q=4))
+
+        blockform = BlockForm([[A, B], [B.T, None]])
+        a = bm.arange(blockform.shape[1], dtype=mesh.ftype)
+        vector = blockform @ a
+        matrix = blockform.assembly(format='block')
+        assert isinstance(matrix, BlockCSRTensor)
+        assert matrix.block(1, 1) is None
+        np.testing.assert_array_almost_equal(bm.to_numpy(matrix.block(0, 1).to_dense()),
+                                             bm.to_numpy(B.assembly().to_dense()))
+        np.testing.assert_array_almost_equal(matrix @ a, vector)
+        np.testing.assert_array_almost_equal(blockform.assembly().to_dense(), matrix.to_dense())
+
+        # rectangular block form, matrix-free
+        blockform = BlockForm([[A, B]])
+        a = bm.arange(blockform.shape[1], dtype=mesh.ftype)
+        vector = blockform @ a
+        np.testing.assert_array_almost_equal(blockform.assembly(format='block') @ a, vector)
+        np.testing.assert_array_almost_equal(blockform.assembly().to_dense() @ a, vector)
+
 
 if __name__ == "__main__":
     pytest.main(['./test_block_form.py', '-sk', 'test_diag_diffusion'])
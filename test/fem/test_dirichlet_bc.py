@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, LinearForm, ScalarDiffusionIntegrator, ScalarSourceIntegrator,
+    DirichletBC
+)
+from fealpy.sparse import CSRTensor
+
+
+@cartesian
+def gd(p):
+    return bm.sin(p[..., 0]) + p[..., 1]**2
+
+
+@cartesian
+def source(p):
+    return bm.cos(p[..., 0]) * p[..., 1]
+
+
+def setup(p=2):
+    mesh = TriangleMesh.from_box(nx=6, ny=6)
+    space = LagrangeFESpace(mesh, p=p)
+    bform = BilinearForm(space).keep_pattern()
+    bform.add_integrator(ScalarDiffusionIntegrator(q=p+2))
+    lform = LinearForm(space)
+    lform.add_integrator(ScalarSourceIntegrator(source, q=p+2))
+    return space, bform, lform
+
+
+def dense(A):
+    return bm.to_numpy(A.to_dense())
+
+
+class TestDirichletBCPlan:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_apply(self, backend):
+        bm.set_backend(backend)
+        space, bform, lform = setup()
+        bc = DirichletBC(space, gd=gd)
+        A, F = bform.assembly(), lform.assembly()
+        A0, F0 = bc.apply(A, F)
+        plan = bc.plan(A)
+
+        A1, F1 = plan.apply(A, F)
+        assert A1.col() is A.col()
+        np.testing.assert_allclose(dense(A1), dense(A0), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(F1), bm.to_numpy(F0), atol=1e-12)
+        # the input is unchanged
+        assert not np.allclose(dense(A), dense(A1))
+
+        # the pattern kept by the form is reused by the plan
+        A2 = bform.assembly()
+        assert A2.col() is A.col()
+        A3, F3 = plan.apply(A2, F, inplace=True)
+        # the values are not copied, and the returned matrix is always valid
+        assert A3.values() is A2.values()
+        np.testing.assert_allclose(dense(A3), dense(A0), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(F3), bm.to_numpy(F0), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_batched(self, backend):
+        bm.set_backend(backend)
+        space, bform, lform = setup(p=1)
+        bc = DirichletBC(space, gd=gd)
+        A, F = bform.assembly(), lform.assembly()
+        plan = bc.plan(A)
+
+        scale = bm.tensor([1., 2., 3.], dtype=A.values().dtype)
+        values = scale[:, None] * A.values()[None, :]
+        AB = CSRTensor(A.crow(), A.col(), values, A.sparse_shape)
+        FB = scale[:, None] * F[None, :]
+        AB, FB = plan.apply(AB, FB)
+        for i in range(3):
+            Ai = CSRTensor(A.crow(), A.col(), A.values() * scale[i], A.sparse_shape)
+            A0, F0 = bc.apply(Ai, F * scale[i])
+            np.testing.assert_allclose(bm.to_numpy(AB.values()[i]), bm.to_numpy(plan.apply_matrix(Ai).values()))
+            np.testing.assert_allclose(bm.to_numpy(FB[i]), bm.to_numpy(F0), atol=1e-12)
+
+    def test_pattern(self):
+        bm.set_backend('numpy')
+        space, bform, lform = setup(p=1)
+        bc = DirichletBC(space, gd=gd)
+        plan = bc.plan(bform.assembly())
+        other = LagrangeFESpace(TriangleMesh.from_box(nx=6, ny=6), p=1)
+        bform2 = BilinearForm(other)
+        bform2.add_integrator(ScalarDiffusionIntegrator())
+        A = bform2.assembly()
+        plan.apply_matrix(A) # same pattern from another assembly
+        with pytest.raises(ValueError):
+            plan.apply_matrix(A.tocoo())
+        B = CSRTensor(A.crow(), bm.flip(A.col(), axis=0), A.values(), A.sparse_shape)
+        with pytest.raises(ValueError):
+            plan.apply_matrix(B)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_dirichlet_bc.py"])
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, LinearForm, ScalarDiffusionIntegrator, ScalarSourceIntegrator
+)
+from fealpy.fem.form import PartitionSplitter
+
+
+@cartesian
+def source(p):
+    return bm.sin(p[..., 0]) * p[..., 1]
+
+
+def matrix(space, splitter, executor=None, region=None):
+    bform = BilinearForm(space).parallel(executor, max_workers=2)
+    bform.add_integrator(ScalarDiffusionIntegrator(q=3), region=region, splitter=splitter)
+    return bform.assembly().to_scipy()
+
+
+def vector(space, splitter, executor=None):
+    lform = LinearForm(space).parallel(executor, max_workers=2)
+    lform.add_integrator(ScalarSourceIntegrator(source, q=3), splitter=splitter)
+    return bm.to_numpy(lform.assembly())
+
+
+class TestFormExecutor:
+
+    @pytest.mark.parametrize("executor", ['thread', 'process'])
+    @pytest.mark.parametrize("splitter", [17, PartitionSplitter(3)])
+    def test_parallel_assembly(self, executor, splitter):
+        bm.set_backend('numpy')
+        space = LagrangeFESpace(TriangleMesh.from_box(nx=8, ny=8), p=2)
+        A0, F0 = matrix(space, None), vector(space, None)
+        A, F = matrix(space, splitter, executor), vector(space, splitter, executor)
+        assert abs(A - A0).max() < 1e-12
+        np.testing.assert_allclose(F, F0, atol=1e-12)
+
+    def test_partition_splitter(self):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        space = LagrangeFESpace(mesh, p=1)
+        integrator = ScalarDiffusionIntegrator()
+        chunks = list(PartitionSplitter(4)(space, integrator))
+        assert len(chunks) == 4
+        np.testing.assert_array_equal(np.sort(np.concatenate(chunks)), np.arange(128))
+
+        # indices of the region
+        region = bm.arange(32, 96)
+        integrator.set_region(region)
+        chunks = list(PartitionSplitter(mesh.partition(4, method='rcb'))(space, integrator))
+        np.testing.assert_array_equal(np.sort(np.concatenate(chunks)), np.arange(64))
+
+        A0 = matrix(space, None, region=region)
+        A = matrix(space, PartitionSplitter(4), 'process', region=region)
+        assert abs(A - A0).max() < 1e-12
+
+    def test_kept_pattern(self):
+        bm.set_backend('numpy')
+        space = LagrangeFESpace(TriangleMesh.from_box(nx=8, ny=8), p=2)
+        bform = BilinearForm(space).parallel('thread', max_workers=2).keep_pattern()
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3), splitter=20)
+        A0 = bform.assembly().to_scipy()
+        A1 = bform.assembly().to_scipy()
+        assert abs(A1 - A0).max() < 1e-12
+
+    def test_backend(self):
+        bm.set_backend('pytorch')
+        space = LagrangeFESpace(TriangleMesh.from_box(nx=2, ny=2), p=1)
+        bform = BilinearForm(space).parallel('thread')
+        bform.add_integrator(ScalarDiffusionIntegrator(), splitter=2)
+        with pytest.raises(RuntimeError):
+            bform.assembly()
+        with pytest.raises(ValueError):
+            bform.parallel('mpi')
+        bm.set_backend('numpy')
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_form_executor.py"])
@@ -0,0 +1,44 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator
+from fealpy.fem.form import PartitionSplitter
+
+# Strong scaling: the same problem and chunks for all numbers of workers.
+WORKERS = [1, 2, 4, 8]
+NCHUNKS = 32
+MESHES = {
+    'triangle': lambda: TriangleMesh.from_box(nx=256, ny=256),
+    'tetrahedron': lambda: TetrahedronMesh.from_box(nx=24, ny=24, nz=24),
+}
+
+
+def create_form(name, executor, workers):
+    space = LagrangeFESpace(MESHES[name](), p=2)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(q=4), splitter=PartitionSplitter(NCHUNKS))
+    if executor is not None:
+        bform.parallel(executor, max_workers=workers)
+    return bform
+
+
+@pytest.mark.benchmark(group="form_executor_sequential")
+@pytest.mark.parametrize("name", list(MESHES))
+def test_sequential_benchmark(benchmark, name):
+    bm.set_backend('numpy')
+    bform = create_form(name, None, None)
+    A = benchmark(bform.assembly)
+    assert A.shape[0] == bform.space.number_of_global_dofs()
+
+
+@pytest.mark.benchmark(group="form_executor_strong_scaling")
+@pytest.mark.parametrize("name", list(MESHES))
+@pytest.mark.parametrize("executor", ['thread', 'process'])
+@pytest.mark.parametrize("workers", WORKERS)
+def test_strong_scaling_benchmark(benchmark, name, executor, workers):
+    bm.set_backend('numpy')
+    bform = create_form(name, executor, workers)
+    A = benchmark(bform.assembly)
+    assert A.shape[0] == bform.space.number_of_global_dofs()
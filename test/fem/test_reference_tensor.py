@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import (
+        ScalarDiffusionIntegrator, ScalarMassIntegrator,
+        ScalarConvectionIntegrator, LinearElasticIntegrator
+    )
+from fealpy.fem.reference_tensor import reference_tensor, clear_reference_tensors
+from fealpy.material.elastic_material import LinearElasticMaterial
+
+
+def create_mesh(TD):
+    if TD == 2:
+        return TriangleMesh.from_box(nx=2, ny=2)
+    return TetrahedronMesh.from_box(nx=1, ny=1, nz=1)
+
+
+class TestReferenceTensor:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_cache(self, backend):
+        bm.set_backend(backend)
+        clear_reference_tensors()
+        mesh = TriangleMesh.from_box(nx=1, ny=1)
+        S = reference_tensor('stiffness', mesh, 2, 4)
+        assert S.shape == (6, 6, 3, 3)
+        assert reference_tensor('stiffness', TriangleMesh.from_box(nx=2, ny=2), 2, 4) is S
+        assert reference_tensor('stiffness', mesh, 2, 5) is not S
+        M = reference_tensor('mass', mesh, 1, 3)
+        np.testing.assert_allclose(bm.to_numpy(bm.sum(M)), 1.0)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("TD", [2, 3])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_scalar_assembly(self, backend, TD, p):
+        bm.set_backend(backend)
+        mesh = create_mesh(TD)
+        space = LagrangeFESpace(mesh, p)
+        NC = mesh.number_of_cells()
+        NQ = mesh.quadrature_formula(p+3).number_of_quadrature_points()
+        coef = bm.arange(1, NC+1, dtype=bm.float64)
+        K = bm.tensor(np.eye(TD) + 0.1, dtype=bm.float64)
+
+        for I, c0, c1 in [(ScalarMassIntegrator, coef, coef),
+                          (ScalarDiffusionIntegrator, coef, coef),
+                          (ScalarDiffusionIntegrator, bm.broadcast_to(K, (NC, NQ, TD, TD)), K)]:
+            expected = bm.to_numpy(I(c0).assembly(space))
+            result = bm.to_numpy(I(c1, method='fast')(space))
+            np.testing.assert_allclose(result, expected, atol=1e-12)
+
+        b = bm.tensor(np.random.rand(NC, TD), dtype=bm.float64)
+        bcs, ws = mesh.quadrature_formula(p+3).get_quadrature_points_and_weights()
+        phi = bm.to_numpy(space.basis(bcs))
+        gphi = bm.to_numpy(space.grad_basis(bcs))
+        cm = bm.to_numpy(mesh.entity_measure('cell'))
+        expected = np.einsum('q, c, qi, cqjm, cm -> cij', bm.to_numpy(ws), cm, phi[0], gphi, bm.to_numpy(b))
+        result = bm.to_numpy(ScalarConvectionIntegrator(b, method='fast')(space))
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("TD", [2, 3])
+    @pytest.mark.parametrize("p", range(1, 3))
+    @pytest.mark.parametrize("priority", [True, False])
+    def test_elasticity_assembly(self, backend, TD, p, priority):
+        bm.set_backend(backend)
+        mesh = create_mesh(TD)
+        space = LagrangeFESpace(mesh, p)
+        tspace = TensorFunctionSpace(space, (TD, -1) if priority else (-1, TD))
+        material = LinearElasticMaterial('material', elastic_modulus=1.0, poisson_ratio=0.3,
+                                         hypo='plane_stress' if TD == 2 else '3D')
+        expected = bm.to_numpy(LinearElasticIntegrator(material, method='voigt')(tspace))
+        result = bm.to_numpy(LinearElasticIntegrator(material, method='reference')(tspace))
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_reference_tensor.py', '-q'])
@@ -0,0 +1,32 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import ScalarDiffusionIntegrator, ScalarMassIntegrator
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def create_space(TD, p):
+    if TD == 2:
+        mesh = TriangleMesh.from_box(nx=64, ny=64)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=8, ny=8, nz=8)
+    return LagrangeFESpace(mesh, p)
+
+
+@pytest.mark.benchmark(group="reference_tensor")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("TD", [2, 3])
+@pytest.mark.parametrize("p", [1, 3])
+@pytest.mark.parametrize("integrator", [ScalarDiffusionIntegrator, ScalarMassIntegrator])
+@pytest.mark.parametrize("method", ["assembly", "fast"])
+def test_reference_tensor_benchmark(benchmark, backend, TD, p, integrator, method):
+    bm.set_backend(backend)
+    space = create_space(TD, p)
+    coef = bm.ones((space.mesh.number_of_cells(), ), dtype=bm.float64)
+    result = benchmark(integrator(coef, method=method), space)
+
+    expected = integrator(coef).assembly(space)
+    assert bm.allclose(result, expected, atol=1e-12)
@@ -4,6 +4,7 @@ import pytest
 
 from fealpy.backend import backend_manager as bm
 from fealpy.mesh.triangle_mesh import TriangleMesh
+from fealpy.mesh import QuadrangleMesh, HexahedronMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem.scalar_diffusion_integrator import ScalarDiffusionIntegrator
 
@@ -22,6 +23,27 @@ class TestScalarDiffusionIntegrator:
         assembly_cell_matrix = integrator.assembly(space)
         np.testing.assert_array_almost_equal(assembly_cell_matrix ,data["assembly_cell_matrix"], 
                                      err_msg=f" `assembly_cell_matrix` function is not equal to real result in backend {backend}")
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("mesh_class", [QuadrangleMesh, HexahedronMesh])
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_tensor_assembly(self, backend, mesh_class, p):
+        bm.set_backend(backend)
+
+        mesh = mesh_class.from_box(nx=2, ny=2) if mesh_class is QuadrangleMesh \
+               else mesh_class.from_box(nx=2, ny=2, nz=2)
+        space = LagrangeFESpace(mesh, p)
+        coef = bm.arange(1, mesh.number_of_cells()+1, dtype=bm.float64)
+        expected = bm.to_numpy(ScalarDiffusionIntegrator(coef).assembly(space))
+
+        integrator = ScalarDiffusionIntegrator(coef, method='tensor')
+        assert integrator.matrix_free
+        np.testing.assert_allclose(bm.to_numpy(integrator(space)), expected, atol=1e-12)
+
+        x = np.random.rand(3, *expected.shape[:2])
+        y = integrator.apply(space, bm.tensor(x, dtype=bm.float64))
+        np.testing.assert_allclose(bm.to_numpy(y), np.einsum('cij, bcj -> bci', expected, x), atol=1e-12)
+
 if __name__ == "__main__":
     #pytest.main(['test_lagrange_fe_space.py', "-q", "-k","test_basis", "-s"])
     pytest.main(['test_scalar_diffusion_integrator.py', "-q"])   
\ No newline at end of file
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import (
+    TriangleMesh, TetrahedronMesh, QuadrangleMesh, HexahedronMesh, UniformMesh2d
+)
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+MESHES = [
+    (TriangleMesh, dict(nx=4, ny=4)),
+    (TetrahedronMesh, dict(nx=2, ny=2, nz=2)),
+    (QuadrangleMesh, dict(nx=4, ny=4)),
+    (HexahedronMesh, dict(nx=2, ny=2, nz=2)),
+]
+
+
+def polynomial(p):
+    def f(x):
+        return bm.sum(x, axis=-1)**p + x[..., 0]
+    return f
+
+
+class TestEvalPoints:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("meshtype, kwargs", MESHES)
+    @pytest.mark.parametrize("p", [1, 2])
+    def test_exact(self, backend, meshtype, kwargs, p):
+        bm.set_backend(backend)
+        mesh = meshtype.from_box(**kwargs)
+        space = LagrangeFESpace(mesh, p=p)
+        f = polynomial(p)
+        uh = space.interpolate(f)
+
+        GD = mesh.geo_dimension()
+        points = bm.tensor(np.random.default_rng(0).random((200, GD)), dtype=bm.float64)
+        np.testing.assert_allclose(bm.to_numpy(uh.eval_points(points)),
+                                   bm.to_numpy(f(points)), atol=1e-10)
+
+    @pytest.mark.parametrize("backend, p", [('numpy', 1), ('numpy', 2), ('pytorch', 1)])
+    def test_uniform_mesh(self, backend, p):
+        # UniformMesh2d overrides point_to_bc, so the space locates the points
+        # by the locator of the mesh
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 4, 0, 4), (0.25, 0.25), (0, 0))
+        space = LagrangeFESpace(mesh, p=p)
+        f = polynomial(p)
+        uh = space.interpolate(f)
+
+        points = bm.tensor(np.random.default_rng(0).random((200, 2)), dtype=bm.float64)
+        np.testing.assert_allclose(bm.to_numpy(uh.eval_points(points)),
+                                   bm.to_numpy(f(points)), atol=1e-10)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_consistent_with_value(self, backend):
+        bm.set_backend(backend)
+        mesh = QuadrangleMesh.from_box(nx=3, ny=3)
+        space = LagrangeFESpace(mesh, p=2)
+        uh = space.function(bm.tensor(np.random.rand(space.number_of_global_dofs())))
+        bcs = mesh.quadrature_formula(3).get_quadrature_points_and_weights()[0]
+        points = bm.reshape(mesh.bc_to_point(bcs), (-1, 2))
+        expected = bm.reshape(uh(bcs), (-1, ))
+        np.testing.assert_allclose(bm.to_numpy(uh.eval_points(points)),
+                                   bm.to_numpy(expected), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_batch_cache_and_outside(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=2)
+        uh = space.function(batch=3)
+        uh[:] = bm.tensor(np.random.rand(3, space.number_of_global_dofs()))
+
+        points = bm.tensor([[0.3, 0.2], [0.9, 0.95], [2.0, 0.5]], dtype=bm.float64)
+        val = uh.eval_points(points)
+        assert val.shape == (3, 3)
+        np.testing.assert_array_equal(bm.to_numpy(val[:, 2]), 0.0)
+        for i in range(3):
+            vi = space.function(uh[i]).eval_points(points)
+            np.testing.assert_allclose(bm.to_numpy(vi), bm.to_numpy(val[i]))
+
+        # the matrix is reused explicitly, and points moved in place are located again
+        M = space.point_interpolation_matrix(points)
+        np.testing.assert_allclose(bm.to_numpy(uh.eval_points(points, matrix=M)),
+                                   bm.to_numpy(val))
+        points += 0.05
+        moved = uh.eval_points(bm.copy(points))
+        np.testing.assert_allclose(bm.to_numpy(uh.eval_points(points)), bm.to_numpy(moved))
+        assert not np.allclose(bm.to_numpy(moved), bm.to_numpy(val))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("shape", [(-1, 2), (2, -1)])
+    def test_tensor_space(self, backend, shape):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=2)
+        tspace = TensorFunctionSpace(space, shape=shape)
+
+        def f(x):
+            return bm.stack([x[..., 0]**2, x[..., 0] * x[..., 1]], axis=-1)
+
+        val = f(space.interpolation_points()) # (gdof, 2)
+        if tspace.dof_priority:
+            val = bm.swapaxes(val, 0, 1)
+        uh = tspace.function(bm.reshape(val, (-1, )))
+        points = bm.tensor(np.random.default_rng(1).random((50, 2)), dtype=bm.float64)
+        val = uh.eval_points(points)
+        assert val.shape == (50, 2)
+        np.testing.assert_allclose(bm.to_numpy(val), bm.to_numpy(f(points)), atol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(["-q", __file__])
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import KDTree
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def brute_force(points, query, radius, include_self=True):
+    d2 = np.sum((query[:, None, :] - points[None, :, :])**2, axis=-1)
+    flag = d2 <= radius**2
+    if not include_self:
+        flag &= d2 > 0
+    return [np.nonzero(row)[0] for row in flag]
+
+
+def check(indices, indptr, expected):
+    indices, indptr = bm.to_numpy(indices), bm.to_numpy(indptr)
+    assert indptr.shape[0] == len(expected) + 1
+    for i, e in enumerate(expected):
+        np.testing.assert_array_equal(np.sort(indices[indptr[i]:indptr[i+1]]), e)
+
+
+class TestKDTree:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("N, D", [(1, 2), (7, 2), (1000, 2), (1000, 3), (555, 1)])
+    @pytest.mark.parametrize("leafsize", [1, 8])
+    @pytest.mark.filterwarnings("error::RuntimeWarning") # no overflow on the empty leaves
+    def test_query_radius(self, backend, N, D, leafsize):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(N)
+        points = rng.random((N, D))
+        query = rng.random((200, D))
+        tree = KDTree(bm.tensor(points), leafsize=leafsize)
+        assert bool(bm.all(bm.sort(tree.perm) == bm.arange(N)))
+
+        indices, indptr = tree.query_radius(bm.tensor(query), 0.1)
+        check(indices, indptr, brute_force(points, query, 0.1))
+
+        # per-query radius, and small batches
+        radius = rng.random(200) * 0.2
+        indices, indptr = tree.query_radius(bm.tensor(query), bm.tensor(radius), batch_size=17)
+        check(indices, indptr, [brute_force(points, query[i:i+1], radius[i])[0] for i in range(200)])
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_self_and_duplicates(self, backend):
+        bm.set_backend(backend)
+        # a lattice with duplicated points, many ties at the medians
+        x = np.linspace(0, 1, 11)
+        points = np.stack(np.meshgrid(x, x, indexing='ij'), axis=-1).reshape(-1, 2)
+        points = np.concatenate([points, points[:5]], axis=0)
+        tree = KDTree(bm.tensor(points))
+
+        indices, indptr = tree.query_radius(bm.tensor(points), 0.1 + 1e-12)
+        check(indices, indptr, brute_force(points, points, 0.1 + 1e-12))
+
+        indices, indptr = tree.query_radius(bm.tensor(points), 0.1 + 1e-12, include_self=False)
+        check(indices, indptr, brute_force(points, points, 0.1 + 1e-12, include_self=False))
+
+        nid, qid = tree.range_query(bm.tensor(points), 0.1 + 1e-12)
+        assert nid.shape == qid.shape == indices.shape
+        assert bool(bm.all(qid[1:] >= qid[:-1]))
+        assert bool(bm.all(nid == indices))
+
+
+if __name__ == "__main__":
+    pytest.main(["-q", __file__])
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import KDTree
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+@pytest.mark.benchmark(group="kd_tree")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("N", [10**5, 10**6])
+def test_kd_tree_benchmark(benchmark, backend, N):
+    bm.set_backend(backend)
+    points = bm.tensor(np.random.default_rng(0).random((N, 2)))
+    # about 30 neighbors per particle, as in SPH
+    radius = float(np.sqrt(30 / (np.pi * N)))
+
+    def build_and_query():
+        tree = KDTree(points)
+        return tree.query_radius(points, radius)
+
+    indices, indptr = benchmark.pedantic(build_and_query, rounds=1, iterations=1)
+    assert indptr.shape == (N + 1, )
+    assert 20 < int(indptr[-1]) / N < 40
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+
+
+class TestMeshDS:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_lazy_construct(self, backend):
+        bm.set_backend(backend)
+        ref = TetrahedronMesh.from_box(nx=3, ny=2, nz=2)
+        mesh = TetrahedronMesh(ref.entity('node'), ref.entity('cell'))
+        assert set(mesh.memory_report()) == {'node', 'cell'}
+
+        assert mesh.number_of_faces() == ref.number_of_faces()
+        for name in ['edge', 'face']:
+            np.testing.assert_array_equal(bm.to_numpy(mesh.entity(name)),
+                                          bm.to_numpy(ref.entity(name)))
+        np.testing.assert_array_equal(bm.to_numpy(mesh.face2cell), bm.to_numpy(ref.face2cell))
+        np.testing.assert_array_equal(bm.to_numpy(mesh.cell_to_edge()),
+                                      bm.to_numpy(ref.cell_to_edge()))
+        report = mesh.memory_report()
+        assert report['face2cell'] == 4 * report['face'] // 3
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_cached_relations(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        c2p = mesh.cell_to_ipoint(3)
+        assert mesh.cell_to_ipoint(3) is c2p
+        np.testing.assert_array_equal(bm.to_numpy(mesh.cell_to_ipoint(3, index=bm.arange(2))),
+                                      bm.to_numpy(c2p[:2]))
+        assert 'cell_to_ipoint(p=3)' in mesh.memory_report()
+
+        # the flags are copies
+        flag = mesh.boundary_node_flag()
+        flag[:] = False
+        assert bm.sum(mesh.boundary_node_flag()) == 8
+
+        # invalidated by assigning the cells
+        mesh.uniform_refine()
+        assert mesh.cell_to_ipoint(3).shape == (32, 10)
+        assert bm.sum(mesh.boundary_node_flag()) == 16
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_mesh_data_structure.py"])
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh
+from fealpy.functionspace import LagrangeFESpace
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def metis_available():
+    try:
+        from fealpy.graph import metis
+    except (ImportError, RuntimeError):
+        return False
+    return True
+
+
+class TestMeshPartition:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("method", ['rcb', 'morton'])
+    @pytest.mark.parametrize("mesh_factory", [lambda: TriangleMesh.from_box(nx=10, ny=8),
+                                              lambda: QuadrangleMesh.from_box(nx=10, ny=8),
+                                              lambda: TetrahedronMesh.from_box(nx=3, ny=3, nz=2)])
+    def test_partition(self, backend, method, mesh_factory):
+        bm.set_backend(backend)
+        mesh = mesh_factory()
+        NC = mesh.number_of_cells()
+        partition = mesh.partition(3, method=method)
+
+        count = bm.to_numpy(partition.number_of_cells_of_parts())
+        assert count.sum() == NC
+        assert count.max() - count.min() <= 1
+        owner = bm.to_numpy(partition.node_owner())
+        assert np.all((owner >= 0) & (owner < 3))
+
+        space = LagrangeFESpace(mesh, p=2)
+        ipoints = bm.to_numpy(space.interpolation_points())
+        covered = np.zeros(NC, dtype=bool)
+        for sd in partition.subdomains(ghost=1):
+            assert sd.mesh.__class__ is mesh.__class__
+            owned = bm.to_numpy(sd.cell[:sd.nowned])
+            assert np.all(bm.to_numpy(partition.part)[owned] == bm.to_numpy(partition.part)[owned[0]])
+            covered[owned] = True
+            np.testing.assert_allclose(bm.to_numpy(sd.mesh.entity('node')),
+                                       bm.to_numpy(mesh.entity('node')[sd.node]))
+
+            subspace = LagrangeFESpace(sd.mesh, p=2)
+            l2g = sd.dof_map(space, subspace)
+            np.testing.assert_allclose(bm.to_numpy(subspace.interpolation_points()),
+                                       ipoints[bm.to_numpy(l2g)])
+            np.testing.assert_array_equal(bm.to_numpy(sd.ipoint_map(mesh, 2)), bm.to_numpy(l2g))
+        assert np.all(covered)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_ghost_layers(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        partition = mesh.partition(2, method='rcb')
+        layers = partition.cells(0, ghost=2)
+        assert len(layers) == 3
+        cell = bm.to_numpy(mesh.entity('cell'))
+        part = bm.to_numpy(partition.part)
+        owned = bm.to_numpy(layers[0])
+        first = bm.to_numpy(layers[1])
+        assert np.all(part[owned] == 0) and np.all(part[first] == 1)
+        # every cell of the first ghost layer shares a node with the owned cells
+        nodes = np.unique(cell[owned])
+        assert np.all(np.isin(cell[first], nodes).any(axis=1))
+        sd = partition.subdomain(0, ghost=2)
+        assert sd.cell.shape[0] == sum(l.shape[0] for l in layers)
+        assert int(bm.sum(sd.owned_cell_flag())) == owned.shape[0]
+
+    @pytest.mark.skipif(not metis_available(), reason="METIS is not available")
+    def test_metis(self):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=10, ny=10)
+        partition = mesh.partition(4, method='metis')
+        assert partition.nparts == 4
+        assert bm.to_numpy(partition.number_of_cells_of_parts()).sum() == 200
+
+    def test_unknown_method(self):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        with pytest.raises(ValueError):
+            mesh.partition(2, method='spectral')
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_mesh_partition.py"])
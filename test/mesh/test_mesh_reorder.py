@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh
+from fealpy.mesh.mesh_reorder import hilbert_key, morton_key
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+METHODS = ['rcm', 'hilbert', 'morton']
+
+
+def shuffled(mesh, seed=0):
+    """The mesh with randomly numbered nodes and cells."""
+    rng = np.random.default_rng(seed)
+    node, cell = mesh.entity('node'), mesh.entity('cell')
+    NN, NC = node.shape[0], cell.shape[0]
+    nperm = bm.tensor(rng.permutation(NN), dtype=cell.dtype)
+    cperm = bm.tensor(rng.permutation(NC), dtype=cell.dtype)
+    inv = bm.zeros((NN, ), dtype=cell.dtype)
+    inv = bm.set_at(inv, nperm, bm.arange(NN, dtype=cell.dtype))
+    return type(mesh)(node[nperm], inv[cell[cperm]])
+
+
+def bandwidth(mesh):
+    cell = bm.to_numpy(mesh.entity('cell'))
+    return int(np.max(cell.max(axis=1) - cell.min(axis=1)))
+
+
+class TestMeshReorder:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("method", METHODS)
+    @pytest.mark.parametrize("Mesh, args", [(TriangleMesh, {'nx': 8, 'ny': 6}),
+                                            (QuadrangleMesh, {'nx': 8, 'ny': 6}),
+                                            (TetrahedronMesh, {'nx': 3, 'ny': 2, 'nz': 2})])
+    def test_reorder(self, backend, method, Mesh, args):
+        bm.set_backend(backend)
+        mesh = shuffled(Mesh.from_box(**args))
+        node = mesh.entity('node')
+        cell = mesh.entity('cell')
+        measure = mesh.entity_measure('cell')
+        NE = mesh.number_of_edges()
+        mesh.celldata['measure'] = measure
+
+        nperm, cperm = mesh.reorder(method)
+
+        np.testing.assert_array_equal(bm.to_numpy(mesh.entity('node')), bm.to_numpy(node[nperm]))
+        np.testing.assert_array_equal(bm.to_numpy(nperm[mesh.entity('cell')]),
+                                      bm.to_numpy(cell[cperm]))
+        np.testing.assert_allclose(bm.to_numpy(mesh.entity_measure('cell')),
+                                   bm.to_numpy(measure[cperm]))
+        np.testing.assert_allclose(bm.to_numpy(mesh.celldata['measure']),
+                                   bm.to_numpy(measure[cperm]))
+        assert mesh.number_of_edges() == NE
+        if method == 'rcm':
+            assert bandwidth(mesh) < bandwidth(shuffled(mesh)) // 2
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_curve_keys(self, backend):
+        bm.set_backend(backend)
+        for GD, bits in [(2, 4), (3, 3)]:
+            grid = np.stack(np.meshgrid(*[np.arange(2**bits)] * GD, indexing='ij'), axis=-1)
+            points = bm.tensor(grid.reshape(-1, GD), dtype=bm.float64)
+
+            # consecutive points along the Hilbert curve are neighbors on the grid
+            order = bm.argsort(hilbert_key(points, bits=bits))
+            step = np.abs(np.diff(bm.to_numpy(points[order]), axis=0)).sum(axis=-1)
+            np.testing.assert_array_equal(step, 1)
+
+            key = bm.to_numpy(morton_key(points, bits=bits))
+            assert np.array_equal(np.sort(key), np.arange(2**(GD * bits)))
+
+    def test_unknown_method(self):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        with pytest.raises(ValueError):
+            mesh.reorder('peano')
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_mesh_reorder.py"])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+ORDERINGS = ['shuffled', 'rcm', 'hilbert', 'morton']
+MESHES = {
+    'triangle': lambda: TriangleMesh.from_box(nx=256, ny=256),
+    'tetrahedron': lambda: TetrahedronMesh.from_box(nx=24, ny=24, nz=24),
+}
+
+
+def ordered_mesh(name, ordering):
+    """The mesh with randomly numbered nodes and cells, like the meshes
+    imported from a generator, then reordered."""
+    mesh = MESHES[name]()
+    rng = np.random.default_rng(0)
+    node, cell = mesh.entity('node'), mesh.entity('cell')
+    NN, NC = node.shape[0], cell.shape[0]
+    nperm = bm.tensor(rng.permutation(NN), dtype=cell.dtype)
+    inv = bm.zeros((NN, ), dtype=cell.dtype)
+    inv = bm.set_at(inv, nperm, bm.arange(NN, dtype=cell.dtype))
+    cperm = bm.tensor(rng.permutation(NC), dtype=cell.dtype)
+    mesh = type(mesh)(node[nperm], inv[cell[cperm]])
+    if ordering != 'shuffled':
+        mesh.reorder(ordering)
+    return mesh
+
+
+@pytest.mark.benchmark(group="mesh_reorder_spmv")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("name", list(MESHES))
+@pytest.mark.parametrize("ordering", ORDERINGS)
+def test_spmv_benchmark(benchmark, backend, name, ordering):
+    bm.set_backend(backend)
+    space = LagrangeFESpace(ordered_mesh(name, ordering), p=1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+    A = bform.assembly(format='csr')
+    x = bm.ones((A.shape[1], ), dtype=bm.float64)
+
+    y = benchmark(A.matmul, x)
+    assert float(bm.max(bm.abs(y))) < 1e-8
+
+
+@pytest.mark.benchmark(group="mesh_reorder_assembly")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("name", list(MESHES))
+@pytest.mark.parametrize("ordering", ORDERINGS)
+def test_assembly_benchmark(benchmark, backend, name, ordering):
+    bm.set_backend(backend)
+    space = LagrangeFESpace(ordered_mesh(name, ordering), p=2)
+    space.cell_to_dof()
+
+    def assembly():
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+        return bform.assembly(format='csr')
+
+    A = benchmark.pedantic(assembly, rounds=3, iterations=1)
+    assert A.shape[0] == space.number_of_global_dofs()
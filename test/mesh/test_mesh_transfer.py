@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, MeshTransfer
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def f2(p):
+    return p[..., 0]**3 - p[..., 0] * p[..., 1]**2 + 1
+
+
+def f3(p):
+    return p[..., 0]**2 + p[..., 1] * p[..., 2]
+
+
+def marked(mesh, r=0.1):
+    c = mesh.entity_barycenter('cell')
+    return bm.sum((c - 0.3)**2, axis=-1) < r
+
+
+class TestMeshTransfer:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_triangle_bisect(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=6, ny=4)
+        for _ in range(3):
+            NC = mesh.number_of_cells()
+            NN = mesh.number_of_nodes()
+            u1 = f2(mesh.entity('node'))
+            u3 = f2(mesh.interpolation_points(3))
+            data = {'u1': (u1, 'node'), 'u3': (u3, 'node'),
+                    'local': (u3[mesh.cell_to_ipoint(3)], 'local'),
+                    'H': (bm.arange(NC, dtype=bm.float64), 'cell')}
+            options = mesh.bisect_options(HB=True, data=data, disp=False, p=3)
+            mesh.bisect(marked(mesh), options=options)
+
+            assert mesh.number_of_cells() > NC
+            parent = options['HB']
+            data = options['data']
+            ip = mesh.interpolation_points(3)
+            np.testing.assert_allclose(bm.to_numpy(data['H']), bm.to_numpy(parent))
+            np.testing.assert_allclose(bm.to_numpy(data['u3']), bm.to_numpy(f2(ip)), atol=1e-12)
+            np.testing.assert_allclose(bm.to_numpy(data['local']),
+                                       bm.to_numpy(f2(ip)[mesh.cell_to_ipoint(3)]), atol=1e-12)
+            # the new nodes are midpoints of old edges
+            node = mesh.entity('node')
+            np.testing.assert_allclose(bm.to_numpy(data['u1'][:NN]), bm.to_numpy(u1))
+            IM = options['IM']
+            assert IM.shape == (ip.shape[0], u3.shape[0])
+            np.testing.assert_allclose(bm.to_numpy(IM @ u3), bm.to_numpy(data['u3']))
+        assert mesh.number_of_nodes() == node.shape[0]
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_triangle_coarsen(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        NC0 = mesh.number_of_cells()
+        for _ in range(2):
+            mesh.bisect(options={})
+        while mesh.number_of_cells() > NC0:
+            NC = mesh.number_of_cells()
+            u2 = f2(mesh.interpolation_points(2))
+            data = {'u2': (u2, 'node'), 'H': (bm.ones(NC, dtype=bm.float64), 'cell')}
+            options = {'data': data, 'IM': None, 'p': 2}
+            mesh.coarsen(bm.ones(NC, dtype=bm.bool), options=options)
+            assert mesh.number_of_cells() < NC
+            ip = mesh.interpolation_points(2)
+            np.testing.assert_allclose(bm.to_numpy(options['data']['u2']),
+                                       bm.to_numpy(f2(ip)), atol=1e-12)
+            np.testing.assert_allclose(bm.to_numpy(options['data']['H']), 1.0)
+            np.testing.assert_allclose(bm.to_numpy(options['IM'] @ u2),
+                                       bm.to_numpy(options['data']['u2']))
+        assert mesh.number_of_cells() == NC0
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_tetrahedron_bisect(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+        for _ in range(3):
+            NC = mesh.number_of_cells()
+            u = f3(mesh.interpolation_points(2))
+            data = {'nodedata': [u], 'celldata': [bm.arange(NC, dtype=bm.float64)]}
+            options = mesh.bisect_options(HB=True, data=data, disp=False, p=2)
+            IM = mesh.bisect(marked(mesh), returnim=True, options=options)
+
+            assert mesh.number_of_cells() > NC
+            ip = mesh.interpolation_points(2)
+            unew = options['data']['nodedata'][0]
+            np.testing.assert_allclose(bm.to_numpy(unew), bm.to_numpy(f3(ip)), atol=1e-12)
+            np.testing.assert_allclose(bm.to_numpy(IM @ u), bm.to_numpy(unew))
+            np.testing.assert_allclose(bm.to_numpy(options['data']['celldata'][0]),
+                                       bm.to_numpy(options['HB'][:, 1]))
+        assert np.all(bm.to_numpy(mesh.entity_measure('cell')) > 0)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_declared_kinds(self, backend):
+        bm.set_backend(backend)
+        # 3 cells of degree 1 and 3 local points: the cell data shaped (NC, 3)
+        # look like local values, and are kept as cell data when declared
+        node = bm.tensor([[0, 0], [1, 0], [1, 1], [0, 1], [2, 0]], dtype=bm.float64)
+        cell = bm.tensor([[1, 2, 0], [3, 0, 2], [4, 2, 1]], dtype=bm.int64)
+        mesh = TriangleMesh(node, cell)
+        H = bm.tensor([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=bm.float64)
+        node = mesh.entity('node')
+        u = node[:, 0] + 2 * node[:, 1]
+
+        with pytest.warns(DeprecationWarning):
+            MeshTransfer(mesh, {'H': H})
+        with pytest.raises(ValueError):
+            mesh.bisect(options={'data': {'u': (u, 'cell')}})
+        with pytest.raises(ValueError):
+            mesh.bisect(options={'data': {'H': (H, 'edge')}})
+
+        options = mesh.bisect_options(HB=True, data={'H': (H, 'cell'), 'u': (u, 'node')})
+        mesh.bisect(options=options)
+        parent = options['HB']
+        np.testing.assert_allclose(bm.to_numpy(options['data']['H']), bm.to_numpy(H[parent]))
+        node = mesh.entity('node')
+        np.testing.assert_allclose(bm.to_numpy(options['data']['u']),
+                                   bm.to_numpy(node[:, 0] + 2 * node[:, 1]), atol=1e-12)
+
+        # the shapes are read as local values only on request
+        options = mesh.bisect_options(data={'L': mesh.entity('node')[mesh.entity('cell')][..., 0]},
+                                      infer=True)
+        mesh.bisect(options=options)
+        node = mesh.entity('node')
+        np.testing.assert_allclose(bm.to_numpy(options['data']['L']),
+                                   bm.to_numpy(node[mesh.entity('cell')][..., 0]), atol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_mesh_transfer.py"])
@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import (
+    TriangleMesh, TetrahedronMesh, QuadrangleMesh, HexahedronMesh,
+    UniformMesh2d, UniformMesh3d, PointLocator
+)
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def tensor_vertex(mesh):
+    """The cell vertices in the order of the multilinear map of the mesh."""
+    corner = bm.eye(2, dtype=bm.float64)
+    return mesh.bc_to_point((corner, ) * mesh.top_dimension())
+
+
+def random_points(mesh, n, rng):
+    """Random points in random cells, and the cells."""
+    NC = mesh.number_of_cells()
+    TD = mesh.top_dimension()
+    cell = bm.tensor(rng.integers(0, NC, n))
+    vertex = mesh.entity('node')[mesh.entity('cell')[cell]]
+    if isinstance(mesh, (TriangleMesh, TetrahedronMesh)):
+        bc = rng.random((n, TD + 1)) + 0.05
+        bc = bm.tensor(bc / bc.sum(axis=1, keepdims=True))
+    else:
+        xi = rng.random((n, TD)) * 0.9 + 0.05
+        bc = np.ones((n, 1))
+        for a in range(TD):
+            bc = np.einsum('mi, mj -> mij', bc, np.stack([1 - xi[:, a], xi[:, a]], axis=-1)).reshape(n, -1)
+        bc = bm.tensor(bc)
+        vertex = tensor_vertex(mesh)[cell]
+    return bm.einsum('mk, mkg -> mg', bc, vertex), cell
+
+
+def perturb(mesh, rng, scale=0.2):
+    """Move the interior nodes randomly to get distorted cells."""
+    node = bm.to_numpy(mesh.entity('node')).copy()
+    h = float(np.min(np.max(node, axis=0) - np.min(node, axis=0))) / 4
+    isBd = bm.to_numpy(mesh.boundary_node_flag())
+    node[~isBd] += (rng.random((int((~isBd).sum()), node.shape[1])) - 0.5) * scale * h / 2
+    mesh.node = bm.tensor(node)
+    return mesh
+
+
+MESHES = [
+    (TriangleMesh, dict(nx=8, ny=8)),
+    (TetrahedronMesh, dict(nx=3, ny=3, nz=3)),
+    (QuadrangleMesh, dict(nx=8, ny=8)),
+    (HexahedronMesh, dict(nx=3, ny=3, nz=3)),
+]
+
+
+class TestPointLocator:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("meshtype, kwargs", MESHES)
+    def test_locate(self, backend, meshtype, kwargs):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(0)
+        mesh = perturb(meshtype.from_box(**kwargs), rng)
+        points, cell = random_points(mesh, 500, rng)
+
+        c, bc = mesh.point_to_bc(points)
+        np.testing.assert_array_equal(bm.to_numpy(c), bm.to_numpy(cell))
+
+        # the barycentric coordinates map back to the points
+        if isinstance(bc, tuple):
+            TD = mesh.top_dimension()
+            w = np.ones((500, 1))
+            for a in range(TD):
+                w = np.einsum('mi, mj -> mij', w, bm.to_numpy(bc[a])).reshape(500, -1)
+            vertex = tensor_vertex(mesh)[c]
+            x = np.einsum('mk, mkg -> mg', w, bm.to_numpy(vertex))
+        else:
+            np.testing.assert_allclose(bm.to_numpy(bm.sum(bc, axis=-1)), 1.0)
+            vertex = mesh.entity('node')[mesh.entity('cell')[c]]
+            x = np.einsum('mk, mkg -> mg', bm.to_numpy(bc), bm.to_numpy(vertex))
+        np.testing.assert_allclose(x, bm.to_numpy(points), atol=1e-12)
+
+        # outside points
+        outside = points + 2.0
+        assert bool(bm.all(mesh.location(outside) == -1))
+
+        # the nodes lie on the boundaries of cells, and are still found
+        assert bool(bm.all(mesh.location(mesh.entity('node')) >= 0))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_uniform_mesh(self, backend):
+        bm.set_backend(backend)
+        # the cell nodes of the uniform meshes are in the lexicographic order
+        mesh = UniformMesh2d((0, 4, 0, 4), (0.25, 0.25), (0, 0))
+        points = bm.tensor([[0.3, 0.4], [0.61, 0.77]], dtype=bm.float64)
+        c, bc = mesh.point_locator().locate(points)
+        np.testing.assert_array_equal(bm.to_numpy(c), [5, 11])
+        for k in range(2):
+            x = mesh.bc_to_point((bc[0][k:k+1], bc[1][k:k+1]), index=c[k:k+1])
+            np.testing.assert_allclose(bm.to_numpy(x).reshape(-1), bm.to_numpy(points[k]))
+
+    def test_uniform_mesh_3d(self):
+        # UniformMesh3d is built on numpy only, see UniformMesh3d.face_to_cell
+        bm.set_backend('numpy')
+        rng = np.random.default_rng(2)
+        mesh = UniformMesh3d((0, 3, 0, 3, 0, 3), (0.5, 0.5, 0.5), (0, 0, 0))
+        points, cell = random_points(mesh, 200, rng)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points)), bm.to_numpy(cell))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_nonconvex(self, backend):
+        bm.set_backend(backend)
+        # an L-shaped domain
+        def threshold(p):
+            return (p[..., 0] > 0.5) & (p[..., 1] > 0.5)
+        mesh = TriangleMesh.from_box(nx=8, ny=8, threshold=threshold)
+        points = bm.tensor([[0.25, 0.25], [0.75, 0.25], [0.25, 0.75],
+                            [0.75, 0.75], [0.6, 0.9], [1.5, 0.5]], dtype=bm.float64)
+        cell = bm.to_numpy(mesh.location(points))
+        assert np.all(cell[:3] >= 0)
+        assert np.all(cell[3:] == -1)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_moved_and_batch(self, backend):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(1)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        point = bm.tensor([[1.5, 1.5]], dtype=bm.float64)
+        assert int(mesh.location(point)[0]) == -1
+        # the nodes moved in place are seen by the next query
+        node = mesh.entity('node')
+        node *= 2
+        assert int(mesh.location(point)[0]) >= 0
+
+        mesh.uniform_refine()
+
+        points, cell = random_points(mesh, 100, rng)
+        c, bc = mesh.point_locator().locate(points, batch_size=7)
+        np.testing.assert_array_equal(bm.to_numpy(c), bm.to_numpy(cell))
+
+        c, bc = PointLocator(mesh).locate(points[:0])
+        assert c.shape == (0, ) and bc.shape == (0, 3)
+
+    def test_errors(self):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_unit_sphere_surface()
+        with pytest.raises(ValueError):
+            PointLocator(mesh)
+
+
+if __name__ == "__main__":
+    pytest.main(["-q", __file__])
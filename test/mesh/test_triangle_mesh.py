@@ -312,7 +312,7 @@ class TestTriangleMeshInterfaces:
         H = bm.sum(u[:][cell2dof],axis=-1)
         
         isMarkedCell = bm.abs(bm.sum(u[cell2dof], axis=-1))>1.5  
-        data1 = {'uh':u, 'H':H}
+        data1 = {'uh':(u, 'node'), 'H':(H, 'cell')}
         option = mesh.bisect_options(disp=False, data=data1)
         mesh.bisect(isMarkedCell, options=option)
         space = LagrangeFESpace(mesh, p=1)
@@ -359,7 +359,7 @@ class TestTriangleMeshInterfaces:
         phi0 = dis(node)
         phi0c2f = phi0[cell2dof]
         isMark = bm.ones(NC,dtype=bm.bool)
-        data1 = {'phi0':phi0c2f} 
+        data1 = {'phi0':(phi0c2f, 'local')} 
         option = mesh.bisect_options(data=data1,disp=False)
         mesh.bisect(isMark,options=option)
         
@@ -3,7 +3,7 @@ import pytest
 
 import numpy as np
 from fealpy.backend import backend_manager as bm
-from fealpy.mesh.utils import inverse_relation
+from fealpy.mesh.utils import inverse_relation, flocc
 
 inverse_relation_with_index_data = [
     {
@@ -62,3 +62,30 @@ def test_inverse_relation_with_flag(data, backend):
     assert bm.all(bm.equal(row, bm.from_numpy(data['row'])))
     assert bm.all(bm.equal(col, bm.from_numpy(data['col'])))
     assert spshape == data['spshape']
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+@pytest.mark.parametrize('shape', [(500, 2), (2000, 3), (50, 4)])
+def test_flocc_packed(shape, backend):
+    bm.set_backend(backend)
+    rng = np.random.default_rng(0)
+    data = np.sort(rng.integers(0, 30, size=shape), axis=1).astype(np.int32)
+    array = bm.from_numpy(data)
+
+    expected = flocc(array, method='lexsort')
+    for method in ['packed', 'auto']:
+        for a, b in zip(flocc(array, method=method), expected):
+            assert bm.all(bm.equal(a, b))
+
+    _, i0, j = np.unique(data, axis=0, return_index=True, return_inverse=True)
+    assert np.array_equal(bm.to_numpy(expected[0]), i0)
+    assert np.array_equal(bm.to_numpy(expected[2]), j.reshape(-1))
+
+
+def test_flocc_packed_overflow():
+    bm.set_backend('numpy')
+    array = bm.from_numpy(np.array([[0, 2**40], [1, 2**40]], dtype=np.int64))
+    with pytest.raises(ValueError):
+        flocc(array, method='packed')
+    i0, i1, j = flocc(array, method='auto')
+    assert np.array_equal(bm.to_numpy(j), [0, 1])
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+    LinearElasticIntegrator
+)
+from fealpy.material.elastic_material import LinearElasticMaterial
+from fealpy.sparse import CSRTensor
+from fealpy.solver import cg, AMGSolver
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def poisson_matrix(n):
+    mesh = TriangleMesh.from_box(nx=n, ny=n)
+    space = LagrangeFESpace(mesh, 1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(), ScalarMassIntegrator(coef=1e-2))
+    return bform.assembly()
+
+
+class TestAMGSolver:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("smoother", ['jacobi', 'gs'])
+    @pytest.mark.parametrize("cycle", ['V', 'W'])
+    def test_poisson(self, backend, smoother, cycle):
+        bm.set_backend(backend)
+        A = poisson_matrix(32)
+        x = bm.tensor(np.random.rand(A.shape[0]), dtype=bm.float64)
+        b = A @ x
+
+        amg = AMGSolver(A, smoother=smoother, cycle=cycle)
+        assert amg.number_of_levels > 2
+        assert amg.operator_complexity() < 2
+
+        sol, info = amg.solve(b, rtol=1e-10, returninfo=True)
+        assert info['success']
+        assert info['niter'] < 60
+        np.testing.assert_allclose(bm.to_numpy(sol), bm.to_numpy(x), atol=1e-6)
+
+        sol, info = cg(A, b, M=amg, rtol=1e-10, returninfo=True)
+        assert info['niter'] < 20
+        np.testing.assert_allclose(bm.to_numpy(sol), bm.to_numpy(x), atol=1e-6)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_batch_and_update(self, backend):
+        bm.set_backend(backend)
+        A = poisson_matrix(16)
+        X = bm.tensor(np.random.rand(A.shape[0], 3), dtype=bm.float64)
+        amg = AMGSolver(A)
+        P = amg.P
+
+        sol = amg.solve(A @ X, rtol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(sol), bm.to_numpy(X), atol=1e-6)
+
+        S = A.to_scipy()
+        A2 = CSRTensor.from_scipy((2 * S).tocsr())
+        amg.update(A2)
+        assert amg.P is P
+        sol = amg.solve(A @ X, rtol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(sol), bm.to_numpy(X) / 2, atol=1e-6)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_elasticity(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=16, ny=16)
+        space = TensorFunctionSpace(LagrangeFESpace(mesh, 1), (-1, 2))
+        material = LinearElasticMaterial('material', elastic_modulus=1.0, poisson_ratio=0.3,
+                                         hypo='plane_stress')
+        bform = BilinearForm(space)
+        bform.add_integrator(LinearElasticIntegrator(material, method='voigt'))
+        S = bform.assembly().to_scipy() + 1e-3 * sp.eye(space.number_of_global_dofs())
+        A = CSRTensor.from_scipy(S.tocsr())
+        x = np.random.rand(S.shape[0])
+        b = bm.tensor(S @ x)
+
+        amg = AMGSolver(A, block_size=2)
+        _, info0 = cg(A, b, rtol=1e-8, returninfo=True)
+        sol, info = cg(A, b, M=amg, rtol=1e-8, returninfo=True)
+        assert info['niter'] < info0['niter'] / 3
+        np.testing.assert_allclose(bm.to_numpy(sol), x, atol=1e-4)
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_amg_solver.py', '-q'])
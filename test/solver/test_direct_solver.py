@@ -4,7 +4,7 @@ import pytest
 import scipy.sparse as sp
 
 from fealpy.backend import backend_manager as bm
-from fealpy.solver import spsolve
+from fealpy.solver import spsolve, factorize
 from fealpy.sparse import COOTensor, CSRTensor
 
 class TestDirectSolver:
@@ -40,13 +40,67 @@ class TestDirectSolver:
         x0 = solver(A, b) 
         assert self._check_solution(x0, x), "f{backend} Test failed!!!!!!!!!!!!!!!!!!!!!!!!"
 
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_factorize(self, backend):
+        bm.set_backend(backend)
+        A, x, b = self._get_cpu_data()
+        lu = factorize(A, solver='scipy')
+        assert self._check_solution(lu.solve(b), x)
+
+        # a block of right-hand sides
+        X = np.random.rand(10, 3)
+        B = bm.tensor(A.to_scipy() @ X)
+        assert self._check_solution(lu.solve(B), bm.tensor(X))
+
+        # new values with the same pattern reuse the analysis
+        assert lu.number_of_analyses() == 1
+        fill = lu._lu.L.nnz + lu._lu.U.nnz
+        A2 = COOTensor(A.indices(), 2*A.values(), A.sparse_shape)
+        lu.refactorize(A2)
+        assert lu.number_of_analyses() == 1
+        assert lu.number_of_factorizations() == 2
+        # the reused column ordering keeps the fill-in
+        assert lu._lu.L.nnz + lu._lu.U.nnz == fill
+        assert self._check_solution(lu(b), x/2)
+        assert self._check_solution(lu.solve(B), bm.tensor(X)/2)
+
+        # a new pattern is analysed again
+        A3 = A.to_scipy() + sp.eye(10, k=1)
+        lu.refactorize(A3)
+        assert lu.number_of_analyses() == 2
+        assert self._check_solution(lu.solve(bm.tensor(A3 @ bm.to_numpy(x))), x)
+
+        with pytest.raises(ValueError):
+            lu.solve(bm.ones((9, ), dtype=bm.float64))
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_factorize_mumps(self, backend):
+        pytest.importorskip('mumps')
+        bm.set_backend(backend)
+        A, x, b = self._get_cpu_data()
+        lu = factorize(A, solver='mumps')
+        assert self._check_solution(lu.solve(b), x)
+
+        X = np.random.rand(10, 3)
+        B = bm.tensor(A.to_scipy() @ X)
+        assert self._check_solution(lu.solve(B), bm.tensor(X))
+
+        A2 = COOTensor(A.indices(), 2*A.values(), A.sparse_shape)
+        lu.refactorize(A2)
+        assert lu.number_of_analyses() == 1
+        assert self._check_solution(lu.solve(B), bm.tensor(X)/2)
+        lu.close()
+
     def test_gpu(self):
         bm.set_backend("pytorch")
         bm.set_default_device("cuda")
         solver = lambda A, b: spsolve(A, b, 'cupy')
 
-        A, x, b = self._get_gpu_data()
-        x0 = solver(A, b)
+        try:
+            A, x, b = self._get_gpu_data()
+            x0 = solver(A, b)
+        finally:
+            bm.set_default_device("cpu")
         assert self._check_solution(x0, x), "Pytorch GPU test failed!!!!!!!!!!!!!!!!!!!!!!!!"
         print("Pytorch GPU test passed!")
 
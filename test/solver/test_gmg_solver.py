@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import cg, GMGSolver
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def assembler(space):
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(q=space.p+2),
+                         ScalarMassIntegrator(coef=1e-2, q=space.p+2))
+    return bform.assembly()
+
+
+class TestGMGSolver:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("p", [1, 2])
+    def test_prolongation(self, backend, p):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        gmg = GMGSolver(mesh, 2, p=p)
+        assert mesh.number_of_cells() == 128
+
+        def f(x):
+            return x[..., 0]**p - 2 * x[..., 1]**p + x[..., 0] * x[..., 1]**(p - 1)
+
+        for P, fine, coarse in zip(gmg.P, gmg.spaces[:-1], gmg.spaces[1:]):
+            uf = f(fine.interpolation_points())
+            uc = f(coarse.interpolation_points())
+            np.testing.assert_allclose(bm.to_numpy(P @ uc), bm.to_numpy(uf), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("galerkin", [True, False])
+    def test_mesh_independence(self, backend, galerkin):
+        bm.set_backend(backend)
+        niters = []
+
+        for nrefine in [2, 3, 4]:
+            mesh = TriangleMesh.from_box(nx=4, ny=4)
+            if galerkin:
+                gmg = GMGSolver(mesh, nrefine)
+                A = assembler(gmg.spaces[0])
+                gmg.setup(A)
+            else:
+                gmg = GMGSolver(mesh, nrefine, assembler=assembler)
+                A = gmg.A[0]
+            assert gmg.number_of_levels == nrefine + 1
+
+            x = bm.tensor(np.random.rand(A.shape[0]), dtype=bm.float64)
+            b = A @ x
+            y, info = gmg.solve(b, rtol=1e-8, returninfo=True)
+            assert info['success']
+            np.testing.assert_allclose(bm.to_numpy(y), bm.to_numpy(x), atol=1e-5)
+            niters.append(info['niter'])
+
+            y, info = cg(A, b, M=gmg, rtol=1e-8, returninfo=True)
+            assert info['success']
+            assert info['niter'] < 20
+
+        assert niters[-1] <= niters[0] + 3
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_tetrahedron(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+        gmg = GMGSolver(mesh, 2, assembler=assembler, cycle='W')
+        A = gmg.A[0]
+        x = bm.tensor(np.random.rand(A.shape[0]), dtype=bm.float64)
+        y, info = cg(A, A @ x, M=gmg, rtol=1e-8, returninfo=True)
+        assert info['success']
+        assert info['niter'] < 20
+
+    def test_errors(self):
+        bm.set_backend('numpy')
+        with pytest.raises(TypeError):
+            GMGSolver(QuadrangleMesh.from_box(nx=2, ny=2), 1)
+        gmg = GMGSolver(TriangleMesh.from_box(nx=2, ny=2), 1)
+        with pytest.raises(ValueError):
+            gmg.setup(assembler(gmg.spaces[1]))
+
+
+if __name__ == "__main__":
+    pytest.main(["-q", __file__])
@@ -45,8 +45,11 @@ class TestDirectSolver:
         bm.set_default_device("cuda")
         solver = lambda A, b: spsolve(A, b, 'cupy')
 
-        A, x, b = self._get_gpu_data()
-        x0 = solver(A, b)
+        try:
+            A, x, b = self._get_gpu_data()
+            x0 = solver(A, b)
+        finally:
+            bm.set_default_device("cpu")
         assert self._check_solution(x0, x), "Pytorch GPU test failed!!!!!!!!!!!!!!!!!!!!!!!!"
         print("Pytorch GPU test passed!")
 
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import CSRTensor
+from fealpy.solver import cg, minres, bicgstab, gmres
+from fealpy.solver import JacobiPreconditioner, SSORPreconditioner, ILU0Preconditioner, IC0Preconditioner
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def laplace(n):
+    T = sp.diags([-1, 2, -1], [-1, 0, 1], shape=(n, n))
+    return sp.kronsum(T, T).tocsr()
+
+
+def fealpy_gmres(A, b, **kwargs):
+    return gmres(A, b, solver='fealpy', tol=kwargs.pop('rtol'), restart=15, **kwargs)
+
+
+SOLVERS = [cg, minres, bicgstab, fealpy_gmres]
+
+
+class TestKrylovSolver:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("solver", SOLVERS)
+    @pytest.mark.parametrize("precond", [None, JacobiPreconditioner, SSORPreconditioner, IC0Preconditioner])
+    def test_spd(self, backend, solver, precond):
+        bm.set_backend(backend)
+        S = laplace(12)
+        A = CSRTensor.from_scipy(S)
+        x = np.random.rand(S.shape[0])
+        M = None if precond is None else precond(A)
+
+        sol, info = solver(A, bm.tensor(S @ x), M=M, rtol=1e-10, returninfo=True)
+        assert info['success']
+        assert info['residual'].shape == (info['niter'] + 1, )
+        np.testing.assert_allclose(bm.to_numpy(sol), x, atol=1e-7)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("solver", SOLVERS)
+    def test_batch(self, backend, solver):
+        bm.set_backend(backend)
+        S = laplace(10)
+        A = CSRTensor.from_scipy(S)
+        X = np.random.rand(3, S.shape[0])
+        X[1] = 0.0 # a column converged at the beginning
+        B = bm.tensor((S @ X.T).T)
+
+        sol, info = solver(A, B, M=SSORPreconditioner(A), batch_first=True,
+                           rtol=1e-10, returninfo=True)
+        assert info['success']
+        assert info['residual'].shape == (info['niter'] + 1, 3)
+        assert bm.all(info['residual'][:, 1] == 0)
+        np.testing.assert_allclose(bm.to_numpy(sol), X, atol=1e-7)
+
+        for i in range(3):
+            x = solver(A, B[i], M=SSORPreconditioner(A), rtol=1e-10)
+            np.testing.assert_allclose(bm.to_numpy(x), X[i], atol=1e-7)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("solver", [minres, bicgstab, fealpy_gmres])
+    def test_indefinite(self, backend, solver):
+        bm.set_backend(backend)
+        S = laplace(8) - 0.5 * sp.eye(64)
+        A = CSRTensor.from_scipy(S.tocsr())
+        x = np.random.rand(64)
+        sol = solver(A, bm.tensor(S @ x), rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(sol), x, atol=1e-7)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("solver", [bicgstab, fealpy_gmres])
+    def test_nonsymmetric(self, backend, solver):
+        bm.set_backend(backend)
+        T = sp.diags([-1.3, 2, -0.7], [-1, 0, 1], shape=(10, 10))
+        S = sp.kronsum(T, T).tocsr()
+        A = CSRTensor.from_scipy(S)
+        x = np.random.rand(100)
+        sol, info = solver(A, bm.tensor(S @ x), M=ILU0Preconditioner(A), rtol=1e-12, returninfo=True)
+        assert info['success']
+        np.testing.assert_allclose(bm.to_numpy(sol), x, atol=1e-7)
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_maxiter(self, backend):
+        bm.set_backend(backend)
+        S = laplace(10)
+        A = CSRTensor.from_scipy(S)
+        b = bm.tensor(np.random.rand(100))
+        _, info = cg(A, b, maxiter=5, returninfo=True)
+        assert not info['success']
+        assert info['niter'] == 5
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_krylov_solver.py', '-q'])
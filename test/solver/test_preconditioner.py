@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import CSRTensor, COOTensor
+from fealpy.solver import (
+    JacobiPreconditioner, BlockJacobiPreconditioner,
+    SSORPreconditioner, ILU0Preconditioner, IC0Preconditioner,
+    BlockDiagonalPreconditioner, BlockTriangularPreconditioner,
+    factorize
+)
+from fealpy.sparse import BlockCSRTensor
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def random_matrix(n):
+    S = sp.random(n, n, density=0.2, random_state=0) + n * sp.eye(n)
+    return S.tocsr()
+
+
+class TestPreconditioner:
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_jacobi(self, backend):
+        bm.set_backend(backend)
+        S = random_matrix(20)
+        r = np.random.rand(20, 2)
+        M = JacobiPreconditioner(CSRTensor.from_scipy(S))
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), r / S.diagonal()[:, None])
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_block_jacobi(self, backend):
+        bm.set_backend(backend)
+        S = random_matrix(20)
+        D = S.toarray()
+        r = np.random.rand(20)
+        M = BlockJacobiPreconditioner(COOTensor.from_scipy(S.tocoo()), 4)
+        expected = np.concatenate([np.linalg.solve(D[i:i+4, i:i+4], r[i:i+4])
+                                   for i in range(0, 20, 4)])
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), expected)
+
+        blocks = np.random.permutation(20).reshape(10, 2)
+        M = BlockJacobiPreconditioner(CSRTensor.from_scipy(S), bm.tensor(blocks))
+        z = bm.to_numpy(M(bm.tensor(r)))
+        for b in blocks:
+            np.testing.assert_allclose(z[b], np.linalg.solve(D[np.ix_(b, b)], r[b]))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("omega", [1.0, 1.5])
+    def test_ssor(self, backend, omega):
+        bm.set_backend(backend)
+        S = random_matrix(30)
+        D = S.toarray()
+        d = np.diag(np.diag(D))
+        P = (d + omega * np.tril(D, -1)) @ np.linalg.inv(d) @ (d + omega * np.triu(D, 1))
+        P /= omega * (2 - omega)
+        r = np.random.rand(30, 3)
+        M = SSORPreconditioner(CSRTensor.from_scipy(S), omega)
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), np.linalg.solve(P, r))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_ilu0(self, backend):
+        bm.set_backend(backend)
+        # no fill-in for a tridiagonal matrix, so ILU(0) is the exact LU.
+        S = sp.diags([-1, 3, -2], [-1, 0, 1], shape=(40, 40)).tocsr()
+        r = np.random.rand(40)
+        M = ILU0Preconditioner(CSRTensor.from_scipy(S), sweeps=40)
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), np.linalg.solve(S.toarray(), r))
+
+        # the factors keep the pattern, and L U matches A on it.
+        S = random_matrix(30)
+        A = CSRTensor.from_scipy(S)
+        M = ILU0Preconditioner(A, sweeps=30)
+        I = np.eye(30)
+        L = np.stack([bm.to_numpy(M.lower(bm.tensor(I[:, i]))) for i in range(30)], axis=1)
+        U = np.stack([bm.to_numpy(M.upper(bm.tensor(I[:, i]))) for i in range(30)], axis=1)
+        LU = np.linalg.inv(L) @ np.linalg.inv(U)
+        mask = S.toarray() != 0
+        np.testing.assert_allclose(LU[mask], S.toarray()[mask], atol=1e-12)
+
+        with pytest.raises(ValueError):
+            ILU0Preconditioner(CSRTensor.from_scipy(sp.csr_matrix(np.array([[0., 1.], [1., 0.]]))))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    def test_ic0(self, backend):
+        bm.set_backend(backend)
+        S = random_matrix(30)
+        S = (S + S.T).tocsr()
+        A = CSRTensor.from_scipy(S)
+        M = IC0Preconditioner(A, sweeps=30)
+        I = np.eye(30)
+        P = np.stack([bm.to_numpy(M(bm.tensor(I[:, i]))) for i in range(30)], axis=1)
+        # the same preconditioner as ILU(0), and symmetric
+        Q = ILU0Preconditioner(A, sweeps=30)
+        r = np.random.rand(30, 2)
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), bm.to_numpy(Q(bm.tensor(r))))
+        np.testing.assert_allclose(P, P.T, atol=1e-12)
+
+        # L D L^T matches A on the pattern
+        L = np.stack([bm.to_numpy(M.lower(bm.tensor(I[:, i]))) for i in range(30)], axis=1)
+        LDLT = np.linalg.inv(L) @ np.diag(bm.to_numpy(M.diag)) @ np.linalg.inv(L).T
+        mask = S.toarray() != 0
+        np.testing.assert_allclose(LDLT[mask], S.toarray()[mask], atol=1e-12)
+
+        with pytest.raises(ValueError):
+            IC0Preconditioner(CSRTensor.from_scipy(random_matrix(30)))
+        with pytest.raises(ValueError):
+            IC0Preconditioner(CSRTensor.from_scipy(sp.csr_matrix(np.array([[2., 1.], [1.5, 2.]]))))
+
+    @pytest.mark.parametrize("backend", ALL_BACKENDS)
+    @pytest.mark.parametrize("lower", [False, True])
+    def test_block(self, backend, lower):
+        bm.set_backend(backend)
+        F = random_matrix(12)
+        B = sp.random(5, 12, density=0.3, format='csr', random_state=1)
+        S = sp.diags(np.arange(1., 6.)).tocsr()
+        A = BlockCSRTensor([[CSRTensor.from_scipy(F), CSRTensor.from_scipy(B.T.tocsr())],
+                            [CSRTensor.from_scipy(B), None]])
+        r = np.random.rand(17, 2)
+
+        M = BlockDiagonalPreconditioner(A, [factorize(A.block(0, 0), "scipy"),
+                                            JacobiPreconditioner(CSRTensor.from_scipy(S))])
+        P = sp.block_diag([F, S]).toarray()
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), np.linalg.solve(P, r))
+
+        M = BlockTriangularPreconditioner(A, [None, JacobiPreconditioner(CSRTensor.from_scipy(S))],
+                                          lower=lower)
+        D = sp.diags(F.diagonal())
+        P = sp.bmat([[D, None], [B, S]] if lower else [[D, B.T], [None, S]]).toarray()
+        np.testing.assert_allclose(bm.to_numpy(M(bm.tensor(r))), np.linalg.solve(P, r))
+
+        with pytest.raises(ValueError):
+            BlockTriangularPreconditioner(A, [None, None])
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_preconditioner.py', '-q'])
@@ -0,0 +1,70 @@
+# test_block_tensor.py
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from fealpy.sparse import BlockCSRTensor, CSRTensor, COOTensor
+from fealpy.backend import backend_manager as bm
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def random_blocks():
+    A = sp.random(6, 6, density=0.4, format='csr', random_state=0)
+    B = sp.random(4, 6, density=0.4, format='csr', random_state=1)
+    C = sp.random(6, 4, density=0.4, format='csr', random_state=2)
+    return A, B, C
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_shape_and_blocks(backend):
+    bm.set_backend(backend)
+    A, B, C = random_blocks()
+    M = BlockCSRTensor([[CSRTensor.from_scipy(A), COOTensor.from_scipy(C.tocoo())],
+                        [CSRTensor.from_scipy(B), None]])
+
+    assert M.block_shape == (2, 2)
+    assert M.shape == (10, 10)
+    assert M.row_offsets == (0, 6, 10)
+    assert M.nnz == A.nnz + B.nnz + C.nnz
+    assert M.block(1, 1) is None
+    assert isinstance(M[0, 1], CSRTensor)
+    np.testing.assert_allclose(bm.to_numpy(M[1, 0].to_dense()), B.toarray())
+
+    with pytest.raises(ValueError):
+        BlockCSRTensor([[CSRTensor.from_scipy(A), CSRTensor.from_scipy(B)]])
+    with pytest.raises(ValueError):
+        BlockCSRTensor([[CSRTensor.from_scipy(A), None]])
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_tocsr(backend):
+    bm.set_backend(backend)
+    A, B, C = random_blocks()
+    M = BlockCSRTensor([[CSRTensor.from_scipy(A), CSRTensor.from_scipy(C), None],
+                        [CSRTensor.from_scipy(B), None, None],
+                        [None, None, None]],
+                       row_sizes=[6, 4, 3], col_sizes=[6, 4, 2])
+    S = sp.bmat([[A, C, sp.csr_matrix((6, 2))],
+                 [B, None, None],
+                 [sp.csr_matrix((3, 6)), None, None]]).tocsr()
+    S.sort_indices()
+
+    csr = M.tocsr()
+    assert csr.sparse_shape == (13, 12)
+    np.testing.assert_array_equal(bm.to_numpy(csr.crow()), S.indptr)
+    np.testing.assert_array_equal(bm.to_numpy(csr.col()), S.indices)
+    np.testing.assert_allclose(bm.to_numpy(csr.values()), S.data)
+    np.testing.assert_allclose(bm.to_numpy(M.tocoo().to_dense()), S.toarray())
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_matmul(backend):
+    bm.set_backend(backend)
+    A, B, C = random_blocks()
+    M = BlockCSRTensor([[CSRTensor.from_scipy(A), CSRTensor.from_scipy(C)],
+                        [CSRTensor.from_scipy(B), None]])
+    S = sp.bmat([[A, C], [B, None]]).toarray()
+    x = np.random.rand(10, 3)
+    np.testing.assert_allclose(bm.to_numpy(M @ bm.tensor(x)), S @ x, atol=1e-14)
+    np.testing.assert_allclose(bm.to_numpy(M @ bm.tensor(x[:, 0])), S @ x[:, 0], atol=1e-14)
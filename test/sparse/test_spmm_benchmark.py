@@ -0,0 +1,46 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import COOTensor
+from fealpy.sparse._spmm import spmm_coo, spmm_csr
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+SIZES = [1000, 10000, 100000]
+
+
+def laplace_matrix(n: int):
+    """Five-point finite difference matrix on a (n x n) grid, in CSR format."""
+    idx = bm.arange(n*n, dtype=bm.int64).reshape(n, n)
+    row = [idx.reshape(-1)]
+    col = [idx.reshape(-1)]
+    val = [bm.full((n*n, ), 4.0, dtype=bm.float64)]
+    for a, b in [(idx[1:, :], idx[:-1, :]), (idx[:, 1:], idx[:, :-1])]:
+        a, b = a.reshape(-1), b.reshape(-1)
+        row.extend([a, b])
+        col.extend([b, a])
+        val.extend([bm.full(a.shape, -1.0, dtype=bm.float64)] * 2)
+    indices = bm.stack([bm.concat(row), bm.concat(col)], axis=0)
+    M = COOTensor(indices, bm.concat(val), (n*n, n*n)).coalesce()
+    return M, M.tocsr()
+
+
+@pytest.mark.benchmark(group="spmm")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kernel", ["coo", "csr", "native"])
+def test_spmm_benchmark(benchmark, backend, size, kernel):
+    bm.set_backend(backend)
+    n = int(size ** 0.5)
+    coo, csr = laplace_matrix(n)
+    x = bm.ones((n*n, ), dtype=bm.float64)
+
+    if kernel == "coo":
+        result = benchmark(spmm_coo, coo.indices(), coo.values(), coo.sparse_shape, x)
+    elif kernel == "csr":
+        result = benchmark(spmm_csr, csr.crow(), csr.col(), csr.values(), csr.sparse_shape, x)
+
+    else: # scipy.sparse for NumPy, torch.sparse for PyTorch
+        result = benchmark(csr.matmul, x)
+
+    expected = coo.to_scipy() @ bm.to_numpy(x)
+    assert bm.allclose(result, bm.tensor(expected))
@@ -2,7 +2,7 @@
 import pytest
 
 from fealpy.backend import backend_manager as bm
-from fealpy.sparse._spspmm import spspmm_coo
+from fealpy.sparse._spspmm import spspmm_coo, spspmm_csr
 from fealpy.sparse import COOTensor
 
 ALL_BACKENDS = ['numpy', 'pytorch']
@@ -47,5 +47,46 @@ def test_spspmm_coo_valid_input(backend):
 
     assert bm.allclose(result, expected)
 
-# Additional tests can be added here to cover more edge cases, different shapes,
-# or to ensure consistency with other matrix multiplication methods under various conditions.
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_csr_valid_input(backend):
+    bm.set_backend(backend)
+    # The second row of matrix1 and the first row of matrix2 are empty.
+    crow1 = bm.tensor([0, 2, 2, 4])
+    col1 = bm.tensor([0, 1, 1, 2])
+    values1 = bm.tensor([[1., 3., 4., 2.],
+                         [2., 6., 8., 4.]], dtype=bm.float64)
+    spshape1 = (3, 3)
+
+    crow2 = bm.tensor([0, 0, 2, 3])
+    col2 = bm.tensor([0, 1, 0])
+    values2 = bm.tensor([[2., 9., 3.],
+                         [2., 9., 3.]], dtype=bm.float64)
+    spshape2 = (3, 2)
+
+    crow, col, values, output_shape = spspmm_csr(crow1, col1, values1, spshape1,
+                                                 crow2, col2, values2, spshape2)
+    assert output_shape == (3, 2)
+    assert bm.all(crow == bm.tensor([0, 2, 2, 4]))
+    assert bm.all(col == bm.tensor([0, 1, 0, 1]))
+    expected = bm.tensor([[6., 27., 14., 36.],
+                          [12., 54., 28., 72.]], dtype=bm.float64)
+    assert bm.allclose(values, expected)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_matmul(backend):
+    bm.set_backend(backend)
+    indices1 = bm.tensor([[0, 2, 1, 0, 2],
+                          [0, 1, 2, 2, 1]])
+    values1 = bm.tensor([1., 2., 3., 4., 5.], dtype=bm.float64)
+    indices2 = bm.tensor([[2, 0, 1, 2],
+                          [0, 1, 1, 1]])
+    values2 = bm.tensor([1., -1., 2., 3.], dtype=bm.float64)
+    A = COOTensor(indices1, values1, (3, 3))
+    B = COOTensor(indices2, values2, (3, 2))
+    expected = A.to_dense() @ B.to_dense()
+
+    assert bm.allclose((A @ B).to_dense(), expected)
+    assert bm.allclose((A.tocsr() @ B.tocsr()).to_dense(), expected)
+    indices, values, spshape = spspmm_coo(indices1, values1, (3, 3), indices2, values2, (3, 2))
+    assert bm.allclose(COOTensor(indices, values, spshape).to_dense(), expected)
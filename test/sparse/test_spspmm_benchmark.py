@@ -0,0 +1,33 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse._spspmm import spspmm_coo, spspmm_csr
+
+from test_spmm_benchmark import laplace_matrix
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+SIZES = [1000, 10000, 100000]
+
+
+@pytest.mark.benchmark(group="spspmm")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kernel", ["coo", "csr", "native"])
+def test_spspmm_benchmark(benchmark, backend, size, kernel):
+    bm.set_backend(backend)
+    n = int(size ** 0.5)
+    coo, csr = laplace_matrix(n)
+
+    if kernel == "coo":
+        args = (coo.indices(), coo.values(), coo.sparse_shape)
+        indices, values, spshape = benchmark(spspmm_coo, *args, *args)
+        result = coo.__class__(indices, values, spshape).coalesce().to_scipy()
+    elif kernel == "csr":
+        args = (csr.crow(), csr.col(), csr.values(), csr.sparse_shape)
+        crow, col, values, spshape = benchmark(spspmm_csr, *args, *args)
+        result = csr.__class__(crow, col, values, spshape).to_scipy()
+    else: # scipy.sparse for NumPy, torch.sparse for PyTorch
+        result = benchmark(csr.matmul, csr).to_scipy()
+
+    expected = coo.to_scipy() @ coo.to_scipy()
+    assert abs(result - expected).max() < 1e-12